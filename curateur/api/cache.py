@@ -7,12 +7,106 @@ and improve performance for unchanged ROMs.
 
 import json
 import logging
-from datetime import datetime, timedelta
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+SCHEMA_VERSION = 4
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    rom_hash TEXT PRIMARY KEY,
+    response BLOB NOT NULL,
+    rom_size INTEGER,
+    created_at REAL NOT NULL,
+    ttl_days INTEGER NOT NULL,
+    checksum INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_entries_created_at ON entries(created_at);
+CREATE INDEX IF NOT EXISTS idx_entries_rom_size ON entries(rom_size);
+CREATE TABLE IF NOT EXISTS media_hashes (
+    rom_hash TEXT NOT NULL REFERENCES entries(rom_hash) ON DELETE CASCADE,
+    media_type TEXT NOT NULL,
+    hash TEXT NOT NULL,
+    PRIMARY KEY (rom_hash, media_type)
+);
+CREATE TABLE IF NOT EXISTS not_found (
+    rom_hash TEXT NOT NULL,
+    endpoint TEXT NOT NULL,
+    rom_size INTEGER,
+    miss_count INTEGER NOT NULL,
+    checked_at REAL NOT NULL,
+    ttl_days REAL NOT NULL,
+    PRIMARY KEY (rom_hash, endpoint)
+);
+"""
+
+# Expiry as an SQL expression over an entries row
+_EXPIRES_AT = "(created_at + ttl_days * 86400)"
+
+# Write-behind buffer keys: ("entries", rom_hash) or
+# ("not_found", rom_hash, endpoint)
+_ENTRIES = "entries"
+_NOT_FOUND = "not_found"
+BufferKey = Tuple[str, ...]
+
+# Unreadable rows skipped while salvaging a damaged database before giving up
+_SALVAGE_MAX_SKIPS = 10000
+
+# zlib level for stored responses: most of the size win for a fraction of
+# the CPU of level 9
+_COMPRESSION_LEVEL = 6
+
+
+def _encode_response(response: Dict[str, Any]) -> bytes:
+    """Serialize an API response as zlib-compressed compact JSON."""
+    encoded = json.dumps(response, ensure_ascii=False, separators=(",", ":"))
+    return zlib.compress(encoded.encode("utf-8"), _COMPRESSION_LEVEL)
+
+
+def _decode_response(stored: Any) -> Dict[str, Any]:
+    """Decode a stored response (compressed BLOB, or TEXT from schema v1/v2)."""
+    if isinstance(stored, bytes):
+        stored = zlib.decompress(stored)
+    return json.loads(stored)
+
+
+def _response_intact(stored: Any, checksum: Optional[int]) -> bool:
+    """Check a stored response against its CRC32 and that it decodes."""
+    if checksum is not None:
+        data = stored if isinstance(stored, bytes) else str(stored).encode("utf-8")
+        if zlib.crc32(data) != checksum:
+            return False
+    try:
+        _decode_response(stored)
+    except (zlib.error, ValueError, TypeError):
+        return False
+    return True
+
+
+def shared_cache_key(namespace: str, rom_hash: str, rom_size: int) -> str:
+    """
+    Build a global cache key.
+
+    Args:
+        namespace: ScreenScraper systemeid of the ROM's platform
+        rom_hash: ROM hash (CRC32, MD5, SHA1 or fingerprint)
+        rom_size: ROM file size in bytes
+
+    Returns:
+        Key of the form "<systemeid>:<HASH>:<size>"
+    """
+    return f"{namespace}:{rom_hash.upper()}:{rom_size}"
+
 
 class MetadataCache:
     """
@@ -20,29 +114,77 @@ class MetadataCache:
 
     Features:
     - Per-system cache storage alongside gamelist.xml
-    - 7-day TTL for cache entries
+    - 7-day TTL for cache entries (configurable per system)
+    - Stale-while-revalidate: with stale_days > 0, entries up to stale_days
+      past their TTL are still returned, flagged "stale": True, so callers
+      can use them immediately and refresh them in the background
     - Automatic cleanup of expired entries
     - Cache invalidation support
     - Thread-safe operations
-
-    Storage format:
+    - Write-behind: changes are buffered and written in batches on a
+      background thread once flush_entries are dirty or flush_interval
+      seconds have passed, and whenever flush() or close() is called
+
+    Storage format (SQLite, WAL journal):
+    - entries: one row per ROM hash with the API response (compact JSON,
+      zlib-compressed; rows from older versions hold plain JSON text), its
+      CRC32, ROM size, creation time (epoch seconds) and TTL; indexed on
+      created_at and rom_size
+    - media_hashes: (rom_hash, media_type) -> hash of the downloaded media file
+    - not_found: (rom_hash, endpoint) -> ROMs ScreenScraper did not know,
+      with a miss count and a TTL that doubles on every repeat miss
+
+    Lookups read only the requested row (or the unflushed buffer), so a cold
+    start does not load the whole cache. Decoded responses are kept in an LRU
+    of at most resident_entries records. Entries are returned in the original
+    dict shape:
     {
-        "<rom_hash>": {
-            "response": {...},  # Full API response
-            "rom_hash": "ABC123",  # ROM hash used as key (stored for validation)
-            "rom_size": 1234567,  # ROM file size for quick validation
-            "media_hashes": {  # Hashes of downloaded media files
-                "screenshot": "DEF456",
-                "box2dfront": "GHI789"
-            },
-            "timestamp": "2025-11-22T10:30:00",
-            "ttl_days": 7
-        }
+        "response": {...},  # Full API response
+        "rom_hash": "ABC123",  # ROM hash used as key (stored for validation)
+        "rom_size": 1234567,  # ROM file size for quick validation
+        "media_hashes": {  # Hashes of downloaded media files
+            "screenshot": "DEF456",
+            "box2dfront": "GHI789"
+        },
+        "timestamp": "2025-11-22T10:30:00",
+        "ttl_days": 7
     }
+
+    A legacy metadata_cache.json found next to a new database is imported
+    once and renamed to metadata_cache.json.migrated.
+
+    Corruption handling: SQLite's WAL discards a torn tail after a crash, so
+    at most the last uncommitted batch is lost. Rows whose checksum does not
+    match are dropped as they are read. A database that cannot be opened is
+    moved aside to metadata_cache.db.corrupt and every readable entry is
+    copied into a new one, instead of silently starting empty. verify() and
+    compact() back the `curateur cache` maintenance commands;
+    export_entries() and import_entries() back `curateur cache export/import`,
+    which move a cache's metadata to another install and merge it by ROM
+    hash.
+
+    Shared layer: a per-system cache can sit on top of a global cache (a
+    MetadataCache in its own directory) keyed by shared_cache_key(), i.e.
+    (systemeid, ROM hash, ROM size). Local misses fall through to the global
+    cache and hits are copied down; new responses are written to both. Alias
+    systems (genesis/megadrive) and duplicate collections then share one
+    lookup. Media hashes describe files in one install and stay local.
     """
 
     def __init__(
-        self, gamelist_directory: Path, ttl_days: int = 7, enabled: bool = True
+        self,
+        gamelist_directory: Path,
+        ttl_days: int = 7,
+        enabled: bool = True,
+        flush_entries: int = 200,
+        flush_interval: float = 10.0,
+        cache_dir: Optional[Path] = None,
+        shared: Optional["MetadataCache"] = None,
+        shared_namespace: Optional[str] = None,
+        negative_ttl_days: float = 1.0,
+        negative_max_ttl_days: float = 30.0,
+        stale_days: float = 0.0,
+        resident_entries: int = 1024,
     ):
         """
         Initialize metadata cache.
@@ -51,22 +193,76 @@ class MetadataCache:
             gamelist_directory: Directory containing gamelist.xml
             ttl_days: Time-to-live for cache entries in days
             enabled: Whether caching is enabled
+            flush_entries: Dirty entries that trigger a background flush
+            flush_interval: Seconds after the first unflushed change that
+                trigger a background flush (checked on each change)
+            cache_dir: Directory holding the cache database (defaults to
+                <gamelist_directory>/.cache)
+            shared: Global cache consulted on local misses (optional)
+            shared_namespace: Key prefix in the global cache, the system's
+                ScreenScraper systemeid (required with shared)
+            negative_ttl_days: How long a "game not found" answer is trusted
+                after the first miss (0 disables the negative cache)
+            negative_max_ttl_days: Upper bound for the negative TTL, which
+                doubles with every repeat miss
+            stale_days: How long past its TTL an entry is still served as
+                stale (0 drops entries as soon as they expire)
+            resident_entries: Decoded records kept in memory (LRU); 0 decodes
+                every lookup from disk
         """
         self.gamelist_directory = gamelist_directory
         self.ttl_days = ttl_days
         self.enabled = enabled
+        self.flush_entries = max(1, flush_entries)
+        self.flush_interval = flush_interval
+        self.negative_ttl_days = negative_ttl_days
+        self.negative_max_ttl_days = max(negative_ttl_days, negative_max_ttl_days)
+        self.stale_days = stale_days
+        self.resident_entries = max(0, resident_entries)
 
         # Cache directory: <gamelist_directory>/.cache/
-        self.cache_dir = gamelist_directory / ".cache"
-        self.cache_file = self.cache_dir / "metadata_cache.json"
-
-        # In-memory cache for faster access during session
-        self._memory_cache: Dict[str, Dict[str, Any]] = {}
-        self._cache_loaded = False
+        self.cache_dir = cache_dir or gamelist_directory / ".cache"
+        self.cache_file = self.cache_dir / "metadata_cache.db"
+        self.legacy_cache_file = self.cache_dir / "metadata_cache.json"
+
+        # Global cache layered underneath (None unless configured)
+        self.shared = shared if shared_namespace is not None else None
+        self.shared_namespace = shared_namespace
+
+        # Reads use their own connection so they never wait on a flush in
+        # progress (WAL allows one writer alongside readers)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._writer_conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        self._write_lock = threading.Lock()
+
+        # Write-behind buffers: buffer key -> record, or None for a delete.
+        # _inflight holds the batch currently being written.
+        self._pending: Dict[BufferKey, Optional[Dict[str, Any]]] = {}
+        self._inflight: Dict[BufferKey, Optional[Dict[str, Any]]] = {}
+        self._dirty_since: Optional[float] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._flush_future: Optional[Future] = None
+
+        # Decoded records read from disk, least recently used first
+        self._resident: "OrderedDict[BufferKey, Dict[str, Any]]" = OrderedDict()
+
+        # Rows in the entries table, counted once and then kept current by
+        # every write (None until first needed)
+        self._entry_count: Optional[int] = None
 
         # Metrics tracking
         self._hits: int = 0
         self._misses: int = 0
+        self._shared_hits: int = 0
+        self._negative_hits: int = 0
+        self._stale_hits: int = 0
+        self._flush_count: int = 0
+        self._flushed_entries: int = 0
+        self._flushed_bytes: int = 0
+        self._flush_seconds_total: float = 0.0
+        self._flush_seconds_max: float = 0.0
+        self._flush_seconds_last: float = 0.0
 
         logger.debug(
             f"MetadataCache initialized: cache_dir={self.cache_dir}, "
@@ -79,55 +275,390 @@ class MetadataCache:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
             logger.debug(f"Created cache directory: {self.cache_dir}")
 
-    def _load_cache(self) -> None:
-        """Load cache from disk into memory."""
-        if self._cache_loaded:
-            return
+    def _open(self) -> sqlite3.Connection:
+        """Open a connection to the cache database, creating the schema."""
+        # Autocommit: every statement outside an explicit transaction commits
+        conn = sqlite3.connect(
+            self.cache_file, isolation_level=None, check_same_thread=False
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        conn.executescript(_SCHEMA)
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(entries)")}
+        if "checksum" not in columns:
+            # Schema v3 and older: rows without a checksum are decode-checked only
+            try:
+                conn.execute("ALTER TABLE entries ADD COLUMN checksum INTEGER")
+            except sqlite3.OperationalError as e:
+                logger.debug(f"Checksum column not added: {e}")
+        conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        return conn
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the read connection (and migrate legacy data) on first use."""
+        if self._conn is not None:
+            return self._conn
+
+        self._ensure_cache_directory()
+        is_new = not self.cache_file.exists()
+        try:
+            self._conn = self._open()
+        except sqlite3.DatabaseError as e:
+            logger.error(
+                f"Metadata cache {self.cache_file} is damaged ({e}), "
+                "salvaging readable entries"
+            )
+            recovered, dropped = self._salvage()
+            logger.warning(
+                f"Recovered {recovered} cache entries, dropped {dropped} "
+                f"(damaged file kept as {self._corrupt_file.name})"
+            )
+            self._conn = self._open()
 
-        if not self.enabled:
-            self._cache_loaded = True
+        if is_new and self.legacy_cache_file.exists():
+            self._migrate_legacy_cache()
+
+        return self._conn
+
+    def _writer(self) -> sqlite3.Connection:
+        """Open the write connection on first use (caller holds _write_lock)."""
+        if self._writer_conn is None:
+            with self._lock:
+                self._connection()
+            self._writer_conn = self._open()
+        return self._writer_conn
+
+    def _migrate_legacy_cache(self) -> None:
+        """Import entries from a pre-SQLite metadata_cache.json."""
+        try:
+            with open(self.legacy_cache_file, "r", encoding="utf-8") as f:
+                legacy = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Failed to load legacy cache file: {e}, not migrating")
             return
 
-        if not self.cache_file.exists():
-            logger.debug("No cache file found, starting with empty cache")
-            self._memory_cache = {}
-            self._cache_loaded = True
+        imported = 0
+        with self._transaction(self._conn) as conn:
+            for rom_hash, entry in legacy.items():
+                try:
+                    record = {
+                        "response": entry["response"],
+                        "rom_size": entry.get("rom_size"),
+                        "created_at": datetime.fromisoformat(
+                            entry["timestamp"]
+                        ).timestamp(),
+                        "ttl_days": entry.get("ttl_days", self.ttl_days),
+                        "media_hashes": entry.get("media_hashes") or {},
+                    }
+                    self._upsert(conn, rom_hash, record)
+                    imported += 1
+                except (KeyError, TypeError, ValueError) as e:
+                    logger.debug(f"Skipping invalid legacy cache entry {rom_hash}: {e}")
+
+        try:
+            self.legacy_cache_file.replace(
+                self.legacy_cache_file.with_suffix(".json.migrated")
+            )
+        except OSError as e:
+            logger.warning(f"Failed to rename legacy cache file: {e}")
+
+        logger.info(f"Migrated {imported} entries from {self.legacy_cache_file.name}")
+
+    @staticmethod
+    @contextmanager
+    def _transaction(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+        """Run the enclosed statements as one transaction."""
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    @staticmethod
+    def _upsert(conn: sqlite3.Connection, rom_hash: str, record: Dict[str, Any]) -> int:
+        """
+        Insert or replace one entry and its media hashes.
+
+        Returns:
+            Bytes of encoded response written
+        """
+        response = _encode_response(record["response"])
+        conn.execute(
+            "INSERT INTO entries "
+            "(rom_hash, response, rom_size, created_at, ttl_days, checksum) "
+            "VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(rom_hash) DO UPDATE SET response=excluded.response, "
+            "rom_size=excluded.rom_size, created_at=excluded.created_at, "
+            "ttl_days=excluded.ttl_days, checksum=excluded.checksum",
+            (
+                rom_hash,
+                response,
+                record["rom_size"],
+                record["created_at"],
+                record["ttl_days"],
+                zlib.crc32(response),
+            ),
+        )
+        conn.execute("DELETE FROM media_hashes WHERE rom_hash = ?", (rom_hash,))
+        # A ROM that is found is no longer "not found" on any endpoint
+        conn.execute("DELETE FROM not_found WHERE rom_hash = ?", (rom_hash,))
+        if record["media_hashes"]:
+            conn.executemany(
+                "INSERT INTO media_hashes (rom_hash, media_type, hash) VALUES (?, ?, ?)",
+                [
+                    (rom_hash, mtype, mhash)
+                    for mtype, mhash in record["media_hashes"].items()
+                ],
+            )
+        return len(response)
+
+    @staticmethod
+    def _entry_exists(conn: sqlite3.Connection, rom_hash: str) -> bool:
+        """Check if an entry is stored (primary key lookup)."""
+        return (
+            conn.execute(
+                "SELECT 1 FROM entries WHERE rom_hash = ?", (rom_hash,)
+            ).fetchone()
+            is not None
+        )
+
+    @staticmethod
+    def _write_not_found(
+        conn: sqlite3.Connection,
+        rom_hash: str,
+        endpoint: str,
+        record: Optional[Dict[str, Any]],
+    ) -> None:
+        """Insert, replace or (record None) delete one negative entry."""
+        if record is None:
+            conn.execute(
+                "DELETE FROM not_found WHERE rom_hash = ? AND endpoint = ?",
+                (rom_hash, endpoint),
+            )
             return
+        conn.execute(
+            "INSERT OR REPLACE INTO not_found "
+            "(rom_hash, endpoint, rom_size, miss_count, checked_at, ttl_days) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                rom_hash,
+                endpoint,
+                record["rom_size"],
+                record["miss_count"],
+                record["checked_at"],
+                record["ttl_days"],
+            ),
+        )
 
+    def _read_record(self, rom_hash: str) -> Optional[Dict[str, Any]]:
+        """Read one entry from the database (caller holds _lock)."""
+        conn = self._connection()
         try:
-            with open(self.cache_file, "r", encoding="utf-8") as f:
-                self._memory_cache = json.load(f)
+            row = conn.execute(
+                "SELECT response, rom_size, created_at, ttl_days, checksum "
+                "FROM entries WHERE rom_hash = ?",
+                (rom_hash,),
+            ).fetchone()
+            if row is None:
+                return None
+            media_hashes = dict(
+                conn.execute(
+                    "SELECT media_type, hash FROM media_hashes WHERE rom_hash = ?",
+                    (rom_hash,),
+                ).fetchall()
+            )
+        except sqlite3.DatabaseError as e:
+            # Damaged page: treat as a miss; `curateur cache verify` repairs it
+            logger.error(f"Cannot read cache entry {rom_hash}: {e}")
+            return None
 
-            logger.info(
-                f"Loaded metadata cache: {len(self._memory_cache)} entries from {self.cache_file}"
+        response, rom_size, created_at, ttl_days, checksum = row
+        if not _response_intact(response, checksum):
+            logger.warning(f"Dropping damaged cache entry {rom_hash}")
+            self._stage((_ENTRIES, rom_hash), None)
+            return None
+
+        return {
+            "response": _decode_response(response),
+            "rom_size": rom_size,
+            "created_at": created_at,
+            "ttl_days": ttl_days,
+            "media_hashes": media_hashes,
+        }
+
+    def _read_not_found(self, rom_hash: str, endpoint: str) -> Optional[Dict[str, Any]]:
+        """Read one negative entry from the database (caller holds _lock)."""
+        row = (
+            self._connection()
+            .execute(
+                "SELECT rom_size, miss_count, checked_at, ttl_days FROM not_found "
+                "WHERE rom_hash = ? AND endpoint = ?",
+                (rom_hash, endpoint),
             )
-            self._cache_loaded = True
+            .fetchone()
+        )
+        if row is None:
+            return None
 
-        except (json.JSONDecodeError, IOError) as e:
-            logger.warning(f"Failed to load cache file: {e}, starting with empty cache")
-            self._memory_cache = {}
-            self._cache_loaded = True
+        rom_size, miss_count, checked_at, ttl_days = row
+        return {
+            "rom_size": rom_size,
+            "miss_count": miss_count,
+            "checked_at": checked_at,
+            "ttl_days": ttl_days,
+        }
 
-    def _save_cache(self) -> None:
-        """Save in-memory cache to disk."""
-        if not self.enabled:
+    def _buffered(self, key: BufferKey) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """Find a record in the unflushed buffers or the LRU (holds _lock)."""
+        for buffer in (self._pending, self._inflight):
+            if key in buffer:
+                return True, buffer[key]
+        if key in self._resident:
+            self._resident.move_to_end(key)
+            return True, self._resident[key]
+        return False, None
+
+    def _lookup(self, key: BufferKey) -> Optional[Dict[str, Any]]:
+        """Find a record in memory, then on disk (caller holds _lock)."""
+        found, record = self._buffered(key)
+        if found:
+            return record
+
+        if key[0] == _NOT_FOUND:
+            record = self._read_not_found(key[1], key[2])
+        else:
+            record = self._read_record(key[1])
+
+        if record is not None and self.resident_entries:
+            self._resident[key] = record
+            if len(self._resident) > self.resident_entries:
+                self._resident.popitem(last=False)
+        return record
+
+    def _drop_resident(self) -> None:
+        """Forget decoded records after rows were deleted in bulk."""
+        with self._lock:
+            self._resident.clear()
+
+    def _record_expired(self, record: Dict[str, Any], grace_days: float = 0) -> bool:
+        """Check whether a record has outlived its TTL (plus grace_days)."""
+        expires_at = record["created_at"] + (record["ttl_days"] + grace_days) * 86400
+        return time.time() > expires_at
+
+    def _stage(self, key: BufferKey, record: Optional[Dict[str, Any]]) -> None:
+        """Buffer a change (record, or None to delete) for the next flush."""
+        with self._lock:
+            # The buffered change supersedes the decoded copy
+            self._resident.pop(key, None)
+            self._pending[key] = record
+            if self._dirty_since is None:
+                self._dirty_since = time.monotonic()
+
+            due = (
+                len(self._pending) >= self.flush_entries
+                or time.monotonic() - self._dirty_since >= self.flush_interval
+            )
+            if due:
+                self._start_background_flush()
+
+    def _adjust_entry_count(self, delta: int) -> None:
+        """Apply a change to the running entry count (caller holds _lock)."""
+        if self._entry_count is not None:
+            self._entry_count = max(0, self._entry_count + delta)
+
+    def _take_pending(self) -> Dict[BufferKey, Optional[Dict[str, Any]]]:
+        """Move the pending buffer to in-flight (caller holds _lock)."""
+        batch = self._pending
+        self._pending = {}
+        self._inflight = batch
+        self._dirty_since = None
+        return batch
+
+    def _start_background_flush(self) -> None:
+        """Hand the pending buffer to the writer thread (caller holds _lock)."""
+        if self._flush_future is not None and not self._flush_future.done():
+            # One flush at a time; the next change re-checks the threshold
+            return
+        if not self._pending:
             return
 
-        try:
-            self._ensure_cache_directory()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="curateur-cache"
+            )
+        batch = self._take_pending()
+        self._flush_future = self._executor.submit(self._write_batch, batch)
 
-            # Write to temporary file first
-            temp_file = self.cache_file.with_suffix(".tmp")
-            with open(temp_file, "w", encoding="utf-8") as f:
-                json.dump(self._memory_cache, f, indent=2, ensure_ascii=False)
+    def _write_batch(self, batch: Dict[BufferKey, Optional[Dict[str, Any]]]) -> None:
+        """Write a batch of buffered changes in one transaction."""
+        start = time.perf_counter()
+        written_bytes = 0
+        entry_delta = 0
 
-            # Atomic rename
-            temp_file.replace(self.cache_file)
+        with self._write_lock:
+            try:
+                with self._transaction(self._writer()) as conn:
+                    for key, record in batch.items():
+                        if key[0] == _NOT_FOUND:
+                            self._write_not_found(conn, key[1], key[2], record)
+                        elif record is None:
+                            entry_delta -= conn.execute(
+                                "DELETE FROM entries WHERE rom_hash = ?", (key[1],)
+                            ).rowcount
+                        else:
+                            if not self._entry_exists(conn, key[1]):
+                                entry_delta += 1
+                            written_bytes += self._upsert(conn, key[1], record)
+            except sqlite3.Error as e:
+                logger.error(f"Failed to flush {len(batch)} cache entries: {e}")
+                with self._lock:
+                    # Keep the batch unless newer changes superseded it
+                    for key, record in batch.items():
+                        self._pending.setdefault(key, record)
+                    self._inflight = {}
+                return
+
+            # Still under _write_lock, so no count taken meanwhile misses it
+            with self._lock:
+                self._adjust_entry_count(entry_delta)
+
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            if self._inflight is batch:
+                self._inflight = {}
+            self._flush_count += 1
+            self._flushed_entries += len(batch)
+            self._flushed_bytes += written_bytes
+            self._flush_seconds_total += elapsed
+            self._flush_seconds_max = max(self._flush_seconds_max, elapsed)
+            self._flush_seconds_last = elapsed
 
-            logger.debug(f"Saved cache: {len(self._memory_cache)} entries")
+        logger.debug(
+            f"Flushed {len(batch)} cache entries ({written_bytes} bytes) "
+            f"in {elapsed * 1000:.1f}ms"
+        )
 
-        except (IOError, OSError) as e:
-            logger.error(f"Failed to save cache: {e}")
+    def flush(self) -> None:
+        """
+        Write all buffered changes to disk and wait for them to land.
+
+        Blocking - call via asyncio.to_thread() from async code.
+        """
+        if not self.enabled:
+            return
+
+        while True:
+            with self._lock:
+                future = self._flush_future
+                if future is None or future.done():
+                    if not self._pending:
+                        return
+                    self._start_background_flush()
+                    future = self._flush_future
+            future.result()
 
     def get(
         self, rom_hash: str, rom_size: Optional[int] = None
@@ -141,46 +672,108 @@ class MetadataCache:
 
         Returns:
             Complete cache entry dict with 'response', 'rom_hash', 'media_hashes', etc.
+            (plus 'stale': True if past its TTL but within stale_days)
             or None if not found/expired/invalid
         """
         if not self.enabled:
             return None
 
-        # Ensure cache is loaded
-        self._load_cache()
+        record = self._fresh_record(rom_hash, rom_size)
+        if record is None:
+            record = self._get_shared(rom_hash, rom_size)
+            if record is None:
+                self._misses += 1
+                return None
+            self._shared_hits += 1
+
+        entry = {
+            "response": record["response"],
+            "rom_hash": rom_hash,
+            "timestamp": datetime.fromtimestamp(record["created_at"]).isoformat(),
+            "ttl_days": record["ttl_days"],
+        }
+        if record["rom_size"] is not None:
+            entry["rom_size"] = record["rom_size"]
+        if record["media_hashes"]:
+            entry["media_hashes"] = dict(record["media_hashes"])
+        if self._record_expired(record):
+            entry["stale"] = True
+            self._stale_hits += 1
+            logger.debug(f"Cache hit (stale): {rom_hash}")
+        else:
+            logger.debug(f"Cache hit: {rom_hash}")
+
+        self._hits += 1
+        return entry
+
+    def _fresh_record(
+        self, rom_hash: str, rom_size: Optional[int]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Look up a record, dropping it if expired or recorded for another size.
+
+        Returns:
+            Record dict, or None on a miss
+        """
+        with self._lock:
+            record = self._lookup((_ENTRIES, rom_hash))
 
         # Check if entry exists
-        if rom_hash not in self._memory_cache:
+        if record is None:
             logger.debug(f"Cache miss: {rom_hash}")
-            self._misses += 1
             return None
 
-        entry = self._memory_cache[rom_hash]
-
-        # Check if expired
-        if self._is_expired(entry):
+        # Check if expired (beyond the stale window, if any)
+        if self._record_expired(record, self.stale_days):
             logger.debug(f"Cache expired: {rom_hash}")
             # Remove expired entry
-            del self._memory_cache[rom_hash]
-            self._misses += 1
+            self._stage((_ENTRIES, rom_hash), None)
             return None
 
         # Validate ROM size if provided (quick validation without rehashing)
-        if rom_size is not None and "rom_size" in entry:
-            if entry["rom_size"] != rom_size:
+        cached_size = record["rom_size"]
+        if rom_size is not None and cached_size is not None:
+            if cached_size != rom_size:
                 logger.warning(
                     f"Cache entry size mismatch for {rom_hash}: "
-                    f"cached={entry['rom_size']}, actual={rom_size}. "
+                    f"cached={cached_size}, actual={rom_size}. "
                     f"ROM may have been replaced."
                 )
                 # Remove invalid entry
-                del self._memory_cache[rom_hash]
-                self._misses += 1
+                self._stage((_ENTRIES, rom_hash), None)
                 return None
 
-        logger.debug(f"Cache hit: {rom_hash}")
-        self._hits += 1
-        return entry
+        return record
+
+    def _shared_key(self, rom_hash: str, rom_size: Optional[int]) -> Optional[str]:
+        """Get this entry's key in the global cache, if it can be shared."""
+        if self.shared is None or not self.shared.enabled or rom_size is None:
+            return None
+        return shared_cache_key(self.shared_namespace, rom_hash, rom_size)
+
+    def _get_shared(
+        self, rom_hash: str, rom_size: Optional[int]
+    ) -> Optional[Dict[str, Any]]:
+        """Fall through to the global cache and copy a hit into this one."""
+        key = self._shared_key(rom_hash, rom_size)
+        if key is None:
+            return None
+
+        shared_record = self.shared._fresh_record(key, rom_size)
+        if shared_record is None:
+            return None
+
+        # Keep the original creation time so the copy expires with its source
+        record = {
+            "response": shared_record["response"],
+            "rom_size": rom_size,
+            "created_at": shared_record["created_at"],
+            "ttl_days": shared_record["ttl_days"],
+            "media_hashes": {},
+        }
+        self._stage((_ENTRIES, rom_hash), record)
+        logger.debug(f"Global cache hit: {key}")
+        return record
 
     def put(
         self,
@@ -201,25 +794,21 @@ class MetadataCache:
         if not self.enabled:
             return
 
-        # Ensure cache is loaded
-        self._load_cache()
-
-        # Create cache entry
-        entry = {
-            "response": response,
-            "rom_hash": rom_hash,
-            "timestamp": datetime.now().isoformat(),
-            "ttl_days": self.ttl_days,
-        }
-
-        # Add optional fields
-        if rom_size is not None:
-            entry["rom_size"] = rom_size
+        self._stage(
+            (_ENTRIES, rom_hash),
+            {
+                "response": response,
+                "rom_size": rom_size,
+                "created_at": time.time(),
+                "ttl_days": self.ttl_days,
+                "media_hashes": dict(media_hashes) if media_hashes else {},
+            },
+        )
 
-        if media_hashes:
-            entry["media_hashes"] = media_hashes
+        shared_key = self._shared_key(rom_hash, rom_size)
+        if shared_key is not None:
+            self.shared.put(shared_key, response, rom_size=rom_size)
 
-        self._memory_cache[rom_hash] = entry
         logger.debug(
             "Cached response: %s (rom_size=%s, media_count=%s)",
             rom_hash,
@@ -227,59 +816,120 @@ class MetadataCache:
             len(media_hashes) if media_hashes else 0,
         )
 
-        # Save to disk
-        self._save_cache()
-
-    def _is_expired(self, entry: Dict[str, Any]) -> bool:
+    def is_not_found(
+        self, rom_hash: str, endpoint: str, rom_size: Optional[int] = None
+    ) -> bool:
         """
-        Check if cache entry is expired.
+        Check whether an endpoint recently reported a ROM as unknown.
 
         Args:
-            entry: Cache entry dict
+            rom_hash: ROM hash
+            endpoint: API endpoint that reported the miss (e.g. 'jeuInfos.php')
+            rom_size: ROM file size for validation (optional)
 
         Returns:
-            True if expired, False otherwise
+            True while the negative entry's TTL has not run out
         """
-        try:
-            timestamp = datetime.fromisoformat(entry["timestamp"])
-            ttl_days = entry.get("ttl_days", self.ttl_days)
-            expiry = timestamp + timedelta(days=ttl_days)
+        if not self.enabled or self.negative_ttl_days <= 0:
+            return False
 
-            return datetime.now() > expiry
+        with self._lock:
+            record = self._lookup((_NOT_FOUND, rom_hash, endpoint))
 
-        except (KeyError, ValueError) as e:
-            logger.warning(f"Invalid cache entry format: {e}")
-            return True
+        if record is None:
+            return False
+        if rom_size is not None and record["rom_size"] not in (None, rom_size):
+            return False
+        if time.time() > record["checked_at"] + record["ttl_days"] * 86400:
+            return False
+
+        logger.debug(
+            f"Negative cache hit: {rom_hash} ({endpoint}, "
+            f"{record['miss_count']} misses)"
+        )
+        self._negative_hits += 1
+        return True
+
+    def record_not_found(
+        self, rom_hash: str, endpoint: str, rom_size: Optional[int] = None
+    ) -> float:
+        """
+        Remember that an endpoint does not know a ROM.
+
+        The first miss is trusted for negative_ttl_days; each repeat miss
+        doubles the TTL up to negative_max_ttl_days.
+
+        Args:
+            rom_hash: ROM hash
+            endpoint: API endpoint that reported the miss
+            rom_size: ROM file size in bytes (optional)
+
+        Returns:
+            TTL in days given to the entry (0 if not recorded)
+        """
+        if not self.enabled or self.negative_ttl_days <= 0:
+            return 0.0
+
+        key = (_NOT_FOUND, rom_hash, endpoint)
+        with self._lock:
+            previous = self._lookup(key)
+            miss_count = 1
+            if previous is not None and previous["rom_size"] in (None, rom_size):
+                miss_count = previous["miss_count"] + 1
+
+            ttl_days = min(
+                self.negative_ttl_days * 2 ** (miss_count - 1),
+                self.negative_max_ttl_days,
+            )
+            self._stage(
+                key,
+                {
+                    "rom_size": rom_size,
+                    "miss_count": miss_count,
+                    "checked_at": time.time(),
+                    "ttl_days": ttl_days,
+                },
+            )
+
+        logger.debug(
+            f"Recorded not found: {rom_hash} ({endpoint}, miss {miss_count}, "
+            f"retry in {ttl_days:g} days)"
+        )
+        return ttl_days
 
     def cleanup_expired(self) -> int:
         """
         Remove expired entries from cache.
 
+        Entries still within the stale window are kept.
+
         Returns:
             Number of entries removed
         """
         if not self.enabled:
             return 0
 
-        # Ensure cache is loaded
-        self._load_cache()
-
-        # Find expired entries
-        expired_hashes = [
-            rom_hash
-            for rom_hash, entry in self._memory_cache.items()
-            if self._is_expired(entry)
-        ]
-
-        # Remove expired entries
-        for rom_hash in expired_hashes:
-            del self._memory_cache[rom_hash]
-
-        removed_count = len(expired_hashes)
+        self.flush()
+        now = time.time()
+        with self._write_lock:
+            conn = self._writer()
+            cursor = conn.execute(
+                f"DELETE FROM entries WHERE {_EXPIRES_AT} + ? < ?",
+                (self.stale_days * 86400, now),
+            )
+            removed_count = cursor.rowcount
+            with self._lock:
+                self._adjust_entry_count(-removed_count)
+            # Negative entries outlive their TTL by negative_max_ttl_days so a
+            # repeat miss still extends the TTL instead of starting over
+            conn.execute(
+                "DELETE FROM not_found WHERE checked_at + (ttl_days + ?) * 86400 < ?",
+                (self.negative_max_ttl_days, now),
+            )
+        self._drop_resident()
 
         if removed_count > 0:
             logger.info(f"Cleaned up {removed_count} expired cache entries")
-            self._save_cache()
 
         return removed_count
 
@@ -287,28 +937,67 @@ class MetadataCache:
         """
         Clear all cache entries.
 
+        Entries for this system's namespace in the global cache are removed
+        too, so a cleared cache is not refilled from it.
+
         Returns:
             Number of entries removed
         """
         if not self.enabled:
             return 0
 
-        # Ensure cache is loaded
-        self._load_cache()
-
-        count = len(self._memory_cache)
-        self._memory_cache = {}
+        if self.shared is not None and self.shared.enabled:
+            self.shared.clear_namespace(self.shared_namespace)
 
-        # Remove cache file
-        if self.cache_file.exists():
+        self.flush()
+        with self._write_lock:
             try:
-                self.cache_file.unlink()
+                conn = self._writer()
+                count = conn.execute("DELETE FROM entries").rowcount
+                with self._lock:
+                    self._entry_count = 0
+                conn.execute("DELETE FROM not_found")
+                conn.execute("VACUUM")
                 logger.info(f"Cleared cache: {count} entries removed")
-            except OSError as e:
-                logger.error(f"Failed to remove cache file: {e}")
+            except sqlite3.Error as e:
+                logger.error(f"Failed to clear cache: {e}")
+                return 0
+        self._drop_resident()
 
         return count
 
+    def clear_namespace(self, namespace: str) -> int:
+        """
+        Remove the global cache entries of one systemeid.
+
+        Args:
+            namespace: Key prefix passed to shared_cache_key()
+
+        Returns:
+            Number of entries removed
+        """
+        if not self.enabled:
+            return 0
+
+        self.flush()
+        # Range over the primary key: every "<namespace>:..." key sorts
+        # between "<namespace>:" and "<namespace>;"
+        with self._write_lock:
+            count = (
+                self._writer()
+                .execute(
+                    "DELETE FROM entries WHERE rom_hash >= ? AND rom_hash < ?",
+                    (f"{namespace}:", f"{namespace};"),
+                )
+                .rowcount
+            )
+            with self._lock:
+                self._adjust_entry_count(-count)
+        self._drop_resident()
+
+        logger.info(f"Cleared {count} global cache entries for systemeid {namespace}")
+        return count
+
     def get_media_hash(self, rom_hash: str, media_type: str) -> Optional[str]:
         """
         Get cached media hash for a specific media type.
@@ -323,16 +1012,26 @@ class MetadataCache:
         if not self.enabled:
             return None
 
-        # Ensure cache is loaded
-        self._load_cache()
+        with self._lock:
+            found, record = self._buffered((_ENTRIES, rom_hash))
+            if not found:
+                # Media hashes live in their own table: no need to decode
+                # the response
+                row = (
+                    self._connection()
+                    .execute(
+                        "SELECT hash FROM media_hashes "
+                        "WHERE rom_hash = ? AND media_type = ?",
+                        (rom_hash, media_type),
+                    )
+                    .fetchone()
+                )
+                return row[0] if row else None
 
-        if rom_hash not in self._memory_cache:
+        if record is None:
             return None
 
-        entry = self._memory_cache[rom_hash]
-        media_hashes = entry.get("media_hashes", {})
-
-        return media_hashes.get(media_type)
+        return record["media_hashes"].get(media_type)
 
     def update_media_hashes(self, rom_hash: str, media_hashes: Dict[str, str]) -> None:
         """
@@ -345,39 +1044,372 @@ class MetadataCache:
         if not self.enabled:
             return
 
-        # Ensure cache is loaded
-        self._load_cache()
-
-        if rom_hash not in self._memory_cache:
-            logger.warning(
-                f"Cannot update media hashes: cache entry not found for {rom_hash}"
-            )
-            return
-
-        entry = self._memory_cache[rom_hash]
-
-        # Merge media hashes
-        if "media_hashes" not in entry:
-            entry["media_hashes"] = {}
+        with self._lock:
+            record = self._lookup((_ENTRIES, rom_hash))
+            if record is None:
+                logger.warning(
+                    f"Cannot update media hashes: cache entry not found for {rom_hash}"
+                )
+                return
 
-        entry["media_hashes"].update(media_hashes)
+            # Merge media hashes into a copy so in-flight batches stay intact
+            record = dict(record)
+            record["media_hashes"] = {**record["media_hashes"], **media_hashes}
+            self._stage((_ENTRIES, rom_hash), record)
 
         logger.debug(
             f"Updated media hashes for {rom_hash}: {list(media_hashes.keys())}"
         )
 
-        # Save to disk
-        self._save_cache()
+    def close(self) -> None:
+        """Flush buffered changes and close the cache database."""
+        if self.enabled:
+            self.flush()
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+            self._flush_future = None
+
+        with self._write_lock, self._lock:
+            self._close_connections()
+
+    @property
+    def _corrupt_file(self) -> Path:
+        """Where a damaged database is kept after salvaging it."""
+        return self.cache_file.with_name(self.cache_file.name + ".corrupt")
+
+    def _salvage(self) -> Tuple[int, int]:
+        """
+        Move a damaged database aside and copy its readable entries.
+
+        Both connections must be closed. Rows are read in rowid order; a
+        read that fails skips ahead one rowid, so a damaged page costs only
+        the rows stored on it.
+
+        Returns:
+            Tuple of (entries recovered, entries dropped)
+        """
+        for suffix in ("", "-wal", "-shm"):
+            source = Path(f"{self.cache_file}{suffix}")
+            if source.exists():
+                source.replace(Path(f"{self._corrupt_file}{suffix}"))
+
+        rows = []
+        media_rows = []
+        dropped = 0
+        try:
+            damaged = sqlite3.connect(f"file:{self._corrupt_file}?mode=ro", uri=True)
+        except sqlite3.Error as e:
+            logger.error(f"Cannot open damaged cache for salvage: {e}")
+            return 0, 0
+
+        try:
+            # Fails outright if the schema itself is unreadable
+            damaged.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+            last_rowid = 0
+            skips = 0
+            while skips < _SALVAGE_MAX_SKIPS:
+                try:
+                    batch = damaged.execute(
+                        "SELECT rowid, rom_hash, response, rom_size, created_at, "
+                        "ttl_days, checksum FROM entries WHERE rowid > ? "
+                        "ORDER BY rowid LIMIT 256",
+                        (last_rowid,),
+                    ).fetchall()
+                except sqlite3.DatabaseError:
+                    last_rowid += 1
+                    skips += 1
+                    dropped += 1
+                    continue
+                if not batch:
+                    break
+                for row in batch:
+                    last_rowid = row[0]
+                    if _response_intact(row[2], row[6]):
+                        rows.append(row[1:])
+                    else:
+                        dropped += 1
+
+            try:
+                media_rows = damaged.execute(
+                    "SELECT rom_hash, media_type, hash FROM media_hashes"
+                ).fetchall()
+            except sqlite3.DatabaseError as e:
+                logger.warning(f"Media hashes could not be salvaged: {e}")
+        except sqlite3.DatabaseError as e:
+            # Schema itself unreadable (e.g. not a database at all)
+            logger.error(f"Cannot read damaged cache: {e}")
+        finally:
+            damaged.close()
+
+        conn = self._open()
+        try:
+            with self._transaction(conn):
+                conn.executemany(
+                    "INSERT OR REPLACE INTO entries (rom_hash, response, rom_size, "
+                    "created_at, ttl_days, checksum) VALUES (?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                recovered = {row[0] for row in rows}
+                conn.executemany(
+                    "INSERT OR REPLACE INTO media_hashes (rom_hash, media_type, hash) "
+                    "VALUES (?, ?, ?)",
+                    [row for row in media_rows if row[0] in recovered],
+                )
+        finally:
+            conn.close()
+
+        return len(rows), dropped
+
+    def verify(self) -> Dict[str, Any]:
+        """
+        Check the database and every entry's checksum, dropping bad entries.
+
+        A database that fails SQLite's integrity check is rebuilt from its
+        readable rows (see _salvage()).
+
+        Returns:
+            Dict with entries checked, recovered and dropped, the integrity
+            check result, and whether the database was rebuilt
+        """
+        if not self.enabled:
+            return {"entries": 0, "recovered": 0, "dropped": 0, "rebuilt": False}
+
+        self.flush()
+        with self._write_lock:
+            try:
+                conn = self._writer()
+                integrity = conn.execute("PRAGMA quick_check").fetchone()[0]
+                damaged = []
+                total = 0
+                if integrity == "ok":
+                    for rom_hash, response, checksum in conn.execute(
+                        "SELECT rom_hash, response, checksum FROM entries"
+                    ).fetchall():
+                        total += 1
+                        if not _response_intact(response, checksum):
+                            damaged.append((rom_hash,))
+                    with self._transaction(conn):
+                        conn.executemany(
+                            "DELETE FROM entries WHERE rom_hash = ?", damaged
+                        )
+                    with self._lock:
+                        self._adjust_entry_count(-len(damaged))
+            except sqlite3.DatabaseError as e:
+                integrity = str(e)
+
+            if integrity == "ok":
+                self._drop_resident()
+                return {
+                    "entries": total,
+                    "recovered": total - len(damaged),
+                    "dropped": len(damaged),
+                    "integrity": integrity,
+                    "rebuilt": False,
+                }
+
+            logger.error(f"Metadata cache {self.cache_file} failed check: {integrity}")
+            with self._lock:
+                self._close_connections()
+                recovered, dropped = self._salvage()
+
+        return {
+            "entries": recovered + dropped,
+            "recovered": recovered,
+            "dropped": dropped,
+            "integrity": integrity,
+            "rebuilt": True,
+        }
+
+    def compact(self) -> Dict[str, Any]:
+        """
+        Drop expired entries and rewrite the database without free pages.
+
+        Returns:
+            Dict with expired entries removed and file size before/after
+        """
+        if not self.enabled:
+            return {"expired_removed": 0, "bytes_before": 0, "bytes_after": 0}
+
+        bytes_before = self._file_size()
+        expired_removed = self.cleanup_expired()
+        with self._write_lock:
+            conn = self._writer()
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            conn.execute("VACUUM")
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+        return {
+            "expired_removed": expired_removed,
+            "bytes_before": bytes_before,
+            "bytes_after": self._file_size(),
+        }
+
+    def export_entries(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield every intact entry, for cache bundles.
+
+        Rows are streamed from a snapshot of the database, so a large cache is
+        never held in memory at once. Damaged rows are skipped. Media hashes
+        describe files in this install and are not exported.
+
+        Yields:
+            Dicts with rom_hash, response, rom_size, created_at and ttl_days
+        """
+        if not self.enabled:
+            return
+
+        self.flush()
+        # Private connection: the snapshot stays consistent while the caller
+        # consumes it, without holding _lock
+        conn = self._open()
+        try:
+            rows = conn.execute(
+                "SELECT rom_hash, response, rom_size, created_at, ttl_days, "
+                "checksum FROM entries ORDER BY rom_hash"
+            )
+            for rom_hash, response, rom_size, created_at, ttl_days, checksum in rows:
+                if not _response_intact(response, checksum):
+                    logger.warning(f"Not exporting damaged cache entry {rom_hash}")
+                    continue
+                yield {
+                    "rom_hash": rom_hash,
+                    "response": _decode_response(response),
+                    "rom_size": rom_size,
+                    "created_at": created_at,
+                    "ttl_days": ttl_days,
+                }
+        finally:
+            conn.close()
+
+    def import_entries(self, entries: Iterable[Dict[str, Any]]) -> Tuple[int, int]:
+        """
+        Merge exported entries into this cache by ROM hash.
+
+        An entry replaces the local one only if it is newer; entries past
+        their TTL (and stale window) are skipped. Creation times and TTLs are
+        kept, so imported entries expire when they would have at the source.
+        Only metadata is merged: media hashes in the bundle describe another
+        install's files and are ignored, and local ones are kept.
+
+        Args:
+            entries: Records as yielded by export_entries()
+
+        Returns:
+            Tuple of (entries imported, entries skipped)
+        """
+        if not self.enabled:
+            return 0, 0
+
+        self.flush()
+        imported = 0
+        skipped = 0
+        added = 0
+        with self._write_lock:
+            with self._transaction(self._writer()) as conn:
+                for entry in entries:
+                    record = {
+                        "response": entry["response"],
+                        "rom_size": entry.get("rom_size"),
+                        "created_at": float(entry["created_at"]),
+                        "ttl_days": entry["ttl_days"],
+                        "media_hashes": {},
+                    }
+                    if self._record_expired(record, self.stale_days):
+                        skipped += 1
+                        continue
+
+                    row = conn.execute(
+                        "SELECT created_at FROM entries WHERE rom_hash = ?",
+                        (entry["rom_hash"],),
+                    ).fetchone()
+                    if row is not None and row[0] >= record["created_at"]:
+                        skipped += 1
+                        continue
+
+                    if row is not None:
+                        record["media_hashes"] = dict(
+                            conn.execute(
+                                "SELECT media_type, hash FROM media_hashes "
+                                "WHERE rom_hash = ?",
+                                (entry["rom_hash"],),
+                            ).fetchall()
+                        )
+                    self._upsert(conn, entry["rom_hash"], record)
+                    imported += 1
+                    if row is None:
+                        added += 1
+            with self._lock:
+                self._adjust_entry_count(added)
+        self._drop_resident()
+
+        logger.info(f"Imported {imported} cache entries ({skipped} skipped)")
+        return imported, skipped
+
+    def _file_size(self) -> int:
+        """Size of the database plus its WAL on disk."""
+        total = 0
+        for suffix in ("", "-wal"):
+            try:
+                total += Path(f"{self.cache_file}{suffix}").stat().st_size
+            except OSError:
+                pass
+        return total
+
+    def _close_connections(self) -> None:
+        """Close both connections (caller holds _write_lock and _lock)."""
+        self._resident.clear()
+        self._entry_count = None
+        for conn in (self._writer_conn, self._conn):
+            if conn is not None:
+                conn.close()
+        self._writer_conn = None
+        self._conn = None
+
+    def _count(self, where: str = "", params: tuple = ()) -> int:
+        """Count entries on disk matching an optional WHERE clause."""
+        query = f"SELECT COUNT(*) FROM entries {where}"
+        return self._connection().execute(query, params).fetchone()[0]
+
+    def _flush_stats(self) -> Dict[str, Any]:
+        """Write-behind statistics (caller holds _lock)."""
+        return {
+            "flushes": self._flush_count,
+            "flushed_entries": self._flushed_entries,
+            "flushed_bytes": self._flushed_bytes,
+            "flush_ms_total": round(self._flush_seconds_total * 1000, 3),
+            "flush_ms_max": round(self._flush_seconds_max * 1000, 3),
+            "flush_ms_last": round(self._flush_seconds_last * 1000, 3),
+        }
 
     def get_metrics(self) -> Dict[str, Any]:
-        """Get cache performance metrics."""
-        self._load_cache()
+        """
+        Get cache performance metrics.
+
+        Cheap enough to call per ROM: the entry count is counted on disk once
+        and then kept current by writes (buffered changes are not included).
+        """
         total_requests = self._hits + self._misses
         hit_rate = (self._hits / total_requests * 100) if total_requests > 0 else 0.0
+        total_entries = 0
+        if self.enabled:
+            with self._lock:
+                total_entries = self._entry_count
+            if total_entries is None:
+                # Counted between batches so no write is missed or doubled
+                with self._write_lock, self._lock:
+                    if self._entry_count is None:
+                        self._entry_count = self._count()
+                    total_entries = self._entry_count
         return {
             "hits": self._hits,
             "misses": self._misses,
-            "total_entries": len(self._memory_cache),
+            "shared_hits": self._shared_hits,
+            "negative_hits": self._negative_hits,
+            "stale_hits": self._stale_hits,
+            "resident_entries": len(self._resident),
+            "total_entries": total_entries,
             "hit_rate": hit_rate,
             "enabled": self.enabled,
         }
@@ -386,8 +1418,13 @@ class MetadataCache:
         """
         Get cache statistics.
 
+        Flushes buffered changes first so entry counts are exact. Blocking -
+        call via asyncio.to_thread() from async code (get_metrics() is the
+        cheap variant for progress updates).
+
         Returns:
-            Dict with cache stats (size, expired count, oldest entry, media coverage)
+            Dict with cache stats (size, expired count, oldest entry, media
+            coverage, negative entries, flush counts/bytes/latency)
         """
         if not self.enabled:
             return {
@@ -395,31 +1432,28 @@ class MetadataCache:
                 "total_entries": 0,
                 "expired_entries": 0,
                 "entries_with_media": 0,
+                "not_found_entries": 0,
             }
 
-        # Ensure cache is loaded
-        self._load_cache()
-
-        total_entries = len(self._memory_cache)
-        expired_entries = sum(
-            1 for entry in self._memory_cache.values() if self._is_expired(entry)
-        )
-
-        entries_with_media = sum(
-            1 for entry in self._memory_cache.values() if entry.get("media_hashes")
+        self.flush()
+        with self._lock:
+            conn = self._connection()
+            total_entries, oldest = conn.execute(
+                "SELECT COUNT(*), MIN(created_at) FROM entries"
+            ).fetchone()
+            expired_entries = self._count(f"WHERE {_EXPIRES_AT} < ?", (time.time(),))
+            entries_with_media = conn.execute(
+                "SELECT COUNT(DISTINCT rom_hash) FROM media_hashes"
+            ).fetchone()[0]
+            not_found_entries = conn.execute(
+                "SELECT COUNT(*) FROM not_found"
+            ).fetchone()[0]
+            flush_stats = self._flush_stats()
+
+        oldest_timestamp = (
+            datetime.fromtimestamp(oldest).isoformat() if oldest is not None else None
         )
 
-        oldest_timestamp = None
-        if self._memory_cache:
-            try:
-                timestamps = [
-                    datetime.fromisoformat(entry["timestamp"])
-                    for entry in self._memory_cache.values()
-                ]
-                oldest_timestamp = min(timestamps).isoformat()
-            except (KeyError, ValueError):
-                pass
-
         return {
             "enabled": True,
             "cache_file": str(self.cache_file),
@@ -427,6 +1461,8 @@ class MetadataCache:
             "expired_entries": expired_entries,
             "valid_entries": total_entries - expired_entries,
             "entries_with_media": entries_with_media,
+            "not_found_entries": not_found_entries,
             "oldest_entry": oldest_timestamp,
             "ttl_days": self.ttl_days,
+            **flush_stats,
         }
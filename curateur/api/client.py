@@ -1,6 +1,8 @@
 """ScreenScraper API client implementation."""
 
 import asyncio
+import copy
+import functools
 import logging
 import time
 from enum import Enum
@@ -11,8 +13,11 @@ import httpx
 
 from curateur.api.cache import MetadataCache
 from curateur.api.error_handler import (
+    ErrorCategory,
     FatalAPIError,
     SkippableAPIError,
+    categorize_error,
+    get_error_message,
     handle_http_status,
     retry_with_backoff,
 )
@@ -25,6 +30,8 @@ from curateur.api.response_parser import (
     parse_user_info,
     validate_response,
 )
+from curateur.api.revalidator import CacheRevalidator
+from curateur.api.single_flight import SingleFlight
 from curateur.api.system_map import get_systemeid
 from curateur.api.throttle import ThrottleManager
 from curateur.scanner.rom_types import ROMInfo
@@ -105,6 +112,14 @@ class ScreenScraperClient:
         # Metadata cache (optional)
         self.cache = cache
 
+        # Background refresh of stale cache entries (set per system by the
+        # orchestrator in stale-while-revalidate mode)
+        self.revalidator: Optional[CacheRevalidator] = None
+
+        # Identical jeuInfos lookups in flight at the same time (duplicate
+        # ROMs) share one request and one quota unit; joiners get a copy
+        self.lookups = SingleFlight(copy_result=copy.deepcopy)
+
         # Connection pool manager for health tracking (optional)
         self.connection_pool_manager = connection_pool_manager
 
@@ -126,8 +141,28 @@ class ScreenScraperClient:
         query_string = urlencode(redacted_params)
         return f"{url}?{query_string}"
 
+    def is_known_not_found(self, rom_info: ROMInfo) -> bool:
+        """
+        Check if ScreenScraper recently reported a ROM as unknown.
+
+        Args:
+            rom_info: ROM information from scanner
+
+        Returns:
+            True if the negative cache holds the ROM (never in force mode)
+        """
+        cache_key = rom_info.hash_value or getattr(rom_info, "fingerprint", None)
+        if self.cache is None or self.scrape_mode == "force" or not cache_key:
+            return False
+        return self.cache.is_not_found(
+            cache_key, APIEndpoint.JEU_INFOS.value, rom_size=rom_info.file_size
+        )
+
     async def query_game(
-        self, rom_info: ROMInfo, shutdown_event: Optional[asyncio.Event] = None
+        self,
+        rom_info: ROMInfo,
+        shutdown_event: Optional[asyncio.Event] = None,
+        known_not_found: Optional[bool] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Query ScreenScraper for game information.
@@ -135,6 +170,8 @@ class ScreenScraperClient:
         Args:
             rom_info: ROM information from scanner
             shutdown_event: Optional event to check for cancellation
+            known_not_found: Result of is_known_not_found() if the caller
+                already checked it (None to check here)
 
         Returns:
             Game data dictionary or None if not found
@@ -154,32 +191,75 @@ class ScreenScraperClient:
         except KeyError as e:
             raise SkippableAPIError(f"Platform not mapped: {e}")
 
+        digests = self._rom_digests(rom_info)
+        cache_key = rom_info.hash_value or getattr(rom_info, "fingerprint", None)
+
+        # Skip ROMs ScreenScraper recently reported as unknown
+        use_negative_cache = (
+            self.cache is not None and self.scrape_mode != "force" and cache_key
+        )
+        if known_not_found is None:
+            known_not_found = self.is_known_not_found(rom_info)
+        if known_not_found:
+            raise SkippableAPIError(
+                f"{get_error_message(404)} ({rom_info.query_filename}, cached)"
+            )
+
         # Build API request
         async def make_request():
             return await self._query_jeu_infos(
                 systemeid=systemeid,
                 romnom=rom_info.query_filename,
                 romtaille=rom_info.file_size,
-                crc=rom_info.hash_value,
+                crc=digests["crc32"],
+                md5=digests["md5"],
+                sha1=digests["sha1"],
+                cache_key=cache_key,
                 shutdown_event=shutdown_event,
             )
 
         # Execute with retry
         context = f"{rom_info.filename} ({rom_info.system.upper()})"
 
-        try:
-            game_data = await retry_with_backoff(
-                make_request,
-                max_attempts=self.max_retries,
-                initial_delay=self.retry_backoff,
-                backoff_factor=2.0,
-                context=context,
+        async def lookup():
+            try:
+                return await retry_with_backoff(
+                    make_request,
+                    max_attempts=self.max_retries,
+                    initial_delay=self.retry_backoff,
+                    backoff_factor=2.0,
+                    context=context,
+                )
+            except FatalAPIError:
+                raise
+            except SkippableAPIError as e:
+                if use_negative_cache:
+                    _, category = categorize_error(e)
+                    if category == ErrorCategory.NOT_FOUND:
+                        self.cache.record_not_found(
+                            cache_key,
+                            APIEndpoint.JEU_INFOS.value,
+                            rom_size=rom_info.file_size,
+                        )
+                raise
+            except Exception as e:
+                # Convert other errors to skippable
+                raise SkippableAPIError(f"API error: {e}")
+
+        # ScreenScraper identifies a ROM by its digests and size, so
+        # concurrent lookups agreeing on those get the same answer whatever
+        # the filename. Without any digest the filename decides: no sharing.
+        if any(digests.values()):
+            flight_key = (
+                systemeid,
+                digests["crc32"],
+                digests["md5"],
+                digests["sha1"],
+                rom_info.file_size,
             )
-        except (FatalAPIError, SkippableAPIError):
-            raise
-        except Exception as e:
-            # Convert other errors to skippable
-            raise SkippableAPIError(f"API error: {e}")
+            game_data = await self.lookups.run(flight_key, lookup)
+        else:
+            game_data = await lookup()
 
         # Verify game name matches ROM
         if game_data and "name" in game_data:
@@ -346,6 +426,23 @@ class ScreenScraperClient:
             )
             logger.info(f"Updated request_timeout to {request_timeout}s")
 
+    @staticmethod
+    def _rom_digests(rom_info: ROMInfo) -> Dict[str, Optional[str]]:
+        """
+        Collect the CRC32/MD5/SHA1 digests known for a ROM.
+
+        Falls back to hash_value for its own hash_type so ROM objects that
+        only carry the primary hash still send it under the right parameter.
+        """
+        digests = {
+            algorithm: getattr(rom_info, algorithm, None)
+            for algorithm in ("crc32", "md5", "sha1")
+        }
+        hash_type = getattr(rom_info, "hash_type", "crc32")
+        if hash_type in digests and not digests[hash_type]:
+            digests[hash_type] = rom_info.hash_value
+        return digests
+
     async def _query_jeu_infos(
         self,
         systemeid: int,
@@ -353,6 +450,10 @@ class ScreenScraperClient:
         romtaille: int,
         crc: Optional[str] = None,
         shutdown_event: Optional[asyncio.Event] = None,
+        md5: Optional[str] = None,
+        sha1: Optional[str] = None,
+        cache_key: Optional[str] = None,
+        refresh: bool = False,
     ) -> Dict[str, Any]:
         """
         Query jeuInfos.php endpoint.
@@ -363,6 +464,11 @@ class ScreenScraperClient:
             romtaille: File size in bytes
             crc: CRC32 hash (optional)
             shutdown_event: Optional event to check for cancellation
+            md5: MD5 hash (optional)
+            sha1: SHA1 hash (optional)
+            cache_key: Hash used as the metadata cache key (defaults to crc)
+            refresh: Skip the cache lookup but store the response (used to
+                revalidate stale entries)
 
         Returns:
             Parsed game data
@@ -371,12 +477,30 @@ class ScreenScraperClient:
             Various API errors
             asyncio.CancelledError: If shutdown is requested
         """
+        cache_key = cache_key or crc
+
         # Check cache first (unless scrape_mode is 'force')
         use_cache = self.cache and self.scrape_mode != "force"
-        if use_cache and crc:
-            cached_entry = self.cache.get(crc, rom_size=romtaille)
+        if use_cache and cache_key and not refresh:
+            cached_entry = self.cache.get(cache_key, rom_size=romtaille)
             if cached_entry is not None:
-                logger.debug(f"Cache hit for {romnom} (hash={crc})")
+                logger.debug(f"Cache hit for {romnom} (hash={cache_key})")
+                if cached_entry.get("stale") and self.revalidator:
+                    # Serve the stale entry now, refresh it when idle
+                    self.revalidator.submit(
+                        cache_key,
+                        functools.partial(
+                            self._query_jeu_infos,
+                            systemeid=systemeid,
+                            romnom=romnom,
+                            romtaille=romtaille,
+                            crc=crc,
+                            md5=md5,
+                            sha1=sha1,
+                            cache_key=cache_key,
+                            refresh=True,
+                        ),
+                    )
                 return cached_entry.get("response")
 
         # Wait for rate limit
@@ -396,8 +520,13 @@ class ScreenScraperClient:
             "romtype": "rom",
         }
 
+        # Send every digest we have; ScreenScraper matches on any of them
         if crc:
             params["crc"] = crc
+        if md5:
+            params["md5"] = md5
+        if sha1:
+            params["sha1"] = sha1
 
         # Make request
         url = f"{self.BASE_URL}/jeuInfos.php"
@@ -418,11 +547,8 @@ class ScreenScraperClient:
                 try:
                     from ..ui.events import APIActivityEvent
 
-                    # Calculate in-flight requests (max - available slots)
-                    in_flight = (
-                        self.throttle_manager.max_concurrent
-                        - self.throttle_manager.concurrency_semaphore._value
-                    )
+                    # Calculate in-flight requests (slots currently held)
+                    in_flight = self.throttle_manager.concurrency_semaphore.in_flight
                     await self.event_bus.publish(
                         APIActivityEvent(
                             metadata_in_flight=in_flight,
@@ -479,6 +605,7 @@ class ScreenScraperClient:
                 # Expected when cancelling task during shutdown
                 raise
             except httpx.TimeoutException:
+                self.throttle_manager.record_api_overload("timeout")
                 if self.connection_pool_manager:
                     if self.connection_pool_manager.record_timeout():
                         logger.warning(
@@ -507,6 +634,14 @@ class ScreenScraperClient:
                     f"API Response: {response.status_code} in {elapsed_time:.2f}s"
                 )
 
+            # Feed server health into the adaptive concurrency limit
+            if response.status_code >= 500:
+                self.throttle_manager.record_api_overload(
+                    f"HTTP {response.status_code}"
+                )
+            elif response.status_code == 200:
+                self.throttle_manager.record_api_success(elapsed_time)
+
             # Handle HTTP status (pass throttle_manager for 429 handling)
             handle_http_status(
                 response.status_code,
@@ -570,8 +705,8 @@ class ScreenScraperClient:
                 raise SkippableAPIError(str(e))
 
             # Store in cache if enabled and we have a hash
-            if use_cache and crc and game_data:
-                self.cache.put(crc, game_data, rom_size=romtaille)
+            if use_cache and cache_key and game_data:
+                self.cache.put(cache_key, game_data, rom_size=romtaille)
                 logger.debug(
                     f"Cached response for {romnom} (hash={crc}, size={romtaille})"
                 )
@@ -583,9 +718,7 @@ class ScreenScraperClient:
 
                     # Calculate in-flight after this completes
                     in_flight = (
-                        self.throttle_manager.max_concurrent
-                        - self.throttle_manager.concurrency_semaphore._value
-                        - 1
+                        self.throttle_manager.concurrency_semaphore.in_flight - 1
                     )
                     await self.event_bus.publish(
                         APIActivityEvent(
@@ -720,11 +853,8 @@ class ScreenScraperClient:
                 try:
                     from ..ui.events import APIActivityEvent
 
-                    # Calculate in-flight requests (max - available slots)
-                    in_flight = (
-                        self.throttle_manager.max_concurrent
-                        - self.throttle_manager.concurrency_semaphore._value
-                    )
+                    # Calculate in-flight requests (slots currently held)
+                    in_flight = self.throttle_manager.concurrency_semaphore.in_flight
                     await self.event_bus.publish(
                         APIActivityEvent(
                             metadata_in_flight=in_flight,
@@ -781,6 +911,7 @@ class ScreenScraperClient:
                 # Expected when cancelling task during shutdown
                 raise
             except httpx.TimeoutException:
+                self.throttle_manager.record_api_overload("timeout")
                 if self.connection_pool_manager:
                     if self.connection_pool_manager.record_timeout():
                         logger.warning(
@@ -809,6 +940,14 @@ class ScreenScraperClient:
                     f"API Response: {response.status_code} in {elapsed_time:.2f}s"
                 )
 
+            # Feed server health into the adaptive concurrency limit
+            if response.status_code >= 500:
+                self.throttle_manager.record_api_overload(
+                    f"HTTP {response.status_code}"
+                )
+            elif response.status_code == 200:
+                self.throttle_manager.record_api_success(elapsed_time)
+
             # Handle HTTP status (pass throttle_manager for 429 handling)
             handle_http_status(
                 response.status_code,
@@ -870,9 +1009,7 @@ class ScreenScraperClient:
 
                     # Calculate in-flight after this completes
                     in_flight = (
-                        self.throttle_manager.max_concurrent
-                        - self.throttle_manager.concurrency_semaphore._value
-                        - 1
+                        self.throttle_manager.concurrency_semaphore.in_flight - 1
                     )
                     await self.event_bus.publish(
                         APIActivityEvent(
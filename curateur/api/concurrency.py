@@ -0,0 +1,236 @@
+"""
+Adaptive concurrency limiting
+
+An asyncio semaphore whose size is tuned by additive-increase /
+multiplicative-decrease (AIMD) from how the server is coping: it grows
+while requests succeed quickly and shrinks on 429s, timeouts, server errors
+and, optionally, when latency climbs well above its usual level.
+"""
+
+import asyncio
+import logging
+import statistics
+import time
+from collections import deque
+from typing import Callable, Deque, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveConcurrency:
+    """
+    Concurrency limit between floor and ceiling, adjusted by AIMD
+
+    - Each successful request adds increase / limit, i.e. about +increase
+      per round of `limit` requests (TCP congestion avoidance).
+    - An overload signal multiplies the limit by `decrease`, at most once per
+      cooldown so a burst of failures from one round counts once.
+    - With latency_tolerance set, latencies are collected in windows of
+      `window` samples. When a window's p90 exceeds latency_tolerance times
+      the baseline (a slowly rising minimum of past medians), that counts as
+      an overload signal.
+
+    Used like asyncio.Semaphore (`async with limiter:`); requests wait in
+    FIFO order. With adaptive=False it is a fixed-size semaphore.
+    """
+
+    def __init__(
+        self,
+        ceiling: int,
+        floor: int = 1,
+        initial: Optional[int] = None,
+        adaptive: bool = True,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        latency_tolerance: Optional[float] = 2.0,
+        window: int = 20,
+        cooldown: float = 2.0,
+        name: str = "requests",
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize adaptive concurrency limit
+
+        Args:
+            ceiling: Upper bound for the limit (e.g. API maxthreads)
+            floor: Lower bound for the limit
+            initial: Starting limit (default: ceiling)
+            adaptive: Adjust the limit from outcomes (False = fixed limit)
+            increase: Additive increase per round of successful requests
+            decrease: Multiplicative decrease factor on overload (0-1)
+            latency_tolerance: p90 / baseline latency ratio treated as
+                overload (None ignores latency, e.g. for variable-size
+                downloads)
+            window: Latency samples per evaluation
+            cooldown: Minimum seconds between two decreases
+            name: Label for log messages
+            clock: Monotonic time source in seconds (injectable for tests)
+        """
+        self.ceiling = max(1, ceiling)
+        self.floor = max(1, min(floor, self.ceiling))
+        self.adaptive = adaptive
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_tolerance = latency_tolerance
+        self.window = max(1, window)
+        self.cooldown = cooldown
+        self.name = name
+        self._clock = clock
+
+        start = self.ceiling if initial is None else initial
+        self._limit = float(max(self.floor, min(start, self.ceiling)))
+        self.in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+        self._samples: list = []
+        self.baseline_latency: Optional[float] = None
+        self._last_decrease: Optional[float] = None
+
+        self.increases = 0
+        self.decreases = 0
+
+    @property
+    def limit(self) -> int:
+        """Current number of concurrent slots."""
+        return max(self.floor, int(self._limit))
+
+    def locked(self) -> bool:
+        """True if acquire() would wait."""
+        return self.in_flight >= self.limit or bool(self._waiters)
+
+    async def acquire(self) -> None:
+        """Wait for a free slot."""
+        if not self.locked():
+            self.in_flight += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Slot was handed over just as we were cancelled: pass it on
+                self.in_flight -= 1
+                self._wake()
+            elif future in self._waiters:
+                self._waiters.remove(future)
+            raise
+
+    def release(self) -> None:
+        """Free a slot and wake waiters the current limit allows."""
+        self.in_flight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        """Hand free slots to waiters in FIFO order."""
+        while self._waiters and self.in_flight < self.limit:
+            future = self._waiters.popleft()
+            if not future.done():
+                self.in_flight += 1
+                future.set_result(None)
+
+    async def __aenter__(self) -> "AdaptiveConcurrency":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.release()
+
+    def set_ceiling(self, ceiling: int) -> None:
+        """
+        Change the upper bound (e.g. new API maxthreads), starting there
+
+        Args:
+            ceiling: New upper bound
+        """
+        self.ceiling = max(1, ceiling)
+        self.floor = min(self.floor, self.ceiling)
+        self._limit = float(self.ceiling)
+        self._wake()
+
+    def record_success(self, latency: Optional[float] = None) -> None:
+        """
+        Account for a request that completed normally
+
+        Args:
+            latency: Request duration in seconds (optional)
+        """
+        if not self.adaptive:
+            return
+
+        if latency is not None and self.latency_tolerance is not None:
+            self._samples.append(latency)
+            if len(self._samples) >= self.window:
+                if self._latency_congested():
+                    return
+
+        if self._limit < self.ceiling:
+            before = self.limit
+            self._limit = min(
+                float(self.ceiling), self._limit + self.increase / self._limit
+            )
+            if self.limit > before:
+                self.increases += 1
+                logger.debug(f"Concurrency for {self.name} raised to {self.limit}")
+                self._wake()
+
+    def record_overload(self, reason: str = "overload") -> None:
+        """
+        Account for a 429, timeout or server error
+
+        Args:
+            reason: What happened, for logging
+        """
+        if not self.adaptive:
+            return
+
+        now = self._clock()
+        if self._last_decrease is not None and now - self._last_decrease < (
+            self.cooldown
+        ):
+            return
+        self._last_decrease = now
+
+        before = self.limit
+        self._limit = max(float(self.floor), self._limit * self.decrease)
+        self.decreases += 1
+        if self.limit < before:
+            logger.info(
+                f"Concurrency for {self.name} lowered {before} -> {self.limit} "
+                f"({reason})"
+            )
+
+    def _latency_congested(self) -> bool:
+        """Evaluate a full latency window; True if it signalled overload."""
+        samples = sorted(self._samples)
+        self._samples = []
+        median = statistics.median(samples)
+        p90 = samples[min(len(samples) - 1, int(len(samples) * 0.9))]
+
+        baseline = self.baseline_latency
+        congested = baseline is not None and p90 > baseline * self.latency_tolerance
+
+        # Baseline: minimum of past medians, drifting up slowly so a server
+        # that is permanently slower is eventually accepted as normal
+        if baseline is None or median < baseline:
+            self.baseline_latency = median
+        else:
+            self.baseline_latency = baseline + (median - baseline) * 0.1
+
+        if congested:
+            self.record_overload(f"p90 latency {p90:.2f}s vs baseline {baseline:.2f}s")
+        return congested
+
+    def get_stats(self) -> dict:
+        """Get current limit, bounds, in-flight count and adjustment counts."""
+        return {
+            "limit": self.limit,
+            "floor": self.floor,
+            "ceiling": self.ceiling,
+            "in_flight": self.in_flight,
+            "waiting": len(self._waiters),
+            "baseline_latency": self.baseline_latency,
+            "increases": self.increases,
+            "decreases": self.decreases,
+        }
@@ -32,6 +32,12 @@ class FatalAPIError(APIError):
     pass
 
 
+class QuotaExceededError(FatalAPIError):
+    """Daily request quota used up (HTTP 430)."""
+
+    pass
+
+
 class RetryableAPIError(APIError):
     """Retryable API error (rate limits, transient failures)."""
 
@@ -107,7 +113,9 @@ def handle_http_status(
         # Authentication failure - critical halt
         logger.critical("Authentication failure - halting execution")
         sys.exit(1)
-    elif status_code in [423, 426, 430]:
+    elif status_code == 430:
+        raise QuotaExceededError(msg)
+    elif status_code in [423, 426]:
         raise FatalAPIError(msg)
 
     # Retryable errors - wait and retry
@@ -0,0 +1,146 @@
+"""
+GCRA rate limiter
+
+Token-bucket rate limiting implemented as the Generic Cell Rate Algorithm:
+the whole bucket state is one timestamp, so admission is O(1) and every
+caller learns the exact moment its slot opens.
+"""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Optional
+
+
+class RateLimiter:
+    """
+    Token bucket of `burst` tokens refilled at `calls` per `period` seconds
+
+    GCRA keeps a theoretical arrival time (TAT): when the next call would be
+    due if calls were perfectly spaced. A call is admitted once
+    now >= TAT - tolerance, where tolerance = (burst - 1) * interval allows
+    up to `burst` calls back to back. Each admission pushes TAT forward by one
+    interval.
+
+    Reservations are made synchronously before sleeping, so concurrent
+    callers on one event loop never need a lock: each one reserves the next
+    free slot and sleeps exactly until it. Nobody wakes early to recheck, and
+    there is no herd of waiters competing for a freed slot.
+
+    Example:
+        limiter = RateLimiter(calls=120, period=60, burst=3)
+        await limiter.acquire()  # returns seconds waited
+    """
+
+    def __init__(
+        self,
+        calls: float,
+        period: float = 60.0,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
+        """
+        Initialize rate limiter
+
+        Args:
+            calls: Calls allowed per period (sustained rate)
+            period: Period in seconds
+            burst: Calls that may be made back to back after an idle spell
+            clock: Monotonic time source in seconds (injectable for tests)
+            sleep: Coroutine function used to wait (injectable for tests)
+        """
+        if calls <= 0 or period <= 0:
+            raise ValueError("calls and period must be positive")
+
+        self.calls = calls
+        self.period = period
+        self.burst = max(1, int(burst))
+        self.interval = period / calls
+        self.tolerance = self.interval * (self.burst - 1)
+        self._clock = clock
+        self._sleep = sleep
+        self._tat: Optional[float] = None
+        self.admitted = 0
+
+    def _current_tat(self, now: float) -> float:
+        """TAT, never earlier than now (an idle bucket is full, not overfull)."""
+        return now if self._tat is None else max(self._tat, now)
+
+    def delay(self) -> float:
+        """
+        Seconds until a call could be admitted, without reserving it
+
+        Returns:
+            0.0 if a call would be admitted now
+        """
+        now = self._clock()
+        return max(0.0, self._current_tat(now) - self.tolerance - now)
+
+    def tokens(self) -> float:
+        """Calls that could be admitted right now, back to back."""
+        now = self._clock()
+        backlog = (self._current_tat(now) - now) / self.interval
+        return max(0.0, min(float(self.burst), self.burst - backlog))
+
+    def reserve(self) -> float:
+        """
+        Reserve the next free slot
+
+        Returns:
+            Seconds until the reserved slot (0.0 = admitted now)
+        """
+        now = self._clock()
+        tat = self._current_tat(now)
+        self._tat = tat + self.interval
+        self.admitted += 1
+        return max(0.0, tat - self.tolerance - now)
+
+    def try_acquire(self) -> bool:
+        """
+        Admit a call only if no wait is needed
+
+        Returns:
+            True if the call was admitted
+        """
+        if self.delay() > 0:
+            return False
+        self.reserve()
+        return True
+
+    async def acquire(self) -> float:
+        """
+        Wait for and take the next free slot
+
+        If the wait is cancelled and no later slot was reserved in the
+        meantime, the slot is handed back.
+
+        Returns:
+            Seconds waited
+        """
+        delay = self.reserve()
+        if delay > 0:
+            reserved_tat = self._tat
+            try:
+                await self._sleep(delay)
+            except asyncio.CancelledError:
+                if self._tat == reserved_tat:
+                    self._tat -= self.interval
+                    self.admitted -= 1
+                raise
+        return delay
+
+    def block_until(self, until: float) -> None:
+        """
+        Admit nothing before a point in time (e.g. a 429 Retry-After)
+
+        Calls resume from an empty bucket, paced at the sustained rate rather
+        than as a burst.
+
+        Args:
+            until: Clock time of the first admission
+        """
+        self._tat = max(self._current_tat(self._clock()), until + self.tolerance)
+
+    def reset(self) -> None:
+        """Forget past calls (full bucket)."""
+        self._tat = None
@@ -276,6 +276,10 @@ def parse_media_urls(medias_elem: etree.Element) -> Dict[str, List[Dict[str, Any
             "format": media.get("format"),
             "region": media.get("region"),
         }
+        # Content hashes, when ScreenScraper reports them (media store keys)
+        for digest in ("crc", "md5", "sha1"):
+            if media.get(digest):
+                media_info[digest] = media.get(digest)
 
         # Add to appropriate list
         if media_type not in media_dict:
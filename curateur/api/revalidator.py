@@ -0,0 +1,154 @@
+"""
+Background revalidation of stale metadata cache entries.
+
+In stale-while-revalidate mode an expired cache entry is still used for the
+current run and its ROM is queued here. Refreshes run one at a time and only
+while the throttle has a free request slot and the daily quota has headroom,
+so they never hold up ROMs that are waiting on a first lookup.
+"""
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional
+
+from curateur.api.throttle import ThrottleManager
+
+if TYPE_CHECKING:
+    from curateur.workflow.quota_planner import QuotaPlanner
+
+logger = logging.getLogger(__name__)
+
+
+class CacheRevalidator:
+    """
+    Low-priority queue of cache refreshes.
+
+    Each refresh is keyed by its cache key, so a ROM served stale several
+    times is only refreshed once. Refreshes still queued when the revalidator
+    is stopped are dropped; their entries stay stale and are queued again on
+    the next run.
+    """
+
+    def __init__(
+        self,
+        throttle_manager: ThrottleManager,
+        endpoint: str,
+        quota_threshold: float = 0.95,
+        poll_interval: float = 1.0,
+        quota_planner: Optional["QuotaPlanner"] = None,
+    ):
+        """
+        Initialize revalidator.
+
+        Args:
+            throttle_manager: Throttle shared with foreground API requests
+            endpoint: API endpoint the refreshes call (for rate limit checks)
+            quota_threshold: Daily quota usage (0.0-1.0) at which refreshes stop
+            poll_interval: Seconds between capacity checks while busy
+            quota_planner: Planner whose daily budget (reserve and fraction
+                applied) each refresh is admitted against
+        """
+        self.throttle_manager = throttle_manager
+        self.endpoint = endpoint
+        self.quota_threshold = quota_threshold
+        self.poll_interval = poll_interval
+        self.quota_planner = quota_planner
+
+        self._queue: Dict[str, Callable[[], Awaitable[Any]]] = {}
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+        self.refreshed = 0
+        self.failed = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of refreshes waiting for capacity."""
+        return len(self._queue)
+
+    def submit(self, key: str, refresh: Callable[[], Awaitable[Any]]) -> None:
+        """
+        Queue a refresh unless one is already queued for the same key.
+
+        Args:
+            key: Cache key being refreshed
+            refresh: Coroutine function that fetches and stores the entry
+        """
+        if key in self._queue:
+            return
+        self._queue[key] = refresh
+        self._wakeup.set()
+
+    def start(self) -> None:
+        """Start processing refreshes on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> int:
+        """
+        Stop processing and drop refreshes that have not run.
+
+        Returns:
+            Number of refreshes dropped
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        dropped = len(self._queue)
+        self._queue.clear()
+        return dropped
+
+    async def _run(self) -> None:
+        """Run queued refreshes whenever there is spare capacity."""
+        while True:
+            if not self._queue:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            if (
+                not self.throttle_manager.has_idle_capacity(
+                    self.endpoint, self.quota_threshold
+                )
+                or not self._budget_available()
+            ):
+                await asyncio.sleep(self.poll_interval)
+                continue
+
+            # A refresh the planner does not admit stays queued and is not
+            # settled
+            if self.quota_planner is not None and not self.quota_planner.admit(1):
+                await asyncio.sleep(self.poll_interval)
+                continue
+
+            key = next(iter(self._queue))
+            refresh = self._queue.pop(key)
+            try:
+                await refresh()
+                self.refreshed += 1
+                logger.debug(f"Revalidated stale cache entry {key}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.failed += 1
+                logger.debug(f"Revalidation of {key} failed: {e}")
+            finally:
+                if self.quota_planner is not None:
+                    self.quota_planner.settle(1)
+
+    def _budget_available(self) -> bool:
+        """
+        Check the planner's daily budget without marking it exhausted.
+
+        Refreshes only use budget that is left over, so running out is not
+        reported as a spent quota; foreground lookups decide that.
+        """
+        if self.quota_planner is None:
+            return True
+        remaining = self.quota_planner.remaining()
+        return remaining is None or remaining > 0
@@ -0,0 +1,107 @@
+"""
+Single-flight coalescing of identical in-flight API requests.
+
+Duplicate ROMs (the same dump under several filenames, or one game in two
+aliased systems scraped at once) produce identical lookups. Without
+coalescing each one spends a quota unit before the first response reaches
+the cache. Here the first caller for a key starts the request and every
+caller that arrives while it is running awaits the same result.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class _Call:
+    """One in-flight request and the number of callers awaiting it."""
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Share one in-flight coroutine between concurrent callers with equal keys.
+
+    The request runs as its own task, so a caller that is cancelled stops
+    waiting without cancelling it for the others. It is cancelled only when
+    every caller has gone. Results and exceptions are delivered to all
+    callers; nothing is remembered once the request completes (that is the
+    cache's job).
+    """
+
+    def __init__(self, copy_result: Optional[Callable[[Any], Any]] = None):
+        """
+        Initialize single-flight group.
+
+        Args:
+            copy_result: Applied to the result handed to callers that joined
+                an in-flight request (e.g. copy.deepcopy when callers may
+                modify it); the caller that started it gets the original
+        """
+        self.copy_result = copy_result
+        self._calls: Dict[Hashable, _Call] = {}
+
+        self.started = 0
+        self.coalesced = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct requests currently running."""
+        return len(self._calls)
+
+    async def run(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run func, or join the request already running for key.
+
+        Args:
+            key: Identity of the request
+            func: Coroutine function performing the request
+
+        Returns:
+            The request's result
+
+        Raises:
+            Whatever the request raised
+        """
+        call = self._calls.get(key)
+        joined = call is not None
+        if joined:
+            self.coalesced += 1
+            logger.debug(f"Joining in-flight request for {key!r}")
+        else:
+            call = _Call(asyncio.create_task(func()))
+            self._calls[key] = call
+            call.task.add_done_callback(lambda _: self._forget(key, call))
+            self.started += 1
+
+        call.waiters += 1
+        try:
+            result = await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                # Every caller was cancelled: nobody needs the result
+                self._forget(key, call)
+                call.task.cancel()
+
+        if joined and self.copy_result is not None:
+            return self.copy_result(result)
+        return result
+
+    def _forget(self, key: Hashable, call: _Call) -> None:
+        """Drop a finished or abandoned request so the next caller starts anew."""
+        if self._calls.get(key) is call:
+            del self._calls[key]
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get requests started, callers coalesced and requests in flight."""
+        return {
+            "started": self.started,
+            "coalesced": self.coalesced,
+            "in_flight": self.in_flight,
+        }
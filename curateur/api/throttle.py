@@ -1,16 +1,18 @@
 """
 Adaptive throttling for API rate limiting
 
-Implements sliding window rate limiting with adaptive backoff.
+Implements GCRA (token bucket) rate limiting with adaptive backoff.
 """
 
 import asyncio
 import logging
 import random
 import time
-from collections import deque
 from dataclasses import dataclass
-from typing import Optional
+from typing import Callable, Dict, Optional
+
+from .concurrency import AdaptiveConcurrency
+from .rate_limiter import RateLimiter
 
 logger = logging.getLogger(__name__)
 
@@ -21,15 +23,19 @@ class RateLimit:
 
     calls: int  # Maximum calls per window
     window_seconds: int  # Time window in seconds
+    burst: int = 1  # Calls allowed back to back after an idle spell
 
 
 class ThrottleManager:
     """
-    Adaptive rate limiting with sliding window
+    Adaptive rate limiting with per-endpoint token buckets
 
     Features:
-    - Sliding window rate limiting
-    - Per-endpoint tracking
+    - GCRA token bucket per endpoint: O(1) admission, exact sleep until the
+      caller's slot, configurable burst
+    - Optional media download limiter sharing the same implementation
+    - AIMD-tuned concurrency for API requests and media downloads, within
+      the API's maxthreads and the configured media ceiling
     - Adaptive backoff on 429 responses
     - Automatic recovery
 
@@ -56,6 +62,10 @@ class ThrottleManager:
         default_limit: RateLimit,
         adaptive: bool = True,
         max_concurrent: Optional[int] = None,
+        media_limit: Optional[RateLimit] = None,
+        clock: Callable[[], float] = time.monotonic,
+        adaptive_concurrency: bool = True,
+        max_media_downloads: Optional[int] = None,
     ):
         """
         Initialize throttle manager
@@ -64,23 +74,46 @@ class ThrottleManager:
             default_limit: Default rate limit for endpoints
             adaptive: Enable adaptive backoff on rate limit errors
             max_concurrent: Maximum concurrent API requests (default: None, will be set from API limits)
+            media_limit: Rate limit for media downloads (default: None, unlimited)
+            clock: Monotonic time source in seconds (injectable for tests)
+            adaptive_concurrency: Tune concurrency from latency, timeouts and
+                429s instead of always running at the ceiling
+            max_media_downloads: Ceiling for concurrent media downloads
+                (default: 20, then 5x the API limit capped at 30)
         """
         self.default_limit = default_limit
         self.adaptive = adaptive
-        self.locks = {}
-        self.call_history = {}  # endpoint -> deque of timestamps
-        self.backoff_until = {}  # endpoint -> timestamp
+        self._clock = clock
+        self.limiters: Dict[str, RateLimiter] = {}  # endpoint -> token bucket
+        self.backoff_until = {}  # endpoint -> clock time
         self.consecutive_429s = {}  # endpoint -> count for exponential backoff
         self.backoff_multiplier = {}  # endpoint -> current multiplier
-        self.global_lock = asyncio.Lock()
 
-        # Concurrency limiting (will be updated from API limits)
+        # Media downloads share the limiter implementation, not the buckets
+        self.media_limiter = (
+            self._create_limiter(media_limit) if media_limit is not None else None
+        )
+
+        # Concurrency limiting (ceiling will be updated from API limits)
         self.max_concurrent = max_concurrent or 3  # Default fallback
-        self.concurrency_semaphore = asyncio.Semaphore(self.max_concurrent)
+        self.concurrency_semaphore = AdaptiveConcurrency(
+            ceiling=self.max_concurrent,
+            adaptive=adaptive_concurrency,
+            name="API requests",
+            clock=clock,
+        )
 
-        # Separate semaphore for media downloads (higher limit for throughput)
-        self.max_media_downloads = 20  # Allow more concurrent media downloads
-        self.media_download_semaphore = asyncio.Semaphore(self.max_media_downloads)
+        # Separate limit for media downloads (higher ceiling for throughput).
+        # Download time depends on file size, so latency is not a signal here.
+        self._media_ceiling_configured = max_media_downloads is not None
+        self.max_media_downloads = max_media_downloads or 20
+        self.media_download_semaphore = AdaptiveConcurrency(
+            ceiling=self.max_media_downloads,
+            adaptive=adaptive_concurrency,
+            latency_tolerance=None,
+            name="media downloads",
+            clock=clock,
+        )
 
         logger.debug(
             "Throttle manager initialized with max %s concurrent API requests, %s concurrent media downloads",
@@ -102,22 +135,32 @@ class ThrottleManager:
         # UI callback for throttle status
         self.ui_callback = None
 
-    async def _get_endpoint_lock(self, endpoint: str) -> asyncio.Lock:
-        """Get or create lock for endpoint"""
-        async with self.global_lock:
-            if endpoint not in self.locks:
-                self.locks[endpoint] = asyncio.Lock()
-                self.call_history[endpoint] = deque()
-                self.consecutive_429s[endpoint] = 0
-                self.backoff_multiplier[endpoint] = 1
-            return self.locks[endpoint]
+    def _create_limiter(self, limit: RateLimit) -> RateLimiter:
+        """Build a token bucket for a rate limit on this manager's clock"""
+        return RateLimiter(
+            calls=limit.calls,
+            period=limit.window_seconds,
+            burst=limit.burst,
+            clock=self._clock,
+        )
+
+    def _get_limiter(self, endpoint: str) -> RateLimiter:
+        """Get or create the token bucket for endpoint"""
+        limiter = self.limiters.get(endpoint)
+        if limiter is None:
+            limiter = self._create_limiter(self.default_limit)
+            self.limiters[endpoint] = limiter
+            self.consecutive_429s[endpoint] = 0
+            self.backoff_multiplier[endpoint] = 1
+        return limiter
 
     def update_concurrency_limit(self, max_concurrent: int) -> None:
         """
         Update maximum concurrent request limit.
 
-        Creates a new semaphore with the updated limit. This should be called
-        after getting API limits from the user info endpoint.
+        Raises the ceiling of the adaptive limit (and resets the limit to it).
+        This should be called after getting API limits from the user info
+        endpoint. Requests in flight keep their slots.
 
         Args:
             max_concurrent: New maximum concurrent requests
@@ -125,13 +168,14 @@ class ThrottleManager:
         if max_concurrent != self.max_concurrent:
             old_limit = self.max_concurrent
             self.max_concurrent = max_concurrent
-            self.concurrency_semaphore = asyncio.Semaphore(max_concurrent)
+            self.concurrency_semaphore.set_ceiling(max_concurrent)
 
             # Scale media downloads proportionally (but cap at reasonable limit)
-            # Use 5x API limit, capped at 30
+            # Use 5x API limit, capped at 30, unless configured explicitly
             old_media_limit = self.max_media_downloads
-            self.max_media_downloads = min(max_concurrent * 5, 30)
-            self.media_download_semaphore = asyncio.Semaphore(self.max_media_downloads)
+            if not self._media_ceiling_configured:
+                self.max_media_downloads = min(max_concurrent * 5, 30)
+                self.media_download_semaphore.set_ceiling(self.max_media_downloads)
 
             logger.info(
                 f"Updated throttle concurrency limits: API {old_limit} -> {max_concurrent}, "
@@ -142,85 +186,84 @@ class ThrottleManager:
         """
         Wait if rate limit would be exceeded
 
+        The caller's slot is reserved before sleeping, so concurrent callers
+        queue up at exact intervals without locking.
+
         Args:
             endpoint: API endpoint name
 
         Returns:
             Seconds waited (0 if no wait needed)
         """
-        lock = await self._get_endpoint_lock(endpoint)
+        limiter = self._get_limiter(endpoint)
+
+        backoff_until = self.backoff_until.get(endpoint)
+        in_backoff = backoff_until is not None and self._clock() < backoff_until
+        if backoff_until is not None and not in_backoff:
+            # Backoff period ended
+            del self.backoff_until[endpoint]
+            logger.info(f"Rate limit backoff ended for {endpoint}")
+
+        wait_time = limiter.delay()
+        if wait_time <= 0:
+            limiter.reserve()
+            return 0.0
 
-        async with lock:
-            # Check if in backoff period
-            if endpoint in self.backoff_until:
-                backoff_until = self.backoff_until[endpoint]
-                now = time.time()
-                if now < backoff_until:
-                    wait_time = backoff_until - now
-                    logger.warning(
-                        f"Rate limit backoff for {endpoint}: waiting {wait_time:.1f}s"
-                    )
+        if in_backoff:
+            logger.warning(
+                f"Rate limit backoff for {endpoint}: waiting {wait_time:.1f}s"
+            )
+        else:
+            logger.debug(
+                f"Rate limit throttle for {endpoint}: waiting {wait_time:.1f}s"
+            )
 
-                    # Notify UI: Throttling active
-                    if self.ui_callback:
-                        self.ui_callback(True)
-
-                    # Async sleep - UI stays responsive
-                    await asyncio.sleep(wait_time)
-
-                    # Notify UI: Throttling ended
-                    if self.ui_callback:
-                        self.ui_callback(False)
-
-                    return wait_time
-                else:
-                    # Backoff period ended
-                    del self.backoff_until[endpoint]
-                    logger.info(f"Rate limit backoff ended for {endpoint}")
-
-                    # Notify UI: Throttling ended
-                    if self.ui_callback:
-                        self.ui_callback(False)
-
-            # Clean old calls outside window
-            history = self.call_history[endpoint]
-            now = time.time()
-            window_start = now - self.default_limit.window_seconds
-
-            while history and history[0] < window_start:
-                history.popleft()
-
-            # Check if limit would be exceeded
-            if len(history) >= self.default_limit.calls:
-                # Must wait until oldest call expires
-                oldest_call = history[0]
-                wait_until = oldest_call + self.default_limit.window_seconds
-                wait_time = wait_until - now
-
-                if wait_time > 0:
-                    logger.debug(
-                        f"Rate limit throttle for {endpoint}: waiting {wait_time:.1f}s"
-                    )
+        # Notify UI: Throttling active
+        if self.ui_callback:
+            self.ui_callback(True)
 
-                    # Notify UI: Throttling active
-                    if self.ui_callback:
-                        self.ui_callback(True)
+        try:
+            # Async sleep - UI stays responsive
+            delay = await limiter.acquire()
+        finally:
+            # Notify UI: Throttling ended
+            if self.ui_callback:
+                self.ui_callback(False)
 
-                    # Async sleep - UI stays responsive
-                    await asyncio.sleep(wait_time)
+        return delay
 
-                    # Notify UI: Throttling ended
-                    if self.ui_callback:
-                        self.ui_callback(False)
+    async def wait_for_media(self) -> float:
+        """
+        Wait for a media download slot
 
-                    # Clean expired call
-                    history.popleft()
+        Returns:
+            Seconds waited (0 if no media limit is configured)
+        """
+        if self.media_limiter is None:
+            return 0.0
+        return await self.media_limiter.acquire()
 
-                    return wait_time
+    def record_api_success(self, latency: float) -> None:
+        """
+        Feed a successful API request into the concurrency controller
 
-            # Record this call
-            history.append(time.time())
-            return 0.0
+        Note: Synchronous method for use in non-async contexts
+
+        Args:
+            latency: Request duration in seconds
+        """
+        self.concurrency_semaphore.record_success(latency)
+
+    def record_api_overload(self, reason: str) -> None:
+        """
+        Feed a timeout or server error into the concurrency controller
+
+        Note: Synchronous method for use in non-async contexts
+
+        Args:
+            reason: What happened, for logging
+        """
+        self.concurrency_semaphore.record_overload(reason)
 
     def handle_rate_limit(
         self, endpoint: str, retry_after: Optional[int] = None
@@ -239,14 +282,7 @@ class ThrottleManager:
             endpoint: API endpoint that returned 429
             retry_after: Retry-After header value in seconds (optional)
         """
-        # Since we need to support synchronous calls from exception handlers,
-        # we'll use a synchronous method here. The actual waiting is done in wait_if_needed()
-        if endpoint not in self.locks:
-            # Initialize endpoint if needed (synchronous version)
-            self.locks[endpoint] = asyncio.Lock()
-            self.call_history[endpoint] = deque()
-            self.consecutive_429s[endpoint] = 0
-            self.backoff_multiplier[endpoint] = 1
+        limiter = self._get_limiter(endpoint)
 
         if retry_after is None:
             # Default backoff: 60 seconds
@@ -271,7 +307,7 @@ class ThrottleManager:
 
         # Apply multiplier to retry_after
         actual_backoff = retry_after * multiplier
-        backoff_until = time.time() + actual_backoff
+        backoff_until = self._clock() + actual_backoff
         self.backoff_until[endpoint] = backoff_until
 
         logger.warning(
@@ -281,10 +317,12 @@ class ThrottleManager:
             f"consecutive_429s={self.consecutive_429s[endpoint]})"
         )
 
-        # Clear recent call history to be conservative
-        if self.adaptive:
-            self.call_history[endpoint].clear()
-            logger.info(f"Cleared call history for {endpoint}")
+        # No calls before the backoff ends, then resume at the sustained rate
+        # from an empty bucket rather than with a burst
+        limiter.block_until(backoff_until)
+
+        # Fewer requests in flight once calls resume
+        self.concurrency_semaphore.record_overload(f"429 on {endpoint}")
 
     def reset_backoff_multiplier(self, endpoint: str) -> None:
         """
@@ -314,26 +352,11 @@ class ThrottleManager:
             endpoint: API endpoint name
 
         Returns:
-            dict with recent_calls, backoff_remaining, backoff_multiplier, consecutive_429s
+            dict with calls admitted, tokens available, next slot delay,
+            backoff_remaining, backoff_multiplier, consecutive_429s
         """
-        if endpoint not in self.call_history:
-            return {
-                "endpoint": endpoint,
-                "recent_calls": 0,
-                "limit": self.default_limit.calls,
-                "window_seconds": self.default_limit.window_seconds,
-                "backoff_remaining": 0.0,
-                "in_backoff": False,
-                "backoff_multiplier": 1,
-                "consecutive_429s": 0,
-            }
-
-        history = self.call_history[endpoint]
-        now = time.time()
-        window_start = now - self.default_limit.window_seconds
-
-        # Count recent calls
-        recent_calls = sum(1 for t in history if t >= window_start)
+        limiter = self.limiters.get(endpoint)
+        now = self._clock()
 
         # Check backoff
         backoff_remaining = 0.0
@@ -342,15 +365,46 @@ class ThrottleManager:
 
         return {
             "endpoint": endpoint,
-            "recent_calls": recent_calls,
+            "calls": limiter.admitted if limiter else 0,
+            "tokens": limiter.tokens() if limiter else float(self.default_limit.burst),
+            "next_slot_in": limiter.delay() if limiter else 0.0,
             "limit": self.default_limit.calls,
             "window_seconds": self.default_limit.window_seconds,
+            "burst": self.default_limit.burst,
             "backoff_remaining": backoff_remaining,
             "in_backoff": backoff_remaining > 0,
             "backoff_multiplier": self.backoff_multiplier.get(endpoint, 1),
             "consecutive_429s": self.consecutive_429s.get(endpoint, 0),
         }
 
+    def has_idle_capacity(self, endpoint: str, quota_threshold: float = 1.0) -> bool:
+        """
+        Check whether a low-priority request could run without delaying others
+
+        Note: Synchronous method for use in non-async contexts
+
+        Args:
+            endpoint: API endpoint name
+            quota_threshold: Daily quota usage (0.0-1.0) at which there is no
+                headroom left for optional requests
+
+        Returns:
+            True if a request slot is free, the endpoint is neither backing off
+            nor out of tokens, and quota usage is below quota_threshold
+        """
+        if self.concurrency_semaphore.locked():
+            return False
+
+        stats = self.get_stats(endpoint)
+        if stats["in_backoff"] or stats["next_slot_in"] > 0:
+            return False
+
+        if self.maxrequestsperday > 0:
+            if self.requeststoday / self.maxrequestsperday >= quota_threshold:
+                return False
+
+        return True
+
     def reset(self, endpoint: Optional[str] = None) -> None:
         """
         Reset throttle state including backoff multipliers
@@ -361,8 +415,8 @@ class ThrottleManager:
             endpoint: Specific endpoint to reset (None = all)
         """
         if endpoint:
-            if endpoint in self.call_history:
-                self.call_history[endpoint].clear()
+            if endpoint in self.limiters:
+                self.limiters[endpoint].reset()
             if endpoint in self.backoff_until:
                 del self.backoff_until[endpoint]
             if endpoint in self.consecutive_429s:
@@ -371,8 +425,10 @@ class ThrottleManager:
                 self.backoff_multiplier[endpoint] = 1
             logger.info(f"Reset throttle for {endpoint}")
         else:
-            for ep in list(self.call_history.keys()):
-                self.call_history[ep].clear()
+            for limiter in self.limiters.values():
+                limiter.reset()
+            if self.media_limiter is not None:
+                self.media_limiter.reset()
             self.backoff_until.clear()
             self.consecutive_429s.clear()
             self.backoff_multiplier.clear()
@@ -3,7 +3,9 @@
 import argparse
 import asyncio
 import logging
+import signal
 import sys
+from datetime import date
 from pathlib import Path
 from typing import Optional
 
@@ -14,8 +16,10 @@ from curateur.config.loader import ConfigError, load_config
 from curateur.config.validator import ValidationError, validate_config
 from curateur.ui.event_bus import EventBus
 from curateur.ui.textual_ui import CurateurUI
+from curateur.workflow.import_schedule import ImportSchedule
 from curateur.workflow.orchestrator import WorkflowOrchestrator
 from curateur.workflow.progress import ErrorLogger, ProgressTracker
+from curateur.workflow.quota_planner import QuotaPlanner
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +53,21 @@ Examples:
   # Use custom config file
   curateur --config /path/to/config.yaml
 
+  # Spread a large first import over several days of API quota (run daily,
+  # e.g. from cron; each run resumes where the last one stopped)
+  curateur --schedule --ui headless
+
+  # Keep running and scrape ROMs as they are copied in (Linux only)
+  curateur --watch --ui headless
+
+  # Check metadata caches for damage, or shrink them
+  curateur cache verify
+  curateur cache compact
+
+  # Copy caches to another install without re-querying the API
+  curateur cache export caches.jsonl.gz
+  curateur cache import caches.jsonl.gz
+
 For more information, see IMPLEMENTATION_PLAN.md
         """,
     )
@@ -102,6 +121,20 @@ For more information, see IMPLEMENTATION_PLAN.md
         help="Clear metadata cache before scraping. Forces fresh API queries.",
     )
 
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="After the initial pass, keep running and rescrape systems as ROMs are "
+        "added or changed (Linux inotify).",
+    )
+
+    parser.add_argument(
+        "--schedule",
+        action="store_true",
+        help="Multi-day import: spend today's share of the API quota, record the "
+        "ROMs still outstanding and continue there on the next run.",
+    )
+
     parser.add_argument(
         "--ui",
         choices=["textual", "headless"],
@@ -195,6 +228,11 @@ def _setup_logging(
     pil_logger.setLevel(logging.INFO)  # Only show info and above
 
 
+def _raise_keyboard_interrupt(signum, frame) -> None:
+    """Signal handler that unwinds the program like Ctrl+C."""
+    raise KeyboardInterrupt
+
+
 def main(argv: Optional[list] = None) -> int:
     """
     Main entry point for curateur CLI.
@@ -205,6 +243,15 @@ def main(argv: Optional[list] = None) -> int:
     Returns:
         Exit code (0 for success, non-zero for failure)
     """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Cache maintenance has its own parser: curateur cache verify|compact|...
+    if argv and argv[0] == "cache":
+        from curateur.tools.cache_cli import main as cache_main
+
+        return cache_main(argv[1:])
+
     parser = create_parser()
     args = parser.parse_args(argv)
 
@@ -245,7 +292,9 @@ def main(argv: Optional[list] = None) -> int:
             config["search"] = {}
         config["search"]["interactive_search"] = True
 
-    # Run main scraping workflow
+    # Run main scraping workflow. SIGTERM (service stop, container shutdown)
+    # is treated like Ctrl+C so cleanup runs and buffered cache writes land.
+    previous_sigterm = signal.signal(signal.SIGTERM, _raise_keyboard_interrupt)
     try:
         return asyncio.run(run_scraper(config, args))
     except KeyboardInterrupt:
@@ -254,6 +303,105 @@ def main(argv: Optional[list] = None) -> int:
     except Exception as e:
         print(f"\nFatal error: {e}", file=sys.stderr)
         return 1
+    finally:
+        signal.signal(signal.SIGTERM, previous_sigterm)
+
+
+async def _watch_systems(
+    orchestrator: WorkflowOrchestrator,
+    systems: list,
+    config: dict,
+    media_types: list,
+    textual_ui=None,
+) -> None:
+    """
+    Rescrape systems whenever ROMs are added to, changed in or removed from them.
+
+    Runs until interrupted (Ctrl+C) or the Textual UI requests quit.
+
+    Args:
+        orchestrator: Orchestrator from the initial pass (caches stay loaded)
+        systems: Systems to watch
+        config: Loaded configuration
+        media_types: ScreenScraper media types to download
+        textual_ui: Optional Textual UI instance for quit polling
+    """
+    from curateur.scanner.watcher import InotifyWatcher, WatchError
+
+    try:
+        watcher = InotifyWatcher(
+            debounce_seconds=config["runtime"].get("watch_debounce_seconds", 5.0)
+        )
+    except WatchError as e:
+        logger.error(f"Cannot start watch mode: {e}")
+        return
+
+    try:
+        watcher.watch_systems(systems, Path(config["paths"]["roms"]).expanduser())
+        logger.info("Watching for new ROMs (Ctrl+C to stop)")
+
+        while not (textual_ui and textual_ui.should_quit):
+            for system in await watcher.changed_systems(timeout=1.0):
+                logger.info(f"ROM changes detected in {system.name}, rescraping")
+                try:
+                    result = await orchestrator.scrape_system(
+                        system=system,
+                        media_types=media_types,
+                        preferred_regions=config["scraping"].get(
+                            "preferred_regions", ["us", "wor", "eu"]
+                        ),
+                    )
+                    logger.info(
+                        f"{system.name}: {result.scraped} scraped, "
+                        f"{result.failed} failed, {result.skipped} skipped"
+                    )
+                except Exception as e:
+                    logger.error(
+                        f"Error rescraping system {system.fullname}: {e}", exc_info=True
+                    )
+    finally:
+        watcher.close()
+
+
+def _print_schedule_report(
+    schedule: ImportSchedule, quota_planner: QuotaPlanner, systems: list
+) -> None:
+    """
+    Print the outstanding ROMs of a scheduled import and when it should finish.
+
+    Args:
+        schedule: Import plan after this run
+        quota_planner: Planner holding today's remaining budget
+        systems: Systems selected for the run (SystemDefinition)
+    """
+    print("\nImport Schedule:")
+    outstanding = schedule.outstanding()
+    if outstanding == 0:
+        print("  Import complete: no ROMs outstanding")
+        return
+
+    print(f"  Outstanding ROMs: {outstanding} (plan: {schedule.schedule_file})")
+    available_today = quota_planner.remaining() or 0
+    # Same ordering the next run starts from
+    order = [
+        system.name
+        for system in schedule.order_systems(quota_planner.order_systems(systems))
+    ]
+    projection = schedule.projection(available_today=available_today, order=order)
+    if projection is None:
+        print("  Projected completion: unknown (no daily quota reported)")
+        return
+
+    print(
+        f"  Daily budget: {schedule.daily_budget} lookups "
+        f"({available_today} left today)"
+    )
+    for system_name, count, finish in projection:
+        estimate = (
+            " (at most)" if schedule.systems[system_name].get("estimated") else ""
+        )
+        print(f"    {system_name}: {count} ROMs{estimate}, done by {finish}")
+    print(f"  Projected completion: {projection[-1][2].isoformat()}")
 
 
 async def run_scraper(config: dict, args: argparse.Namespace) -> int:
@@ -288,6 +436,13 @@ async def run_scraper(config: dict, args: argparse.Namespace) -> int:
     else:
         systems = all_systems
 
+    # Multi-day import plan, carried between scheduled runs
+    schedule = None
+    if getattr(args, "schedule", False):
+        schedule = ImportSchedule.load(
+            Path(config["paths"]["gamelists"]).expanduser() / "import_schedule.json"
+        )
+
     # Phase D: Create connection pool manager
     from curateur.api.connection_pool import ConnectionPoolManager
 
@@ -319,8 +474,19 @@ async def run_scraper(config: dict, args: argparse.Namespace) -> int:
         default_rpm = config_rpm
         logger.info(f"Using configured requests_per_minute: {default_rpm}")
 
+    api_config = config.get("api", {})
+    burst = api_config.get("rate_limit_burst", 1)
+    media_rpm = api_config.get("media_requests_per_minute")
     throttle_manager = ThrottleManager(
-        default_limit=RateLimit(calls=default_rpm, window_seconds=60), adaptive=True
+        default_limit=RateLimit(calls=default_rpm, window_seconds=60, burst=burst),
+        adaptive=True,
+        media_limit=(
+            RateLimit(calls=media_rpm, window_seconds=60, burst=burst)
+            if media_rpm
+            else None
+        ),
+        adaptive_concurrency=api_config.get("adaptive_concurrency", True),
+        max_media_downloads=api_config.get("max_concurrent_downloads"),
     )
 
     # Phase E: Initialize WorkQueueManager
@@ -447,6 +613,22 @@ async def run_scraper(config: dict, args: argparse.Namespace) -> int:
         # Update throttle manager with initial quota
         await throttle_manager.update_quota(user_limits)
 
+        # Budget the remaining daily quota across systems and ROMs
+        quota_planner = QuotaPlanner(
+            throttle_manager,
+            reserve=config.get("api", {}).get("quota_reserve", 0),
+            system_priority=config["scraping"].get("system_priority", []),
+            daily_fraction=config.get("api", {}).get("daily_quota_fraction", 1.0),
+        )
+        systems = quota_planner.order_systems(systems)
+        if schedule is not None:
+            # Finish what earlier scheduled runs left outstanding first
+            systems = schedule.order_systems(systems)
+            schedule.daily_budget = quota_planner.daily_budget()
+        remaining = quota_planner.remaining()
+        if remaining is not None:
+            logger.info(f"Daily API quota: {remaining} requests available this run")
+
     except SystemExit:
         # Authentication failed - exit already logged
         raise
@@ -455,17 +637,34 @@ async def run_scraper(config: dict, args: argparse.Namespace) -> int:
         raise SystemExit(1)
 
     # Phase D: Count total ROMs for performance monitor
+    from curateur.scanner.dir_snapshot import DirectorySnapshot, capture_directory
+    from curateur.scanner.rom_scanner import scan_system
+
     total_roms = 0
+    rom_counts = {}
+    rom_root = Path(config["paths"]["roms"]).expanduser()
+    gamelist_root = Path(config["paths"]["gamelists"]).expanduser()
+    runtime_config = config.get("runtime", {})
+    snapshots_enabled = runtime_config.get(
+        "incremental_scan", True
+    ) and runtime_config.get("enable_cache", True)
     for system in systems:
         try:
-            from curateur.scanner.rom_scanner import scan_system
-
-            rom_entries = scan_system(
-                system,
-                rom_root=Path(config["paths"]["roms"]).expanduser(),
-                crc_size_limit=1073741824,
+            # Directories unchanged since their scan snapshot keep its count
+            snapshot = DirectorySnapshot(
+                gamelist_root / system.name / ".cache", enabled=snapshots_enabled
             )
-            total_roms += len(rom_entries)
+            rom_count = snapshot.recorded_rom_count(
+                capture_directory(system.resolve_rom_path(rom_root))
+                if snapshots_enabled
+                else None
+            )
+            if rom_count is None:
+                rom_count = len(
+                    scan_system(system, rom_root=rom_root, crc_size_limit=1073741824)
+                )
+            total_roms += rom_count
+            rom_counts[system.name] = rom_count
         except Exception:
             pass  # Continue counting other systems
 
@@ -478,6 +677,7 @@ async def run_scraper(config: dict, args: argparse.Namespace) -> int:
 
     # Get search configuration (with defaults)
     search_config = config.get("search", {})
+    watch_mode = getattr(args, "watch", False)
 
     # Initialize orchestrator with Phase D & E components
     orchestrator = WorkflowOrchestrator(
@@ -501,6 +701,8 @@ async def run_scraper(config: dict, args: argparse.Namespace) -> int:
         clear_cache=args.clear_cache,
         event_bus=event_bus,
         textual_ui=textual_ui,
+        retain_caches=watch_mode,
+        quota_planner=quota_planner,
     )
 
     # Connect orchestrator to Textual UI for search response handling
@@ -543,6 +745,7 @@ async def run_scraper(config: dict, args: argparse.Namespace) -> int:
         if not media_types_to_scrape:
             media_types_to_scrape = ["box-2D", "ss"]
 
+        schedule_paused = False
         for system in systems:
             try:
                 # Check for quit request from Textual UI
@@ -560,6 +763,21 @@ async def run_scraper(config: dict, args: argparse.Namespace) -> int:
                     progress.finish_system()
                     continue
 
+                # Scheduled import: once today's share of the quota is spent,
+                # leave the remaining systems for the next run instead of
+                # scanning them only to defer every ROM
+                if schedule is not None and quota_planner.remaining() == 0:
+                    if not schedule_paused:
+                        schedule_paused = True
+                        logger.info(
+                            "Today's share of the API quota is spent: remaining "
+                            "systems continue on the next scheduled run"
+                        )
+                    schedule.record_pending(
+                        system.name, rom_counts.get(system.name, 0), date.today()
+                    )
+                    continue
+
                 result = await orchestrator.scrape_system(
                     system=system,
                     media_types=media_types_to_scrape,
@@ -570,6 +788,10 @@ async def run_scraper(config: dict, args: argparse.Namespace) -> int:
                     current_system_index=systems.index(system),
                     total_systems=len(systems),
                 )
+                if schedule is not None:
+                    schedule.record_system(
+                        system.name, result.total_roms, result.deferred, date.today()
+                    )
 
                 # Log each ROM result in headless mode only
                 if headless_logger and not textual_ui:
@@ -637,6 +859,17 @@ async def run_scraper(config: dict, args: argparse.Namespace) -> int:
                 print(f"\nError processing system {system.fullname}: {e}")
                 progress.finish_system()
                 continue
+
+        # Watch mode: stay resident with warm caches and HTTP pool, and rescrape
+        # systems as ROMs land in them
+        if watch_mode and not (textual_ui and textual_ui.should_quit):
+            await _watch_systems(
+                orchestrator,
+                systems,
+                config,
+                media_types_to_scrape,
+                textual_ui=textual_ui,
+            )
     finally:
         # Phase D & E: Clean up resources
 
@@ -685,6 +918,17 @@ async def run_scraper(config: dict, args: argparse.Namespace) -> int:
             await thread_manager.shutdown(wait=True)
             print("Worker threads stopped")
 
+        # Write any buffered metadata cache entries
+        await asyncio.to_thread(orchestrator.flush_caches)
+
+        # Persist the import plan, including systems finished before an
+        # interruption
+        if schedule is not None:
+            schedule.save()
+
+        # Stop hashing workers
+        orchestrator.hash_backend.shutdown(wait=False)
+
         # Close HTTP client
         if client:
             print("Closing HTTP connections...")
@@ -703,6 +947,9 @@ async def run_scraper(config: dict, args: argparse.Namespace) -> int:
             print("Shutdown complete")
             print("=" * 60 + "\n")
 
+    if schedule is not None:
+        _print_schedule_report(schedule, quota_planner, systems)
+
     # Print final summary in headless mode only
     if headless_logger and not textual_ui:
         progress.print_final_summary()
@@ -768,7 +1015,11 @@ async def run_scraper(config: dict, args: argparse.Namespace) -> int:
                     max_backoff_multiplier = stats["backoff_multiplier"]
 
                 print(f"  {endpoint.value}:")
-                print(f"    Recent calls: {stats['recent_calls']}/{stats['limit']}")
+                print(
+                    f"    Calls: {stats['calls']} "
+                    f"(limit {stats['limit']}/{stats['window_seconds']}s, "
+                    f"{stats['tokens']:.1f}/{stats['burst']} tokens free)"
+                )
                 print(f"    Backoff multiplier: {stats['backoff_multiplier']}x")
                 print(f"    Consecutive 429s: {stats['consecutive_429s']}")
                 if stats["in_backoff"]:
@@ -779,6 +1030,16 @@ async def run_scraper(config: dict, args: argparse.Namespace) -> int:
             print("  Summary:")
             print(f"    Total backoff events: {backoff_events}")
             print(f"    Max backoff multiplier reached: {max_backoff_multiplier}x")
+            print(
+                "    Duplicate lookups sharing a request: "
+                f"{api_client.lookups.get_stats()['coalesced']}"
+            )
+            deferred = quota_planner.get_stats()["deferred"]
+            if deferred:
+                print(
+                    f"    ROMs deferred to the next run (daily quota used up): "
+                    f"{deferred}"
+                )
 
     # Write error log if needed
     if error_logger.has_errors():
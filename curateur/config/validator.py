@@ -109,6 +109,13 @@ def _validate_scraping(section: Dict[str, Any]) -> List[str]:
     elif any(not isinstance(s, str) for s in systems):
         errors.append("scraping.systems entries must be strings")
 
+    # Validate system_priority list (systems scraped first)
+    priority = section.get("system_priority", [])
+    if not isinstance(priority, list):
+        errors.append("scraping.system_priority must be a list")
+    elif any(not isinstance(s, str) for s in priority):
+        errors.append("scraping.system_priority entries must be strings")
+
     # Validate regions
     regions = section.get("preferred_regions", [])
     if not isinstance(regions, list):
@@ -230,6 +237,19 @@ def _validate_media(section: Dict[str, Any]) -> List[str]:
         if not isinstance(section["clean_mismatched_media"], bool):
             errors.append("media.clean_mismatched_media must be a boolean")
 
+    # Validate store_dir (content-addressed media store, null = disabled)
+    if section.get("store_dir") is not None:
+        if not isinstance(section["store_dir"], str):
+            errors.append("media.store_dir must be a string path or null")
+
+    # Validate store_link_mode
+    if "store_link_mode" in section:
+        valid_link_modes = ["hardlink", "reflink", "copy"]
+        if section["store_link_mode"] not in valid_link_modes:
+            errors.append(
+                f"media.store_link_mode must be one of: {', '.join(valid_link_modes)}"
+            )
+
     return errors
 
 
@@ -274,6 +294,59 @@ def _validate_api(section: Dict[str, Any]) -> List[str]:
         elif not (0.0 <= threshold <= 1.0):
             errors.append("api.quota_warning_threshold must be between 0.0 and 1.0")
 
+    # Rate limit burst (token bucket size)
+    if "rate_limit_burst" in section:
+        burst = section["rate_limit_burst"]
+        if not isinstance(burst, int) or isinstance(burst, bool) or burst < 1:
+            errors.append("api.rate_limit_burst must be a positive integer")
+
+    # Optional media download rate limit
+    if section.get("media_requests_per_minute") is not None:
+        media_rpm = section["media_requests_per_minute"]
+        if (
+            not isinstance(media_rpm, int)
+            or isinstance(media_rpm, bool)
+            or media_rpm < 1
+        ):
+            errors.append(
+                "api.media_requests_per_minute must be a positive integer or null"
+            )
+
+    # Daily requests the quota planner leaves unused
+    if "quota_reserve" in section:
+        reserve = section["quota_reserve"]
+        if not isinstance(reserve, int) or isinstance(reserve, bool) or reserve < 0:
+            errors.append("api.quota_reserve must be a non-negative integer")
+
+    # Share of each day's quota curateur may spend
+    if "daily_quota_fraction" in section:
+        fraction = section["daily_quota_fraction"]
+        if (
+            not isinstance(fraction, (int, float))
+            or isinstance(fraction, bool)
+            or not (0.0 < fraction <= 1.0)
+        ):
+            errors.append(
+                "api.daily_quota_fraction must be a number above 0.0 and at most 1.0"
+            )
+
+    # Adaptive (AIMD) concurrency below the API thread limit
+    if "adaptive_concurrency" in section:
+        if not isinstance(section["adaptive_concurrency"], bool):
+            errors.append("api.adaptive_concurrency must be a boolean")
+
+    # Optional ceiling for concurrent media downloads
+    if section.get("max_concurrent_downloads") is not None:
+        downloads = section["max_concurrent_downloads"]
+        if (
+            not isinstance(downloads, int)
+            or isinstance(downloads, bool)
+            or downloads < 1
+        ):
+            errors.append(
+                "api.max_concurrent_downloads must be a positive integer or null"
+            )
+
     return errors
 
 
@@ -317,6 +390,45 @@ def _validate_runtime(section: Dict[str, Any]) -> List[str]:
             f"runtime.hash_algorithm must be one of: {', '.join(valid_hashes)}"
         )
 
+    # Additional ROM digests computed in the same pass
+    if "rom_digests" in section:
+        rom_digests = section["rom_digests"]
+        if not isinstance(rom_digests, list) or any(
+            digest not in valid_hashes for digest in rom_digests
+        ):
+            errors.append(
+                "runtime.rom_digests must be a list containing only: "
+                f"{', '.join(valid_hashes)}"
+            )
+
+    # Hashing backend
+    if "hash_backend" in section:
+        if section["hash_backend"] not in ("thread", "process"):
+            errors.append("runtime.hash_backend must be one of: thread, process")
+
+    if "hash_workers" in section:
+        hash_workers = section["hash_workers"]
+        if (
+            not isinstance(hash_workers, int)
+            or isinstance(hash_workers, bool)
+            or hash_workers < 0
+        ):
+            errors.append("runtime.hash_workers must be a non-negative integer")
+
+    for key in ("hash_hdd_readers", "hash_ssd_readers"):
+        if key in section:
+            readers = section[key]
+            if not isinstance(readers, int) or isinstance(readers, bool) or readers < 0:
+                errors.append(f"runtime.{key} must be a non-negative integer")
+
+    if "hash_drop_page_cache" in section:
+        if not isinstance(section["hash_drop_page_cache"], bool):
+            errors.append("runtime.hash_drop_page_cache must be a boolean")
+
+    if "hash_read_mode" in section:
+        if section["hash_read_mode"] not in ("readinto", "mmap"):
+            errors.append("runtime.hash_read_mode must be one of: readinto, mmap")
+
     # CRC size limit
     if "crc_size_limit" in section:
         size_limit = section["crc_size_limit"]
@@ -361,6 +473,125 @@ def _validate_runtime(section: Dict[str, Any]) -> List[str]:
         if not isinstance(enable_cache, bool):
             errors.append("runtime.enable_cache must be a boolean")
 
+    # Validate zip_member_crc flag
+    if "zip_member_crc" in section:
+        if not isinstance(section["zip_member_crc"], bool):
+            errors.append("runtime.zip_member_crc must be a boolean")
+
+    # Validate fingerprint_large_roms flag
+    if "fingerprint_large_roms" in section:
+        if not isinstance(section["fingerprint_large_roms"], bool):
+            errors.append("runtime.fingerprint_large_roms must be a boolean")
+
+    # Validate incremental_scan flag
+    if "incremental_scan" in section:
+        if not isinstance(section["incremental_scan"], bool):
+            errors.append("runtime.incremental_scan must be a boolean")
+
+    # Validate watch mode debounce
+    if "watch_debounce_seconds" in section:
+        debounce = section["watch_debounce_seconds"]
+        if (
+            not isinstance(debounce, (int, float))
+            or isinstance(debounce, bool)
+            or debounce <= 0
+        ):
+            errors.append("runtime.watch_debounce_seconds must be a positive number")
+
+    # Validate metadata cache write-behind thresholds
+    if "cache_ttl_days" in section:
+        ttl_days = section["cache_ttl_days"]
+        if not isinstance(ttl_days, int) or isinstance(ttl_days, bool) or ttl_days < 1:
+            errors.append("runtime.cache_ttl_days must be a positive integer")
+
+    if "cache_ttl_overrides" in section:
+        ttl_overrides = section["cache_ttl_overrides"]
+        if not isinstance(ttl_overrides, dict):
+            errors.append("runtime.cache_ttl_overrides must be a mapping")
+        else:
+            for system_name, ttl_days in ttl_overrides.items():
+                if (
+                    not isinstance(ttl_days, int)
+                    or isinstance(ttl_days, bool)
+                    or ttl_days < 1
+                ):
+                    errors.append(
+                        f"runtime.cache_ttl_overrides.{system_name} must be a "
+                        "positive integer"
+                    )
+
+    if "stale_while_revalidate_days" in section:
+        stale_days = section["stale_while_revalidate_days"]
+        if (
+            not isinstance(stale_days, (int, float))
+            or isinstance(stale_days, bool)
+            or stale_days < 0
+        ):
+            errors.append(
+                "runtime.stale_while_revalidate_days must be a non-negative number"
+            )
+
+    if "cache_resident_entries" in section:
+        resident_entries = section["cache_resident_entries"]
+        if (
+            not isinstance(resident_entries, int)
+            or isinstance(resident_entries, bool)
+            or resident_entries < 0
+        ):
+            errors.append(
+                "runtime.cache_resident_entries must be a non-negative integer"
+            )
+
+    if "cache_flush_entries" in section:
+        flush_entries = section["cache_flush_entries"]
+        if (
+            not isinstance(flush_entries, int)
+            or isinstance(flush_entries, bool)
+            or flush_entries < 1
+        ):
+            errors.append("runtime.cache_flush_entries must be a positive integer")
+
+    if "cache_flush_interval" in section:
+        flush_interval = section["cache_flush_interval"]
+        if (
+            not isinstance(flush_interval, (int, float))
+            or isinstance(flush_interval, bool)
+            or flush_interval < 0
+        ):
+            errors.append("runtime.cache_flush_interval must be a non-negative number")
+
+    # Validate optional global metadata cache directory
+    if "global_cache_dir" in section and section["global_cache_dir"] is not None:
+        if not isinstance(section["global_cache_dir"], str):
+            errors.append("runtime.global_cache_dir must be a string path or null")
+
+    if "negative_cache_ttl_days" in section:
+        negative_ttl = section["negative_cache_ttl_days"]
+        if (
+            not isinstance(negative_ttl, (int, float))
+            or isinstance(negative_ttl, bool)
+            or negative_ttl < 0
+        ):
+            errors.append(
+                "runtime.negative_cache_ttl_days must be a non-negative number"
+            )
+
+    if "negative_cache_max_ttl_days" in section:
+        negative_max_ttl = section["negative_cache_max_ttl_days"]
+        if (
+            not isinstance(negative_max_ttl, (int, float))
+            or isinstance(negative_max_ttl, bool)
+            or negative_max_ttl <= 0
+        ):
+            errors.append(
+                "runtime.negative_cache_max_ttl_days must be a positive number"
+            )
+
+    # Validate enable_hash_index flag
+    if "enable_hash_index" in section:
+        if not isinstance(section["enable_hash_index"], bool):
+            errors.append("runtime.enable_hash_index must be a boolean")
+
     return errors
 
 
@@ -6,6 +6,7 @@ Handles downloading, validating, and organizing game media from ScreenScraper.
 
 from .downloader import DownloadError, ImageDownloader, ValidationError
 from .media_downloader import DownloadResult, MediaDownloader
+from .media_store import MediaStore
 from .media_types import MEDIA_TYPE_MAP, MediaType, get_directory_for_media_type
 from .organizer import MediaOrganizer
 from .region_selector import (
@@ -31,4 +32,5 @@ __all__ = [
     "MediaOrganizer",
     "MediaDownloader",
     "DownloadResult",
+    "MediaStore",
 ]
@@ -7,11 +7,13 @@ Downloads images from URLs with retry logic and validates them using Pillow.
 import asyncio
 from io import BytesIO
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Callable, Dict, Optional, Tuple
 
 import httpx
 from PIL import Image
 
+from .media_store import data_digest
+
 
 class DownloadError(Exception):
     """Base exception for download errors."""
@@ -44,6 +46,7 @@ class ImageDownloader:
         min_width: int = 50,
         min_height: int = 50,
         validation_mode: str = "disabled",
+        overload_callback: Optional[Callable[[str], None]] = None,
     ):
         """
         Initialize image downloader.
@@ -55,6 +58,8 @@ class ImageDownloader:
             min_width: Minimum acceptable image width in pixels
             min_height: Minimum acceptable image height in pixels
             validation_mode: Validation mode (disabled, normal, strict)
+            overload_callback: Called with a reason when the server answers
+                429/5xx or times out (e.g. to lower download concurrency)
         """
         self.client = client
         self.timeout = timeout
@@ -62,9 +67,14 @@ class ImageDownloader:
         self.min_width = min_width
         self.min_height = min_height
         self.validation_mode = validation_mode
+        self.overload_callback = overload_callback
 
     async def download(
-        self, url: str, output_path: Path, validate: bool = True
+        self,
+        url: str,
+        output_path: Path,
+        validate: bool = True,
+        digests: Optional[Dict[str, Optional[str]]] = None,
     ) -> Tuple[bool, Optional[str]]:
         """
         Download an image from URL to output path.
@@ -73,6 +83,9 @@ class ImageDownloader:
             url: Image URL to download
             output_path: Path where image should be saved
             validate: Whether to validate image after download
+            digests: Algorithms ('sha1', 'md5', 'crc') to hash the downloaded
+                bytes with, as keys; their values are filled in on success,
+                so the file never has to be read back to hash it
 
         Returns:
             Tuple of (success: bool, error_message: str or None)
@@ -103,6 +116,10 @@ class ImageDownloader:
                             continue
                         return False, f"Validation failed: {validation_error}"
 
+                if digests is not None:
+                    for algorithm in digests:
+                        digests[algorithm] = data_digest(image_data, algorithm)
+
                 # Write to temporary file first
                 temp_path = output_path.with_suffix(output_path.suffix + ".tmp")
                 try:
@@ -119,6 +136,7 @@ class ImageDownloader:
                 return True, None
 
             except (httpx.HTTPError, httpx.TimeoutException) as e:
+                self._report_overload(e)
                 if attempt == self.max_retries - 1:
                     return (
                         False,
@@ -134,6 +152,17 @@ class ImageDownloader:
 
         return False, "Download failed (max retries exceeded)"
 
+    def _report_overload(self, error: Exception) -> None:
+        """Pass 429/5xx responses and timeouts to overload_callback."""
+        if self.overload_callback is None:
+            return
+        if isinstance(error, httpx.TimeoutException):
+            self.overload_callback("timeout")
+        elif isinstance(error, httpx.HTTPStatusError):
+            status = error.response.status_code
+            if status == 429 or status >= 500:
+                self.overload_callback(f"HTTP {status}")
+
     async def _download_with_retry(self, url: str, attempt: int) -> bytes:
         """
         Download image data from URL.
@@ -7,9 +7,12 @@ Coordinates URL selection, downloading, validation, and organization of game med
 import asyncio
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+from ..api.concurrency import AdaptiveConcurrency
+from ..api.rate_limiter import RateLimiter
 from .downloader import ImageDownloader
+from .media_store import MediaStore
 from .organizer import MediaOrganizer
 from .url_selector import MediaURLSelector
 
@@ -65,6 +68,8 @@ class MediaDownloader:
     - Image downloading with retry logic
     - Image validation with Pillow
     - File organization in ES-DE structure
+    - Optional content-addressed store so identical files are downloaded
+      and stored once
     """
 
     def __init__(
@@ -79,8 +84,12 @@ class MediaDownloader:
         min_height: int = 50,
         hash_algorithm: str = "crc32",
         validation_mode: str = "disabled",
-        download_semaphore: Optional[asyncio.Semaphore] = None,
+        download_semaphore: Optional[
+            Union[asyncio.Semaphore, AdaptiveConcurrency]
+        ] = None,
         event_bus: Optional[Any] = None,
+        media_store: Optional[MediaStore] = None,
+        rate_limiter: Optional[RateLimiter] = None,
     ):
         """
         Initialize media downloader.
@@ -96,8 +105,13 @@ class MediaDownloader:
             min_height: Minimum image height in pixels
             hash_algorithm: Hash algorithm for file verification ('crc32', 'md5', 'sha1')
             validation_mode: Validation mode (disabled, normal, strict)
-            download_semaphore: Optional semaphore to limit concurrent downloads globally
+            download_semaphore: Optional semaphore to limit concurrent downloads
+                globally; an AdaptiveConcurrency limit is also told about
+                successful downloads, timeouts and 429/5xx responses
             event_bus: Optional EventBus for UI event emissions
+            media_store: Optional content-addressed store; files it already
+                holds are linked instead of downloaded
+            rate_limiter: Optional token bucket paced before each download
         """
         self.url_selector = MediaURLSelector(
             preferred_regions=preferred_regions, enabled_media_types=enabled_media_types
@@ -110,6 +124,11 @@ class MediaDownloader:
             min_width=min_width,
             min_height=min_height,
             validation_mode=validation_mode,
+            overload_callback=(
+                download_semaphore.record_overload
+                if isinstance(download_semaphore, AdaptiveConcurrency)
+                else None
+            ),
         )
 
         self.organizer = MediaOrganizer(media_root)
@@ -117,6 +136,8 @@ class MediaDownloader:
         self.validation_mode = validation_mode
         self.download_semaphore = download_semaphore
         self.event_bus = event_bus
+        self.media_store = media_store
+        self.rate_limiter = rate_limiter
 
     async def download_media_for_game(
         self,
@@ -304,10 +325,32 @@ class MediaDownloader:
         # Skip image validation for non-image types (PDFs, videos)
         validate = media_type not in ["manuel", "video"]
 
-        # Download and validate
-        success, error = await self.downloader.download(
-            url, output_path, validate=validate
-        )
+        # Identical content already stored (clones, regional variants,
+        # multi-disc sets): link it instead of downloading
+        store_key = self.media_store.api_key(media_info) if self.media_store else None
+        if store_key and await asyncio.to_thread(
+            self.media_store.materialize, store_key, file_format, output_path
+        ):
+            success, error = True, None
+        else:
+            if self.rate_limiter:
+                await self.rate_limiter.acquire()
+
+            # Download and validate, hashing the bytes for the store on the way
+            digests = None
+            if self.media_store:
+                digests = {"sha1": None}
+                if store_key:
+                    digests[store_key.split("/", 1)[0]] = None
+            success, error = await self.downloader.download(
+                url, output_path, validate=validate, digests=digests
+            )
+            if success and isinstance(self.download_semaphore, AdaptiveConcurrency):
+                self.download_semaphore.record_success()
+            if success and self.media_store:
+                await asyncio.to_thread(
+                    self.media_store.add, output_path, file_format, media_info, digests
+                )
 
         if success:
             # Get dimensions (only for images)
@@ -316,7 +359,6 @@ class MediaDownloader:
                 dimensions = self.downloader.get_image_dimensions(output_path)
 
             # Calculate hash based on validation mode
-            import asyncio
             import logging
 
             from curateur.scanner.hash_calculator import calculate_hash
@@ -0,0 +1,291 @@
+"""
+Content-addressed store for downloaded media.
+
+Clones, regional variants and multi-disc sets often share byte-identical
+box art and videos. With a store configured, each distinct file is kept
+once under its content hash and the ES-DE media layout gets hardlinks (or
+reflinks) to it, so a duplicate costs neither a download nor disk space.
+"""
+
+import errno
+import hashlib
+import logging
+import os
+import shutil
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+LINK_MODES = ("hardlink", "reflink", "copy")
+
+# ScreenScraper media hash attributes, most specific first
+_API_DIGESTS = ("sha1", "md5", "crc")
+
+# FICLONE ioctl (<linux/fs.h>): share extents copy-on-write (Btrfs, XFS)
+_FICLONE = 0x40049409
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+def file_digest(path: Path, algorithm: str) -> str:
+    """
+    Hash a file with one of the algorithms ScreenScraper reports for media.
+
+    Args:
+        path: File to hash
+        algorithm: 'sha1', 'md5' or 'crc'
+
+    Returns:
+        Lowercase hex digest (8 digits for crc)
+    """
+    if algorithm == "crc":
+        crc = 0
+        with open(path, "rb") as f:
+            while chunk := f.read(_CHUNK_SIZE):
+                crc = zlib.crc32(chunk, crc)
+        return f"{crc:08x}"
+
+    digest = hashlib.new(algorithm)
+    with open(path, "rb") as f:
+        while chunk := f.read(_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def data_digest(data: bytes, algorithm: str) -> str:
+    """
+    Hash bytes held in memory the way file_digest() hashes a file.
+
+    Args:
+        data: Content to hash
+        algorithm: 'sha1', 'md5' or 'crc'
+
+    Returns:
+        Lowercase hex digest (8 digits for crc)
+    """
+    if algorithm == "crc":
+        return f"{zlib.crc32(data):08x}"
+    return hashlib.new(algorithm, data).hexdigest()
+
+
+class MediaStore:
+    """
+    Media files keyed by content hash, linked into the ES-DE layout.
+
+    Layout: <root>/<algorithm>/<hh>/<digest>.<ext>, where the digest is the
+    hash ScreenScraper reports for the media (sha1, else md5, else crc) or,
+    when it reports none, the SHA1 of the downloaded bytes.
+
+    Link modes:
+    - hardlink: ES-DE files are extra names for the stored file. Falls back
+      to copying when the media directory is on another filesystem.
+    - reflink: copy-on-write clone (Btrfs, XFS); falls back to copying.
+    - copy: plain copies, which only saves repeat downloads.
+
+    Media files are replaced, never modified in place, so a linked file is
+    not changed through another name. The store can be deleted at any time;
+    existing ES-DE media files stay intact.
+    """
+
+    def __init__(self, root: Path, link_mode: str = "hardlink"):
+        """
+        Initialize media store.
+
+        Args:
+            root: Directory holding the stored files
+            link_mode: How files are placed in the media layout
+                (hardlink, reflink or copy)
+
+        Raises:
+            ValueError: If link_mode is not supported
+        """
+        if link_mode not in LINK_MODES:
+            raise ValueError(f"link_mode must be one of: {', '.join(LINK_MODES)}")
+
+        self.root = Path(root)
+        self.link_mode = link_mode
+
+        self.reused = 0
+        self.stored = 0
+        self.bytes_saved = 0
+
+    @staticmethod
+    def api_key(media_info: Dict[str, Any]) -> Optional[str]:
+        """
+        Get the store key from the hashes in a ScreenScraper media entry.
+
+        Args:
+            media_info: Media dict from the API response
+
+        Returns:
+            "<algorithm>/<digest>", or None if the entry has no hash
+        """
+        for algorithm in _API_DIGESTS:
+            value = media_info.get(algorithm)
+            if value:
+                return f"{algorithm}/{str(value).lower()}"
+        return None
+
+    def blob_path(self, key: str, extension: str) -> Path:
+        """Path of the stored file for a key."""
+        algorithm, digest = key.split("/", 1)
+        return self.root / algorithm / digest[:2] / f"{digest}.{extension}"
+
+    def materialize(self, key: str, extension: str, output_path: Path) -> bool:
+        """
+        Place a stored file at output_path if the store has it.
+
+        Blocking - call via asyncio.to_thread() from async code.
+
+        Args:
+            key: Store key from api_key()
+            extension: Media file extension
+            output_path: Destination in the ES-DE media layout
+
+        Returns:
+            True if the file was placed, False if the store does not have it
+        """
+        blob = self.blob_path(key, extension)
+        try:
+            size = blob.stat().st_size
+        except FileNotFoundError:
+            return False
+
+        try:
+            self._place(blob, output_path)
+        except OSError as e:
+            logger.warning(f"Cannot link stored media {blob} to {output_path}: {e}")
+            return False
+
+        self.reused += 1
+        self.bytes_saved += size
+        logger.debug(f"Reused stored media {key} for {output_path.name}")
+        return True
+
+    def add(
+        self,
+        file_path: Path,
+        extension: str,
+        media_info: Optional[Dict[str, Any]] = None,
+        digests: Optional[Dict[str, Optional[str]]] = None,
+    ) -> Optional[str]:
+        """
+        Add a freshly downloaded file to the store.
+
+        The file is stored under the API hash if its bytes match it, else
+        under its own SHA1. If the store already holds the same content,
+        file_path is replaced by a link to the stored copy.
+
+        Blocking - call via asyncio.to_thread() from async code.
+
+        Args:
+            file_path: Downloaded file in the ES-DE media layout
+            extension: Media file extension
+            media_info: Media dict from the API response (for its hashes)
+            digests: Digests of the file by algorithm, if already calculated
+                (e.g. while downloading); missing ones are read from the file
+
+        Returns:
+            Store key, or None if the file could not be stored
+        """
+        known = digests or {}
+
+        def digest(algorithm: str) -> str:
+            return known.get(algorithm) or file_digest(file_path, algorithm)
+
+        key = self.api_key(media_info or {})
+        try:
+            if key is not None:
+                algorithm, expected = key.split("/", 1)
+                if digest(algorithm) != expected:
+                    logger.debug(
+                        f"{file_path.name} does not match its API {algorithm}, "
+                        "storing under its own digest"
+                    )
+                    key = None
+            if key is None:
+                key = f"sha1/{digest('sha1')}"
+
+            blob = self.blob_path(key, extension)
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            if blob.exists():
+                # Same bytes already stored: share them
+                self.bytes_saved += file_path.stat().st_size
+                self._place(blob, file_path)
+            else:
+                self._store(file_path, blob)
+                self.stored += 1
+        except OSError as e:
+            logger.warning(f"Cannot add {file_path} to media store: {e}")
+            return None
+
+        return key
+
+    def _store(self, source: Path, blob: Path) -> None:
+        """Put a new file into the store."""
+        if self.link_mode == "hardlink":
+            try:
+                os.link(source, blob)
+                return
+            except FileExistsError:
+                # Stored concurrently by another download
+                self._place(blob, source)
+                return
+            except OSError as e:
+                if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK):
+                    raise
+        self._clone(source, blob)
+
+    def _place(self, blob: Path, output_path: Path) -> None:
+        """Atomically replace output_path with a link or copy of blob."""
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = output_path.with_name(output_path.name + ".link")
+        temp_path.unlink(missing_ok=True)
+        try:
+            if self.link_mode == "hardlink":
+                try:
+                    os.link(blob, temp_path)
+                except OSError as e:
+                    if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK):
+                        raise
+                    self._clone(blob, temp_path)
+            else:
+                self._clone(blob, temp_path)
+            temp_path.replace(output_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+    def _clone(self, source: Path, destination: Path) -> None:
+        """Copy a file, as a reflink when link_mode is reflink and supported."""
+        if self.link_mode == "reflink" and self._reflink(source, destination):
+            return
+        temp_path = destination.with_name(destination.name + ".part")
+        shutil.copyfile(source, temp_path)
+        temp_path.replace(destination)
+
+    @staticmethod
+    def _reflink(source: Path, destination: Path) -> bool:
+        """Clone source into destination with FICLONE; False if unsupported."""
+        try:
+            import fcntl
+        except ImportError:
+            return False
+
+        try:
+            with open(source, "rb") as src, open(destination, "wb") as dst:
+                fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+            return True
+        except OSError:
+            destination.unlink(missing_ok=True)
+            return False
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get files reused from and added to the store this session."""
+        return {
+            "reused": self.reused,
+            "stored": self.stored,
+            "bytes_saved": self.bytes_saved,
+        }
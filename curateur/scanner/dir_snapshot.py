@@ -0,0 +1,256 @@
+"""
+Per-system directory snapshot for incremental scans.
+
+Records a cheap summary of a system's ROM directory - directory mtime, entry
+count and a rolling digest of every entry's (name, size, mtime), disc
+subdirectories included - together
+with the state of the gamelist written from it. When a later run finds the
+same summary, the same gamelist and the same scrape settings, the system can
+be skipped without scanning, hashing or parsing anything.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+
+
+def settings_digest(settings: Any) -> str:
+    """
+    Digest the scrape settings a snapshot was taken under.
+
+    Args:
+        settings: JSON-serializable settings (config sections, media types...)
+
+    Returns:
+        Hex digest that changes whenever any setting changes
+    """
+    encoded = json.dumps(settings, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha1(encoded).hexdigest()
+
+
+def _digest_entries(directory: Path, prefix: str, hasher: Any) -> int:
+    """
+    Feed a directory's entries, and those of its subdirectories, to a digest.
+
+    Args:
+        directory: Directory to list
+        prefix: Path of the directory relative to the ROM directory
+        hasher: hashlib object updated in place
+
+    Returns:
+        Number of entries digested
+    """
+    with os.scandir(directory) as scanner:
+        entries = sorted(scanner, key=lambda entry: entry.name)
+    count = 0
+    for entry in entries:
+        entry_stat = entry.stat()
+        name = prefix + entry.name
+        hasher.update(
+            f"{name}\0{entry_stat.st_size}\0{entry_stat.st_mtime_ns}\n".encode(
+                "utf-8", "surrogateescape"
+            )
+        )
+        count += 1
+        # Symlinked directories are not followed, so links cannot loop
+        if entry.is_dir(follow_symlinks=False):
+            count += _digest_entries(Path(entry.path), f"{name}/", hasher)
+    return count
+
+
+def capture_directory(rom_path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Summarize a ROM directory with a single listing.
+
+    Every entry (including hidden ones) contributes its name, size and mtime
+    to a rolling digest. Disc subdirectories are listed too, since a file
+    rewritten in place changes its own mtime but not the directory's.
+
+    Args:
+        rom_path: System ROM directory
+
+    Returns:
+        Dict with dir_mtime_ns, entry_count and digest, or None if the
+        directory cannot be listed
+    """
+    try:
+        dir_stat = rom_path.stat()
+        hasher = hashlib.sha1()
+        entry_count = _digest_entries(rom_path, "", hasher)
+    except OSError as e:
+        logger.debug(f"Cannot snapshot {rom_path}: {e}")
+        return None
+
+    return {
+        "dir_mtime_ns": dir_stat.st_mtime_ns,
+        "entry_count": entry_count,
+        "digest": hasher.hexdigest(),
+    }
+
+
+def _file_state(file_path: Path) -> Optional[Dict[str, int]]:
+    """Get the (size, mtime) of a file, or None if it does not exist."""
+    try:
+        stat_result = file_path.stat()
+    except OSError:
+        return None
+    return {"size": stat_result.st_size, "mtime_ns": stat_result.st_mtime_ns}
+
+
+class DirectorySnapshot:
+    """
+    Persisted snapshot of one system's ROM directory and gamelist.
+
+    Storage format:
+    {
+        "version": 1,
+        "rom_directory": {"dir_mtime_ns": ..., "entry_count": 412, "digest": "..."},
+        "gamelist": {"size": 183220, "mtime_ns": ...},
+        "settings": "<settings digest>",
+        "rom_count": 398,
+        "recorded_at": 1700000000.0
+    }
+    """
+
+    def __init__(self, snapshot_directory: Path, enabled: bool = True):
+        """
+        Initialize directory snapshot.
+
+        Args:
+            snapshot_directory: Directory holding the snapshot file (gamelist .cache/)
+            enabled: Whether the snapshot is consulted and updated
+        """
+        self.snapshot_directory = snapshot_directory
+        self.snapshot_file = snapshot_directory / "scan_snapshot.json"
+        self.enabled = enabled
+
+    def _load(self) -> Optional[Dict[str, Any]]:
+        """Load the stored snapshot, or None if missing or unreadable."""
+        if not self.snapshot_file.exists():
+            return None
+
+        try:
+            with open(self.snapshot_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Failed to load scan snapshot: {e}")
+            return None
+
+        if data.get("version") != SNAPSHOT_VERSION:
+            return None
+        return data
+
+    def unchanged_rom_count(
+        self,
+        rom_state: Optional[Dict[str, Any]],
+        gamelist_path: Path,
+        settings: str,
+        max_age_seconds: float,
+    ) -> Optional[int]:
+        """
+        Check whether a system is untouched since the snapshot was recorded.
+
+        Args:
+            rom_state: Current directory summary from capture_directory()
+            gamelist_path: Path of the system's gamelist.xml
+            settings: Current settings digest
+            max_age_seconds: Snapshots older than this are not trusted (keeps
+                the system from outliving its metadata cache entries)
+
+        Returns:
+            ROM count recorded with the snapshot if nothing changed, else None
+        """
+        if not self.enabled or rom_state is None:
+            return None
+
+        stored = self._load()
+        if stored is None:
+            return None
+
+        if time.time() - stored.get("recorded_at", 0) > max_age_seconds:
+            logger.debug("Scan snapshot older than cache TTL, full scan required")
+            return None
+
+        if (
+            stored.get("rom_directory") != rom_state
+            or stored.get("gamelist") != _file_state(gamelist_path)
+            or stored.get("settings") != settings
+        ):
+            return None
+
+        return stored.get("rom_count", 0)
+
+    def recorded_rom_count(self, rom_state: Optional[Dict[str, Any]]) -> Optional[int]:
+        """
+        Get the ROM count recorded for a directory that has not changed since.
+
+        Unlike unchanged_rom_count() only the ROM directory is compared, which
+        is all the count depends on, so callers can size a run without
+        scanning systems that will be skipped or rescanned later anyway.
+
+        Args:
+            rom_state: Current directory summary from capture_directory()
+
+        Returns:
+            Recorded ROM count if the directory matches, else None
+        """
+        if not self.enabled or rom_state is None:
+            return None
+
+        stored = self._load()
+        if stored is None or stored.get("rom_directory") != rom_state:
+            return None
+        return stored.get("rom_count")
+
+    def save(
+        self,
+        rom_state: Optional[Dict[str, Any]],
+        gamelist_path: Path,
+        settings: str,
+        rom_count: int,
+    ) -> None:
+        """
+        Record the state a system was completely processed in.
+
+        Args:
+            rom_state: Directory summary captured before the system was scanned
+            gamelist_path: Path of the gamelist.xml written for the system
+            settings: Settings digest the system was processed with
+            rom_count: Number of ROMs found by the scan
+        """
+        if not self.enabled or rom_state is None:
+            return
+
+        try:
+            self.snapshot_directory.mkdir(parents=True, exist_ok=True)
+
+            # Write to temporary file first
+            temp_file = self.snapshot_file.with_suffix(".tmp")
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "version": SNAPSHOT_VERSION,
+                        "rom_directory": rom_state,
+                        "gamelist": _file_state(gamelist_path),
+                        "settings": settings,
+                        "rom_count": rom_count,
+                        "recorded_at": time.time(),
+                    },
+                    f,
+                    indent=2,
+                )
+
+            # Atomic rename
+            temp_file.replace(self.snapshot_file)
+            logger.debug(f"Saved scan snapshot: {self.snapshot_file}")
+
+        except (IOError, OSError) as e:
+            logger.error(f"Failed to save scan snapshot: {e}")
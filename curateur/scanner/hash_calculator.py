@@ -1,9 +1,144 @@
 """Hash calculation for ROM and media files."""
 
+import asyncio
+import functools
 import hashlib
+import mmap
+import multiprocessing
+import os
+import threading
+import zipfile
 import zlib
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Dict, Iterator, Optional, Sequence, Tuple
+
+SUPPORTED_ALGORITHMS = ("crc32", "md5", "sha1")
+
+HASH_BACKENDS = ("thread", "process")
+READ_MODES = ("readinto", "mmap")
+
+CHUNK_SIZE = 8 * 1024 * 1024  # 8MB chunks for better I/O efficiency
+
+# One reusable read buffer per worker thread (or process), so hashing does not
+# allocate a fresh 8MB bytes object for every chunk
+_buffers = threading.local()
+
+
+def _chunk_buffer() -> memoryview:
+    """Get this thread's preallocated read buffer."""
+    buffer = getattr(_buffers, "view", None)
+    if buffer is None:
+        buffer = memoryview(bytearray(CHUNK_SIZE))
+        _buffers.view = buffer
+    return buffer
+
+
+def _iter_chunks(f: BinaryIO, file_size: int, read_mode: str) -> Iterator[memoryview]:
+    """
+    Yield zero-copy views over a file's contents.
+
+    Args:
+        f: File opened in binary mode
+        file_size: Size of the file in bytes
+        read_mode: 'readinto' (reused buffer) or 'mmap' (memory-mapped file)
+
+    Yields:
+        memoryview chunks, only valid until the next chunk is requested
+    """
+    if read_mode == "mmap" and file_size > 0:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                for offset in range(0, file_size, CHUNK_SIZE):
+                    with view[offset : offset + CHUNK_SIZE] as chunk:
+                        yield chunk
+        return
+
+    buffer = _chunk_buffer()
+    while True:
+        bytes_read = f.readinto(buffer)
+        if not bytes_read:
+            break
+        with buffer[:bytes_read] as chunk:
+            yield chunk
+
+
+def calculate_hashes(
+    file_path: Path,
+    algorithms: Sequence[str] = SUPPORTED_ALGORITHMS,
+    size_limit: int = 1073741824,
+    read_mode: str = "readinto",
+    drop_page_cache: bool = False,
+) -> Optional[Dict[str, str]]:
+    """
+    Calculate several hashes for a file in a single read.
+
+    Every chunk read from disk updates all requested digests, so asking for
+    CRC32, MD5 and SHA1 together costs one pass over the file instead of three.
+
+    Args:
+        file_path: Path to file to hash
+        algorithms: Hash algorithms to calculate ('crc32', 'md5', 'sha1')
+        size_limit: Maximum file size to hash (default 1GB). Set 0 for no limit.
+        read_mode: 'readinto' to reuse a preallocated buffer, or 'mmap'
+        drop_page_cache: Advise the kernel to read sequentially and to evict
+            each chunk from the page cache once hashed (POSIX only; ignored
+            where posix_fadvise is unavailable)
+
+    Returns:
+        Dict of algorithm -> uppercase hex hash string, or None if file exceeds limit
+
+    Raises:
+        IOError: If file cannot be read
+        ValueError: If an algorithm is not supported
+    """
+    for algorithm in algorithms:
+        if algorithm not in SUPPORTED_ALGORITHMS:
+            raise ValueError(f"Unsupported hash algorithm: {algorithm}")
+    if read_mode not in READ_MODES:
+        raise ValueError(f"Unsupported read mode: {read_mode}")
+
+    file_size = file_path.stat().st_size
+
+    # Only check size limit if one is set (non-zero)
+    if size_limit > 0 and file_size > size_limit:
+        return None
+
+    crc = 0
+    use_crc = "crc32" in algorithms
+    hashers = {
+        algorithm: hashlib.new(algorithm)
+        for algorithm in algorithms
+        if algorithm != "crc32"
+    }
+
+    fadvise = drop_page_cache and hasattr(os, "posix_fadvise")
+
+    with open(file_path, "rb") as f:
+        if fadvise:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+        offset = 0
+        for chunk in _iter_chunks(f, file_size, read_mode):
+            if use_crc:
+                crc = zlib.crc32(chunk, crc)
+            for hasher in hashers.values():
+                hasher.update(chunk)
+
+            if fadvise:
+                # Hashed bytes are never needed again; keep the page cache for
+                # gamelists, media and the metadata cache instead
+                os.posix_fadvise(f.fileno(), offset, len(chunk), os.POSIX_FADV_DONTNEED)
+            offset += len(chunk)
+
+    results = {
+        algorithm: hasher.hexdigest().upper() for algorithm, hasher in hashers.items()
+    }
+    if use_crc:
+        # Convert to unsigned 32-bit value and format as uppercase hex
+        results["crc32"] = f"{crc & 0xFFFFFFFF:08X}"
+
+    return results
 
 
 def calculate_hash(
@@ -24,42 +159,195 @@ def calculate_hash(
         IOError: If file cannot be read
         ValueError: If algorithm is not supported
     """
-    if algorithm not in ("crc32", "md5", "sha1"):
-        raise ValueError(f"Unsupported hash algorithm: {algorithm}")
+    hashes = calculate_hashes(file_path, (algorithm,), size_limit=size_limit)
+    if hashes is None:
+        return None
+    return hashes[algorithm]
+
 
+FINGERPRINT_PREFIX = "FP-"
+FINGERPRINT_SAMPLE_SIZE = 64 * 1024  # 64KB per sampled block
+
+
+def calculate_fingerprint(
+    file_path: Path, sample_size: int = FINGERPRINT_SAMPLE_SIZE
+) -> str:
+    """
+    Calculate a cheap change-detection fingerprint for a large file.
+
+    Combines the file size with SHA1 of three sampled blocks (head, middle and
+    tail), so multi-GB images are fingerprinted with three small reads. The
+    fingerprint identifies a file for change detection only - it is never
+    sent to the API as a hash.
+
+    Args:
+        file_path: Path to file to fingerprint
+        sample_size: Bytes read from each sampled position
+
+    Returns:
+        Fingerprint string prefixed with 'FP-' so it cannot collide with a
+        real CRC32/MD5/SHA1 value
+
+    Raises:
+        IOError: If file cannot be read
+    """
     file_size = file_path.stat().st_size
+    hasher = hashlib.sha1(str(file_size).encode("ascii"))
 
-    # Only check size limit if one is set (non-zero)
-    if size_limit > 0 and file_size > size_limit:
+    offsets = sorted(
+        {0, max(0, file_size // 2 - sample_size // 2), max(0, file_size - sample_size)}
+    )
+    with open(file_path, "rb") as f:
+        for offset in offsets:
+            f.seek(offset)
+            hasher.update(f.read(sample_size))
+
+    return f"{FINGERPRINT_PREFIX}{hasher.hexdigest().upper()}"
+
+
+def read_zip_member_crc(file_path: Path) -> Optional[Tuple[str, int]]:
+    """
+    Get the CRC32 and size of the ROM inside a single-member zip archive.
+
+    Both values come from the zip central directory, so nothing is
+    decompressed and only the end of the archive is read.
+
+    Args:
+        file_path: Path to .zip file
+
+    Returns:
+        Tuple of (uppercase hex CRC32, uncompressed size), or None if the
+        archive is unreadable or does not contain exactly one file
+    """
+    try:
+        with zipfile.ZipFile(file_path) as archive:
+            members = [info for info in archive.infolist() if not info.is_dir()]
+    except (zipfile.BadZipFile, OSError):
         return None
 
-    chunk_size = 8 * 1024 * 1024  # 8MB chunks for better I/O efficiency
+    if len(members) != 1:
+        return None
 
-    if algorithm == "crc32":
-        # Calculate CRC32
-        crc = 0
-        with open(file_path, "rb") as f:
-            while True:
-                chunk = f.read(chunk_size)
-                if not chunk:
-                    break
-                crc = zlib.crc32(chunk, crc)
+    member = members[0]
+    return f"{member.CRC:08X}", member.file_size
 
-        # Convert to unsigned 32-bit value and format as uppercase hex
-        crc = crc & 0xFFFFFFFF
-        return f"{crc:08X}"
 
-    else:
-        # Calculate MD5 or SHA1
-        hasher = hashlib.md5() if algorithm == "md5" else hashlib.sha1()
-        with open(file_path, "rb") as f:
-            while True:
-                chunk = f.read(chunk_size)
-                if not chunk:
-                    break
-                hasher.update(chunk)
+class HashingBackend:
+    """
+    Runs calculate_hashes() off the event loop on a dedicated executor.
+
+    The 'thread' backend uses its own thread pool so hashing does not compete
+    with other asyncio.to_thread() work; the 'process' backend sidesteps the
+    GIL for CPU-bound MD5/SHA1 on many-core machines. The executor is created
+    on first use and reused until shutdown().
+    """
+
+    def __init__(
+        self,
+        mode: str = "thread",
+        workers: int = 0,
+        read_mode: str = "readinto",
+        drop_page_cache: bool = False,
+    ):
+        """
+        Initialize hashing backend.
+
+        Args:
+            mode: Executor type ('thread' or 'process')
+            workers: Number of hashing workers (0 = based on CPU count)
+            read_mode: File read strategy passed to calculate_hashes()
+            drop_page_cache: Evict hashed data from the page cache as it is read
+
+        Raises:
+            ValueError: If mode or read_mode is not supported
+        """
+        if mode not in HASH_BACKENDS:
+            raise ValueError(f"Unsupported hashing backend: {mode}")
+        if read_mode not in READ_MODES:
+            raise ValueError(f"Unsupported read mode: {read_mode}")
+
+        cpu_count = os.cpu_count() or 1
+        if not workers:
+            # I/O waits leave room for extra threads; processes map to cores
+            workers = cpu_count if mode == "process" else min(32, cpu_count + 4)
+
+        self.mode = mode
+        self.workers = workers
+        self.read_mode = read_mode
+        self.drop_page_cache = drop_page_cache
+        self._executor: Optional[Executor] = None
+
+    def _get_executor(self) -> Executor:
+        """Create the executor on first use."""
+        if self._executor is None:
+            if self.mode == "process":
+                # spawn avoids forking a process that already runs threads
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="curateur-hash"
+                )
+        return self._executor
+
+    async def calculate_hashes(
+        self,
+        file_path: Path,
+        algorithms: Sequence[str] = SUPPORTED_ALGORITHMS,
+        size_limit: int = 1073741824,
+    ) -> Optional[Dict[str, str]]:
+        """
+        Calculate hashes for a file on the backend's executor.
+
+        Args:
+            file_path: Path to file to hash
+            algorithms: Hash algorithms to calculate
+            size_limit: Maximum file size to hash. Set 0 for no limit.
+
+        Returns:
+            Dict of algorithm -> uppercase hex hash string, or None if file
+            exceeds limit
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(),
+            functools.partial(
+                calculate_hashes,
+                file_path,
+                algorithms=tuple(algorithms),
+                size_limit=size_limit,
+                read_mode=self.read_mode,
+                drop_page_cache=self.drop_page_cache,
+            ),
+        )
+
+    async def calculate_fingerprint(self, file_path: Path) -> str:
+        """
+        Calculate a sampled change-detection fingerprint on the executor.
+
+        Args:
+            file_path: Path to file to fingerprint
+
+        Returns:
+            Fingerprint string (see calculate_fingerprint())
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(), calculate_fingerprint, file_path
+        )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shut down the executor (a new one is created if used again).
 
-        return hasher.hexdigest().upper()
+        Args:
+            wait: Wait for running hash jobs to finish
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
 
 
 def format_file_size(size_bytes: int) -> str:
@@ -0,0 +1,248 @@
+"""
+Persistent ROM hash index.
+
+Remembers the hashes of every ROM file keyed by its filesystem identity
+(path, size, mtime and inode) so unchanged files can be identified on
+later runs from a single stat() call instead of re-reading their contents.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Set
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 2
+
+
+class HashIndex:
+    """
+    Disk-based index of ROM hashes keyed by file identity.
+
+    Features:
+    - Per-system index stored alongside the metadata cache
+    - Entries are only trusted while size, mtime and inode are unchanged
+    - Entries missing any of the configured digests count as misses
+    - Entries for files not seen during the session are pruned on save
+
+    Storage format:
+    {
+        "version": 2,
+        "entries": {
+            "/roms/nes/Game.nes": {
+                "size": 40976,
+                "mtime_ns": 1700000000000000000,
+                "inode": 1234567,
+                "hashes": {"crc32": "ABCD1234", "md5": "...", "sha1": "..."}
+            }
+        }
+    }
+    """
+
+    def __init__(
+        self,
+        index_directory: Path,
+        algorithm: str = "crc32",
+        enabled: bool = True,
+        digests: Sequence[str] = (),
+    ):
+        """
+        Initialize hash index.
+
+        Args:
+            index_directory: Directory holding the index file (e.g. gamelist .cache/)
+            algorithm: Primary hash algorithm used to identify ROMs
+            enabled: Whether the index is consulted and updated
+            digests: Additional digests an entry must carry to be reused
+        """
+        self.index_directory = index_directory
+        self.index_file = index_directory / "hash_index.json"
+        self.algorithm = algorithm
+        self.algorithms = tuple(dict.fromkeys((algorithm, *digests)))
+        self.enabled = enabled
+
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._loaded = False
+        self._dirty = False
+        self._seen: Set[str] = set()
+
+        # Metrics tracking
+        self._hits: int = 0
+        self._misses: int = 0
+
+    def _load(self) -> None:
+        """Load index from disk into memory."""
+        if self._loaded:
+            return
+
+        self._loaded = True
+
+        if not self.enabled or not self.index_file.exists():
+            return
+
+        try:
+            with open(self.index_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Failed to load hash index: {e}, starting with empty index")
+            return
+
+        if data.get("version") != INDEX_VERSION:
+            logger.info(
+                f"Hash index format changed, rebuilding (stored={data.get('version')})"
+            )
+            self._dirty = True
+            return
+
+        self._entries = data.get("entries", {})
+        logger.debug(
+            f"Loaded hash index: {len(self._entries)} entries from {self.index_file}"
+        )
+
+    @staticmethod
+    def _identity(stat_result: os.stat_result) -> Dict[str, int]:
+        """Extract the identity fields compared on lookup."""
+        return {
+            "size": stat_result.st_size,
+            "mtime_ns": stat_result.st_mtime_ns,
+            "inode": stat_result.st_ino,
+        }
+
+    def lookup(
+        self, file_path: Path, stat_result: Optional[os.stat_result] = None
+    ) -> Optional[Dict[str, str]]:
+        """
+        Get the indexed hashes for a file if it is unchanged since it was hashed.
+
+        Args:
+            file_path: File whose contents would be hashed
+            stat_result: Pre-fetched stat() of file_path (avoids a second syscall)
+
+        Returns:
+            Dict of algorithm -> uppercase hex hash, or None if not indexed,
+            the file changed, or a configured digest is missing
+        """
+        if not self.enabled:
+            return None
+
+        self._load()
+
+        key = str(file_path)
+        self._seen.add(key)
+
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        if stat_result is None:
+            try:
+                stat_result = file_path.stat()
+            except OSError:
+                self._misses += 1
+                return None
+
+        identity = self._identity(stat_result)
+        if any(entry.get(field) != value for field, value in identity.items()):
+            logger.debug(f"Hash index stale for {file_path.name}, rehash required")
+            self._misses += 1
+            return None
+
+        hashes = entry.get("hashes", {})
+        if any(algorithm not in hashes for algorithm in self.algorithms):
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        return dict(hashes)
+
+    def record(
+        self,
+        file_path: Path,
+        hashes: Optional[Dict[str, str]],
+        stat_result: Optional[os.stat_result] = None,
+    ) -> None:
+        """
+        Store freshly calculated hashes for a file.
+
+        Args:
+            file_path: File that was hashed
+            hashes: Dict of algorithm -> hash (None or empty values are ignored)
+            stat_result: stat() of file_path taken before hashing (optional)
+        """
+        if not self.enabled or not hashes:
+            return
+
+        self._load()
+
+        if stat_result is None:
+            try:
+                stat_result = file_path.stat()
+            except OSError as e:
+                logger.debug(f"Cannot index {file_path}: {e}")
+                return
+
+        key = str(file_path)
+        entry = self._identity(stat_result)
+        entry["hashes"] = dict(hashes)
+
+        self._entries[key] = entry
+        self._seen.add(key)
+        self._dirty = True
+
+    def save(self, prune: bool = True) -> None:
+        """
+        Write index to disk if it changed.
+
+        Args:
+            prune: Drop entries for files not looked up or recorded this session
+        """
+        if not self.enabled or not self._loaded:
+            return
+
+        if prune:
+            stale = [key for key in self._entries if key not in self._seen]
+            for key in stale:
+                del self._entries[key]
+            if stale:
+                logger.debug(f"Pruned {len(stale)} stale hash index entries")
+                self._dirty = True
+
+        if not self._dirty:
+            return
+
+        try:
+            self.index_directory.mkdir(parents=True, exist_ok=True)
+
+            # Write to temporary file first
+            temp_file = self.index_file.with_suffix(".tmp")
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "version": INDEX_VERSION,
+                        "entries": self._entries,
+                    },
+                    f,
+                    separators=(",", ":"),
+                )
+
+            # Atomic rename
+            temp_file.replace(self.index_file)
+            self._dirty = False
+
+            logger.debug(f"Saved hash index: {len(self._entries)} entries")
+
+        except (IOError, OSError) as e:
+            logger.error(f"Failed to save hash index: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hash index statistics."""
+        return {
+            "enabled": self.enabled,
+            "index_file": str(self.index_file),
+            "total_entries": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+        }
@@ -0,0 +1,127 @@
+"""
+Device-aware I/O scheduling for ROM hashing.
+
+Groups files by the block device they live on (st_dev) so each device can be
+given its own read concurrency: spinning disks get one or two sequential
+readers to avoid seek thrashing, while SSDs and NVMe drives get many.
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+UNKNOWN_DEVICE = -1
+
+
+class DeviceIOScheduler:
+    """
+    Classifies files by block device and assigns per-device read limits.
+
+    Rotational detection reads /sys/dev/block/<major>:<minor>/queue/rotational
+    (or the parent disk's queue for partitions). Devices that cannot be
+    classified - network filesystems, non-Linux platforms - are treated as
+    non-rotational.
+    """
+
+    def __init__(
+        self,
+        rotational_limit: int = 1,
+        ssd_limit: int = 8,
+        sysfs_root: Path = Path("/sys"),
+    ):
+        """
+        Initialize I/O scheduler.
+
+        Args:
+            rotational_limit: Concurrent readers per spinning disk
+            ssd_limit: Concurrent readers per non-rotational (or unknown) device
+            sysfs_root: sysfs mount point (overridable for testing)
+        """
+        self.rotational_limit = max(1, rotational_limit)
+        self.ssd_limit = max(1, ssd_limit)
+        self.sysfs_root = sysfs_root
+
+        # st_dev -> (label, rotational) resolved once per device
+        self._devices: Dict[int, Tuple[str, bool]] = {}
+
+    def device_of(self, file_path: Path) -> int:
+        """
+        Get the device ID a file is stored on.
+
+        Args:
+            file_path: File to locate
+
+        Returns:
+            st_dev of the file, or UNKNOWN_DEVICE if it cannot be stat()ed
+        """
+        try:
+            return file_path.stat().st_dev
+        except OSError:
+            return UNKNOWN_DEVICE
+
+    def _sysfs_queue_dir(self, device: int) -> Optional[Path]:
+        """Find the sysfs queue directory for a device (or its parent disk)."""
+        block_dir = (
+            self.sysfs_root / "dev" / "block" / f"{os.major(device)}:{os.minor(device)}"
+        )
+        try:
+            block_dir = block_dir.resolve(strict=True)
+        except OSError:
+            return None
+
+        # Partitions have no queue/ of their own; it lives on the parent disk
+        for candidate in (block_dir, block_dir.parent):
+            if (candidate / "queue" / "rotational").is_file():
+                return candidate
+        return None
+
+    def _resolve(self, device: int) -> Tuple[str, bool]:
+        """Resolve and memoize (label, rotational) for a device."""
+        if device in self._devices:
+            return self._devices[device]
+
+        label = "unknown"
+        rotational = False
+
+        if device != UNKNOWN_DEVICE:
+            label = f"{os.major(device)}:{os.minor(device)}"
+            disk_dir = self._sysfs_queue_dir(device)
+            if disk_dir is not None:
+                label = disk_dir.name
+                try:
+                    flag = (disk_dir / "queue" / "rotational").read_text().strip()
+                    rotational = flag == "1"
+                except OSError as e:
+                    logger.debug(f"Cannot read rotational flag for {label}: {e}")
+
+        logger.debug(
+            f"I/O device {label}: {'rotational' if rotational else 'non-rotational'}"
+        )
+        self._devices[device] = (label, rotational)
+        return self._devices[device]
+
+    def is_rotational(self, device: int) -> bool:
+        """Check whether a device is a spinning disk."""
+        return self._resolve(device)[1]
+
+    def label_for(self, device: int) -> str:
+        """Get a human-readable name for a device (e.g. 'sda', 'nvme0n1')."""
+        return self._resolve(device)[0]
+
+    def limit_for(self, device: int) -> int:
+        """Get the number of concurrent readers allowed on a device."""
+        return self.rotational_limit if self.is_rotational(device) else self.ssd_limit
+
+    def describe_limits(self) -> Dict[str, int]:
+        """
+        Get per-device reader limits for every device seen so far.
+
+        Returns:
+            Dict of device label -> concurrent reader limit
+        """
+        return {
+            self.label_for(device): self.limit_for(device) for device in self._devices
+        }
@@ -1,14 +1,17 @@
 """Main ROM scanner implementation."""
 
 import logging
+import os
 from pathlib import Path
-from typing import List, Optional, Set, Tuple
+from typing import FrozenSet, List, Optional, Sequence, Set, Tuple, Union
 
 from curateur.config.es_systems import SystemDefinition
 from curateur.scanner.disc_handler import (
     DiscSubdirError,
     validate_disc_subdirectory,
 )
+from curateur.scanner.hash_calculator import read_zip_member_crc
+from curateur.scanner.hash_index import HashIndex
 from curateur.scanner.m3u_parser import M3UError, get_disc1_file, parse_m3u
 from curateur.scanner.rom_types import ROMInfo, ROMType
 
@@ -21,8 +24,57 @@ class ScannerError(Exception):
     pass
 
 
+class ExtensionMatcher:
+    """
+    Precompiled filename matcher for a system's ROM extensions.
+
+    Built once per scan from SystemDefinition.extensions. Dotted extensions
+    (including multi-part ones like ".p8.png") are matched by looking up each
+    dot-suffix of the name in a set, so the cost depends on the number of
+    dots in the filename rather than the number of extensions.
+    """
+
+    def __init__(self, extensions: Sequence[str]):
+        """
+        Initialize matcher.
+
+        Args:
+            extensions: Extensions from es_systems.xml (e.g. ['.nes', '.zip'])
+        """
+        normalized = {ext.lower() for ext in extensions if ext}
+        self._suffixes: FrozenSet[str] = frozenset(
+            ext for ext in normalized if ext.startswith(".")
+        )
+        # Extensions without a leading dot fall back to a plain suffix test
+        self._bare: Tuple[str, ...] = tuple(
+            ext for ext in normalized if not ext.startswith(".")
+        )
+
+    def matches(self, name_lower: str) -> bool:
+        """
+        Check whether a lowercased filename ends with one of the extensions.
+
+        Args:
+            name_lower: Filename already converted to lowercase
+
+        Returns:
+            True if the name carries a system extension
+        """
+        dot = name_lower.find(".")
+        while dot != -1:
+            if name_lower[dot:] in self._suffixes:
+                return True
+            dot = name_lower.find(".", dot + 1)
+
+        return bool(self._bare) and name_lower.endswith(self._bare)
+
+
 def scan_system(
-    system: SystemDefinition, rom_root: Path, crc_size_limit: int = 1073741824
+    system: SystemDefinition,
+    rom_root: Path,
+    crc_size_limit: int = 1073741824,
+    hash_index: Optional[HashIndex] = None,
+    zip_member_crc: bool = False,
 ) -> List[ROMInfo]:
     """
     Scan a system's ROM directory for all valid ROM files.
@@ -31,6 +83,11 @@ def scan_system(
         system: System definition from es_systems.xml
         rom_root: Root ROM directory (for %ROMPATH% substitution)
         crc_size_limit: Maximum file size for CRC calculation (default 1GB)
+        hash_index: Optional persistent hash index; unchanged files get their
+            hash_value populated from it without being read
+        zip_member_crc: Identify single-member .zip ROMs by the inner file's
+            CRC32 and size from the zip central directory instead of hashing
+            the archive (only when the hash index algorithm is crc32)
 
     Returns:
         List of ROMInfo objects for all discovered ROMs
@@ -40,18 +97,17 @@ def scan_system(
     """
     rom_path = system.resolve_rom_path(rom_root)
 
-    # Check if directory exists
-    if not rom_path.exists():
+    # Scan directory. os.scandir() returns each entry's type with the listing
+    # and caches its stat(), avoiding extra round trips on network mounts.
+    try:
+        with os.scandir(rom_path) as scanner:
+            entries = list(scanner)
+        logger.info(f"Found {len(entries)} entries in {rom_path}")
+    except FileNotFoundError:
         logger.info(f"ROM directory not found, skipping system: {rom_path}")
         return []
-
-    if not rom_path.is_dir():
+    except NotADirectoryError:
         raise ScannerError(f"ROM path is not a directory: {rom_path}")
-
-    # Scan directory
-    try:
-        entries = list(rom_path.iterdir())
-        logger.info(f"Found {len(entries)} entries in {rom_path}")
     except PermissionError:
         raise ScannerError(f"Permission denied accessing ROM directory: {rom_path}")
     except Exception as e:
@@ -62,6 +118,7 @@ def scan_system(
         return []
 
     # Process entries
+    matcher = ExtensionMatcher(system.extensions)
     roms = []
     m3u_files = set()
     disc_subdirs = set()
@@ -72,7 +129,9 @@ def scan_system(
             continue
 
         try:
-            rom_info = _process_entry(entry, system, crc_size_limit)
+            rom_info = _process_entry(
+                entry, system, crc_size_limit, hash_index, zip_member_crc, matcher
+            )
             if rom_info:
                 roms.append(rom_info)
 
@@ -110,15 +169,23 @@ def scan_system(
 
 
 def _process_entry(
-    entry: Path, system: SystemDefinition, crc_size_limit: int
+    entry: Union[os.DirEntry, Path],
+    system: SystemDefinition,
+    crc_size_limit: int,
+    hash_index: Optional[HashIndex] = None,
+    zip_member_crc: bool = False,
+    matcher: Optional[ExtensionMatcher] = None,
 ) -> Optional[ROMInfo]:
     """
     Process a single filesystem entry (file or directory).
 
     Args:
-        entry: Path to file or directory
+        entry: Directory entry from os.scandir() (or a Path) for a file or directory
         system: System definition
         crc_size_limit: CRC calculation size limit
+        hash_index: Optional persistent hash index for unchanged files
+        zip_member_crc: Use zip central directory CRC32 for single-member zips
+        matcher: Precompiled extension matcher (built from system if omitted)
 
     Returns:
         ROMInfo object or None if entry should be skipped
@@ -129,34 +196,64 @@ def _process_entry(
     """
     entry_lower = entry.name.lower()
 
-    # Check if entry matches system extensions
-    matches_extension = any(entry_lower.endswith(ext) for ext in system.extensions)
-
-    if not matches_extension:
+    # Check if entry matches system extensions (no filesystem access needed)
+    if matcher is None:
+        matcher = ExtensionMatcher(system.extensions)
+    if not matcher.matches(entry_lower):
         return None
 
-    # Determine ROM type and process accordingly
+    # Determine ROM type and process accordingly. DirEntry.is_dir() and
+    # DirEntry.stat() reuse data from the directory listing where possible.
+    entry_path = Path(entry)
     if entry.is_dir():
-        return _process_disc_subdirectory(entry, system, crc_size_limit)
+        return _process_disc_subdirectory(
+            entry_path, system, crc_size_limit, hash_index
+        )
     elif entry_lower.endswith(".m3u"):
-        return _process_m3u_file(entry, system, crc_size_limit)
+        return _process_m3u_file(entry_path, system, crc_size_limit, hash_index)
     else:
-        return _process_standard_rom(entry, system, crc_size_limit)
+        return _process_standard_rom(
+            entry_path,
+            system,
+            crc_size_limit,
+            hash_index,
+            zip_member_crc,
+            stat_result=entry.stat(),
+        )
+
+
+def _apply_indexed_hashes(
+    rom_info: ROMInfo,
+    hash_file: Path,
+    stat_result: os.stat_result,
+    hash_index: Optional[HashIndex],
+) -> ROMInfo:
+    """Populate hashes previously calculated for an unchanged file."""
+    rom_info.hash_stat = stat_result
+    if hash_index is not None:
+        hashes = hash_index.lookup(hash_file, stat_result)
+        if hashes:
+            rom_info.apply_hashes(hashes, primary=hash_index.algorithm)
+    return rom_info
 
 
 def _process_standard_rom(
-    rom_file: Path, system: SystemDefinition, crc_size_limit: int
+    rom_file: Path,
+    system: SystemDefinition,
+    crc_size_limit: int,
+    hash_index: Optional[HashIndex] = None,
+    zip_member_crc: bool = False,
+    stat_result: Optional[os.stat_result] = None,
 ) -> ROMInfo:
     """Process a standard ROM file."""
-    file_size = rom_file.stat().st_size
-
-    # Store crc_size_limit for later hashing in pipeline
-    # Hash calculation deferred to pipeline for parallel processing
+    if stat_result is None:
+        stat_result = rom_file.stat()
+    file_size = stat_result.st_size
 
     # Get basename (filename without extension)
     basename = rom_file.stem
 
-    return ROMInfo(
+    rom_info = ROMInfo(
         path=rom_file,
         filename=rom_file.name,
         basename=basename,
@@ -164,14 +261,31 @@ def _process_standard_rom(
         system=system.name,
         query_filename=rom_file.name,
         file_size=file_size,
-        hash_type="crc32",
-        hash_value=None,  # Will be calculated in pipeline
         crc_size_limit=crc_size_limit,
     )
 
+    # Single-member zips are identified by the inner ROM, whose CRC32 and
+    # size are stored in the central directory (no decompression needed).
+    # Only possible when CRC32 is the primary hash.
+    primary = hash_index.algorithm if hash_index else "crc32"
+    if zip_member_crc and primary == "crc32" and rom_file.suffix.lower() == ".zip":
+        member = read_zip_member_crc(rom_file)
+        if member:
+            crc, rom_info.file_size = member
+            rom_info.apply_hashes({"crc32": crc}, primary="crc32")
+            return rom_info
+
+    # Store crc_size_limit for later hashing in pipeline
+    # Hash calculation deferred to pipeline for parallel processing,
+    # unless the hash index already knows this exact file
+    return _apply_indexed_hashes(rom_info, rom_file, stat_result, hash_index)
+
 
 def _process_m3u_file(
-    m3u_file: Path, system: SystemDefinition, crc_size_limit: int
+    m3u_file: Path,
+    system: SystemDefinition,
+    crc_size_limit: int,
+    hash_index: Optional[HashIndex] = None,
 ) -> ROMInfo:
     """
     Process an M3U playlist file.
@@ -183,13 +297,14 @@ def _process_m3u_file(
     disc1_file = get_disc1_file(m3u_file)
 
     # Use disc 1 file for identification
-    file_size = disc1_file.stat().st_size
+    stat_result = disc1_file.stat()
+    file_size = stat_result.st_size
     # Hash calculation deferred to pipeline
 
     # Basename is M3U filename (not disc 1)
     basename = m3u_file.stem
 
-    return ROMInfo(
+    rom_info = ROMInfo(
         path=m3u_file,
         filename=m3u_file.name,
         basename=basename,
@@ -197,15 +312,17 @@ def _process_m3u_file(
         system=system.name,
         query_filename=disc1_file.name,
         file_size=file_size,
-        hash_type="crc32",
-        hash_value=None,  # Will be calculated in pipeline
         disc_files=disc_files,
         crc_size_limit=crc_size_limit,
     )
+    return _apply_indexed_hashes(rom_info, disc1_file, stat_result, hash_index)
 
 
 def _process_disc_subdirectory(
-    disc_subdir: Path, system: SystemDefinition, crc_size_limit: int
+    disc_subdir: Path,
+    system: SystemDefinition,
+    crc_size_limit: int,
+    hash_index: Optional[HashIndex] = None,
 ) -> ROMInfo:
     """
     Process a disc subdirectory.
@@ -216,13 +333,14 @@ def _process_disc_subdirectory(
     contained_file = validate_disc_subdirectory(disc_subdir, system.extensions)
 
     # Use contained file for identification
-    file_size = contained_file.stat().st_size
+    stat_result = contained_file.stat()
+    file_size = stat_result.st_size
     # Hash calculation deferred to pipeline
 
     # Basename is directory name (includes extension)
     basename = disc_subdir.name
 
-    return ROMInfo(
+    rom_info = ROMInfo(
         path=disc_subdir,
         filename=disc_subdir.name,
         basename=basename,
@@ -230,11 +348,10 @@ def _process_disc_subdirectory(
         system=system.name,
         query_filename=contained_file.name,
         file_size=file_size,
-        hash_type="crc32",
-        hash_value=None,  # Will be calculated in pipeline
         contained_file=contained_file,
         crc_size_limit=crc_size_limit,
     )
+    return _apply_indexed_hashes(rom_info, contained_file, stat_result, hash_index)
 
 
 def _detect_conflicts(
@@ -1,9 +1,10 @@
 """ROM type definitions and data structures."""
 
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 
 class ROMType(Enum):
@@ -35,15 +36,40 @@ class ROMInfo:
     hash_type: str = "crc32"  # Hash algorithm used (default: crc32)
     hash_value: Optional[str] = None  # Hash value (uppercase hex, or None if skipped)
 
+    # Individual digests from the single-pass hash (uppercase hex, None if skipped)
+    crc32: Optional[str] = None
+    md5: Optional[str] = None
+    sha1: Optional[str] = None
+
+    # Sampled fingerprint for files too large to hash (change detection only)
+    fingerprint: Optional[str] = None
+
     # Hash calculation configuration
     crc_size_limit: int = 1073741824  # Max file size for CRC calculation (1GB default)
 
+    # stat() of the file to hash, taken by the scan (before any hashing)
+    hash_stat: Optional[os.stat_result] = field(default=None, repr=False, compare=False)
+
     # M3U-specific data
     disc_files: Optional[List[Path]] = None  # List of disc files in M3U
 
     # Disc subdirectory-specific data
     contained_file: Optional[Path] = None  # File inside disc subdir
 
+    def apply_hashes(self, hashes: Dict[str, str], primary: str = "crc32") -> None:
+        """
+        Populate digest fields from a calculate_hashes() result.
+
+        Args:
+            hashes: Dict of algorithm -> uppercase hex hash
+            primary: Algorithm whose value becomes hash_value
+        """
+        self.crc32 = hashes.get("crc32")
+        self.md5 = hashes.get("md5")
+        self.sha1 = hashes.get("sha1")
+        self.hash_type = primary
+        self.hash_value = hashes.get(primary)
+
     def get_media_basename(self) -> str:
         """
         Get the basename to use for media files.
@@ -0,0 +1,240 @@
+"""
+Linux inotify watcher for ROM directories.
+
+Used by --watch mode to notice ROMs as they are copied into a system's ROM
+directory. Events are debounced per burst so a multi-file copy results in a
+single rescrape of each affected system.
+"""
+
+import asyncio
+import ctypes
+import ctypes.util
+import logging
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from curateur.config.es_systems import SystemDefinition
+
+logger = logging.getLogger(__name__)
+
+# inotify event masks (from <sys/inotify.h>)
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+# Events that mark a ROM as complete, added or removed. IN_MODIFY is left
+# out: every write() of a copy raises it, IN_CLOSE_WRITE marks the end.
+# IN_CREATE is not among them - a created file is still being written, and a
+# slow copy raises nothing more until it is closed.
+CHANGE_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE
+
+# IN_CREATE is watched only to follow new subdirectories
+WATCH_MASK = CHANGE_MASK | IN_CREATE
+
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+_READ_SIZE = 64 * 1024
+
+
+class WatchError(Exception):
+    """Directory watching errors."""
+
+    pass
+
+
+class InotifyWatcher:
+    """
+    Watches system ROM directories and reports which systems changed.
+
+    Each system's ROM directory and its immediate subdirectories (disc
+    subdirectories) are watched; subdirectories created later are picked up
+    as they appear. Hidden entries (e.g. rsync/partial download temp files)
+    are ignored.
+    """
+
+    def __init__(self, debounce_seconds: float = 5.0):
+        """
+        Initialize watcher.
+
+        Args:
+            debounce_seconds: Quiet period after the last event before a burst
+                of changes is reported
+
+        Raises:
+            WatchError: If inotify is unavailable on this platform
+        """
+        if not sys.platform.startswith("linux"):
+            raise WatchError("Watch mode requires Linux inotify")
+
+        libc_name = ctypes.util.find_library("c")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise WatchError(f"inotify_init1 failed: {os.strerror(errno)}")
+
+        self.debounce_seconds = debounce_seconds
+
+        # Watch descriptor -> (system name, watched directory)
+        self._watches: Dict[int, Tuple[str, Path]] = {}
+        self._systems: Dict[str, SystemDefinition] = {}
+
+        self._pending: Set[str] = set()
+        self._activity = asyncio.Event()
+        self._rescan_all = False
+
+    def _add_watch(self, system_name: str, directory: Path) -> None:
+        """Watch one directory on behalf of a system."""
+        wd = self._libc.inotify_add_watch(
+            self._fd, os.fsencode(str(directory)), WATCH_MASK
+        )
+        if wd < 0:
+            errno = ctypes.get_errno()
+            logger.warning(f"Cannot watch {directory}: {os.strerror(errno)}")
+            return
+        self._watches[wd] = (system_name, directory)
+
+    def watch_systems(self, systems: Iterable[SystemDefinition], rom_root: Path) -> int:
+        """
+        Start watching each system's ROM directory.
+
+        Args:
+            systems: Systems to watch
+            rom_root: Root ROM directory (for %ROMPATH% substitution)
+
+        Returns:
+            Number of systems whose ROM directory is being watched
+        """
+        watched = 0
+        for system in systems:
+            rom_path = system.resolve_rom_path(rom_root)
+            if not rom_path.is_dir():
+                logger.debug(f"Not watching {system.name}: {rom_path} not found")
+                continue
+
+            self._systems[system.name] = system
+            self._add_watch(system.name, rom_path)
+            with os.scandir(rom_path) as scanner:
+                for entry in scanner:
+                    if entry.is_dir() and not entry.name.startswith("."):
+                        self._add_watch(system.name, Path(entry.path))
+            watched += 1
+
+        logger.info(f"Watching {watched} system ROM directories for changes")
+        return watched
+
+    def _parse_events(self, data: bytes) -> List[Tuple[int, int, str]]:
+        """Split a read() buffer into (wd, mask, name) events."""
+        events = []
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = os.fsdecode(data[offset : offset + length].rstrip(b"\0"))
+            offset += length
+            events.append((wd, mask, name))
+        return events
+
+    def _on_readable(self) -> None:
+        """Drain pending inotify events (event loop reader callback)."""
+        changed = False
+        while True:
+            try:
+                data = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                break
+            if not data:
+                break
+
+            for wd, mask, name in self._parse_events(data):
+                if mask & IN_Q_OVERFLOW:
+                    # Kernel dropped events - we no longer know what changed
+                    logger.warning("inotify queue overflow, rescanning all systems")
+                    self._rescan_all = True
+                    changed = True
+                    continue
+
+                watch = self._watches.get(wd)
+                if watch is None:
+                    continue
+                system_name, directory = watch
+
+                if mask & IN_IGNORED:
+                    # Watched directory was removed
+                    del self._watches[wd]
+                    continue
+
+                if not name or name.startswith("."):
+                    continue
+
+                if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                    self._add_watch(system_name, directory / name)
+
+                if not mask & CHANGE_MASK:
+                    continue
+
+                logger.debug(f"Change detected in {system_name}: {name}")
+                self._pending.add(system_name)
+                changed = True
+
+        if changed:
+            self._activity.set()
+
+    async def changed_systems(
+        self, timeout: Optional[float] = None
+    ) -> List[SystemDefinition]:
+        """
+        Wait for the next burst of changes to settle.
+
+        Args:
+            timeout: Give up waiting for a first event after this many seconds
+                (None waits indefinitely)
+
+        Returns:
+            Systems with new, modified or removed ROMs, once no further events
+            have arrived for debounce_seconds (empty if the timeout expired)
+        """
+        loop = asyncio.get_running_loop()
+        loop.add_reader(self._fd, self._on_readable)
+        try:
+            try:
+                await asyncio.wait_for(self._activity.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                return []
+
+            # Debounce: keep extending while events keep arriving
+            while True:
+                self._activity.clear()
+                try:
+                    await asyncio.wait_for(
+                        self._activity.wait(), timeout=self.debounce_seconds
+                    )
+                except asyncio.TimeoutError:
+                    break
+        finally:
+            loop.remove_reader(self._fd)
+
+        if self._rescan_all:
+            names = set(self._systems)
+        else:
+            names = self._pending
+
+        self._pending = set()
+        self._rescan_all = False
+        self._activity.clear()
+        return [self._systems[name] for name in sorted(names) if name in self._systems]
+
+    def close(self) -> None:
+        """Stop watching and release the inotify descriptor."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+            self._watches.clear()
@@ -0,0 +1,372 @@
+"""Maintenance commands for metadata cache databases (curateur cache ...)."""
+
+import argparse
+import gzip
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from curateur.api.cache import MetadataCache
+from curateur.config.loader import ConfigError, load_config
+from curateur.config.validator import ValidationError, validate_config
+
+# Cache bundle: gzip-compressed JSON lines. The first line is a header
+# {"format": BUNDLE_FORMAT, "version": BUNDLE_VERSION, ...}; every following
+# line is one entry from MetadataCache.export_entries() plus its "cache"
+# label (system short name, or "global").
+BUNDLE_FORMAT = "curateur-cache-bundle"
+BUNDLE_VERSION = 1
+GLOBAL_LABEL = "global"
+
+# Entries merged per transaction while importing
+_IMPORT_BATCH = 5000
+
+
+class BundleError(Exception):
+    """Unreadable or unsupported cache bundle."""
+
+    pass
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """Create and configure argument parser for cache maintenance."""
+    parser = argparse.ArgumentParser(
+        prog="curateur cache",
+        description="Verify, compact, export or import metadata cache databases",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Check every system's cache, dropping damaged entries
+  curateur cache verify
+
+  # Remove expired entries and reclaim disk space for some systems
+  curateur cache compact --systems nes snes
+
+  # Copy every cache to another machine
+  curateur cache export caches.jsonl.gz
+  curateur cache import caches.jsonl.gz
+        """,
+    )
+
+    parser.add_argument(
+        "command",
+        choices=["verify", "compact", "export", "import"],
+        help="verify: check checksums and salvage damaged databases; "
+        "compact: drop expired entries and reclaim free space; "
+        "export/import: write caches to a bundle, or merge one in by ROM hash",
+    )
+
+    parser.add_argument(
+        "bundle",
+        nargs="?",
+        type=Path,
+        help="Bundle file for export/import",
+    )
+
+    parser.add_argument(
+        "--config",
+        type=Path,
+        metavar="PATH",
+        help="Path to config.yaml (default: ./config.yaml)",
+    )
+
+    parser.add_argument(
+        "--systems",
+        nargs="+",
+        metavar="SYSTEM",
+        help="System short names to process (default: every system with a "
+        "cache, plus the global cache)",
+    )
+
+    return parser
+
+
+def find_caches(config: dict, systems: Optional[List[str]]) -> List[Tuple[str, Path]]:
+    """
+    Locate metadata cache directories.
+
+    Args:
+        config: Loaded configuration
+        systems: System short names to limit to (None = all)
+
+    Returns:
+        List of (label, cache directory) for caches that exist on disk
+    """
+    gamelist_root = Path(config["paths"]["gamelists"]).expanduser()
+    caches = []
+
+    if systems:
+        candidates = [gamelist_root / name for name in systems]
+    elif gamelist_root.is_dir():
+        candidates = sorted(d for d in gamelist_root.iterdir() if d.is_dir())
+    else:
+        candidates = []
+
+    for system_dir in candidates:
+        cache_dir = system_dir / ".cache"
+        if (cache_dir / "metadata_cache.db").exists():
+            caches.append((system_dir.name, cache_dir))
+
+    global_dir = config.get("runtime", {}).get("global_cache_dir")
+    if global_dir and not systems:
+        cache_dir = Path(global_dir).expanduser()
+        if (cache_dir / "metadata_cache.db").exists():
+            caches.append((GLOBAL_LABEL, cache_dir))
+
+    return caches
+
+
+def cache_dir_for(config: dict, label: str) -> Optional[Path]:
+    """
+    Get the cache directory an exported cache is imported into.
+
+    Args:
+        config: Loaded configuration
+        label: System short name, or "global"
+
+    Returns:
+        Cache directory (may not exist yet), or None for the global cache
+        when runtime.global_cache_dir is not set
+    """
+    if label == GLOBAL_LABEL:
+        global_dir = config.get("runtime", {}).get("global_cache_dir")
+        return Path(global_dir).expanduser() if global_dir else None
+    return Path(config["paths"]["gamelists"]).expanduser() / label / ".cache"
+
+
+def write_bundle(path: Path, caches: List[Tuple[str, MetadataCache]]) -> Dict[str, int]:
+    """
+    Write caches to a bundle file.
+
+    Args:
+        path: Bundle file to create
+        caches: (label, cache) pairs to export
+
+    Returns:
+        Dict of label -> entries written
+    """
+    counts = {}
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        header = {
+            "format": BUNDLE_FORMAT,
+            "version": BUNDLE_VERSION,
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "caches": [label for label, _ in caches],
+        }
+        f.write(json.dumps(header) + "\n")
+        for label, cache in caches:
+            counts[label] = 0
+            for entry in cache.export_entries():
+                entry["cache"] = label
+                f.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")))
+                f.write("\n")
+                counts[label] += 1
+    return counts
+
+
+def read_bundle(path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Stream entries from a bundle file.
+
+    Args:
+        path: Bundle file written by write_bundle()
+
+    Yields:
+        Entry dicts, each with its "cache" label
+
+    Raises:
+        BundleError: If the file is not a bundle or has a newer version
+    """
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            try:
+                header = json.loads(f.readline())
+            except ValueError:
+                header = None
+            if not isinstance(header, dict) or header.get("format") != BUNDLE_FORMAT:
+                raise BundleError(f"{path} is not a curateur cache bundle")
+            if header.get("version", 0) > BUNDLE_VERSION:
+                raise BundleError(
+                    f"{path} has bundle version {header['version']}, this curateur "
+                    f"reads up to version {BUNDLE_VERSION}"
+                )
+            for line_number, line in enumerate(f, start=2):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError as e:
+                    raise BundleError(f"{path} line {line_number}: {e}") from e
+    except (OSError, EOFError) as e:
+        raise BundleError(f"Cannot read {path}: {e}") from e
+
+
+def _open_cache(cache_dir: Path, runtime_config: dict) -> MetadataCache:
+    """Open a cache directory with the configured TTL windows."""
+    return MetadataCache(
+        gamelist_directory=cache_dir.parent,
+        cache_dir=cache_dir,
+        negative_max_ttl_days=runtime_config.get("negative_cache_max_ttl_days", 30),
+        stale_days=runtime_config.get("stale_while_revalidate_days", 0),
+    )
+
+
+def export_caches(
+    config: dict, systems: Optional[List[str]], bundle: Path
+) -> Dict[str, int]:
+    """
+    Export the caches found by find_caches() to a bundle.
+
+    No bundle is left behind when there is nothing to export.
+
+    Returns:
+        Dict of label -> entries exported
+    """
+    runtime_config = config.get("runtime", {})
+    caches = [
+        (label, _open_cache(cache_dir, runtime_config))
+        for label, cache_dir in find_caches(config, systems)
+    ]
+    if not caches:
+        return {}
+    try:
+        counts = write_bundle(bundle, caches)
+    finally:
+        for _, cache in caches:
+            cache.close()
+    if not sum(counts.values()):
+        bundle.unlink(missing_ok=True)
+    return counts
+
+
+def import_caches(
+    config: dict, systems: Optional[List[str]], bundle: Path
+) -> Dict[str, Tuple[int, int]]:
+    """
+    Merge a bundle into this install's caches, creating them as needed.
+
+    Entries are grouped per cache as they stream from the bundle, so only
+    one cache is open at a time when the bundle was written by export.
+
+    Returns:
+        Dict of label -> (entries imported, entries skipped)
+
+    Raises:
+        BundleError: If the bundle cannot be read
+    """
+    runtime_config = config.get("runtime", {})
+    results: Dict[str, Tuple[int, int]] = {}
+
+    def merge(label: str, entries: List[Dict[str, Any]]) -> None:
+        cache_dir = cache_dir_for(config, label)
+        if cache_dir is None or (systems and label not in systems):
+            imported, skipped = 0, len(entries)
+        else:
+            cache = _open_cache(cache_dir, runtime_config)
+            try:
+                imported, skipped = cache.import_entries(entries)
+            finally:
+                cache.close()
+        total_imported, total_skipped = results.get(label, (0, 0))
+        results[label] = (total_imported + imported, total_skipped + skipped)
+
+    label = None
+    batch: List[Dict[str, Any]] = []
+    for entry in read_bundle(bundle):
+        entry_label = entry.pop("cache", None)
+        if not entry_label:
+            raise BundleError(f"{bundle} has an entry without a cache label")
+        if entry_label != label or len(batch) >= _IMPORT_BATCH:
+            if batch:
+                merge(label, batch)
+            label, batch = entry_label, []
+        batch.append(entry)
+    if batch:
+        merge(label, batch)
+
+    return results
+
+
+def main(argv: Optional[list] = None) -> int:
+    """
+    Entry point for `curateur cache`.
+
+    Args:
+        argv: Arguments after "cache" (default: sys.argv)
+
+    Returns:
+        Exit code: 0 on success, 1 on configuration errors, unreadable
+        bundles, an export with nothing to export, or if verify had to drop
+        entries
+    """
+    parser = create_parser()
+    args = parser.parse_args(argv)
+    if args.command in ("export", "import") and args.bundle is None:
+        parser.error(f"{args.command} requires a bundle file")
+
+    try:
+        config = load_config(args.config)
+        validate_config(config)
+    except (ConfigError, ValidationError) as e:
+        print(f"Configuration error: {e}", file=sys.stderr)
+        return 1
+
+    runtime_config = config.get("runtime", {})
+
+    if args.command in ("export", "import"):
+        return _run_bundle_command(args, config)
+
+    caches = find_caches(config, args.systems)
+    if not caches:
+        print("No metadata caches found")
+        return 0
+
+    total_dropped = 0
+    for label, cache_dir in caches:
+        cache = _open_cache(cache_dir, runtime_config)
+        try:
+            if args.command == "verify":
+                report = cache.verify()
+                total_dropped += report["dropped"]
+                status = "rebuilt" if report["rebuilt"] else "ok"
+                print(
+                    f"{label}: {status}, {report['recovered']} entries recovered, "
+                    f"{report['dropped']} dropped"
+                )
+            else:
+                report = cache.compact()
+                print(
+                    f"{label}: {report['expired_removed']} expired entries removed, "
+                    f"{report['bytes_before']} -> {report['bytes_after']} bytes"
+                )
+        finally:
+            cache.close()
+
+    return 1 if total_dropped else 0
+
+
+def _run_bundle_command(args: argparse.Namespace, config: dict) -> int:
+    """Run export or import and print a line per cache."""
+    if args.command == "export":
+        counts = export_caches(config, args.systems, args.bundle)
+        if not sum(counts.values()):
+            print(
+                "Nothing to export: no metadata cache entries found",
+                file=sys.stderr,
+            )
+            return 1
+        for label, count in counts.items():
+            print(f"{label}: {count} entries exported")
+        print(f"Wrote {sum(counts.values())} entries to {args.bundle}")
+        return 0
+
+    try:
+        results = import_caches(config, args.systems, args.bundle)
+    except BundleError as e:
+        print(f"Import failed: {e}", file=sys.stderr)
+        return 1
+    for label, (imported, skipped) in results.items():
+        print(f"{label}: {imported} entries imported, {skipped} skipped")
+    return 0
@@ -5,7 +5,7 @@ Events are immutable dataclasses that carry state updates from the workflow
 orchestrator to the Textual UI.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Literal, Optional
 
@@ -58,19 +58,21 @@ class ROMProgressEvent:
 
 @dataclass(frozen=True)
 class HashingProgressEvent:
-    """Emitted during batch ROM hashing.
+    """Emitted during ROM hashing.
 
     Attributes:
         completed: Number of ROMs hashed so far
         total: Total number of ROMs to hash
         in_progress: Whether hashing is currently active
         skipped: Number of ROMs skipped (e.g., too large)
+        device_limits: Concurrent readers per storage device (e.g. {'sda': 1})
     """
 
     completed: int
     total: int
     in_progress: bool
     skipped: int = 0
+    device_limits: dict[str, int] = field(default_factory=dict)
 
 
 @dataclass(frozen=True)
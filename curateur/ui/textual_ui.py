@@ -129,6 +129,7 @@ class CurrentSystemOperations(Container):
     hash_total = reactive(0)
     hash_skipped = reactive(0)
     hash_in_progress = reactive(False)
+    hash_devices = reactive("")
     metadata_in_flight = reactive(0)
     metadata_total = reactive(0)
     search_in_flight = reactive(0)
@@ -313,6 +314,9 @@ class CurrentSystemOperations(Container):
         if self.hash_skipped > 0:
             hash_content.append(f" ⊝ {self.hash_skipped}", style="dim yellow")
 
+        if self.hash_devices:
+            hash_content.append(f"\n{self.hash_devices}", style="dim")
+
         self.query_one("#hashing-content", Static).update(hash_content)
 
     def update_cache(self) -> None:
@@ -2104,6 +2108,7 @@ class CurateurUI(App):
             current_system.hash_total = event.total_roms
             current_system.hash_completed = 0
             current_system.hash_skipped = 0
+            current_system.hash_devices = ""
             current_system.hash_in_progress = False
 
             # Reset API stats
@@ -2334,6 +2339,11 @@ class CurateurUI(App):
             current_system.hash_total = event.total
             current_system.hash_skipped = event.skipped
             current_system.hash_in_progress = event.in_progress
+            if event.device_limits:
+                current_system.hash_devices = " ".join(
+                    f"{device}×{limit}"
+                    for device, limit in sorted(event.device_limits.items())
+                )
         except Exception as e:
             logger.debug(f"Failed to update current system: {e}")
 
@@ -282,14 +282,15 @@ class WorkflowEvaluator:
         Check if calculated hash matches stored hash in cache.
 
         Args:
-            calculated_hash: Hash calculated from ROM file
+            calculated_hash: Hash calculated from ROM file, or its sampled
+                fingerprint when the file exceeds the hash size limit
             gamelist_entry: Gamelist entry (for reference, not used for hash)
 
         Returns:
             True if ROM hash exists in cache (indicating ROM is unchanged), False otherwise
         """
         if calculated_hash is None:
-            # No hash calculated (file too large or error)
+            # No hash or fingerprint calculated (error or fingerprinting disabled)
             return False
 
         if not self.cache:
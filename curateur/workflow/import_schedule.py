@@ -0,0 +1,232 @@
+"""
+Multi-day import schedule
+
+A first import of a large collection needs several days of API quota. In
+schedule mode each run spends the day's share of the quota (see
+QuotaPlanner), records which systems still have ROMs outstanding and stops
+starting new systems once the share is spent. The next run - typically from
+cron - continues with the unfinished systems as soon as the quota has reset,
+and every run reports when the import is projected to finish.
+"""
+
+import json
+import logging
+import math
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+SCHEDULE_VERSION = 1
+
+
+class ImportSchedule:
+    """
+    Persisted plan of outstanding ROMs per system.
+
+    Storage format:
+    {
+        "version": 1,
+        "updated": "2026-10-16",
+        "daily_budget": 18000,
+        "systems": {
+            "nes": {"total": 2400, "outstanding": 0, "updated": "2026-10-15"},
+            "snes": {"total": 3100, "outstanding": 1250, "updated": "2026-10-16"},
+            "psx": {"total": 5200, "outstanding": 5200, "updated": "2026-10-16",
+                    "estimated": true}
+        }
+    }
+
+    Outstanding counts are exact for systems that were scraped (the ROMs the
+    quota planner deferred) and an upper bound for systems not reached yet
+    (their ROM count before the metadata cache is consulted, flagged as
+    estimated).
+    """
+
+    def __init__(self, schedule_file: Path):
+        """
+        Initialize import schedule.
+
+        Args:
+            schedule_file: JSON file holding the plan
+        """
+        self.schedule_file = schedule_file
+        self.systems: Dict[str, Dict[str, Any]] = {}
+        self.daily_budget: Optional[int] = None
+        self.updated: Optional[str] = None
+
+    @classmethod
+    def load(cls, schedule_file: Path) -> "ImportSchedule":
+        """
+        Load the plan, starting a new one if it is missing or unreadable.
+
+        Args:
+            schedule_file: JSON file holding the plan
+
+        Returns:
+            ImportSchedule instance
+        """
+        schedule = cls(schedule_file)
+        if not schedule_file.exists():
+            return schedule
+
+        try:
+            with open(schedule_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Failed to load import schedule, starting anew: {e}")
+            return schedule
+
+        if data.get("version") != SCHEDULE_VERSION:
+            return schedule
+
+        schedule.systems = dict(data.get("systems", {}))
+        schedule.daily_budget = data.get("daily_budget")
+        schedule.updated = data.get("updated")
+        return schedule
+
+    def save(self, today: Optional[date] = None) -> None:
+        """
+        Write the plan.
+
+        Args:
+            today: Date recorded as the last update (default: today)
+        """
+        self.updated = (today or date.today()).isoformat()
+        try:
+            self.schedule_file.parent.mkdir(parents=True, exist_ok=True)
+
+            # Write to temporary file first
+            temp_file = self.schedule_file.with_suffix(".tmp")
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "version": SCHEDULE_VERSION,
+                        "updated": self.updated,
+                        "daily_budget": self.daily_budget,
+                        "systems": self.systems,
+                    },
+                    f,
+                    indent=2,
+                )
+
+            # Atomic rename
+            temp_file.replace(self.schedule_file)
+            logger.debug(f"Saved import schedule: {self.schedule_file}")
+
+        except (IOError, OSError) as e:
+            logger.error(f"Failed to save import schedule: {e}")
+
+    def order_systems(self, systems: List[Any]) -> List[Any]:
+        """
+        Put systems left unfinished by earlier runs first.
+
+        Unfinished systems keep the order they were planned in, systems the
+        plan does not know come next and finished systems (rescanned cheaply,
+        to pick up new ROMs) last.
+
+        Args:
+            systems: Objects with a `name` attribute (SystemDefinition)
+
+        Returns:
+            Reordered list
+        """
+        position = {name: i for i, name in enumerate(self.systems)}
+
+        def key(system: Any) -> Tuple[int, int]:
+            entry = self.systems.get(system.name)
+            if entry is None:
+                return (1, 0)
+            if entry.get("outstanding", 0) > 0:
+                return (0, position[system.name])
+            return (2, 0)
+
+        return sorted(systems, key=key)
+
+    def record_system(
+        self, system_name: str, total: int, outstanding: int, today: date
+    ) -> None:
+        """
+        Record a system that was scraped this run.
+
+        Args:
+            system_name: System short name
+            total: ROMs in the system
+            outstanding: ROMs deferred to a later run
+            today: Date of the run
+        """
+        self.systems[system_name] = {
+            "total": total,
+            "outstanding": outstanding,
+            "updated": today.isoformat(),
+        }
+
+    def record_pending(self, system_name: str, total: int, today: date) -> None:
+        """
+        Record a system that was not reached this run.
+
+        An outstanding count from an earlier run is kept, since it is more
+        precise than the ROM count.
+
+        Args:
+            system_name: System short name
+            total: ROMs in the system
+            today: Date of the run
+        """
+        entry = self.systems.get(system_name)
+        if entry is not None and entry.get("outstanding", 0) > 0:
+            entry["total"] = total
+            return
+        self.systems[system_name] = {
+            "total": total,
+            "outstanding": total,
+            "updated": today.isoformat(),
+            "estimated": True,
+        }
+
+    def outstanding(self) -> int:
+        """Total ROMs outstanding across all systems."""
+        return sum(entry.get("outstanding", 0) for entry in self.systems.values())
+
+    def projection(
+        self,
+        available_today: int = 0,
+        today: Optional[date] = None,
+        order: Optional[Sequence[str]] = None,
+    ) -> Optional[List[Tuple[str, int, date]]]:
+        """
+        Project when each unfinished system completes.
+
+        Systems are finished in the order the next run takes them, each
+        outstanding ROM costing one lookup: first from what is left of
+        today's budget, then from daily_budget per day.
+
+        Args:
+            available_today: Lookups still available today
+            today: Date of the run (default: today)
+            order: System names in the order runs scrape them (systems
+                missing from it follow in plan order; default: plan order)
+
+        Returns:
+            List of (system name, outstanding ROMs, completion date), or None
+            if the daily budget is unknown or zero
+        """
+        if not self.daily_budget or self.daily_budget <= 0:
+            return None
+
+        today = today or date.today()
+        available_today = max(0, available_today)
+        names = [name for name in order or [] if name in self.systems]
+        names += [name for name in self.systems if name not in names]
+        projected = []
+        cumulative = 0
+        for system_name in names:
+            outstanding = self.systems[system_name].get("outstanding", 0)
+            if outstanding <= 0:
+                continue
+            cumulative += outstanding
+            beyond_today = max(0, cumulative - available_today)
+            days = math.ceil(beyond_today / self.daily_budget)
+            projected.append((system_name, outstanding, today + timedelta(days=days)))
+        return projected
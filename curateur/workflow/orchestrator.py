@@ -14,7 +14,17 @@ import time
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 if TYPE_CHECKING:
     from ..api.throttle import ThrottleManager
@@ -22,9 +32,16 @@ if TYPE_CHECKING:
     from ..workflow.thread_pool import ThreadPoolManager
 
 from ..api.cache import MetadataCache
-from ..api.client import ScreenScraperClient
-from ..api.error_handler import SkippableAPIError
+from ..api.client import APIEndpoint, ScreenScraperClient
+from ..api.error_handler import (
+    ErrorCategory,
+    QuotaExceededError,
+    SkippableAPIError,
+    categorize_error,
+)
 from ..api.match_scorer import calculate_match_confidence
+from ..api.revalidator import CacheRevalidator
+from ..api.system_map import get_systemeid
 from ..config.es_systems import SystemDefinition
 from ..gamelist.backup import GamelistBackup
 from ..gamelist.game_entry import GameEntry
@@ -33,11 +50,24 @@ from ..gamelist.integrity_validator import IntegrityValidator
 from ..gamelist.metadata_merger import MetadataMerger
 from ..gamelist.parser import GamelistParser
 from ..media.media_downloader import MediaDownloader
-from ..scanner.hash_calculator import calculate_hash
+from ..media.media_store import MediaStore
+from ..scanner.dir_snapshot import (
+    DirectorySnapshot,
+    capture_directory,
+    settings_digest,
+)
+from ..scanner.hash_calculator import (
+    SUPPORTED_ALGORITHMS,
+    HashingBackend,
+    calculate_hash,
+)
+from ..scanner.hash_index import HashIndex
+from ..scanner.io_scheduler import DeviceIOScheduler
 from ..scanner.rom_scanner import scan_system
 from ..scanner.rom_types import ROMInfo
 from ..ui.prompts import prompt_for_search_match
 from ..workflow.evaluator import WorkflowEvaluator
+from ..workflow.quota_planner import DEFERRED_REASON, QuotaPlanner
 from ..workflow.work_queue import Priority, WorkQueueManager
 
 logger = logging.getLogger(__name__)
@@ -57,6 +87,7 @@ class ScrapingResult:
     game_entry: Optional["GameEntry"] = None  # Pre-merged entry from MetadataMerger
     skipped: bool = False
     skip_reason: Optional[str] = None
+    unmatched: bool = False  # API answered that it has no such game
 
 
 @dataclass
@@ -72,6 +103,7 @@ class SystemResult:
     work_queue_stats: Optional[dict] = None
     failed_items: Optional[list] = None
     not_found_items: Optional[list] = None
+    deferred: int = 0  # ROMs left for the next run (daily quota used up)
 
 
 class WorkflowOrchestrator:
@@ -105,6 +137,8 @@ class WorkflowOrchestrator:
         clear_cache: bool = False,
         event_bus: Optional[Any] = None,
         textual_ui: Optional[Any] = None,
+        retain_caches: bool = False,
+        quota_planner: Optional[QuotaPlanner] = None,
     ):
         """
         Initialize workflow orchestrator.
@@ -128,6 +162,10 @@ class WorkflowOrchestrator:
             clear_cache: Whether to clear metadata cache before scraping
             event_bus: Optional EventBus for UI event emissions
             textual_ui: Optional Textual UI instance for flag polling
+            retain_caches: Keep each system's metadata cache in memory between
+                scrape_system() calls (watch mode) instead of reloading it
+            quota_planner: Optional QuotaPlanner that orders ROMs by value
+                and defers them once the daily API quota is spent
         """
         self.api_client = api_client
         self.rom_directory = rom_directory
@@ -142,6 +180,10 @@ class WorkflowOrchestrator:
         self.interactive_search = interactive_search
         self.preferred_regions = preferred_regions or ["us", "wor", "eu"]
         self.clear_cache = clear_cache
+        self.retain_caches = retain_caches
+        self._system_caches: Dict[str, MetadataCache] = {}
+        self._shared_cache: Optional[MetadataCache] = None
+        self._media_store: Optional[MediaStore] = None
 
         # Phase D components (optional)
         self.thread_manager = thread_manager
@@ -149,6 +191,7 @@ class WorkflowOrchestrator:
         self.throttle_manager = throttle_manager
         self.event_bus = event_bus
         self.textual_ui = textual_ui
+        self.quota_planner = quota_planner
 
         # Search response handling for interactive search
         self.search_response_queues: Dict[
@@ -188,6 +231,23 @@ class WorkflowOrchestrator:
         # Track unmatched ROMs per system
         self.unmatched_roms: Dict[str, List[str]] = {}
 
+        # Persistent ROM hash index for the system being scraped
+        self.hash_index: Optional[HashIndex] = None
+
+        # Dedicated executor for ROM hashing (created lazily on first hash)
+        runtime_config = self.config.get("runtime", {})
+        self.hash_backend = HashingBackend(
+            mode=runtime_config.get("hash_backend", "thread"),
+            workers=runtime_config.get("hash_workers", 0),
+            read_mode=runtime_config.get("hash_read_mode", "readinto"),
+            drop_page_cache=runtime_config.get("hash_drop_page_cache", False),
+        )
+        self.io_scheduler = DeviceIOScheduler(
+            rotational_limit=runtime_config.get("hash_hdd_readers", 1),
+            ssd_limit=runtime_config.get("hash_ssd_readers", 0)
+            or self.hash_backend.workers,
+        )
+
         # Session statistics for aggregate tracking (never decrement, only increment)
         self.session_stats = {
             "api_successful": 0,
@@ -273,9 +333,60 @@ class WorkflowOrchestrator:
         logger.info(f"Path: {system.path}")
 
         gamelist_dir = self.paths["gamelists"] / system.name
+        gamelist_path = gamelist_dir / "gamelist.xml"
+        runtime_config = self.config.get("runtime", {})
+        cache_ttl_days = self._cache_ttl_days(system)
+
+        # Incremental scan: skip systems untouched since their last complete run
+        enable_cache = runtime_config.get("enable_cache", True)
+        snapshot = DirectorySnapshot(
+            gamelist_dir / ".cache",
+            enabled=runtime_config.get("incremental_scan", True) and enable_cache,
+        )
+        snapshot_settings = settings_digest(
+            {
+                "scraping": self.config.get("scraping", {}),
+                "media": self.config.get("media", {}),
+                "media_types": media_types,
+                "preferred_regions": preferred_regions,
+                "digests": self._rom_digest_algorithms(),
+            }
+        )
+        rom_state = None
+        if snapshot.enabled:
+            rom_state = capture_directory(system.resolve_rom_path(self.rom_directory))
+            unchanged_count = None
+            if not self.clear_cache and self.evaluator.scrape_mode != "force":
+                unchanged_count = snapshot.unchanged_rom_count(
+                    rom_state,
+                    gamelist_path,
+                    snapshot_settings,
+                    max_age_seconds=cache_ttl_days * 86400,
+                )
+            if unchanged_count is not None:
+                logger.info(
+                    f"No changes since last run, skipping {system.name} "
+                    f"({unchanged_count} ROMs)"
+                )
+                logger.info(f"=== End work for system: {system.name} ===")
+                return SystemResult(
+                    system_name=system.fullname,
+                    total_roms=unchanged_count,
+                    scraped=0,
+                    failed=0,
+                    skipped=unchanged_count,
+                    results=[],
+                )
+
+        if self.quota_planner:
+            # Watch mode outlives the day: pick up a quota that has reset
+            await self.quota_planner.check_reset(self.api_client.get_user_info)
+            self.quota_planner.start_system(system.name)
+
+        # Media failures don't fail their ROM, so count them for the snapshot
+        media_failed_before = self.session_stats["media_failed"]
 
         # Initialize metadata cache for this system
-        enable_cache = self.config.get("runtime", {}).get("enable_cache", True)
 
         # Log warning if cache is disabled
         if not enable_cache:
@@ -285,12 +396,38 @@ class WorkflowOrchestrator:
                 "Existing cache will be ignored but not deleted."
             )
 
-        cache = MetadataCache(
-            gamelist_directory=gamelist_dir, ttl_days=7, enabled=enable_cache
-        )
+        cache = self._system_caches.get(system.name)
+        first_visit = cache is None
+        if first_visit:
+            shared_cache = self._get_shared_cache()
+            shared_namespace = None
+            if shared_cache is not None:
+                try:
+                    shared_namespace = str(get_systemeid(system.name))
+                except KeyError:
+                    logger.debug(
+                        f"{system.name} has no systemeid, not using global cache"
+                    )
+            cache = MetadataCache(
+                gamelist_directory=gamelist_dir,
+                ttl_days=cache_ttl_days,
+                enabled=enable_cache,
+                flush_entries=runtime_config.get("cache_flush_entries", 200),
+                flush_interval=runtime_config.get("cache_flush_interval", 10.0),
+                shared=shared_cache,
+                shared_namespace=shared_namespace,
+                negative_ttl_days=runtime_config.get("negative_cache_ttl_days", 1),
+                negative_max_ttl_days=runtime_config.get(
+                    "negative_cache_max_ttl_days", 30
+                ),
+                stale_days=runtime_config.get("stale_while_revalidate_days", 0),
+                resident_entries=runtime_config.get("cache_resident_entries", 1024),
+            )
+            if self.retain_caches:
+                self._system_caches[system.name] = cache
 
-        # Handle cache operations
-        if self.clear_cache:
+        # Handle cache operations (--clear-cache applies once per session)
+        if self.clear_cache and first_visit:
             if enable_cache:
                 # Clear cache and start fresh
                 cleared_count = cache.clear()
@@ -310,8 +447,8 @@ class WorkflowOrchestrator:
                 if expired_count > 0:
                     logger.info(f"Cleaned up {expired_count} expired cache entries")
 
-        # Log cache stats
-        cache_stats = cache.get_stats()
+        # Log cache stats (counting flushes first, so off the event loop)
+        cache_stats = await asyncio.to_thread(cache.get_stats)
         if cache_stats["enabled"] and cache_stats["valid_entries"] > 0:
             logger.info(
                 f"Metadata cache: {cache_stats['valid_entries']} valid entries, "
@@ -326,15 +463,31 @@ class WorkflowOrchestrator:
         # Track cache existing count for this system
         self.session_stats["cache_existing"] = cache_stats.get("valid_entries", 0)
 
+        # Initialize persistent hash index for this system
+        self.hash_index = HashIndex(
+            index_directory=gamelist_dir / ".cache",
+            algorithm=runtime_config.get("hash_algorithm", "crc32"),
+            enabled=runtime_config.get("enable_hash_index", True),
+            digests=self._rom_digest_algorithms(),
+        )
+
         # Step 1: Scan ROMs
         logger.info("Scanning ROMs...")
-        crc_size_limit = self.config.get("runtime", {}).get(
-            "crc_size_limit", 1073741824
-        )
+        crc_size_limit = runtime_config.get("crc_size_limit", 1073741824)
         rom_entries = scan_system(
-            system, rom_root=self.rom_directory, crc_size_limit=crc_size_limit
+            system,
+            rom_root=self.rom_directory,
+            crc_size_limit=crc_size_limit,
+            hash_index=self.hash_index,
+            zip_member_crc=self._zip_member_crc_enabled(),
         )
         logger.info(f"ROM scan complete: {len(rom_entries)} files found")
+        if self.hash_index.enabled:
+            index_stats = self.hash_index.get_stats()
+            logger.info(
+                f"Hash index: {index_stats['hits']} unchanged ROMs reused, "
+                f"{index_stats['misses']} need hashing"
+            )
 
         # Early exit if no ROMs found - don't create any directories or files
         if len(rom_entries) == 0:
@@ -387,7 +540,6 @@ class WorkflowOrchestrator:
             )
 
         # Step 2: Parse and validate existing gamelist
-        gamelist_path = self.paths["gamelists"] / system.name / "gamelist.xml"
         existing_entries = []
 
         if gamelist_path.exists():
@@ -460,17 +612,62 @@ class WorkflowOrchestrator:
         failed_count = 0
         skipped_count = 0
 
+        # Stale-while-revalidate: refresh stale entries when the API is idle
+        revalidator = None
+        if enable_cache and cache.stale_days > 0:
+            revalidator = CacheRevalidator(
+                self.api_client.throttle_manager,
+                APIEndpoint.JEU_INFOS.value,
+                quota_threshold=self.config.get("api", {}).get(
+                    "quota_warning_threshold", 0.95
+                ),
+                quota_planner=self.quota_planner,
+            )
+            self.api_client.revalidator = revalidator
+            revalidator.start()
+
         # Step 2-4: Process ROMs through concurrent pipeline
-        results, not_found_items = await self._scrape_roms_parallel(
-            system, rom_entries, media_types, preferred_regions, existing_entries
-        )
+        try:
+            results, not_found_items = await self._scrape_roms_parallel(
+                system, rom_entries, media_types, preferred_regions, existing_entries
+            )
+        finally:
+            if revalidator is not None:
+                self.api_client.revalidator = None
+                dropped = await revalidator.stop()
+                logger.info(
+                    f"Revalidated {revalidator.refreshed} stale cache entries "
+                    f"({dropped} left for a later run)"
+                )
+
+        # Persist hashes calculated this run for the next one
+        if not self.dry_run:
+            self.hash_index.save()
+
+        # Write buffered cache entries off the event loop. Caches kept for
+        # watch mode stay open; others are released with their connections.
+        await asyncio.to_thread(cache.flush)
+        if cache.shared is not None:
+            await asyncio.to_thread(cache.shared.flush)
+        await self._log_cache_flush_stats(cache)
+        if self._media_store is not None and self._media_store.reused:
+            store_stats = self._media_store.get_stats()
+            logger.info(
+                f"Media store: {store_stats['reused']} files reused, "
+                f"{store_stats['bytes_saved']} bytes not downloaded or stored twice"
+            )
+        if not self.retain_caches:
+            await asyncio.to_thread(cache.close)
 
         # Count results
+        lookup_failed_count = 0
         for result in results:
             if result.success:
                 scraped_count += 1
             elif result.error:
                 failed_count += 1
+                if not result.unmatched:
+                    lookup_failed_count += 1
             else:
                 skipped_count += 1
 
@@ -491,6 +688,35 @@ class WorkflowOrchestrator:
                 logger.error(f"Failed to generate gamelist: {e}", exc_info=True)
                 print(f"Warning: Failed to generate gamelist: {e}")
 
+        # Remember the state this system was fully processed in, so the next
+        # run can skip it if nothing changes. Interrupted or failed systems,
+        # including ones with failed media downloads, are not recorded and get
+        # a full pass next time. ROMs the API does not know are not failures
+        # here: scraping them again would give the same answer.
+        media_failed = self.session_stats["media_failed"] > media_failed_before
+        interrupted = bool(
+            self.textual_ui
+            and (self.textual_ui.should_quit or self.textual_ui.should_skip_system)
+        )
+        deferred = (
+            self.quota_planner.get_deferred(system.name) if self.quota_planner else []
+        )
+        if (
+            not self.dry_run
+            and lookup_failed_count == 0
+            and not media_failed
+            and not interrupted
+            and not deferred
+        ):
+            snapshot.save(rom_state, gamelist_path, snapshot_settings, len(rom_entries))
+
+        # Keep the list of ROMs left for the next run current
+        if not self.dry_run and self.quota_planner:
+            try:
+                self._write_deferred_roms(system.name, deferred)
+            except Exception as e:
+                logger.warning(f"Failed to write deferred ROMs for {system.name}: {e}")
+
         # Step 6: Write unmatched ROMs log if any
         if (
             len(rom_entries) > 0
@@ -581,8 +807,93 @@ class WorkflowOrchestrator:
                 self.work_queue.get_failed_items() if self.work_queue else None
             ),
             not_found_items=not_found_items,
+            deferred=len(deferred),
         )
 
+    def _cache_ttl_days(self, system: SystemDefinition) -> int:
+        """
+        Get the metadata cache TTL for a system.
+
+        Returns:
+            runtime.cache_ttl_overrides[system.name] if set, else
+            runtime.cache_ttl_days (default 7)
+        """
+        runtime_config = self.config.get("runtime", {})
+        overrides = runtime_config.get("cache_ttl_overrides") or {}
+        return overrides.get(system.name, runtime_config.get("cache_ttl_days", 7))
+
+    def _get_shared_cache(self) -> Optional[MetadataCache]:
+        """
+        Open the global metadata cache on first use.
+
+        Returns:
+            Cache shared by every system, or None if runtime.global_cache_dir
+            is not set or the metadata cache is disabled
+        """
+        runtime_config = self.config.get("runtime", {})
+        cache_dir = runtime_config.get("global_cache_dir")
+        if not cache_dir or not runtime_config.get("enable_cache", True):
+            return None
+
+        if self._shared_cache is None:
+            cache_dir = Path(cache_dir).expanduser()
+            self._shared_cache = MetadataCache(
+                gamelist_directory=cache_dir,
+                ttl_days=runtime_config.get("cache_ttl_days", 7),
+                flush_entries=runtime_config.get("cache_flush_entries", 200),
+                flush_interval=runtime_config.get("cache_flush_interval", 10.0),
+                cache_dir=cache_dir,
+            )
+            logger.info(f"Global metadata cache: {self._shared_cache.cache_file}")
+        return self._shared_cache
+
+    def _get_media_store(self) -> Optional[MediaStore]:
+        """
+        Open the content-addressed media store on first use.
+
+        Returns:
+            Store shared by every system, or None if media.store_dir is not set
+        """
+        media_config = self.config.get("media", {})
+        store_dir = media_config.get("store_dir")
+        if not store_dir:
+            return None
+
+        if self._media_store is None:
+            self._media_store = MediaStore(
+                Path(store_dir).expanduser(),
+                link_mode=media_config.get("store_link_mode", "hardlink"),
+            )
+            logger.info(f"Media store: {self._media_store.root}")
+        return self._media_store
+
+    async def _log_cache_flush_stats(self, cache: MetadataCache) -> None:
+        """Log write-behind flush statistics for a system's metadata cache."""
+        stats = await asyncio.to_thread(cache.get_stats)
+        if stats.get("flushes"):
+            logger.info(
+                f"Metadata cache: {stats['flushed_entries']} entries written in "
+                f"{stats['flushes']} flushes ({stats['flushed_bytes']} bytes, "
+                f"max {stats['flush_ms_max']:.1f}ms)"
+            )
+
+    def flush_caches(self) -> None:
+        """
+        Write all buffered metadata cache entries to disk.
+
+        Called on shutdown; blocking, so use asyncio.to_thread() from async code.
+        """
+        caches = set(self._system_caches.values())
+        if self.api_client and self.api_client.cache:
+            caches.add(self.api_client.cache)
+        if self._shared_cache is not None:
+            caches.add(self._shared_cache)
+        for cache in caches:
+            try:
+                cache.flush()
+            except Exception as e:
+                logger.error(f"Failed to flush metadata cache {cache.cache_file}: {e}")
+
     async def _scrape_rom(
         self,
         system: SystemDefinition,
@@ -643,12 +954,14 @@ class WorkflowOrchestrator:
                 )
 
         try:
-            # Step 1: ROM hash (already calculated during batch pre-processing)
-            rom_hash = rom_info.hash_value
+            # Step 1: ROM hash (already calculated during batch pre-processing).
+            # Files too large to hash are identified by their sampled fingerprint
+            # so the cache can still recognise them as unchanged.
+            rom_hash = rom_info.hash_value or rom_info.fingerprint
 
             if not rom_hash:
                 logger.debug(
-                    f"[{rom_info.filename}] No hash value available (skipped or failed during batch hashing)"
+                    f"[{rom_info.filename}] No hash value available (skipped or failed during hashing)"
                 )
                 completed_tasks += 1
             else:
@@ -719,6 +1032,7 @@ class WorkflowOrchestrator:
                 )
 
             game_info = None
+            lookup_error: Optional[Exception] = None
 
             if decision.fetch_metadata:
                 # Check if we have cached data
@@ -729,36 +1043,48 @@ class WorkflowOrchestrator:
                     )
                     from_cache = cached_data is not None
 
-                source_label = "CACHED" if from_cache else "API"
-                logger.info(
-                    f"[{rom_info.filename}] Fetching metadata [{source_label}] "
-                    f"(hash={rom_hash}, size={rom_info.file_size})"
-                )
-                logger.debug(
-                    f"API request: hash={rom_hash}, "
-                    f"size={rom_info.file_size}, "
-                    f"system_id={system.platform}"
-                )
+                # Budget the lookup against the daily quota (ROMs the cache
+                # knows as not found cost nothing either)
+                known_not_found = None
+                if not from_cache and self.api_client.cache:
+                    known_not_found = self.api_client.is_known_not_found(rom_info)
+                quota_calls = 0 if from_cache or known_not_found else 1
+                if self.quota_planner and not self.quota_planner.admit(quota_calls):
+                    return self._defer_rom(system, rom_info, gamelist_entry)
+
+                # Settled in the finally below: keep every await inside the try
+                try:
+                    source_label = "CACHED" if from_cache else "API"
+                    logger.info(
+                        f"[{rom_info.filename}] Fetching metadata [{source_label}] "
+                        f"(hash={rom_hash}, size={rom_info.file_size})"
+                    )
+                    logger.debug(
+                        f"API request: hash={rom_hash}, "
+                        f"size={rom_info.file_size}, "
+                        f"system_id={system.platform}"
+                    )
 
-                api_start = time.time()
+                    api_start = time.time()
 
-                # Emit ActiveRequestEvent - API fetch started (only if not from cache)
-                if self.event_bus and not from_cache:
-                    from ..ui.events import ActiveRequestEvent
+                    # Emit ActiveRequestEvent - API fetch started (only if not from cache)
+                    if self.event_bus and not from_cache:
+                        from ..ui.events import ActiveRequestEvent
 
-                    await self.event_bus.publish(
-                        ActiveRequestEvent(
-                            request_id=f"{rom_info.filename}-api",
-                            rom_name=rom_info.filename,
-                            stage="API Fetch",
-                            status="started",
-                            duration=0.0,
+                        await self.event_bus.publish(
+                            ActiveRequestEvent(
+                                request_id=f"{rom_info.filename}-api",
+                                rom_name=rom_info.filename,
+                                stage="API Fetch",
+                                status="started",
+                                duration=0.0,
+                            )
                         )
-                    )
 
-                try:
                     game_info = await self.api_client.query_game(
-                        rom_info, shutdown_event=shutdown_event
+                        rom_info,
+                        shutdown_event=shutdown_event,
+                        known_not_found=known_not_found,
                     )
                     api_duration = time.time() - api_start
 
@@ -895,7 +1221,13 @@ class WorkflowOrchestrator:
                         success=False,
                         error="Cancelled due to shutdown",
                     )
+                except QuotaExceededError:
+                    if not self.quota_planner:
+                        raise
+                    self.quota_planner.mark_exhausted()
+                    return self._defer_rom(system, rom_info, gamelist_entry)
                 except SkippableAPIError as e:
+                    lookup_error = e
                     logger.debug(f"[{rom_info.filename}] Hash lookup failed: {e}")
 
                     # Emit ActiveRequestEvent - API fetch failed
@@ -913,8 +1245,10 @@ class WorkflowOrchestrator:
                             )
                         )
 
-                    # Try search fallback if enabled
-                    if self.enable_search_fallback:
+                    # Try search fallback if enabled (and quota is left for it)
+                    if self.enable_search_fallback and not (
+                        self.quota_planner and self.quota_planner.exhausted
+                    ):
                         logger.info(f"[{rom_info.filename}] Attempting search fallback")
 
                         # Emit ActiveRequestEvent - Search started
@@ -991,6 +1325,9 @@ class WorkflowOrchestrator:
                             )
                     else:
                         raise
+                finally:
+                    if self.quota_planner:
+                        self.quota_planner.settle(quota_calls)
 
             if not game_info and decision.fetch_metadata:
                 # Track as unmatched
@@ -1017,6 +1354,8 @@ class WorkflowOrchestrator:
                     rom_path=rom_info.path,
                     success=False,
                     error="No game info found from API",
+                    unmatched=lookup_error is None
+                    or categorize_error(lookup_error)[1] == ErrorCategory.NOT_FOUND,
                 )
 
             # Step 5: Process media with hash validation
@@ -1052,6 +1391,12 @@ class WorkflowOrchestrator:
                     min_height=image_min_dimension,
                     download_semaphore=media_semaphore,
                     event_bus=self.event_bus,
+                    media_store=self._get_media_store(),
+                    rate_limiter=(
+                        self.throttle_manager.media_limiter
+                        if self.throttle_manager
+                        else None
+                    ),
                 )
 
                 # Get media list from game_info
@@ -1887,7 +2232,60 @@ class WorkflowOrchestrator:
         except Exception as e:
             logger.error(f"[{rom_info.filename}] Error scraping: {e}")
 
-            return ScrapingResult(rom_path=rom_info.path, success=False, error=str(e))
+            return ScrapingResult(
+                rom_path=rom_info.path,
+                success=False,
+                error=str(e),
+                unmatched=categorize_error(e)[1] == ErrorCategory.NOT_FOUND,
+            )
+
+    def _defer_rom(
+        self,
+        system: SystemDefinition,
+        rom_info: ROMInfo,
+        gamelist_entry: Optional[GameEntry],
+    ) -> ScrapingResult:
+        """
+        Leave a ROM for the next run because the daily quota is spent.
+
+        The ROM keeps its existing gamelist entry and is listed in the
+        system's remainder file.
+        """
+        self.quota_planner.defer(system.name, rom_info.filename)
+        logger.info(f"[{rom_info.filename}] {DEFERRED_REASON}")
+        return ScrapingResult(
+            rom_path=rom_info.path,
+            success=False,
+            skipped=True,
+            skip_reason=DEFERRED_REASON,
+            game_entry=gamelist_entry,
+        )
+
+    def _quota_rank(self, rom_info: ROMInfo, gamelist_paths: Set[str]) -> int:
+        """
+        Get the quota planner's queue rank for a ROM.
+
+        Args:
+            rom_info: Hashed ROM
+            gamelist_paths: Paths of the existing gamelist entries
+
+        Returns:
+            Rank from QuotaPlanner.rank() (lower is scraped first)
+        """
+        rom_hash = rom_info.hash_value or rom_info.fingerprint
+        cache = self.api_client.cache
+        has_media = bool(
+            cache
+            and rom_hash
+            and any(
+                cache.get_media_hash(rom_hash, media_type)
+                for media_type in self.evaluator.enabled_media_types
+            )
+        )
+        return QuotaPlanner.rank(
+            in_gamelist=f"./{rom_info.filename}" in gamelist_paths,
+            has_media=has_media,
+        )
 
     def _create_rom_processor(
         self,
@@ -1959,26 +2357,69 @@ class WorkflowOrchestrator:
 
         return process_rom
 
-    async def _batch_hash_roms(
+    def _rom_digest_algorithms(self) -> Tuple[str, ...]:
+        """
+        Get the digests calculated for each ROM, primary algorithm first.
+
+        Returns:
+            Tuple of algorithm names from runtime.hash_algorithm and
+            runtime.rom_digests (duplicates removed)
+        """
+        runtime_config = self.config.get("runtime", {})
+        primary = runtime_config.get("hash_algorithm", "crc32")
+        digests = runtime_config.get("rom_digests", list(SUPPORTED_ALGORITHMS))
+        return tuple(dict.fromkeys([primary, *digests]))
+
+    def _zip_member_crc_enabled(self) -> bool:
+        """
+        Check whether single-member zips are identified by their inner file.
+
+        Opt-in: cache entries and gamelist hashes recorded from the container
+        CRC would all miss once it is switched on. The shortcut also yields
+        only CRC32, so it is skipped when runtime.rom_digests asks for more.
+
+        Returns:
+            True if the scan may read CRC32 from the zip central directory
+        """
+        runtime_config = self.config.get("runtime", {})
+        if not runtime_config.get("zip_member_crc", False):
+            return False
+        if self._rom_digest_algorithms() != ("crc32",):
+            logger.debug(
+                "runtime.zip_member_crc ignored: rom_digests needs more than CRC32"
+            )
+            return False
+        return True
+
+    async def _stream_hash_roms(
         self,
         rom_entries: List[ROMInfo],
         hash_algorithm: str,
-        batch_size: int = 100,
+        max_in_flight: Optional[int] = None,
         scrape_mode: str = "changed",
         existing_entries: List[GameEntry] = None,
+        on_ready: Optional[Callable[[ROMInfo], Awaitable[None]]] = None,
     ) -> List[ROMInfo]:
         """
-        Hash ROMs in concurrent batches to feed the pipeline.
+        Hash ROMs concurrently, handing each one on as soon as it is ready.
 
-        Processes ROMs in batches using asyncio.gather() with asyncio.to_thread()
-        to maximize CPU utilization while preventing memory exhaustion.
+        Acts as the producer stage of the scraping pipeline: up to max_in_flight
+        files are hashed at once on the hashing backend, and each ROM is passed
+        to on_ready the moment its hash completes (or immediately if it needs no
+        hashing). There is no batch barrier, so one large file never holds back
+        ROMs that finished hashing alongside it. Files are grouped by physical
+        device, and each device is limited to the reader count chosen by the
+        I/O scheduler (few for spinning disks, many for SSDs).
 
         Args:
             rom_entries: List of ROM entries to hash
             hash_algorithm: Hash algorithm to use (crc32, md5, sha1, etc)
-            batch_size: Number of ROMs to hash concurrently per batch
+            max_in_flight: Maximum number of files being hashed at once
+                (default: twice the hashing backend's worker count)
             scrape_mode: Scrape mode to determine which ROMs need hashing
             existing_entries: Existing gamelist entries for skip optimization
+            on_ready: Optional async callback invoked with each ROM once it is
+                ready for scraping (in completion order, not scan order)
 
         Returns:
             List of ROMInfo objects with hash_value populated
@@ -1987,13 +2428,29 @@ class WorkflowOrchestrator:
         from ..scanner.m3u_parser import get_disc1_file
         from ..scanner.rom_types import ROMType
 
+        digest_algorithms = self._rom_digest_algorithms()
+        fingerprint_large_roms = self.config.get("runtime", {}).get(
+            "fingerprint_large_roms", True
+        )
+        if not max_in_flight:
+            # Keep every hashing worker busy with one job queued behind it
+            max_in_flight = self.hash_backend.workers * 2
         total = len(rom_entries)
+        completed_count = 0
         hashed_count = 0
         last_log_time = time.time()
         log_interval = 10.0  # Log every 10 seconds minimum
 
+        existing_paths = (
+            {entry.path for entry in existing_entries}
+            if scrape_mode == "new_only" and existing_entries
+            else set()
+        )
+
         logger.info(
-            f"Starting ROM hash calculation: {total} ROMs in batches of {batch_size}"
+            f"Starting ROM hash calculation: {total} ROMs, "
+            f"up to {max_in_flight} in flight on {self.hash_backend.workers} "
+            f"{self.hash_backend.mode} worker(s)"
         )
 
         # Emit initial HashingProgressEvent to show spinner immediately
@@ -2010,113 +2467,33 @@ class WorkflowOrchestrator:
             )
             await asyncio.sleep(0)  # Yield to event processor
 
-        for i in range(0, total, batch_size):
-            batch = rom_entries[i : i + batch_size]
-
-            # Create hash tasks for this batch
-            hash_tasks = []
-            for rom_info in batch:
-                # Skip if hash already calculated
-                if rom_info.hash_value:
-                    continue
-
-                # Skip hash calculation for existing ROMs in new_only mode
-                if scrape_mode == "new_only" and existing_entries:
-                    rom_relative_path = f"./{rom_info.filename}"
-                    if any(
-                        entry.path == rom_relative_path for entry in existing_entries
-                    ):
-                        logger.debug(
-                            f"Skipping hash for existing ROM in new_only mode: {rom_info.filename}"
-                        )
-                        continue
+        async def rom_ready(rom_info: ROMInfo, hashed: bool) -> None:
+            """Hand a ROM to the consumer and report progress."""
+            nonlocal completed_count, hashed_count, last_log_time
 
-                # Determine which file to hash based on ROM type
-                hash_file = None
-                if rom_info.rom_type == ROMType.STANDARD:
-                    hash_file = rom_info.path
-                elif rom_info.rom_type == ROMType.M3U_PLAYLIST:
-                    try:
-                        hash_file = get_disc1_file(rom_info.path)
-                    except Exception as e:
-                        logger.warning(
-                            f"Failed to get disc1 file for {rom_info.name}: {e}"
-                        )
-                        continue
-                elif rom_info.rom_type == ROMType.DISC_SUBDIR:
-                    # Use contained file that was stored during scanning
-                    if rom_info.contained_file:
-                        hash_file = rom_info.contained_file
-                    else:
-                        try:
-                            hash_file = get_contained_file(rom_info.path)
-                        except Exception as e:
-                            logger.warning(
-                                f"Failed to get contained file for {rom_info.name}: {e}"
-                            )
-                            continue
-                else:
-                    hash_file = rom_info.path
-
-                if not hash_file:
-                    logger.warning(f"No hash file determined for {rom_info.name}")
-                    continue
-
-                # Wrap calculate_hash in asyncio.to_thread for concurrent execution
-                size_limit = rom_info.crc_size_limit
-                task = asyncio.to_thread(
-                    calculate_hash,
-                    hash_file,
-                    algorithm=hash_algorithm,
-                    size_limit=size_limit,
-                )
-                hash_tasks.append((rom_info, task))
-
-            # Execute batch concurrently
-            if hash_tasks:
-                # Log what we're about to hash (for large files, show size)
-                large_files = [
-                    rom_info
-                    for rom_info, _ in hash_tasks
-                    if rom_info.file_size > 100_000_000
-                ]  # > 100MB
-                if large_files:
-                    largest_gb = max(rom_info.file_size for rom_info in large_files) / (
-                        1024**3
-                    )
-                    logger.info(
-                        f"Hashing batch {(i // batch_size) + 1}: {len(hash_tasks)} files "
-                        f"({len(large_files)} files > 100MB, largest: {largest_gb:.2f} GB)"
-                    )
+            completed_count += 1
+            if hashed:
+                hashed_count += 1
 
-                results = await asyncio.gather(
-                    *[task for _, task in hash_tasks], return_exceptions=True
-                )
-
-                # Assign hash values to ROM entries
-                for (rom_info, _), result in zip(hash_tasks, results):
-                    if isinstance(result, Exception):
-                        logger.warning(f"Failed to hash {rom_info.filename}: {result}")
-                    else:
-                        rom_info.hash_value = result
-                        hashed_count += 1
+            if on_ready:
+                await on_ready(rom_info)
 
             # Progress logging - update frequently (every 10 ROMs or 10 seconds)
-            current_count = min(i + batch_size, total)
             current_time = time.time()
             should_log = (
-                (current_count % 10 == 0)  # Every 10 ROMs
+                (completed_count % 10 == 0)  # Every 10 ROMs
                 or (current_time - last_log_time >= log_interval)  # Every 10 seconds
-                or (current_count >= total)  # Always log completion
+                or (completed_count >= total)  # Always log completion
             )
+            if not should_log:
+                return
 
-            if should_log:
-                logger.info(
-                    f"Hashing progress: {current_count}/{total} ROMs processed "
-                    f"({hashed_count} hashed, {current_count - hashed_count} skipped) "
-                    f"[{(current_count / total * 100):.1f}%]"
-                )
-                last_log_time = current_time
+            logger.info(
+                f"Hashing progress: {completed_count}/{total} ROMs processed "
+                f"({hashed_count} hashed, {completed_count - hashed_count} skipped) "
+                f"[{(completed_count / total * 100):.1f}%]"
+            )
+            last_log_time = current_time
 
             # Emit HashingProgressEvent
             if self.event_bus:
@@ -2124,14 +2501,149 @@ class WorkflowOrchestrator:
 
                 await self.event_bus.publish(
                     HashingProgressEvent(
-                        completed=current_count,
+                        completed=completed_count,
                         total=total,
-                        skipped=current_count - hashed_count,
-                        in_progress=(current_count < total),
+                        skipped=completed_count - hashed_count,
+                        in_progress=(completed_count < total),
+                        device_limits=self.io_scheduler.describe_limits(),
                     )
                 )
                 await asyncio.sleep(0)  # Yield to event processor
 
+        async def hash_rom(rom_info: ROMInfo, hash_file: Path) -> None:
+            """Hash one ROM in a worker thread, then hand it on."""
+            hashed = False
+            try:
+                if rom_info.file_size > 100_000_000:  # > 100MB
+                    logger.info(
+                        f"Hashing large file {rom_info.filename} "
+                        f"({rom_info.file_size / (1024**3):.2f} GB)"
+                    )
+
+                # Identify the file as it was before hashing, so content that
+                # changes mid-read is not indexed under the new size and mtime
+                stat_result = rom_info.hash_stat
+                if stat_result is None and self.hash_index:
+                    stat_result = await asyncio.to_thread(hash_file.stat)
+
+                # All configured digests are computed in one read of the file
+                result = await self.hash_backend.calculate_hashes(
+                    hash_file,
+                    algorithms=digest_algorithms,
+                    size_limit=rom_info.crc_size_limit,
+                )
+                if result is not None:
+                    rom_info.apply_hashes(result, primary=hash_algorithm)
+                    hashed = True
+                    if self.hash_index:
+                        self.hash_index.record(hash_file, result, stat_result)
+                elif fingerprint_large_roms:
+                    # Over the size limit: sample a fingerprint so the ROM is
+                    # not treated as changed on every run
+                    rom_info.fingerprint = (
+                        await self.hash_backend.calculate_fingerprint(hash_file)
+                    )
+            except Exception as e:
+                logger.warning(f"Failed to hash {rom_info.filename}: {e}")
+            finally:
+                in_flight.release()
+
+            await rom_ready(rom_info, hashed)
+
+        def stop_requested() -> bool:
+            """Check whether the user asked to quit or skip this system."""
+            return bool(
+                self.textual_ui
+                and (self.textual_ui.should_quit or self.textual_ui.should_skip_system)
+            )
+
+        in_flight = asyncio.Semaphore(max(1, max_in_flight))
+        device_jobs: Dict[int, List[Tuple[ROMInfo, Path]]] = {}
+
+        for rom_info in rom_entries:
+            if stop_requested():
+                logger.info("Hashing stopped early - quit or skip system requested")
+                break
+
+            hash_file = None
+
+            # Skip if hash already calculated, or ROM already in gamelist for
+            # new_only mode
+            if rom_info.hash_value:
+                pass
+            elif f"./{rom_info.filename}" in existing_paths:
+                logger.debug(
+                    f"Skipping hash for existing ROM in new_only mode: {rom_info.filename}"
+                )
+            # Determine which file to hash based on ROM type
+            elif rom_info.rom_type == ROMType.M3U_PLAYLIST:
+                try:
+                    hash_file = get_disc1_file(rom_info.path)
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to get disc1 file for {rom_info.filename}: {e}"
+                    )
+            elif rom_info.rom_type == ROMType.DISC_SUBDIR:
+                # Use contained file that was stored during scanning
+                if rom_info.contained_file:
+                    hash_file = rom_info.contained_file
+                else:
+                    try:
+                        hash_file = get_contained_file(rom_info.path)
+                    except Exception as e:
+                        logger.warning(
+                            f"Failed to get contained file for {rom_info.filename}: {e}"
+                        )
+            else:
+                hash_file = rom_info.path
+
+            if not hash_file:
+                # Nothing to hash - ROM is ready immediately
+                await rom_ready(rom_info, hashed=False)
+                continue
+
+            # Group by physical device so each gets its own read concurrency
+            device = self.io_scheduler.device_of(hash_file)
+            device_jobs.setdefault(device, []).append((rom_info, hash_file))
+
+        hash_tasks = []
+
+        async def feed_device(device: int, jobs: List[Tuple[ROMInfo, Path]]) -> None:
+            """Start hash jobs for one device, never exceeding its reader limit."""
+            device_slots = asyncio.Semaphore(self.io_scheduler.limit_for(device))
+
+            async def hash_on_device(rom_info: ROMInfo, hash_file: Path) -> None:
+                try:
+                    await hash_rom(rom_info, hash_file)
+                finally:
+                    device_slots.release()
+
+            for rom_info, hash_file in jobs:
+                if stop_requested():
+                    break
+                # Wait for a free reader on this device, then a global slot
+                await device_slots.acquire()
+                await in_flight.acquire()
+                hash_tasks.append(
+                    asyncio.create_task(hash_on_device(rom_info, hash_file))
+                )
+
+        for device in device_jobs:
+            logger.info(
+                f"Hashing {len(device_jobs[device])} ROM(s) on device "
+                f"{self.io_scheduler.label_for(device)} "
+                f"({'rotational' if self.io_scheduler.is_rotational(device) else 'non-rotational'}, "
+                f"{self.io_scheduler.limit_for(device)} reader(s))"
+            )
+
+        # Devices are fed concurrently so a busy spinning disk never holds
+        # back ROMs waiting on an SSD
+        await asyncio.gather(
+            *(feed_device(device, jobs) for device, jobs in device_jobs.items())
+        )
+        if hash_tasks:
+            await asyncio.gather(*hash_tasks)
+
         # Emit final HashingProgressEvent
         if self.event_bus:
             from ..ui.events import HashingProgressEvent
@@ -2142,11 +2654,81 @@ class WorkflowOrchestrator:
                     total=total,
                     skipped=total - hashed_count,
                     in_progress=False,
+                    device_limits=self.io_scheduler.describe_limits(),
                 )
             )
 
         return rom_entries
 
+    def _enqueue_rom(self, rom_info: ROMInfo, idx: int, rank: int = 0) -> None:
+        """
+        Serialize a ROM and add it to the work queue for full scraping.
+
+        Args:
+            rom_info: ROM information (hashed, or skipped by the hash stage)
+            idx: Position of the ROM in the stream (for error logging)
+            rank: Queue order among ROMs of equal priority (lower first)
+        """
+        try:
+            # Removed excessive debug logging that was causing BrokenPipeError with Rich
+            rom_info_dict = {
+                "filename": rom_info.filename,
+                "path": str(rom_info.path),
+                "system": rom_info.system,
+                "file_size": rom_info.file_size,
+                "hash_type": rom_info.hash_type,
+                "hash_value": rom_info.hash_value,
+                "crc32": rom_info.crc32,
+                "md5": rom_info.md5,
+                "sha1": rom_info.sha1,
+                "fingerprint": rom_info.fingerprint,
+                "query_filename": rom_info.query_filename,
+                "basename": rom_info.basename,
+                "rom_type": rom_info.rom_type.value,  # Serialize enum as string
+                "crc_size_limit": rom_info.crc_size_limit,
+                "disc_files": (
+                    [str(f) for f in rom_info.disc_files]
+                    if rom_info.disc_files
+                    else None
+                ),
+                "contained_file": (
+                    str(rom_info.contained_file) if rom_info.contained_file else None
+                ),
+            }
+            self.work_queue.add_work(
+                rom_info_dict, "full_scrape", Priority.NORMAL, rank=rank
+            )
+        except KeyboardInterrupt:
+            logger.warning(
+                f"Keyboard interrupt received while adding ROM {idx} to queue"
+            )
+            raise
+        except SystemExit as e:
+            logger.error(
+                "SystemExit raised while adding ROM %s (%s): exit code %s",
+                idx,
+                rom_info.filename,
+                e.code,
+                exc_info=True,
+            )
+            raise
+        except BaseException as e:
+            logger.error(
+                "BaseException raised while adding ROM %s (%s): %s: %s",
+                idx,
+                rom_info.filename,
+                type(e).__name__,
+                e,
+                exc_info=True,
+            )
+            raise
+        except Exception as e:
+            logger.error(
+                f"Failed to add ROM {idx} ({rom_info.filename}) to work queue: {e}",
+                exc_info=True,
+            )
+            raise
+
     async def _scrape_roms_parallel(
         self,
         system: SystemDefinition,
@@ -2159,6 +2741,8 @@ class WorkflowOrchestrator:
         Scrape ROMs in parallel using WorkQueueManager and async task pool.
 
         Uses work queue consumer pattern with selective retry based on error category.
+        ROM hashing is the producer stage: workers are spawned first and each ROM
+        is queued as soon as its hash is ready.
 
         Args:
             system: System definition
@@ -2174,90 +2758,13 @@ class WorkflowOrchestrator:
         not_found_items = []  # Track 404 errors separately
         rom_count = 0
 
-        # Pre-hash ROMs in batches for better throughput (feeds pipeline efficiently)
-        logger.info(f"Pre-hashing {len(rom_entries)} ROMs in concurrent batches of 100")
         hash_algorithm = self.config.get("runtime", {}).get("hash_algorithm", "crc32")
         scrape_mode = self.config.get("scraping", {}).get("scrape_mode", "changed")
-        rom_entries = await self._batch_hash_roms(
-            rom_entries,
-            hash_algorithm,
-            batch_size=100,
-            scrape_mode=scrape_mode,
-            existing_entries=existing_entries,
-        )
-        logger.info(
-            "ROM hashing complete: %s hashed, %s skipped",
-            sum(1 for r in rom_entries if r.hash_value),
-            sum(1 for r in rom_entries if not r.hash_value),
-        )
-
-        # Populate work queue with all ROM entries
-        logger.info(f"Populating work queue with {len(rom_entries)} ROM entries")
-        successfully_added = 0
-        for idx, rom_info in enumerate(rom_entries):
-            try:
-                # Removed excessive debug logging that was causing BrokenPipeError with Rich
-                rom_info_dict = {
-                    "filename": rom_info.filename,
-                    "path": str(rom_info.path),
-                    "system": rom_info.system,
-                    "file_size": rom_info.file_size,
-                    "hash_type": rom_info.hash_type,
-                    "hash_value": rom_info.hash_value,
-                    "query_filename": rom_info.query_filename,
-                    "basename": rom_info.basename,
-                    "rom_type": rom_info.rom_type.value,  # Serialize enum as string
-                    "crc_size_limit": rom_info.crc_size_limit,
-                    "disc_files": (
-                        [str(f) for f in rom_info.disc_files]
-                        if rom_info.disc_files
-                        else None
-                    ),
-                    "contained_file": (
-                        str(rom_info.contained_file)
-                        if rom_info.contained_file
-                        else None
-                    ),
-                }
-                self.work_queue.add_work(rom_info_dict, "full_scrape", Priority.NORMAL)
-                successfully_added += 1
-            except KeyboardInterrupt:
-                logger.warning(
-                    f"Keyboard interrupt received while adding ROM {idx} to queue"
-                )
-                raise
-            except SystemExit as e:
-                logger.error(
-                    "SystemExit raised while adding ROM %s (%s): exit code %s",
-                    idx,
-                    rom_info.filename,
-                    e.code,
-                    exc_info=True,
-                )
-                raise
-            except BaseException as e:
-                logger.error(
-                    "BaseException raised while adding ROM %s (%s): %s: %s",
-                    idx,
-                    rom_info.filename,
-                    type(e).__name__,
-                    e,
-                    exc_info=True,
-                )
-                raise
-            except Exception as e:
-                logger.error(
-                    f"Failed to add ROM {idx} ({rom_info.filename}) to work queue: {e}",
-                    exc_info=True,
-                )
-                raise
-
-        logger.info(
-            "Work queue populated: successfully added %s/%s, queue reports %s items queued",
-            successfully_added,
-            len(rom_entries),
-            self.work_queue.get_stats()["pending"],
-        )
+        hash_kwargs = {
+            "hash_algorithm": hash_algorithm,
+            "scrape_mode": scrape_mode,
+            "existing_entries": existing_entries,
+        }
 
         # Work queue consumption using producer-consumer pattern with concurrent tasks
         if (
@@ -2322,7 +2829,7 @@ class WorkflowOrchestrator:
                 count=self.thread_manager.max_concurrent,
             )
 
-            logger.info("Pipeline tasks spawned. Waiting for completion...")
+            logger.info("Pipeline tasks spawned. Streaming hashed ROMs into queue...")
 
             # Start periodic UI updates in background
             ui_update_task = None
@@ -2331,6 +2838,44 @@ class WorkflowOrchestrator:
                     self._periodic_ui_update(not_found_items, len(rom_entries))
                 )
 
+            # Hashing is the producer stage: each ROM enters the work queue as
+            # soon as its hash is ready, so API workers start immediately
+            queued_count = 0
+
+            # When the daily quota may not cover this system, queued ROMs are
+            # taken by value instead of directory order
+            gamelist_paths = None
+            if self.quota_planner and self.quota_planner.is_scarce(len(rom_entries)):
+                gamelist_paths = {entry.path for entry in existing_entries or []}
+                logger.info(
+                    f"Daily API quota may not cover {system.name} "
+                    f"({self.quota_planner.remaining()} requests left for "
+                    f"{len(rom_entries)} ROMs): scraping new ROMs and ROMs "
+                    "without media first"
+                )
+
+            async def enqueue_rom(rom_info: ROMInfo) -> None:
+                nonlocal queued_count
+                rank = 0
+                if gamelist_paths is not None:
+                    rank = self._quota_rank(rom_info, gamelist_paths)
+                self._enqueue_rom(rom_info, queued_count, rank=rank)
+                queued_count += 1
+
+            try:
+                await self._stream_hash_roms(
+                    rom_entries, on_ready=enqueue_rom, **hash_kwargs
+                )
+            finally:
+                # No more work will be added for this system
+                self.work_queue.mark_system_complete()
+
+            logger.info(
+                "Work queue populated: successfully added %s/%s ROM entries",
+                queued_count,
+                len(rom_entries),
+            )
+
             # Wait for all work to complete and collect results
             task_results = await self.thread_manager.wait_for_completion()
 
@@ -2363,8 +2908,7 @@ class WorkflowOrchestrator:
                         {"filename": result.rom_path.name, "path": str(result.rom_path)}
                     )
 
-            # Mark system complete and stop pipeline tasks
-            self.work_queue.mark_system_complete()
+            # Stop pipeline tasks
             await self.thread_manager.stop_workers()
 
         else:
@@ -2372,6 +2916,8 @@ class WorkflowOrchestrator:
             # Used when: dry-run mode, thread_manager not initialized, or no thread_manager
             logger.info("Using simple sequential processing (no concurrent tasks)")
 
+            rom_entries = await self._stream_hash_roms(rom_entries, **hash_kwargs)
+
             # Sequential processing using _scrape_rom
             for rom_info in rom_entries:
                 # Check for quit request from Textual UI
@@ -2477,6 +3023,17 @@ class WorkflowOrchestrator:
         if shutdown_event and shutdown_event.is_set():
             raise asyncio.CancelledError("Shutdown requested")
 
+        # Skip searches that recently came back empty for this ROM
+        cache = self.api_client.cache
+        cache_key = rom_info.hash_value or getattr(rom_info, "fingerprint", None)
+        if not cache or self.api_client.scrape_mode == "force":
+            cache_key = None
+        if cache_key and cache.is_not_found(
+            cache_key, APIEndpoint.JEU_RECHERCHE.value, rom_size=rom_info.file_size
+        ):
+            logger.debug(f"[{rom_info.filename}] Search skipped (cached no match)")
+            return None
+
         try:
             # Search API
             results = await self.api_client.search_game(
@@ -2487,6 +3044,12 @@ class WorkflowOrchestrator:
 
             if not results:
                 logger.debug(f"[{rom_info.filename}] Search returned no results")
+                if cache_key:
+                    cache.record_not_found(
+                        cache_key,
+                        APIEndpoint.JEU_RECHERCHE.value,
+                        rom_size=rom_info.file_size,
+                    )
                 return None
 
             # Convert ROM info to dict for scorer
@@ -2559,6 +3122,12 @@ class WorkflowOrchestrator:
                     f"[{rom_info.filename}] Best match below threshold: "
                     f"{best_score:.1%} < {self.search_confidence_threshold:.1%}"
                 )
+                if cache_key:
+                    cache.record_not_found(
+                        cache_key,
+                        APIEndpoint.JEU_RECHERCHE.value,
+                        rom_size=rom_info.file_size,
+                    )
                 return None
 
         except SkippableAPIError as e:
@@ -2749,6 +3318,38 @@ class WorkflowOrchestrator:
             logger.error(f"Failed to write unmatched ROMs log: {e}")
             raise
 
+    def _write_deferred_roms(self, system_name: str, deferred: List[str]) -> None:
+        """
+        Write the ROMs deferred by the quota planner to deferred_roms.txt.
+
+        The next run picks them up by itself (finished ROMs are answered by
+        the metadata cache), so the file is removed once none are left.
+
+        Args:
+            system_name: System short name
+            deferred: Filenames of the deferred ROMs
+        """
+        output_file = self.gamelist_directory / system_name / "deferred_roms.txt"
+        if not deferred:
+            output_file.unlink(missing_ok=True)
+            return
+
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_file, "w", encoding="utf-8") as f:
+            f.write(f"# ROMs deferred for {system_name}\n")
+            f.write(f"# Total: {len(deferred)}\n")
+            f.write(
+                "# The daily API quota was used up before these ROMs were "
+                "scraped.\n# Run curateur again once the quota resets to "
+                "finish them.\n#\n"
+            )
+            for filename in sorted(deferred):
+                f.write(f"{filename}\n")
+
+        logger.info(
+            f"Deferred {len(deferred)} ROMs to the next run, listed in {output_file}"
+        )
+
     def _write_not_found_summary(
         self, system: SystemDefinition, not_found_items: List[dict]
     ) -> None:
@@ -2857,6 +3458,11 @@ class WorkflowOrchestrator:
             PerformanceUpdateEvent,
         )
 
+        # Cache metrics feed both the performance and the cache panels
+        cache_data = None
+        if self.api_client and self.api_client.cache:
+            cache_data = self.api_client.cache.get_metrics()
+
         # Get performance metrics if available
         if self.performance_monitor:
             metrics = self.performance_monitor.get_metrics()
@@ -2873,8 +3479,7 @@ class WorkflowOrchestrator:
 
             # Get cache metrics
             cache_hit_rate = None
-            if self.api_client and self.api_client.cache:
-                cache_data = self.api_client.cache.get_metrics()
+            if cache_data is not None:
                 cache_hit_rate = cache_data.get("hit_rate", 0.0)
 
             # Emit consolidated performance update
@@ -2891,8 +3496,7 @@ class WorkflowOrchestrator:
             )
 
         # Emit cache metrics
-        if self.api_client and self.api_client.cache:
-            cache_data = self.api_client.cache.get_metrics()
+        if cache_data is not None:
             await self.event_bus.publish(
                 CacheMetricsEvent(
                     existing=self.session_stats["cache_existing"],
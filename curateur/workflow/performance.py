@@ -279,7 +279,7 @@ class PerformanceMonitor:
             "total_roms": self.total_roms,
             "roms_processed": self.roms_processed,
             "elapsed_seconds": metrics.elapsed_seconds,
-            "avg_roms_per_second": metrics.roms_per_second,
+            "avg_roms_per_second": metrics.roms_per_hour / 3600,
             "total_api_calls": self.api_calls,
             "total_downloads": self.downloads,
             "peak_memory_mb": metrics.memory_mb,
@@ -0,0 +1,330 @@
+"""
+Quota-aware run planning
+
+ScreenScraper grants a fixed number of API requests per day. A first-time
+import of a large collection can need more than that, and without a plan
+whichever ROMs come first in directory order get scraped while the rest
+fail with 430 (daily quota exceeded) one after another.
+
+The planner budgets the quota left today. When a system may need more
+lookups than remain, its ROMs are queued by value (new ROMs before ones
+already in the gamelist, ROMs without media before partly scraped ones),
+and once the budget is spent the remaining ROMs are deferred: they keep
+their gamelist entries, are listed in a remainder file and are picked up
+by the next run, which finds the finished ones in the metadata cache. A
+long-running process (watch mode) re-reads the quota and resumes once it
+has reset.
+"""
+
+import logging
+import time
+from datetime import date
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+)
+
+if TYPE_CHECKING:
+    from curateur.api.throttle import ThrottleManager
+
+logger = logging.getLogger(__name__)
+
+# Queue ranks, most valuable first
+RANK_NEW_WITHOUT_MEDIA = 0
+RANK_NEW_WITH_MEDIA = 1
+RANK_KNOWN_WITHOUT_MEDIA = 2
+RANK_KNOWN_WITH_MEDIA = 3
+
+DEFERRED_REASON = "Deferred: daily API quota used up, resumes next run"
+
+
+class QuotaPlanner:
+    """
+    Budget the daily API quota across ROMs and systems.
+
+    Quota usage comes from the throttle manager, which is updated from every
+    API response. Lookups that are admitted but not answered yet are held as
+    commitments, so concurrent workers cannot overspend the remainder.
+
+    Only metadata lookups are budgeted, one jeuInfos call per ROM not in the
+    cache. Search fallback calls are covered by the reserve; media downloads
+    are paced separately.
+
+    With daily_fraction below 1 only that share of each day's quota is
+    spent, leaving the rest of the account's allowance for other use.
+
+    Example:
+        planner = QuotaPlanner(throttle_manager, reserve=100)
+        if planner.admit(1):
+            try:
+                ...  # query the API
+            finally:
+                planner.settle(1)
+        else:
+            planner.defer("nes", "Alpha Quest.nes")
+    """
+
+    def __init__(
+        self,
+        throttle_manager: "ThrottleManager",
+        reserve: int = 0,
+        system_priority: Optional[Sequence[str]] = None,
+        daily_fraction: float = 1.0,
+        recheck_interval: float = 900.0,
+        clock: Callable[[], float] = time.monotonic,
+        today: Callable[[], date] = date.today,
+    ):
+        """
+        Initialize quota planner.
+
+        Args:
+            throttle_manager: ThrottleManager holding today's quota usage
+            reserve: Requests per day left unused (for other tools)
+            system_priority: System short names to scrape first, in order
+            daily_fraction: Share of the daily quota that may be used (0-1]
+            recheck_interval: Minimum seconds between quota re-reads while
+                the budget is spent
+            clock: Monotonic time source in seconds (injectable for tests)
+            today: Current date source (injectable for tests)
+        """
+        self.throttle_manager = throttle_manager
+        self.reserve = reserve
+        self.daily_fraction = daily_fraction
+        self.system_priority = list(system_priority or [])
+        self.recheck_interval = recheck_interval
+        self._clock = clock
+        self._today = today
+
+        self._committed = 0
+        self._exhausted = False
+        self._spent_on: Optional[date] = None
+        self._last_check: Optional[float] = None
+        self.admitted = 0
+        self.deferred: Dict[str, List[str]] = {}
+
+    @property
+    def exhausted(self) -> bool:
+        """True once the budget is spent or the API reported 430."""
+        return self._exhausted
+
+    def remaining(self) -> Optional[int]:
+        """
+        Requests still available today after the reserve and commitments.
+
+        Returns:
+            Remaining request count, or None if the daily limit is unknown
+        """
+        if self._exhausted:
+            return 0
+        budget = self.daily_budget()
+        if budget is None:
+            return None
+        used = self.throttle_manager.get_quota_stats().get("requeststoday", 0)
+        # The fraction caps total usage today, so calls made by other tools
+        # on the same account count against it too
+        return max(0, budget - used - self._committed)
+
+    def daily_budget(self) -> Optional[int]:
+        """
+        Requests a full day's quota allows after the fraction and reserve.
+
+        Returns:
+            Requests per day, or None if the daily limit is unknown
+        """
+        limit = self.throttle_manager.get_quota_stats().get("maxrequestsperday", 0)
+        if not limit:
+            return None
+        return max(0, int(limit * self.daily_fraction) - self.reserve)
+
+    def is_scarce(self, max_calls: int) -> bool:
+        """
+        Check if a system may need more requests than remain.
+
+        Args:
+            max_calls: Upper bound of lookups the system needs (e.g. its ROM
+                count, before the cache is consulted)
+
+        Returns:
+            True if the work should be queued by value
+        """
+        remaining = self.remaining()
+        return remaining is not None and max_calls > remaining
+
+    def order_systems(self, systems: List[Any]) -> List[Any]:
+        """
+        Put prioritized systems first, in the configured order.
+
+        Systems not listed keep their relative order after them.
+
+        Args:
+            systems: Objects with a `name` attribute (SystemDefinition)
+
+        Returns:
+            Reordered list
+        """
+        if not self.system_priority:
+            return list(systems)
+        position = {name: i for i, name in enumerate(self.system_priority)}
+        return sorted(
+            systems, key=lambda system: position.get(system.name, len(position))
+        )
+
+    @staticmethod
+    def rank(in_gamelist: bool, has_media: bool) -> int:
+        """
+        Queue rank of a ROM (lower is scraped first).
+
+        New ROMs come before ROMs already in the gamelist (rescrapes and
+        revalidation), and within each group ROMs without any media come
+        before partly scraped ones.
+
+        Args:
+            in_gamelist: ROM already has a gamelist entry
+            has_media: Some of the ROM's media is already known
+
+        Returns:
+            One of the RANK_* constants
+        """
+        if in_gamelist:
+            return RANK_KNOWN_WITH_MEDIA if has_media else RANK_KNOWN_WITHOUT_MEDIA
+        return RANK_NEW_WITH_MEDIA if has_media else RANK_NEW_WITHOUT_MEDIA
+
+    def admit(self, calls: int) -> bool:
+        """
+        Commit budget for a ROM's lookups.
+
+        Args:
+            calls: Estimated requests for the ROM
+
+        Returns:
+            True if the ROM may be scraped (settle() afterwards), False if
+            it should be deferred
+        """
+        if calls <= 0:
+            return True
+        remaining = self.remaining()
+        if remaining is None:
+            return True
+        if calls > remaining:
+            if not self._exhausted and remaining == 0:
+                self._exhausted = True
+                self._spent_on = self._today()
+                logger.warning(
+                    "Daily API quota used up: remaining ROMs are deferred to the "
+                    "next run"
+                )
+            return False
+        self._committed += calls
+        self.admitted += 1
+        return True
+
+    def settle(self, calls: int) -> None:
+        """
+        Release a commitment once the ROM's lookups were answered.
+
+        The throttle manager's quota usage already includes them by then.
+
+        Args:
+            calls: Value passed to admit()
+        """
+        if calls > 0 and self.remaining() is not None:
+            self._committed = max(0, self._committed - calls)
+
+    def mark_exhausted(self) -> None:
+        """Stop admitting lookups (the API answered 430)."""
+        if not self._exhausted:
+            self._exhausted = True
+            self._spent_on = self._today()
+            logger.warning(
+                "API reported the daily quota exceeded: remaining ROMs are "
+                "deferred to the next run"
+            )
+
+    async def check_reset(
+        self, fetch_user_info: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> bool:
+        """
+        Re-read quota usage while the budget is spent and resume after a reset.
+
+        API responses stop once every ROM is deferred, so a long-running
+        process never sees the quota reset by itself. While the budget is
+        spent, usage is fetched again at most every recheck_interval. The
+        quota has reset when usage went down, or when the date changed since
+        the budget was spent (a 430 may leave usage unknown).
+
+        Args:
+            fetch_user_info: Coroutine function returning the API user info
+                (e.g. ScreenScraperClient.get_user_info)
+
+        Returns:
+            True if lookups are admitted again
+        """
+        if self.remaining() != 0:
+            return False
+        if self._spent_on is None:
+            self._spent_on = self._today()
+
+        now = self._clock()
+        if (
+            self._last_check is not None
+            and now - self._last_check < self.recheck_interval
+        ):
+            return False
+        self._last_check = now
+
+        used_before = self.throttle_manager.get_quota_stats().get("requeststoday", 0)
+        try:
+            user_info = await fetch_user_info()
+        except Exception as e:
+            logger.debug(f"Cannot re-read API quota: {e}")
+            return False
+        await self.throttle_manager.update_quota(user_info)
+
+        used = int(user_info.get("requeststoday", used_before))
+        if used >= used_before and self._today() == self._spent_on:
+            return False
+
+        self._exhausted = False
+        self._committed = 0
+        self._spent_on = None
+        if self.remaining() == 0:
+            # New date, but the API has not reset the count yet
+            self._spent_on = self._today()
+            return False
+
+        logger.info("Daily API quota has reset: deferred ROMs are scraped again")
+        return True
+
+    def start_system(self, system_name: str) -> None:
+        """Forget a system's deferrals from an earlier pass (watch mode)."""
+        self.deferred.pop(system_name, None)
+
+    def defer(self, system_name: str, filename: str) -> None:
+        """
+        Record a ROM left for the next run.
+
+        Args:
+            system_name: System short name
+            filename: ROM filename
+        """
+        self.deferred.setdefault(system_name, []).append(filename)
+
+    def get_deferred(self, system_name: str) -> List[str]:
+        """Get the ROMs deferred for a system this run."""
+        return list(self.deferred.get(system_name, []))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get remaining budget, admissions and deferrals."""
+        return {
+            "remaining": self.remaining(),
+            "reserve": self.reserve,
+            "admitted": self.admitted,
+            "deferred": sum(len(roms) for roms in self.deferred.values()),
+            "exhausted": self._exhausted,
+        }
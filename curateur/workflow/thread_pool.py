@@ -352,6 +352,10 @@ class ThreadPoolManager:
                         "file_size": rom_info_dict["file_size"],
                         "hash_type": rom_info_dict.get("hash_type", "crc32"),
                         "hash_value": rom_info_dict.get("hash_value"),
+                        "crc32": rom_info_dict.get("crc32"),
+                        "md5": rom_info_dict.get("md5"),
+                        "sha1": rom_info_dict.get("sha1"),
+                        "fingerprint": rom_info_dict.get("fingerprint"),
                         "crc_size_limit": rom_info_dict.get(
                             "crc_size_limit", 1073741824
                         ),
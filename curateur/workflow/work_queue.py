@@ -29,6 +29,7 @@ class WorkItem:
     action: str  # 'full_scrape' | 'media_only' | 'update'
     priority: Priority
     retry_count: int = 0
+    rank: int = 0  # Order within a priority level (lower first)
 
 
 class WorkQueueManager:
@@ -80,7 +81,11 @@ class WorkQueueManager:
         self._system_complete = False  # Flag to signal tasks that system is done
 
     def add_work(
-        self, rom_info: dict, action: str, priority: Priority = Priority.NORMAL
+        self,
+        rom_info: dict,
+        action: str,
+        priority: Priority = Priority.NORMAL,
+        rank: int = 0,
     ) -> None:
         """
         Add work item to queue (synchronous for scanner compatibility)
@@ -89,14 +94,16 @@ class WorkQueueManager:
             rom_info: ROM information dict
             action: Action type ('full_scrape', 'media_only', 'update')
             priority: Work priority level
+            rank: Order within the priority level, lower first (e.g. the
+                quota planner's value ranking)
         """
-        item = WorkItem(rom_info, action, priority, retry_count=0)
+        item = WorkItem(rom_info, action, priority, retry_count=0, rank=rank)
 
-        # Use counter for stable sort (FIFO within same priority)
+        # Use counter for stable sort (FIFO within same priority and rank)
         # Note: We can't use async lock here since this is sync method
         # asyncio.PriorityQueue is thread-safe for put_nowait()
         self._item_counter += 1
-        sort_key = (priority.value, self._item_counter)
+        sort_key = (priority.value, rank, self._item_counter)
 
         self.queue.put_nowait((sort_key, item))
         # Temporarily disabled to reduce log noise
@@ -152,7 +159,7 @@ class WorkQueueManager:
             work_item.priority = Priority.HIGH
 
             self._item_counter += 1
-            sort_key = (Priority.HIGH.value, self._item_counter)
+            sort_key = (Priority.HIGH.value, work_item.rank, self._item_counter)
 
             self.queue.put_nowait((sort_key, work_item))
         else:
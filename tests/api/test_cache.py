@@ -1,8 +1,11 @@
+import json
+import time
+from datetime import datetime
 from pathlib import Path
 
 import pytest
 
-from curateur.api.cache import MetadataCache
+from curateur.api.cache import MetadataCache, shared_cache_key
 
 
 @pytest.mark.unit
@@ -35,6 +38,32 @@ def test_cache_rejects_size_mismatch(tmp_path: Path):
     assert metrics["misses"] == 1  # size mismatch counts as miss
 
 
+@pytest.mark.unit
+def test_cache_metrics_keep_entry_count_without_counting(tmp_path: Path):
+    cache = MetadataCache(gamelist_directory=tmp_path)
+    cache.put("A", {"name": "Alpha"}, rom_size=1)
+    cache.flush()
+    assert cache.get_metrics()["total_entries"] == 1
+
+    # Counted once; writes keep it current from then on
+    def no_count(*args, **kwargs):
+        raise AssertionError("metrics must not count entries again")
+
+    cache._count = no_count
+    cache.put("A", {"name": "Alpha (USA)"}, rom_size=1)
+    cache.put("B", {"name": "Beta"}, rom_size=2)
+    cache.flush()
+    assert cache.get_metrics()["total_entries"] == 2
+
+    # Size mismatch drops the entry
+    assert cache.get("B", rom_size=3) is None
+    cache.flush()
+    assert cache.get_metrics()["total_entries"] == 1
+
+    cache.clear()
+    assert cache.get_metrics()["total_entries"] == 0
+
+
 @pytest.mark.unit
 def test_cache_cleanup_expired(tmp_path: Path):
     gamelist_dir = tmp_path / "gamelists"
@@ -47,3 +76,326 @@ def test_cache_cleanup_expired(tmp_path: Path):
     assert removed == 1
     stats = cache.get_stats()
     assert stats["total_entries"] == 0
+
+
+@pytest.mark.unit
+def test_cache_persists_rows_across_instances(tmp_path: Path):
+    cache = MetadataCache(gamelist_directory=tmp_path)
+    cache.put("ABC123", {"name": "Example"}, rom_size=100, media_hashes={"ss": "H1"})
+    cache.update_media_hashes("ABC123", {"box2dfront": "H2"})
+    cache.close()
+
+    reopened = MetadataCache(gamelist_directory=tmp_path)
+    entry = reopened.get("ABC123", rom_size=100)
+    assert entry["response"] == {"name": "Example"}
+    assert entry["media_hashes"] == {"ss": "H1", "box2dfront": "H2"}
+    assert reopened.get_media_hash("ABC123", "box2dfront") == "H2"
+
+    journal_mode = reopened._connection().execute("PRAGMA journal_mode").fetchone()
+    assert journal_mode[0] == "wal"
+
+
+@pytest.mark.unit
+def test_cache_put_replaces_existing_row(tmp_path: Path):
+    cache = MetadataCache(gamelist_directory=tmp_path)
+    cache.put("ABC123", {"name": "Old"}, media_hashes={"ss": "H1"})
+    cache.put("ABC123", {"name": "New"}, rom_size=5)
+
+    entry = cache.get("ABC123")
+    assert entry["response"] == {"name": "New"}
+    assert "media_hashes" not in entry
+    assert cache.get_stats()["total_entries"] == 1
+
+
+@pytest.mark.unit
+def test_cache_migrates_legacy_json(tmp_path: Path):
+    legacy_file = tmp_path / ".cache" / "metadata_cache.json"
+    legacy_file.parent.mkdir()
+    legacy_file.write_text(
+        json.dumps(
+            {
+                "ABC123": {
+                    "response": {"name": "Legacy"},
+                    "rom_hash": "ABC123",
+                    "rom_size": 100,
+                    "media_hashes": {"ss": "H1"},
+                    "timestamp": datetime.now().isoformat(),
+                    "ttl_days": 7,
+                },
+                "BROKEN": {"rom_hash": "BROKEN"},
+            }
+        )
+    )
+
+    cache = MetadataCache(gamelist_directory=tmp_path)
+    entry = cache.get("ABC123", rom_size=100)
+    assert entry["response"] == {"name": "Legacy"}
+    assert entry["media_hashes"] == {"ss": "H1"}
+    assert cache.get_stats()["total_entries"] == 1
+    assert not legacy_file.exists()
+    assert legacy_file.with_suffix(".json.migrated").exists()
+
+
+@pytest.mark.unit
+def test_cache_buffers_writes_until_threshold(tmp_path: Path):
+    cache = MetadataCache(
+        gamelist_directory=tmp_path, flush_entries=3, flush_interval=3600
+    )
+    cache.put("A", {"name": "A"})
+    cache.put("B", {"name": "B"})
+
+    # Buffered entries are visible to lookups before they reach disk
+    assert cache.get("A")["response"] == {"name": "A"}
+    assert cache._count() == 0
+
+    cache.put("C", {"name": "C"})  # threshold reached: background flush
+    cache.flush()
+    assert cache._count() == 3
+
+    stats = cache.get_stats()
+    assert stats["flushes"] == 1
+    assert stats["flushed_entries"] == 3
+    assert stats["flushed_bytes"] > 0
+    assert stats["flush_ms_max"] >= stats["flush_ms_last"] >= 0
+
+
+@pytest.mark.unit
+def test_cache_buffers_deletes_and_media_updates(tmp_path: Path):
+    cache = MetadataCache(gamelist_directory=tmp_path, flush_interval=3600)
+    cache.put("A", {"name": "A"}, rom_size=10)
+    cache.flush()
+
+    cache.update_media_hashes("A", {"ss": "H1"})
+    assert cache.get_media_hash("A", "ss") == "H1"
+
+    # Size mismatch removes the entry, buffered as a delete
+    assert cache.get("A", rom_size=99) is None
+    assert cache.get("A") is None
+
+    cache.close()
+    assert MetadataCache(gamelist_directory=tmp_path).get("A") is None
+
+
+@pytest.mark.unit
+def test_cache_shares_entries_across_systems(tmp_path: Path):
+    shared = MetadataCache(
+        gamelist_directory=tmp_path / "global", cache_dir=tmp_path / "global"
+    )
+    genesis = MetadataCache(
+        gamelist_directory=tmp_path / "genesis", shared=shared, shared_namespace="1"
+    )
+    megadrive = MetadataCache(
+        gamelist_directory=tmp_path / "megadrive", shared=shared, shared_namespace="1"
+    )
+    snes = MetadataCache(
+        gamelist_directory=tmp_path / "snes", shared=shared, shared_namespace="4"
+    )
+
+    genesis.put("abc123", {"name": "Sonic"}, rom_size=100, media_hashes={"ss": "X"})
+    assert shared.get(shared_cache_key("1", "abc123", 100)) is not None
+
+    # Alias system hits the global entry and keeps a local copy
+    entry = megadrive.get("abc123", rom_size=100)
+    assert entry["response"]["name"] == "Sonic"
+    assert "media_hashes" not in entry
+    assert megadrive.get_metrics()["shared_hits"] == 1
+    megadrive.flush()
+    assert megadrive.get_stats()["total_entries"] == 1
+
+    # Other systemeids and other sizes do not match
+    assert snes.get("abc123", rom_size=100) is None
+    assert megadrive.get("abc123", rom_size=200) is None
+
+    # Clearing a system drops its namespace from the global cache
+    genesis.clear()
+    assert shared.get(shared_cache_key("1", "abc123", 100)) is None
+    for cache in (genesis, megadrive, snes, shared):
+        cache.close()
+
+
+@pytest.mark.unit
+def test_cache_negative_ttl_doubles_on_repeat_misses(tmp_path: Path, monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr("curateur.api.cache.time.time", lambda: now[0])
+    cache = MetadataCache(
+        gamelist_directory=tmp_path, negative_ttl_days=1, negative_max_ttl_days=3
+    )
+
+    assert cache.record_not_found("ABC", "jeuInfos.php", rom_size=10) == 1
+    assert cache.is_not_found("ABC", "jeuInfos.php", rom_size=10)
+    assert not cache.is_not_found("ABC", "jeuRecherche.php", rom_size=10)
+    assert not cache.is_not_found("ABC", "jeuInfos.php", rom_size=11)
+
+    # TTL runs out, the next miss doubles it, then it is capped
+    now[0] += 86400 + 1
+    assert not cache.is_not_found("ABC", "jeuInfos.php", rom_size=10)
+    assert cache.record_not_found("ABC", "jeuInfos.php", rom_size=10) == 2
+    cache.flush()
+    assert cache.record_not_found("ABC", "jeuInfos.php", rom_size=10) == 3
+
+    # A successful lookup clears the negative entry
+    cache.put("ABC", {"name": "Found"}, rom_size=10)
+    cache.flush()
+    assert not cache.is_not_found("ABC", "jeuInfos.php", rom_size=10)
+    assert cache.get_stats()["not_found_entries"] == 0
+    cache.close()
+
+
+@pytest.mark.unit
+def test_cache_serves_stale_entries_within_window(tmp_path: Path, monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr("curateur.api.cache.time.time", lambda: now[0])
+    cache = MetadataCache(gamelist_directory=tmp_path, ttl_days=1, stale_days=2)
+    cache.put("ABC", {"name": "Old"}, rom_size=10)
+    assert "stale" not in cache.get("ABC", rom_size=10)
+
+    now[0] += 2 * 86400
+    entry = cache.get("ABC", rom_size=10)
+    assert entry["stale"] is True
+    assert entry["response"]["name"] == "Old"
+    assert cache.cleanup_expired() == 0
+    assert cache.get_metrics()["stale_hits"] == 1
+
+    now[0] += 2 * 86400
+    assert cache.get("ABC", rom_size=10) is None
+    cache.close()
+
+
+@pytest.mark.unit
+def test_cache_stores_compressed_responses(tmp_path: Path):
+    response = {"name": "Example", "synopsis": "A long description. " * 200}
+    cache = MetadataCache(gamelist_directory=tmp_path)
+    cache.put("ABC", response, rom_size=1)
+    cache.flush()
+
+    stored = cache._connection().execute("SELECT response FROM entries").fetchone()
+    assert isinstance(stored[0], bytes)
+    assert len(stored[0]) < len(json.dumps(response)) / 10
+
+    # Rows written by older versions hold plain JSON text
+    cache._writer().execute(
+        "INSERT INTO entries (rom_hash, response, rom_size, created_at, ttl_days) "
+        "VALUES ('OLD', ?, 1, ?, 7)",
+        (json.dumps({"name": "Legacy"}), datetime.now().timestamp()),
+    )
+    assert cache.get("OLD", rom_size=1)["response"] == {"name": "Legacy"}
+    assert cache.get("ABC", rom_size=1)["response"] == response
+    cache.close()
+
+
+@pytest.mark.unit
+def test_cache_bounds_resident_decoded_entries(tmp_path: Path):
+    cache = MetadataCache(gamelist_directory=tmp_path, resident_entries=2)
+    for rom_hash in ("A", "B", "C"):
+        cache.put(rom_hash, {"name": rom_hash}, rom_size=1, media_hashes={"ss": "H"})
+    cache.flush()
+
+    for rom_hash in ("A", "B", "C", "C"):
+        assert cache.get(rom_hash, rom_size=1)["response"]["name"] == rom_hash
+    assert cache.get_metrics()["resident_entries"] == 2
+
+    # Media hash lookups do not decode the response
+    assert cache.get_media_hash("A", "ss") == "H"
+    assert cache.get_metrics()["resident_entries"] == 2
+
+    # A new write supersedes the resident copy
+    cache.put("C", {"name": "C2"}, rom_size=1)
+    cache.flush()
+    assert cache.get("C", rom_size=1)["response"]["name"] == "C2"
+    cache.close()
+
+
+@pytest.mark.unit
+def test_cache_drops_entries_with_bad_checksum(tmp_path: Path):
+    cache = MetadataCache(gamelist_directory=tmp_path)
+    cache.put("GOOD", {"name": "Good"}, rom_size=1)
+    cache.put("BAD", {"name": "Bad"}, rom_size=1)
+    cache.flush()
+    cache._writer().execute(
+        "UPDATE entries SET checksum = checksum + 1 WHERE rom_hash = 'BAD'"
+    )
+
+    assert cache.get("BAD", rom_size=1) is None
+    assert cache.get("GOOD", rom_size=1) is not None
+    cache.flush()
+    assert cache.get_stats()["total_entries"] == 1
+    cache.close()
+
+
+@pytest.mark.unit
+def test_cache_verify_reports_recovered_and_dropped(tmp_path: Path):
+    cache = MetadataCache(gamelist_directory=tmp_path)
+    for rom_hash in ("A", "B", "C"):
+        cache.put(rom_hash, {"name": rom_hash}, rom_size=1)
+    cache.flush()
+    cache._writer().execute("UPDATE entries SET response = X'00' WHERE rom_hash = 'B'")
+
+    report = cache.verify()
+    assert report["recovered"] == 2
+    assert report["dropped"] == 1
+    assert report["rebuilt"] is False
+
+    cache.put("D", {"name": "D"}, rom_size=1, media_hashes={"ss": "H"})
+    cache.compact()
+    assert cache.get_stats()["total_entries"] == 3
+    cache.close()
+
+
+@pytest.mark.unit
+def test_cache_moves_unreadable_database_aside(tmp_path: Path):
+    cache_dir = tmp_path / ".cache"
+    cache_dir.mkdir()
+    (cache_dir / "metadata_cache.db").write_bytes(b"\x00garbage" * 1024)
+
+    cache = MetadataCache(gamelist_directory=tmp_path)
+    assert cache.get("ABC") is None
+    cache.put("ABC", {"name": "New"}, rom_size=1)
+    assert cache.get("ABC", rom_size=1) is not None
+    assert (cache_dir / "metadata_cache.db.corrupt").exists()
+    cache.close()
+
+
+@pytest.mark.unit
+def test_cache_import_keeps_newer_local_entries(tmp_path: Path):
+    source = MetadataCache(gamelist_directory=tmp_path / "a")
+    source.put("OLD", {"name": "Old"}, rom_size=1)
+    source.put("NEW", {"name": "Exported"}, rom_size=1, media_hashes={"ss": "H"})
+    exported = list(source.export_entries())
+    source.close()
+
+    target = MetadataCache(gamelist_directory=tmp_path / "b", ttl_days=7)
+    target.put("OLD", {"name": "Local"}, rom_size=1)
+    expired = dict(exported[0], rom_hash="GONE", created_at=0)
+
+    imported, skipped = target.import_entries(exported + [expired])
+
+    assert (imported, skipped) == (1, 2)
+    assert target.get("OLD", rom_size=1)["response"] == {"name": "Local"}
+    assert target.get("NEW", rom_size=1)["response"] == {"name": "Exported"}
+    # Media hashes describe the source install's files
+    assert all("media_hashes" not in entry for entry in exported)
+    assert target.get_media_hash("NEW", "ss") is None
+    assert target.get("GONE") is None
+    target.close()
+
+
+@pytest.mark.unit
+def test_cache_import_keeps_local_media_hashes(tmp_path: Path):
+    target = MetadataCache(gamelist_directory=tmp_path, ttl_days=7)
+    target.put("A", {"name": "Old"}, rom_size=1, media_hashes={"ss": "LOCAL"})
+    target.flush()
+
+    entry = {
+        "rom_hash": "A",
+        "response": {"name": "New"},
+        "rom_size": 1,
+        "created_at": time.time() + 60,
+        "ttl_days": 7,
+        "media_hashes": {"ss": "REMOTE", "video": "REMOTE"},
+    }
+    assert target.import_entries([entry]) == (1, 0)
+
+    assert target.get("A", rom_size=1)["response"] == {"name": "New"}
+    assert target.get_media_hash("A", "ss") == "LOCAL"
+    assert target.get_media_hash("A", "video") is None
+    target.close()
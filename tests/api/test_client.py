@@ -1,3 +1,4 @@
+import asyncio
 from pathlib import Path
 
 import httpx
@@ -104,6 +105,93 @@ async def test_query_game_parses_response_and_updates_cache(tmp_path: Path):
     assert cached and cached["response"]["name"] == "Alpha Quest"
 
 
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_query_game_sends_all_digests(tmp_path: Path):
+    throttle = ThrottleManager(RateLimit(calls=10, window_seconds=60))
+    rom_info = ROMInfo(
+        path=tmp_path / "Alpha Quest.nes",
+        filename="Alpha Quest.nes",
+        basename="Alpha Quest",
+        rom_type=ROMType.STANDARD,
+        system="nes",
+        query_filename="Alpha Quest.nes",
+        file_size=2048,
+        hash_type="sha1",
+        hash_value="S" * 40,
+        crc32="ABCD1234",
+        md5="M" * 32,
+        sha1="S" * 40,
+    )
+
+    async with httpx.AsyncClient() as http_client:
+        client = ScreenScraperClient(
+            config=_base_config(),
+            throttle_manager=throttle,
+            client=http_client,
+            cache=None,
+        )
+
+        with respx.mock(assert_all_called=True) as mock:
+            route = mock.get("https://api.screenscraper.fr/api2/jeuInfos.php").respond(
+                200,
+                content=b'<Data><jeu id="1"><noms><nom region="us">Alpha Quest</nom>'
+                b"</noms></jeu></Data>",
+            )
+            await client.query_game(rom_info)
+
+    params = route.calls.last.request.url.params
+    assert params["crc"] == "ABCD1234"
+    assert params["md5"] == "M" * 32
+    assert params["sha1"] == "S" * 40
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_concurrent_duplicate_roms_share_one_request(tmp_path: Path):
+    throttle = ThrottleManager(RateLimit(calls=10, window_seconds=60))
+
+    def rom(filename: str) -> ROMInfo:
+        return ROMInfo(
+            path=tmp_path / filename,
+            filename=filename,
+            basename=Path(filename).stem,
+            rom_type=ROMType.STANDARD,
+            system="nes",
+            query_filename=filename,
+            file_size=2048,
+            hash_value="ABC123",
+        )
+
+    async with httpx.AsyncClient() as http_client:
+        client = ScreenScraperClient(
+            config=_base_config(),
+            throttle_manager=throttle,
+            client=http_client,
+            cache=None,
+        )
+
+        with respx.mock(assert_all_called=True) as mock:
+            route = mock.get("https://api.screenscraper.fr/api2/jeuInfos.php").respond(
+                200,
+                content=b'<Data><jeu id="1"><noms><nom region="us">Alpha Quest</nom>'
+                b"</noms></jeu></Data>",
+            )
+            first, second = await asyncio.gather(
+                client.query_game(rom("Alpha Quest.nes")),
+                client.query_game(rom("Alpha Quest (USA).nes")),
+            )
+
+    assert route.call_count == 1
+    assert first["name"] == second["name"] == "Alpha Quest"
+    assert first is not second  # joiners get their own copy
+    assert client.lookups.get_stats() == {
+        "started": 1,
+        "coalesced": 1,
+        "in_flight": 0,
+    }
+
+
 @pytest.mark.integration
 @pytest.mark.asyncio
 @pytest.mark.slow
@@ -224,6 +312,110 @@ async def test_query_game_cache_hit_short_circuits(monkeypatch, tmp_path: Path):
         assert result["name"] == "FromCache"
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_query_game_negative_cache_skips_known_misses(tmp_path: Path):
+    throttle = ThrottleManager(RateLimit(calls=10, window_seconds=60))
+    config = _base_config()
+    rom_info = ROMInfo(
+        path=tmp_path / "Homebrew.nes",
+        filename="Homebrew.nes",
+        basename="Homebrew",
+        rom_type=ROMType.STANDARD,
+        system="nes",
+        query_filename="Homebrew.nes",
+        file_size=10,
+        hash_value="HASH",
+    )
+    cache = MetadataCache(gamelist_directory=tmp_path, negative_ttl_days=2)
+
+    async with httpx.AsyncClient() as http_client:
+        client = ScreenScraperClient(
+            config=config,
+            throttle_manager=throttle,
+            client=http_client,
+            cache=cache,
+        )
+
+        with respx.mock(assert_all_called=True) as mock:
+            route = mock.get("https://api.screenscraper.fr/api2/jeuInfos.php").respond(
+                404, content=b"Erreur : Jeu non trouvee !"
+            )
+            with pytest.raises(SkippableAPIError):
+                await client.query_game(rom_info)
+            # Second lookup is answered from the negative cache
+            assert client.is_known_not_found(rom_info)
+            with pytest.raises(SkippableAPIError, match="not found"):
+                await client.query_game(rom_info, known_not_found=True)
+            assert route.call_count == 1
+
+    # The caller's check is reused, not repeated
+    assert cache.get_metrics()["negative_hits"] == 1
+    cache.flush()
+    assert cache.get_stats()["not_found_entries"] == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_query_game_serves_stale_entry_and_queues_refresh(
+    monkeypatch, tmp_path: Path
+):
+    throttle = ThrottleManager(RateLimit(calls=10, window_seconds=60))
+    config = _base_config()
+    config["scraping"]["name_verification"] = "disabled"
+    rom_info = ROMInfo(
+        path=tmp_path / "Alpha.nes",
+        filename="Alpha.nes",
+        basename="Alpha",
+        rom_type=ROMType.STANDARD,
+        system="nes",
+        query_filename="Alpha.nes",
+        file_size=10,
+        hash_value="HASH",
+    )
+
+    now = [1_000_000.0]
+    monkeypatch.setattr("curateur.api.cache.time.time", lambda: now[0])
+    cache = MetadataCache(gamelist_directory=tmp_path, ttl_days=1, stale_days=7)
+    cache.put("HASH", {"name": "Stale"}, rom_size=10)
+    now[0] += 3 * 86400
+
+    class RecordingRevalidator:
+        def __init__(self):
+            self.submitted = {}
+
+        def submit(self, key, refresh):
+            self.submitted[key] = refresh
+
+    async with httpx.AsyncClient() as http_client:
+        client = ScreenScraperClient(
+            config=config,
+            throttle_manager=throttle,
+            client=http_client,
+            cache=cache,
+        )
+        client.revalidator = RecordingRevalidator()
+
+        # Stale entry is returned without an HTTP call
+        result = await client.query_game(rom_info)
+        assert result["name"] == "Stale"
+        assert list(client.revalidator.submitted) == ["HASH"]
+
+        # The queued refresh bypasses the cache and stores the new response
+        xml = (
+            b"<Data><jeu id='1'><noms><nom region='us'>Fresh</nom></noms></jeu></Data>"
+        )
+        with respx.mock(assert_all_called=True) as mock:
+            mock.get("https://api.screenscraper.fr/api2/jeuInfos.php").respond(
+                200, content=xml
+            )
+            await client.revalidator.submitted["HASH"]()
+
+    entry = cache.get("HASH", rom_size=10)
+    assert entry["response"]["name"] == "Fresh"
+    assert "stale" not in entry
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_search_game_parses_results(tmp_path: Path):
@@ -0,0 +1,129 @@
+import asyncio
+
+import pytest
+
+from curateur.api.concurrency import AdaptiveConcurrency
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.unit
+def test_overload_halves_limit_once_per_cooldown():
+    clock = FakeClock()
+    limiter = AdaptiveConcurrency(ceiling=8, clock=clock)
+
+    limiter.record_overload("HTTP 429")
+    limiter.record_overload("HTTP 429")  # same round, within cooldown
+    assert limiter.limit == 4
+    assert limiter.decreases == 1
+
+    clock.now += 5
+    limiter.record_overload("timeout")
+    clock.now += 5
+    limiter.record_overload("timeout")
+    clock.now += 5
+    limiter.record_overload("timeout")
+    assert limiter.limit == 1  # never below the floor
+
+
+@pytest.mark.unit
+def test_success_adds_about_one_slot_per_round_up_to_ceiling():
+    limiter = AdaptiveConcurrency(ceiling=6, initial=2, clock=FakeClock())
+
+    for _ in range(2):
+        limiter.record_success()
+    assert limiter.limit == 2  # 2 + 1/2 + 1/2.5 is still below 3
+
+    for _ in range(3):
+        limiter.record_success()
+    assert limiter.limit == 3
+
+    for _ in range(100):
+        limiter.record_success()
+    assert limiter.limit == 6
+
+
+@pytest.mark.unit
+def test_latency_well_above_baseline_counts_as_overload():
+    limiter = AdaptiveConcurrency(
+        ceiling=10, window=5, latency_tolerance=2.0, clock=FakeClock()
+    )
+
+    for _ in range(5):
+        limiter.record_success(0.2)
+    assert limiter.baseline_latency == pytest.approx(0.2)
+    assert limiter.limit == 10
+
+    for _ in range(5):
+        limiter.record_success(1.0)
+    assert limiter.limit == 5
+    assert limiter.decreases == 1
+
+
+@pytest.mark.unit
+def test_fixed_limit_ignores_signals():
+    limiter = AdaptiveConcurrency(ceiling=4, adaptive=False, clock=FakeClock())
+
+    limiter.record_overload("HTTP 503")
+    limiter.record_success(30.0)
+
+    assert limiter.limit == 4
+    assert limiter.get_stats()["decreases"] == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_waiters_are_served_in_order_as_limit_allows():
+    limiter = AdaptiveConcurrency(ceiling=2, initial=1, clock=FakeClock())
+    order = []
+
+    async def worker(name: str, hold: asyncio.Event) -> None:
+        async with limiter:
+            order.append(name)
+            await hold.wait()
+
+    holds = [asyncio.Event() for _ in range(3)]
+    tasks = [
+        asyncio.create_task(worker(name, hold)) for name, hold in zip("abc", holds)
+    ]
+    await asyncio.sleep(0)
+    assert order == ["a"]
+    assert limiter.get_stats()["waiting"] == 2
+
+    # Raising the ceiling frees a slot immediately, for the oldest waiter
+    limiter.set_ceiling(2)
+    await asyncio.sleep(0)
+    assert order == ["a", "b"]
+
+    holds[0].set()
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert order == ["a", "b", "c"]
+
+    for hold in holds:
+        hold.set()
+    await asyncio.gather(*tasks)
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_lowered_limit_applies_as_slots_are_released():
+    limiter = AdaptiveConcurrency(ceiling=4, clock=FakeClock())
+    for _ in range(4):
+        await limiter.acquire()
+
+    limiter.record_overload("HTTP 429")
+    assert limiter.limit == 2
+
+    limiter.release()
+    limiter.release()
+    assert limiter.locked()  # still 2 in flight
+    limiter.release()
+    assert not limiter.locked()
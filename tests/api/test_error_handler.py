@@ -36,8 +36,9 @@ def test_handle_http_status_routes_errors_and_notifies_throttle():
     with pytest.raises(SkippableAPIError):
         error_handler.handle_http_status(404, context="missing")
 
-    with pytest.raises(FatalAPIError):
+    with pytest.raises(error_handler.QuotaExceededError) as excinfo:
         error_handler.handle_http_status(430, context="quota")
+    assert isinstance(excinfo.value, FatalAPIError)
 
 
 @pytest.mark.unit
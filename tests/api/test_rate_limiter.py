@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+
+from curateur.api.rate_limiter import RateLimiter
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.mark.unit
+def test_reserve_spaces_calls_at_exact_intervals():
+    clock = FakeClock()
+    limiter = RateLimiter(calls=300, period=60, clock=clock)
+
+    delays = [limiter.reserve() for _ in range(4)]
+
+    assert delays == pytest.approx([0.0, 0.2, 0.4, 0.6])
+    assert limiter.admitted == 4
+
+
+@pytest.mark.unit
+def test_burst_admits_back_to_back_then_paces():
+    clock = FakeClock()
+    limiter = RateLimiter(calls=60, period=60, burst=3, clock=clock)
+
+    assert limiter.tokens() == 3
+    assert [limiter.try_acquire() for _ in range(4)] == [True, True, True, False]
+    assert limiter.delay() == pytest.approx(1.0)
+
+    clock.now += 1.0
+    assert limiter.try_acquire() is True
+    assert limiter.try_acquire() is False
+
+    # Idle long enough and the bucket refills, but never beyond burst
+    clock.now += 60
+    assert limiter.tokens() == 3
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_acquire_sleeps_until_reserved_slot():
+    clock = FakeClock()
+    limiter = RateLimiter(calls=120, period=60, clock=clock, sleep=clock.sleep)
+
+    waited = [await limiter.acquire() for _ in range(3)]
+
+    assert waited == pytest.approx([0.0, 0.5, 0.5])
+    assert clock.sleeps == pytest.approx([0.5, 0.5])
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_cancelled_acquire_returns_its_slot():
+    clock = FakeClock()
+
+    async def never(seconds):
+        await asyncio.Event().wait()
+
+    limiter = RateLimiter(calls=60, period=60, clock=clock, sleep=never)
+    limiter.reserve()
+
+    task = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert limiter.admitted == 1
+    assert limiter.delay() == pytest.approx(1.0)
+
+
+@pytest.mark.unit
+def test_block_until_resumes_from_empty_bucket():
+    clock = FakeClock()
+    limiter = RateLimiter(calls=60, period=60, burst=5, clock=clock)
+
+    limiter.block_until(clock.now + 30)
+
+    assert limiter.delay() == pytest.approx(30.0)
+    clock.now += 30
+    assert limiter.try_acquire() is True
+    assert limiter.try_acquire() is False
+
+    limiter.reset()
+    assert limiter.tokens() == 5
@@ -56,7 +56,7 @@ def test_parse_game_info_extracts_core_fields():
         <joueurs>1-2</joueurs>
         <note>15</note>
         <medias>
-          <media type="screenshot" format="png" region="us">http://example/s.png</media>
+          <media type="screenshot" format="png" region="us" crc="1A2B3C4D" md5="">http://example/s.png</media>
         </medias>
       </jeu>
     </Data>
@@ -78,6 +78,8 @@ def test_parse_game_info_extracts_core_fields():
     media = game["media"]["screenshot"][0]
     assert media["url"].startswith("http://example")
     assert media["region"] == "us"
+    assert media["crc"] == "1A2B3C4D"
+    assert "md5" not in media
 
 
 @pytest.mark.unit
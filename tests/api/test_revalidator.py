@@ -0,0 +1,128 @@
+import asyncio
+
+import pytest
+
+from curateur.api.revalidator import CacheRevalidator
+from curateur.api.throttle import RateLimit, ThrottleManager
+from curateur.workflow.quota_planner import QuotaPlanner
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_revalidator_waits_for_idle_capacity_and_dedupes():
+    throttle = ThrottleManager(
+        default_limit=RateLimit(calls=10, window_seconds=60), max_concurrent=1
+    )
+    revalidator = CacheRevalidator(throttle, "jeuInfos.php", poll_interval=0.01)
+    refreshed = []
+
+    async def refresh(key):
+        refreshed.append(key)
+
+    await throttle.concurrency_semaphore.acquire()
+    revalidator.start()
+    revalidator.submit("A", lambda: refresh("A"))
+    revalidator.submit("A", lambda: refresh("A"))
+    revalidator.submit("B", lambda: refresh("B"))
+
+    # Foreground request holds the only slot: nothing runs
+    await asyncio.sleep(0.05)
+    assert refreshed == []
+    assert revalidator.pending == 2
+
+    throttle.concurrency_semaphore.release()
+    for _ in range(100):
+        if len(refreshed) == 2:
+            break
+        await asyncio.sleep(0.01)
+    assert refreshed == ["A", "B"]
+    assert revalidator.refreshed == 2
+    assert await revalidator.stop() == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_revalidator_stop_drops_pending_refreshes():
+    throttle = ThrottleManager(default_limit=RateLimit(calls=10, window_seconds=60))
+    await throttle.update_quota({"requeststoday": 100, "maxrequestsperday": 100})
+    revalidator = CacheRevalidator(throttle, "jeuInfos.php", poll_interval=0.01)
+
+    async def refresh():
+        raise AssertionError("no quota headroom, must not run")
+
+    revalidator.start()
+    revalidator.submit("A", refresh)
+    await asyncio.sleep(0.03)
+    assert await revalidator.stop() == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_revalidator_respects_quota_planner_budget():
+    throttle = ThrottleManager(default_limit=RateLimit(calls=10, window_seconds=60))
+    # 60% used: under the 95% warning threshold, but past a 50% daily share
+    await throttle.update_quota({"requeststoday": 60, "maxrequestsperday": 100})
+    planner = QuotaPlanner(throttle, daily_fraction=0.5)
+    revalidator = CacheRevalidator(
+        throttle, "jeuInfos.php", poll_interval=0.01, quota_planner=planner
+    )
+
+    async def refresh():
+        raise AssertionError("daily share spent, must not run")
+
+    revalidator.start()
+    revalidator.submit("A", refresh)
+    await asyncio.sleep(0.03)
+    assert await revalidator.stop() == 1
+    # Background refreshes do not mark the foreground budget as spent
+    assert not planner.exhausted
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_revalidator_commits_budget_while_refreshing():
+    throttle = ThrottleManager(default_limit=RateLimit(calls=10, window_seconds=60))
+    await throttle.update_quota({"requeststoday": 90, "maxrequestsperday": 100})
+    planner = QuotaPlanner(throttle, reserve=5)
+    revalidator = CacheRevalidator(
+        throttle, "jeuInfos.php", poll_interval=0.01, quota_planner=planner
+    )
+    remaining_during_refresh = []
+
+    async def refresh():
+        remaining_during_refresh.append(planner.remaining())
+
+    revalidator.start()
+    revalidator.submit("A", refresh)
+    for _ in range(100):
+        if revalidator.refreshed:
+            break
+        await asyncio.sleep(0.01)
+    await revalidator.stop()
+
+    assert remaining_during_refresh == [4]
+    assert planner.remaining() == 5
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_revalidator_keeps_refresh_queued_when_not_admitted():
+    throttle = ThrottleManager(default_limit=RateLimit(calls=10, window_seconds=60))
+    await throttle.update_quota({"requeststoday": 10, "maxrequestsperday": 100})
+    planner = QuotaPlanner(throttle)
+    planner.admit = lambda calls: False
+    settled = []
+    planner.settle = settled.append
+    revalidator = CacheRevalidator(
+        throttle, "jeuInfos.php", poll_interval=0.01, quota_planner=planner
+    )
+
+    async def refresh():
+        raise AssertionError("not admitted, must not run")
+
+    revalidator.start()
+    revalidator.submit("A", refresh)
+    await asyncio.sleep(0.03)
+    assert revalidator.pending == 1
+    assert await revalidator.stop() == 1
+    assert settled == []
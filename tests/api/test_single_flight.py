@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+
+from curateur.api.single_flight import SingleFlight
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_call():
+    flight = SingleFlight(copy_result=list)
+    release = asyncio.Event()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await release.wait()
+        return ["result"]
+
+    tasks = [asyncio.create_task(flight.run("key", fetch)) for _ in range(3)]
+    await asyncio.sleep(0)
+    assert flight.in_flight == 1
+
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert calls == [1]
+    assert results == [["result"]] * 3
+    assert results[1] is not results[0]
+    assert flight.get_stats() == {"started": 1, "coalesced": 2, "in_flight": 0}
+
+    # Completed calls are not remembered
+    assert await flight.run("key", fetch) == ["result"]
+    assert calls == [1, 1]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_exception_reaches_every_caller():
+    flight = SingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0)
+        raise ValueError("not found")
+
+    results = await asyncio.gather(
+        flight.run("key", fetch), flight.run("key", fetch), return_exceptions=True
+    )
+
+    assert [type(r) for r in results] == [ValueError, ValueError]
+    assert flight.started == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_the_others():
+    flight = SingleFlight()
+    release = asyncio.Event()
+    cancelled = []
+
+    async def fetch():
+        try:
+            await release.wait()
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+        return 42
+
+    first = asyncio.create_task(flight.run("key", fetch))
+    second = asyncio.create_task(flight.run("key", fetch))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await second == 42
+    assert first.cancelled()
+    assert cancelled == []
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_call_is_cancelled_when_every_caller_leaves():
+    flight = SingleFlight()
+    cancelled = asyncio.Event()
+
+    async def fetch():
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    caller = asyncio.create_task(flight.run("key", fetch))
+    await asyncio.sleep(0)
+    caller.cancel()
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+    assert flight.in_flight == 0
@@ -1,5 +1,4 @@
 import math
-from collections import deque
 
 import pytest
 
@@ -9,7 +8,9 @@ from curateur.api.throttle import RateLimit, ThrottleManager
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_wait_if_needed_records_calls_without_wait():
-    throttle = ThrottleManager(default_limit=RateLimit(calls=2, window_seconds=60))
+    throttle = ThrottleManager(
+        default_limit=RateLimit(calls=2, window_seconds=60, burst=2)
+    )
 
     waited1 = await throttle.wait_if_needed("jeuInfos.php")
     waited2 = await throttle.wait_if_needed("jeuInfos.php")
@@ -17,16 +18,19 @@ async def test_wait_if_needed_records_calls_without_wait():
     assert waited1 == 0
     assert waited2 == 0
     stats = throttle.get_stats("jeuInfos.php")
-    assert stats["recent_calls"] == 2
+    assert stats["calls"] == 2
+    assert stats["tokens"] == pytest.approx(0.0, abs=1e-3)
+    assert stats["next_slot_in"] == pytest.approx(30.0, abs=0.1)
     assert stats["in_backoff"] is False
 
 
 @pytest.mark.unit
-def test_handle_rate_limit_sets_backoff_and_clears_history(monkeypatch):
-    throttle = ThrottleManager(default_limit=RateLimit(calls=5, window_seconds=60))
-
-    # Prime call history
-    throttle.call_history["jeuInfos.php"] = deque([1, 2, 3])  # type: ignore[attr-defined]
+def test_handle_rate_limit_sets_backoff_and_drains_bucket(monkeypatch):
+    now = [100.0]
+    throttle = ThrottleManager(
+        default_limit=RateLimit(calls=60, window_seconds=60, burst=5),
+        clock=lambda: now[0],
+    )
 
     # Deterministic jitter
     monkeypatch.setattr("random.uniform", lambda a, b: 1.0)
@@ -36,8 +40,30 @@ def test_handle_rate_limit_sets_backoff_and_clears_history(monkeypatch):
     assert stats["in_backoff"] is True
     # With jitter=1 and first 429, multiplier should be 1.0
     assert math.isclose(stats["backoff_multiplier"], 1.0)
-    # Call history cleared when adaptive
-    assert throttle.call_history["jeuInfos.php"] == deque()  # type: ignore[attr-defined]
+    # Nothing is admitted before the backoff ends
+    assert stats["next_slot_in"] == pytest.approx(10.0)
+
+    # Afterwards calls resume one at a time, not as a burst
+    now[0] += 10
+    limiter = throttle.limiters["jeuInfos.php"]
+    assert limiter.try_acquire() is True
+    assert limiter.try_acquire() is False
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_media_limit_paces_media_downloads():
+    throttle = ThrottleManager(
+        default_limit=RateLimit(calls=10, window_seconds=60),
+        media_limit=RateLimit(calls=6000, window_seconds=60),
+    )
+
+    assert await throttle.wait_for_media() == 0
+    assert await throttle.wait_for_media() == pytest.approx(0.01, abs=2e-3)
+    assert throttle.get_stats("jeuInfos.php")["calls"] == 0
+
+    unlimited = ThrottleManager(default_limit=RateLimit(calls=10, window_seconds=60))
+    assert await unlimited.wait_for_media() == 0
 
 
 @pytest.mark.unit
@@ -45,11 +71,61 @@ def test_update_concurrency_limit_rescales_media_semaphore():
     throttle = ThrottleManager(
         default_limit=RateLimit(calls=10, window_seconds=60), max_concurrent=2
     )
-    assert throttle.concurrency_semaphore._value == 2  # type: ignore[attr-defined]
+    assert throttle.concurrency_semaphore.limit == 2
     # Default media semaphore starts at 20
-    assert throttle.media_download_semaphore._value == 20  # type: ignore[attr-defined]
+    assert throttle.media_download_semaphore.limit == 20
 
     throttle.update_concurrency_limit(5)
 
-    assert throttle.concurrency_semaphore._value == 5  # type: ignore[attr-defined]
-    assert throttle.media_download_semaphore._value == 25  # type: ignore[attr-defined]
+    assert throttle.concurrency_semaphore.limit == 5
+    assert throttle.media_download_semaphore.limit == 25
+
+
+@pytest.mark.unit
+def test_configured_media_ceiling_survives_api_limit_update():
+    throttle = ThrottleManager(
+        default_limit=RateLimit(calls=10, window_seconds=60),
+        max_concurrent=2,
+        max_media_downloads=4,
+    )
+
+    throttle.update_concurrency_limit(5)
+
+    assert throttle.media_download_semaphore.ceiling == 4
+
+
+@pytest.mark.unit
+def test_rate_limit_and_timeouts_lower_api_concurrency():
+    throttle = ThrottleManager(
+        default_limit=RateLimit(calls=10, window_seconds=60), max_concurrent=8
+    )
+
+    throttle.handle_rate_limit("jeuInfos.php", retry_after=1)
+    assert throttle.concurrency_semaphore.limit == 4
+
+    fixed = ThrottleManager(
+        default_limit=RateLimit(calls=10, window_seconds=60),
+        max_concurrent=8,
+        adaptive_concurrency=False,
+    )
+    fixed.record_api_overload("timeout")
+    assert fixed.concurrency_semaphore.limit == 8
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_has_idle_capacity_respects_slots_rate_and_quota():
+    throttle = ThrottleManager(
+        default_limit=RateLimit(calls=1, window_seconds=60), max_concurrent=1
+    )
+    assert throttle.has_idle_capacity("jeuInfos.php")
+
+    async with throttle.concurrency_semaphore:
+        assert not throttle.has_idle_capacity("jeuInfos.php")
+
+    await throttle.update_quota({"requeststoday": 96, "maxrequestsperday": 100})
+    assert throttle.has_idle_capacity("jeuInfos.php", quota_threshold=0.97)
+    assert not throttle.has_idle_capacity("jeuInfos.php", quota_threshold=0.95)
+
+    await throttle.wait_if_needed("jeuInfos.php")
+    assert not throttle.has_idle_capacity("jeuInfos.php", quota_threshold=0.97)
@@ -69,14 +69,43 @@ def test_validate_config_collects_errors(tmp_path):
     cfg = _base_config(str(tmp_path / "missing.xml"))
     cfg["screenscraper"]["user_id"] = ""
     cfg["scraping"]["gamelist_integrity_threshold"] = "bad"
+    cfg["scraping"]["system_priority"] = "snes"
     cfg["media"]["media_types"] = "covers"
+    cfg["media"]["store_dir"] = 7
+    cfg["media"]["store_link_mode"] = "symlink"
     cfg["api"]["max_retries"] = "a lot"
     cfg["api"]["quota_warning_threshold"] = 2
+    cfg["api"]["rate_limit_burst"] = 0
+    cfg["api"]["media_requests_per_minute"] = "fast"
+    cfg["api"]["adaptive_concurrency"] = "yes"
+    cfg["api"]["max_concurrent_downloads"] = 0
+    cfg["api"]["quota_reserve"] = -1
+    cfg["api"]["daily_quota_fraction"] = 0
     cfg["search"]["confidence_threshold"] = 2
     cfg["runtime"]["hash_algorithm"] = "xxhash"
     cfg["runtime"]["crc_size_limit"] = -1
     cfg["runtime"]["rate_limit_override_enabled"] = "yes"
     cfg["runtime"]["rate_limit_override"] = {"max_workers": 11}
+    cfg["runtime"]["enable_hash_index"] = "yes"
+    cfg["runtime"]["rom_digests"] = ["crc32", "sha256"]
+    cfg["runtime"]["hash_backend"] = "gpu"
+    cfg["runtime"]["hash_workers"] = -1
+    cfg["runtime"]["hash_read_mode"] = "read"
+    cfg["runtime"]["zip_member_crc"] = 1
+    cfg["runtime"]["fingerprint_large_roms"] = "yes"
+    cfg["runtime"]["incremental_scan"] = "on"
+    cfg["runtime"]["watch_debounce_seconds"] = 0
+    cfg["runtime"]["cache_flush_entries"] = 0
+    cfg["runtime"]["cache_flush_interval"] = "10s"
+    cfg["runtime"]["global_cache_dir"] = 42
+    cfg["runtime"]["cache_resident_entries"] = -5
+    cfg["runtime"]["cache_ttl_days"] = 0
+    cfg["runtime"]["cache_ttl_overrides"] = {"arcade": "long"}
+    cfg["runtime"]["stale_while_revalidate_days"] = -1
+    cfg["runtime"]["negative_cache_ttl_days"] = -1
+    cfg["runtime"]["negative_cache_max_ttl_days"] = 0
+    cfg["runtime"]["hash_hdd_readers"] = "two"
+    cfg["runtime"]["hash_drop_page_cache"] = "yes"
     cfg["logging"]["file"] = 123
 
     with pytest.raises(ValidationError) as exc:
@@ -90,11 +119,40 @@ def test_validate_config_collects_errors(tmp_path):
         or "must be a number" in msg
     )
     assert "media.media_types must be a list" in msg
+    assert "media.store_dir must be a string path or null" in msg
+    assert "media.store_link_mode must be one of: hardlink, reflink, copy" in msg
     assert "api.max_retries must be an integer" in msg
     assert "api.quota_warning_threshold must be between 0.0 and 1.0" in msg
+    assert "api.rate_limit_burst must be a positive integer" in msg
+    assert "api.media_requests_per_minute must be a positive integer or null" in msg
+    assert "api.adaptive_concurrency must be a boolean" in msg
+    assert "api.max_concurrent_downloads must be a positive integer or null" in msg
+    assert "scraping.system_priority must be a list" in msg
+    assert "api.quota_reserve must be a non-negative integer" in msg
+    assert "api.daily_quota_fraction must be a number above 0.0" in msg
     assert "search.confidence_threshold must be between 0.0 and 1.0" in msg
     assert "runtime.hash_algorithm must be one of" in msg
     assert "runtime.crc_size_limit must be a non-negative integer" in msg
     assert "runtime.rate_limit_override_enabled must be a boolean" in msg
     assert "runtime.rate_limit_override.max_workers must be between 1 and 10" in msg
+    assert "runtime.enable_hash_index must be a boolean" in msg
+    assert "runtime.rom_digests must be a list containing only" in msg
+    assert "runtime.hash_backend must be one of: thread, process" in msg
+    assert "runtime.hash_workers must be a non-negative integer" in msg
+    assert "runtime.hash_read_mode must be one of: readinto, mmap" in msg
+    assert "runtime.zip_member_crc must be a boolean" in msg
+    assert "runtime.fingerprint_large_roms must be a boolean" in msg
+    assert "runtime.incremental_scan must be a boolean" in msg
+    assert "runtime.watch_debounce_seconds must be a positive number" in msg
+    assert "runtime.cache_flush_entries must be a positive integer" in msg
+    assert "runtime.cache_flush_interval must be a non-negative number" in msg
+    assert "runtime.global_cache_dir must be a string path or null" in msg
+    assert "runtime.cache_resident_entries must be a non-negative integer" in msg
+    assert "runtime.cache_ttl_days must be a positive integer" in msg
+    assert "runtime.cache_ttl_overrides.arcade must be a positive integer" in msg
+    assert "runtime.stale_while_revalidate_days must be a non-negative number" in msg
+    assert "runtime.negative_cache_ttl_days must be a non-negative number" in msg
+    assert "runtime.negative_cache_max_ttl_days must be a positive number" in msg
+    assert "runtime.hash_hdd_readers must be a non-negative integer" in msg
+    assert "runtime.hash_drop_page_cache must be a boolean" in msg
     assert "logging.file must be a string path or null" in msg
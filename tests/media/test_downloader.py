@@ -67,6 +67,27 @@ async def test_image_downloader_downloads_and_validates(tmp_path):
     assert client.calls == 1
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_image_downloader_hashes_downloaded_bytes(tmp_path):
+    import hashlib
+    import zlib
+
+    png_bytes = _make_png_bytes()
+    downloader = ImageDownloader(client=DummyClient(png_bytes))
+    digests = {"sha1": None, "crc": None}
+
+    ok, _ = await downloader.download(
+        "http://example/image.png", tmp_path / "image.png", digests=digests
+    )
+
+    assert ok is True
+    assert digests == {
+        "sha1": hashlib.sha1(png_bytes).hexdigest(),
+        "crc": f"{zlib.crc32(png_bytes):08x}",
+    }
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_image_downloader_rejects_small_images(tmp_path):
@@ -105,8 +126,12 @@ async def test_image_downloader_rejects_bad_content_type(tmp_path):
 async def test_image_downloader_retries_on_timeout(tmp_path):
     png_bytes = _make_png_bytes()
     client = FailingClient(png_bytes, errors_before_success=1)
+    overloads = []
     downloader = ImageDownloader(
-        client=client, validation_mode="disabled", max_retries=2
+        client=client,
+        validation_mode="disabled",
+        max_retries=2,
+        overload_callback=overloads.append,
     )
 
     out = tmp_path / "retry.png"
@@ -114,3 +139,4 @@ async def test_image_downloader_retries_on_timeout(tmp_path):
 
     assert ok is True
     assert client.calls >= 1
+    assert overloads == ["timeout"]
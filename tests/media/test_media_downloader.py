@@ -4,6 +4,7 @@ from types import SimpleNamespace
 import pytest
 
 from curateur.media.media_downloader import DownloadResult, MediaDownloader
+from curateur.media.media_store import MediaStore
 
 
 class DummyDownloader:
@@ -11,7 +12,7 @@ class DummyDownloader:
         self.success = success
         self.calls = []
 
-    async def download(self, url, output_path, validate=True):
+    async def download(self, url, output_path, validate=True, digests=None):
         self.calls.append((url, output_path, validate))
         if self.success:
             output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -212,3 +213,34 @@ def test_check_existing_media(tmp_path):
     existing = downloader.check_existing_media("nes", "Game")
     assert existing["box-2D"] is True
     assert existing["ss"] is False
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_media_downloader_reuses_stored_media(tmp_path):
+    media = {"url": "http://example/cover", "format": "jpg", "md5": "ABC123"}
+    dummy_selector = SimpleNamespace(
+        enabled_media_types=["box-2D"],
+        select_media_urls=lambda media_list, rom_filename: {"box-2D": media},
+    )
+    store = MediaStore(tmp_path / "store")
+    blob = store.blob_path(store.api_key(media), "jpg")
+    blob.parent.mkdir(parents=True)
+    blob.write_text("stored")
+
+    downloader = MediaDownloader(
+        media_root=tmp_path / "media",
+        client=None,
+        enabled_media_types=["box-2D"],
+        media_store=store,
+    )
+    downloader.url_selector = dummy_selector
+    dummy = DummyDownloader(success=True)
+    downloader.downloader = dummy
+
+    results, _ = await downloader.download_media_for_game([], "Game.nes", "nes")
+
+    assert results[0].success
+    assert results[0].file_path.read_text() == "stored"
+    assert dummy.calls == []
+    assert store.reused == 1
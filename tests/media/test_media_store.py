@@ -0,0 +1,95 @@
+import hashlib
+import os
+
+import pytest
+
+from curateur.media.media_store import MediaStore, file_digest
+
+
+def _sha1(data: bytes) -> str:
+    return hashlib.sha1(data).hexdigest()
+
+
+@pytest.mark.unit
+def test_add_then_materialize_hardlinks_identical_media(tmp_path):
+    store = MediaStore(tmp_path / "store")
+    first = tmp_path / "media" / "nes" / "covers" / "Game (USA).png"
+    first.parent.mkdir(parents=True)
+    first.write_bytes(b"box art")
+    info = {"url": "u", "format": "png", "sha1": _sha1(b"box art").upper()}
+
+    key = store.add(first, "png", info)
+    assert key == f"sha1/{_sha1(b'box art')}"
+
+    second = tmp_path / "media" / "nes" / "covers" / "Game (Europe).png"
+    assert store.materialize(store.api_key(info), "png", second) is True
+    assert second.read_bytes() == b"box art"
+    assert os.stat(second).st_ino == os.stat(first).st_ino
+    assert store.get_stats() == {"reused": 1, "stored": 1, "bytes_saved": 7}
+
+
+@pytest.mark.unit
+def test_materialize_misses_unknown_key(tmp_path):
+    store = MediaStore(tmp_path / "store")
+    assert store.materialize("md5/abcd", "jpg", tmp_path / "out.jpg") is False
+    assert not (tmp_path / "out.jpg").exists()
+
+
+@pytest.mark.unit
+def test_add_uses_own_digest_when_api_hash_does_not_match(tmp_path):
+    store = MediaStore(tmp_path / "store", link_mode="copy")
+    path = tmp_path / "shot.png"
+    path.write_bytes(b"actual bytes")
+
+    key = store.add(path, "png", {"crc": "deadbeef"})
+
+    assert key == f"sha1/{_sha1(b'actual bytes')}"
+    blob = store.blob_path(key, "png")
+    assert blob.read_bytes() == b"actual bytes"
+    assert os.stat(blob).st_ino != os.stat(path).st_ino
+
+
+@pytest.mark.unit
+def test_add_links_duplicate_download_to_stored_copy(tmp_path):
+    store = MediaStore(tmp_path / "store")
+    first = tmp_path / "a.mp4"
+    second = tmp_path / "b.mp4"
+    first.write_bytes(b"video")
+    second.write_bytes(b"video")
+
+    assert store.add(first, "mp4") == store.add(second, "mp4")
+
+    assert os.stat(first).st_ino == os.stat(second).st_ino
+    assert store.stored == 1
+    assert store.bytes_saved == 5
+
+
+@pytest.mark.unit
+def test_add_uses_digests_calculated_while_downloading(tmp_path, monkeypatch):
+    store = MediaStore(tmp_path / "store")
+    path = tmp_path / "cover.png"
+    path.write_bytes(b"box art")
+    digests = {"md5": "abc123", "sha1": _sha1(b"box art")}
+
+    def no_reread(*args, **kwargs):
+        raise AssertionError("file must not be read back to hash it")
+
+    monkeypatch.setattr("curateur.media.media_store.file_digest", no_reread)
+
+    assert store.add(path, "png", {"md5": "ABC123"}, digests) == "md5/abc123"
+    assert store.add(path, "png", {"md5": "FFFF"}, digests) == (
+        f"sha1/{_sha1(b'box art')}"
+    )
+
+
+@pytest.mark.unit
+def test_file_digest_crc_matches_screenscraper_format(tmp_path):
+    path = tmp_path / "f"
+    path.write_bytes(b"123456789")
+    assert file_digest(path, "crc") == "cbf43926"
+
+
+@pytest.mark.unit
+def test_media_store_rejects_unknown_link_mode(tmp_path):
+    with pytest.raises(ValueError):
+        MediaStore(tmp_path, link_mode="symlink")
@@ -0,0 +1,86 @@
+import os
+import time
+
+import pytest
+
+from curateur.scanner.dir_snapshot import (
+    DirectorySnapshot,
+    capture_directory,
+    settings_digest,
+)
+
+
+def _populate(rom_dir):
+    rom_dir.mkdir()
+    (rom_dir / "Alpha.nes").write_bytes(b"alpha")
+    (rom_dir / "Game (Disc 1).cue").mkdir()
+    (rom_dir / "Game (Disc 1).cue" / "Game (Disc 1).cue").write_text("FILE")
+
+
+@pytest.mark.unit
+def test_capture_directory_detects_changes(tmp_path):
+    rom_dir = tmp_path / "nes"
+    _populate(rom_dir)
+
+    state = capture_directory(rom_dir)
+    assert state["entry_count"] == 3
+    assert capture_directory(rom_dir) == state
+
+    # Same size, different mtime
+    rom = rom_dir / "Alpha.nes"
+    stat_result = rom.stat()
+    os.utime(rom, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 10**9))
+    assert capture_directory(rom_dir)["digest"] != state["digest"]
+
+    # A disc image rewritten in place leaves its directory's mtime alone
+    state = capture_directory(rom_dir)
+    cue = rom_dir / "Game (Disc 1).cue" / "Game (Disc 1).cue"
+    disc_dir_mtime = cue.parent.stat().st_mtime_ns
+    stat_result = cue.stat()
+    cue.write_text("TRACK")
+    os.utime(cue, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 10**9))
+    assert cue.parent.stat().st_mtime_ns == disc_dir_mtime
+    assert capture_directory(rom_dir)["digest"] != state["digest"]
+
+    assert capture_directory(tmp_path / "missing") is None
+
+
+@pytest.mark.unit
+def test_snapshot_roundtrip_and_invalidation(tmp_path):
+    rom_dir = tmp_path / "nes"
+    _populate(rom_dir)
+    gamelist = tmp_path / "gamelist.xml"
+    gamelist.write_text("<gameList/>")
+    snapshot = DirectorySnapshot(tmp_path / ".cache")
+    settings = settings_digest({"scrape_mode": "changed"})
+    state = capture_directory(rom_dir)
+
+    assert snapshot.unchanged_rom_count(state, gamelist, settings, 3600) is None
+
+    snapshot.save(state, gamelist, settings, rom_count=2)
+    assert snapshot.unchanged_rom_count(state, gamelist, settings, 3600) == 2
+
+    # Settings, gamelist and age each invalidate the snapshot
+    other = settings_digest({"scrape_mode": "force"})
+    assert snapshot.unchanged_rom_count(state, gamelist, other, 3600) is None
+    assert snapshot.unchanged_rom_count(state, gamelist, settings, -1) is None
+
+    gamelist.write_text("<gameList><game/></gameList>")
+    assert snapshot.unchanged_rom_count(state, gamelist, settings, 3600) is None
+    # The ROM count only depends on the directory
+    assert snapshot.recorded_rom_count(state) == 2
+    (rom_dir / "Beta.nes").write_bytes(b"beta")
+    assert snapshot.recorded_rom_count(capture_directory(rom_dir)) is None
+
+
+@pytest.mark.unit
+def test_snapshot_disabled_is_inert(tmp_path):
+    rom_dir = tmp_path / "nes"
+    _populate(rom_dir)
+    gamelist = tmp_path / "gamelist.xml"
+    snapshot = DirectorySnapshot(tmp_path / ".cache", enabled=False)
+    state = capture_directory(rom_dir)
+
+    snapshot.save(state, gamelist, "s", rom_count=1)
+    assert not snapshot.snapshot_file.exists()
+    assert snapshot.unchanged_rom_count(state, gamelist, "s", time.time()) is None
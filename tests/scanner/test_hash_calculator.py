@@ -1,6 +1,17 @@
+import hashlib
+import os
+import zlib
+
 import pytest
 
-from curateur.scanner.hash_calculator import calculate_hash, format_file_size
+from curateur.scanner.hash_calculator import (
+    CHUNK_SIZE,
+    HashingBackend,
+    calculate_fingerprint,
+    calculate_hash,
+    calculate_hashes,
+    format_file_size,
+)
 
 
 @pytest.mark.unit
@@ -27,6 +38,117 @@ def test_calculate_hash_supports_md5_and_sha1(tmp_path):
     assert len(sha1) == 40
 
 
+@pytest.mark.unit
+def test_calculate_hashes_single_pass_matches_reference(tmp_path):
+    data = b"curateur" * 1000
+    rom = tmp_path / "file.bin"
+    rom.write_bytes(data)
+
+    hashes = calculate_hashes(rom, size_limit=0)
+
+    assert hashes == {
+        "crc32": f"{zlib.crc32(data) & 0xFFFFFFFF:08X}",
+        "md5": hashlib.md5(data).hexdigest().upper(),
+        "sha1": hashlib.sha1(data).hexdigest().upper(),
+    }
+    assert calculate_hash(rom, algorithm="sha1", size_limit=0) == hashes["sha1"]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("read_mode", ["readinto", "mmap"])
+def test_calculate_hashes_read_modes_match(tmp_path, read_mode):
+    # Span more than one chunk so buffer reuse is exercised
+    data = bytes(range(256)) * (CHUNK_SIZE // 256 + 7)
+    rom = tmp_path / "file.bin"
+    rom.write_bytes(data)
+    empty = tmp_path / "empty.bin"
+    empty.write_bytes(b"")
+
+    hashes = calculate_hashes(rom, size_limit=0, read_mode=read_mode)
+
+    assert hashes["sha1"] == hashlib.sha1(data).hexdigest().upper()
+    assert calculate_hashes(empty, size_limit=0, read_mode=read_mode) == (
+        calculate_hashes(empty, size_limit=0)
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not hasattr(os, "posix_fadvise"), reason="POSIX only")
+def test_calculate_hashes_drop_page_cache_advises_kernel(tmp_path, monkeypatch):
+    data = b"x" * (CHUNK_SIZE + 10)
+    rom = tmp_path / "file.bin"
+    rom.write_bytes(data)
+
+    calls = []
+    monkeypatch.setattr(
+        os,
+        "posix_fadvise",
+        lambda fd, offset, length, advice: calls.append((offset, length, advice)),
+    )
+
+    hashes = calculate_hashes(rom, size_limit=0, drop_page_cache=True)
+
+    assert hashes["sha1"] == hashlib.sha1(data).hexdigest().upper()
+    assert calls == [
+        (0, 0, os.POSIX_FADV_SEQUENTIAL),
+        (0, CHUNK_SIZE, os.POSIX_FADV_DONTNEED),
+        (CHUNK_SIZE, 10, os.POSIX_FADV_DONTNEED),
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode", ["thread", "process"])
+async def test_hashing_backend_matches_direct_hashing(tmp_path, mode):
+    rom = tmp_path / "file.bin"
+    rom.write_bytes(b"backend" * 100)
+
+    backend = HashingBackend(mode=mode, workers=1)
+    try:
+        result = await backend.calculate_hashes(rom, size_limit=0)
+    finally:
+        backend.shutdown()
+
+    assert result == calculate_hashes(rom, size_limit=0)
+
+
+@pytest.mark.unit
+def test_calculate_hashes_rejects_unknown_algorithm(tmp_path):
+    rom = tmp_path / "file.bin"
+    rom.write_bytes(b"data")
+
+    with pytest.raises(ValueError):
+        calculate_hashes(rom, algorithms=("crc32", "sha256"))
+
+
+@pytest.mark.unit
+def test_calculate_fingerprint_samples_head_middle_and_tail(tmp_path):
+    sample = 1024
+    data = bytearray(os.urandom(sample * 8))
+    rom = tmp_path / "disc.iso"
+    rom.write_bytes(data)
+
+    fingerprint = calculate_fingerprint(rom, sample_size=sample)
+    assert fingerprint.startswith("FP-")
+    assert fingerprint == calculate_fingerprint(rom, sample_size=sample)
+
+    # Bytes between the sampled blocks do not affect the fingerprint
+    data[sample + 10] ^= 0xFF
+    rom.write_bytes(data)
+    assert calculate_fingerprint(rom, sample_size=sample) == fingerprint
+
+    # Head, middle and tail changes do
+    for offset in (0, len(data) // 2, len(data) - 1):
+        changed = bytearray(data)
+        changed[offset] ^= 0xFF
+        rom.write_bytes(changed)
+        assert calculate_fingerprint(rom, sample_size=sample) != fingerprint
+
+    # As does the size, even when every sampled byte is unchanged
+    rom.write_bytes(bytes(data) + b"\x00")
+    assert calculate_fingerprint(rom, sample_size=sample) != fingerprint
+
+
 @pytest.mark.unit
 @pytest.mark.parametrize(
     "size,expected",
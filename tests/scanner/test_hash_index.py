@@ -0,0 +1,89 @@
+import os
+
+import pytest
+
+from curateur.scanner.hash_index import HashIndex
+
+
+@pytest.mark.unit
+def test_hash_index_round_trip(tmp_path):
+    rom = tmp_path / "Game.nes"
+    rom.write_bytes(b"data")
+    cache_dir = tmp_path / ".cache"
+
+    index = HashIndex(cache_dir)
+    assert index.lookup(rom) is None
+    index.record(rom, {"crc32": "ABCD1234"})
+    index.save()
+
+    reloaded = HashIndex(cache_dir)
+    assert reloaded.lookup(rom) == {"crc32": "ABCD1234"}
+    assert reloaded.get_stats()["hits"] == 1
+
+
+@pytest.mark.unit
+def test_hash_index_detects_modified_file(tmp_path):
+    rom = tmp_path / "Game.nes"
+    rom.write_bytes(b"data")
+
+    index = HashIndex(tmp_path / ".cache")
+    index.record(rom, {"crc32": "ABCD1234"})
+
+    stat = rom.stat()
+    os.utime(rom, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert index.lookup(rom) is None
+
+    rom.write_bytes(b"longer data")
+    assert index.lookup(rom) is None
+
+
+@pytest.mark.unit
+def test_hash_index_requires_all_configured_digests(tmp_path):
+    rom = tmp_path / "Game.nes"
+    rom.write_bytes(b"data")
+    cache_dir = tmp_path / ".cache"
+
+    index = HashIndex(cache_dir, algorithm="crc32")
+    index.record(rom, {"crc32": "ABCD1234"})
+    index.save()
+
+    assert HashIndex(cache_dir, algorithm="md5").lookup(rom) is None
+    assert HashIndex(cache_dir, digests=("sha1",)).lookup(rom) is None
+    assert HashIndex(cache_dir, algorithm="crc32").lookup(rom) == {"crc32": "ABCD1234"}
+
+
+@pytest.mark.unit
+def test_hash_index_prunes_unseen_entries(tmp_path):
+    kept = tmp_path / "Kept.nes"
+    gone = tmp_path / "Gone.nes"
+    kept.write_bytes(b"kept")
+    gone.write_bytes(b"gone")
+    cache_dir = tmp_path / ".cache"
+
+    index = HashIndex(cache_dir)
+    index.record(kept, {"crc32": "11111111"})
+    index.record(gone, {"crc32": "22222222"})
+    index.save()
+
+    gone.unlink()
+    session = HashIndex(cache_dir)
+    session.lookup(kept)
+    session.save()
+
+    final = HashIndex(cache_dir)
+    assert final.lookup(kept) == {"crc32": "11111111"}
+    assert final.get_stats()["total_entries"] == 1
+
+
+@pytest.mark.unit
+def test_hash_index_disabled_never_writes(tmp_path):
+    rom = tmp_path / "Game.nes"
+    rom.write_bytes(b"data")
+    cache_dir = tmp_path / ".cache"
+
+    index = HashIndex(cache_dir, enabled=False)
+    index.record(rom, {"crc32": "ABCD1234"})
+    index.save()
+
+    assert index.lookup(rom) is None
+    assert not (cache_dir / "hash_index.json").exists()
@@ -0,0 +1,43 @@
+import os
+
+import pytest
+
+from curateur.scanner.io_scheduler import UNKNOWN_DEVICE, DeviceIOScheduler
+
+
+def _fake_sysfs(tmp_path, disk: str, rotational: str, device: int):
+    """Build /sys/dev/block/<maj>:<min> -> .../block/<disk>/<disk>1 (a partition)."""
+    disk_dir = tmp_path / "devices" / "block" / disk
+    (disk_dir / "queue").mkdir(parents=True)
+    (disk_dir / "queue" / "rotational").write_text(f"{rotational}\n")
+    partition_dir = disk_dir / f"{disk}1"
+    partition_dir.mkdir()
+
+    dev_block = tmp_path / "dev" / "block"
+    dev_block.mkdir(parents=True, exist_ok=True)
+    (dev_block / f"{os.major(device)}:{os.minor(device)}").symlink_to(partition_dir)
+
+
+@pytest.mark.unit
+def test_rotational_partition_gets_hdd_limit(tmp_path):
+    hdd = os.makedev(8, 1)
+    ssd = os.makedev(259, 1)
+    _fake_sysfs(tmp_path, "sda", "1", hdd)
+    _fake_sysfs(tmp_path, "nvme0n1", "0", ssd)
+
+    scheduler = DeviceIOScheduler(rotational_limit=2, ssd_limit=16, sysfs_root=tmp_path)
+
+    assert scheduler.is_rotational(hdd)
+    assert scheduler.limit_for(hdd) == 2
+    assert scheduler.limit_for(ssd) == 16
+    assert scheduler.describe_limits() == {"sda": 2, "nvme0n1": 16}
+
+
+@pytest.mark.unit
+def test_unknown_device_treated_as_non_rotational(tmp_path):
+    scheduler = DeviceIOScheduler(rotational_limit=1, ssd_limit=4, sysfs_root=tmp_path)
+
+    assert scheduler.device_of(tmp_path / "missing.bin") == UNKNOWN_DEVICE
+    assert scheduler.limit_for(UNKNOWN_DEVICE) == 4
+    assert scheduler.limit_for(os.makedev(0, 42)) == 4
+    assert scheduler.label_for(os.makedev(0, 42)) == "0:42"
@@ -1,9 +1,17 @@
+import zipfile
+import zlib
 from pathlib import Path
 
 import pytest
 
 from curateur.config.es_systems import SystemDefinition
-from curateur.scanner.rom_scanner import _process_entry, scan_system
+from curateur.scanner.hash_index import HashIndex
+from curateur.scanner.rom_scanner import (
+    ExtensionMatcher,
+    ScannerError,
+    _process_entry,
+    scan_system,
+)
 from curateur.scanner.rom_types import ROMType
 
 
@@ -26,6 +34,18 @@ def test_process_entry_skips_non_matching_extensions(tmp_path):
     assert _process_entry(file_path, system, crc_size_limit=1) is None
 
 
+@pytest.mark.unit
+def test_extension_matcher_matches_suffixes():
+    matcher = ExtensionMatcher([".NES", ".p8.png", ".zip"])
+
+    assert matcher.matches("alpha.nes")
+    assert matcher.matches("v1.0 beta.zip")
+    assert matcher.matches("cart.p8.png")
+    assert not matcher.matches("cover.png")
+    assert not matcher.matches("alpha.nes.txt")
+    assert not matcher.matches("nes")
+
+
 @pytest.mark.unit
 def test_process_standard_rom(tmp_path):
     system = _make_system(tmp_path)
@@ -89,3 +109,90 @@ def test_scan_system_filters_conflicts(tmp_path):
     # Conflict logic removes the M3U entry; disc subdir remains
     assert len(roms) == 1
     assert roms[0].rom_type.name == "DISC_SUBDIR"
+
+
+@pytest.mark.unit
+def test_scan_system_uses_hash_index_for_unchanged_files(tmp_path):
+    system_path = tmp_path / "nes"
+    system_path.mkdir()
+    known = system_path / "Known.nes"
+    known.write_bytes(b"known")
+    (system_path / "New.nes").write_bytes(b"new")
+
+    index = HashIndex(tmp_path / ".cache")
+    index.record(known, {"crc32": "CAFEBABE", "md5": "D41D8CD9"})
+
+    system = SystemDefinition(
+        name="nes",
+        fullname="NES",
+        path=str(system_path),
+        extensions=[".nes"],
+        platform="nes",
+    )
+    roms = {r.filename: r for r in scan_system(system, tmp_path, hash_index=index)}
+
+    assert roms["Known.nes"].hash_value == "CAFEBABE"
+    assert roms["Known.nes"].md5 == "D41D8CD9"
+    assert roms["New.nes"].hash_value is None
+
+
+@pytest.mark.unit
+def test_scan_system_reads_crc_from_single_member_zip(tmp_path):
+    system_path = tmp_path / "nes"
+    system_path.mkdir()
+    rom_data = b"NES\x1a" + b"\x00" * 1000
+    with zipfile.ZipFile(system_path / "Single.zip", "w", zipfile.ZIP_DEFLATED) as z:
+        z.writestr("Single.nes", rom_data)
+    with zipfile.ZipFile(system_path / "Multi.zip", "w") as z:
+        z.writestr("a.nes", b"a")
+        z.writestr("b.nes", b"b")
+
+    system = SystemDefinition(
+        name="nes",
+        fullname="NES",
+        path=str(system_path),
+        extensions=[".zip"],
+        platform="nes",
+    )
+    roms = {r.filename: r for r in scan_system(system, tmp_path, zip_member_crc=True)}
+
+    assert roms["Single.zip"].hash_value == f"{zlib.crc32(rom_data):08X}"
+    assert roms["Single.zip"].file_size == len(rom_data)
+    assert roms["Multi.zip"].hash_value is None
+
+    container = {r.filename: r for r in scan_system(system, tmp_path)}
+    assert container["Single.zip"].hash_value is None
+
+
+@pytest.mark.unit
+def test_scan_system_reuses_directory_entry_stat(tmp_path, monkeypatch):
+    system = _make_system(tmp_path)
+    (tmp_path / "Alpha.nes").write_bytes(b"alpha")
+    (tmp_path / "Beta.nes").write_bytes(b"beta")
+    (tmp_path / "notes.txt").write_text("ignore")
+
+    stat_calls = []
+    original_stat = Path.stat
+
+    def counting_stat(self, *args, **kwargs):
+        stat_calls.append(self.name)
+        return original_stat(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "stat", counting_stat)
+    roms = {r.filename: r for r in scan_system(system, tmp_path)}
+
+    assert set(roms) == {"Alpha.nes", "Beta.nes"}
+    assert roms["Alpha.nes"].file_size == 5
+    # ROM sizes come from the cached DirEntry stat, not a second stat() call
+    assert not {"Alpha.nes", "Beta.nes"} & set(stat_calls)
+
+
+@pytest.mark.unit
+def test_scan_system_missing_and_non_directory_paths(tmp_path):
+    missing = _make_system(tmp_path / "missing")
+    assert scan_system(missing, tmp_path) == []
+
+    not_dir = tmp_path / "file.nes"
+    not_dir.write_bytes(b"x")
+    with pytest.raises(ScannerError):
+        scan_system(_make_system(not_dir), tmp_path)
@@ -0,0 +1,95 @@
+import sys
+
+import pytest
+
+from curateur.config.es_systems import SystemDefinition
+from curateur.scanner.watcher import InotifyWatcher
+
+pytestmark = pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="inotify is Linux-only"
+)
+
+
+def _system(name, rom_dir):
+    return SystemDefinition(
+        name=name,
+        fullname=name.upper(),
+        path=str(rom_dir),
+        extensions=[".nes", ".cue"],
+        platform=name,
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_watcher_reports_changed_systems_after_debounce(tmp_path):
+    nes_dir = tmp_path / "nes"
+    snes_dir = tmp_path / "snes"
+    nes_dir.mkdir()
+    snes_dir.mkdir()
+
+    watcher = InotifyWatcher(debounce_seconds=0.1)
+    try:
+        assert watcher.watch_systems(
+            [_system("nes", nes_dir), _system("snes", snes_dir)], tmp_path
+        )
+        assert await watcher.changed_systems(timeout=0.1) == []
+
+        # A burst of copies into one system is reported once
+        for i in range(3):
+            (nes_dir / f"Game {i}.nes").write_bytes(b"rom")
+        (nes_dir / ".Game 3.nes.part").write_bytes(b"partial")
+
+        changed = await watcher.changed_systems(timeout=5)
+        assert [system.name for system in changed] == ["nes"]
+
+        # Hidden temp files alone are ignored
+        (snes_dir / ".sync.tmp").write_bytes(b"x")
+        assert await watcher.changed_systems(timeout=0.2) == []
+    finally:
+        watcher.close()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_watcher_follows_new_disc_subdirectories(tmp_path):
+    nes_dir = tmp_path / "nes"
+    nes_dir.mkdir()
+
+    watcher = InotifyWatcher(debounce_seconds=0.1)
+    try:
+        watcher.watch_systems([_system("nes", nes_dir)], tmp_path)
+
+        # An empty new subdirectory is watched but does not trigger a rescrape
+        disc_dir = nes_dir / "Game (Disc 1).cue"
+        disc_dir.mkdir()
+        assert await watcher.changed_systems(timeout=0.3) == []
+
+        # Files landing inside the new subdirectory are seen too
+        (disc_dir / "Game (Disc 1).cue").write_text("FILE")
+        assert [s.name for s in await watcher.changed_systems(timeout=5)] == ["nes"]
+    finally:
+        watcher.close()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_watcher_waits_for_slow_copy_to_finish(tmp_path):
+    nes_dir = tmp_path / "nes"
+    nes_dir.mkdir()
+
+    watcher = InotifyWatcher(debounce_seconds=0.1)
+    try:
+        watcher.watch_systems([_system("nes", nes_dir)], tmp_path)
+
+        with open(nes_dir / "Big Game.nes", "wb") as rom:
+            rom.write(b"first half")
+            rom.flush()
+            # Copy stalls for longer than the debounce: nothing is reported
+            assert await watcher.changed_systems(timeout=0.5) == []
+            rom.write(b"second half")
+
+        # Closing the finished file reports the system
+        assert [s.name for s in await watcher.changed_systems(timeout=5)] == ["nes"]
+    finally:
+        watcher.close()
@@ -31,12 +31,14 @@ def test_create_parser_includes_flags():
             "--search-threshold",
             "0.8",
             "--interactive-search",
+            "--watch",
         ]
     )
     assert args.dry_run is True
     assert args.enable_search is True
     assert args.search_threshold == 0.8
     assert args.interactive_search is True
+    assert args.watch is True
 
 
 def test_main_handles_config_error(monkeypatch):
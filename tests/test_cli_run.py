@@ -1,10 +1,13 @@
 import argparse
+import json
 from pathlib import Path
 
 import pytest
 
 import curateur.cli as cli
+from curateur.api.single_flight import SingleFlight
 from curateur.config.es_systems import SystemDefinition
+from curateur.scanner.hash_calculator import HashingBackend
 from curateur.workflow.orchestrator import SystemResult
 
 
@@ -40,6 +43,7 @@ class DummyAPIClient:
         self.cache = None
         self.client = None
         self.throttle_manager = DummyThrottleManager()
+        self.lookups = SingleFlight()
 
     async def get_user_info(self):
         return {
@@ -70,6 +74,11 @@ class DummyOrchestrator:
     def __init__(self, *args, **kwargs):
         self.args = args
         self.kwargs = kwargs
+        self.hash_backend = HashingBackend()
+        self.caches_flushed = False
+
+    def flush_caches(self):
+        self.caches_flushed = True
 
     async def scrape_system(
         self, system, media_types, preferred_regions, progress_tracker=None
@@ -139,6 +148,84 @@ async def test_run_scraper_happy_path(monkeypatch, tmp_path: Path, capsys):
     assert "curateur v" in out
 
 
+class SpentQuotaAPIClient(DummyAPIClient):
+    async def get_user_info(self):
+        return {
+            "maxthreads": 1,
+            "maxrequestspermin": 60,
+            "requeststoday": 10,
+            "maxrequestsperday": 10,
+        }
+
+
+@pytest.mark.asyncio
+async def test_run_scraper_schedule_waits_for_quota_reset(
+    monkeypatch, tmp_path: Path, capsys
+):
+    roms = tmp_path / "roms"
+    media = tmp_path / "media"
+    gamelists = tmp_path / "gamelists"
+    for d in (roms, media, gamelists):
+        d.mkdir()
+    for name in ("a.nes", "b.nes", "c.nes"):
+        (roms / name).write_bytes(b"rom")
+
+    config = {
+        "logging": {"console": False},
+        "scraping": {
+            "systems": [],
+            "preferred_regions": ["us"],
+            "name_verification": "normal",
+        },
+        "runtime": {"dry_run": True},
+        "paths": {
+            "roms": str(roms),
+            "media": str(media),
+            "gamelists": str(gamelists),
+            "es_systems": str(tmp_path / "es_systems.xml"),
+        },
+        "media": {"media_types": ["covers"]},
+        "api": {"request_timeout": 5, "max_retries": 1},
+        "search": {},
+    }
+    fake_system = SystemDefinition(
+        name="nes",
+        fullname="NES",
+        path=str(roms),
+        extensions=[".nes"],
+        platform="nes",
+    )
+    scraped = []
+
+    class RecordingOrchestrator(DummyOrchestrator):
+        async def scrape_system(self, system, *args, **kwargs):
+            scraped.append(system.name)
+            return await super().scrape_system(system, None, None)
+
+    monkeypatch.setattr(cli, "parse_es_systems", lambda path: [fake_system])
+    monkeypatch.setattr(
+        cli, "ConnectionPoolManager", DummyConnectionPool, raising=False
+    )
+    monkeypatch.setattr(cli, "ScreenScraperClient", SpentQuotaAPIClient)
+    monkeypatch.setattr(cli, "ThreadPoolManager", DummyThreadPool, raising=False)
+    monkeypatch.setattr(cli, "WorkflowOrchestrator", RecordingOrchestrator)
+
+    code = await cli.run_scraper(
+        config, argparse.Namespace(clear_cache=False, schedule=True)
+    )
+    assert code == 0
+
+    # Nothing is scraped once today's quota is spent; the system waits
+    assert scraped == []
+    plan = json.loads((gamelists / "import_schedule.json").read_text())
+    assert plan["systems"]["nes"]["outstanding"] == 3
+    assert plan["daily_budget"] == 10
+
+    out = capsys.readouterr().out
+    assert "Outstanding ROMs: 3" in out
+    assert "Projected completion:" in out
+
+
 @pytest.mark.asyncio
 async def test_run_scraper_parse_error(monkeypatch, tmp_path: Path):
     config = {
@@ -0,0 +1,130 @@
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+import curateur.cli as cli
+from curateur.api.cache import MetadataCache
+from curateur.tools import cache_cli
+
+
+def _config(tmp_path: Path) -> dict:
+    return {
+        "paths": {"gamelists": str(tmp_path / "gamelists")},
+        "runtime": {"global_cache_dir": str(tmp_path / "global")},
+    }
+
+
+def _patch_config(monkeypatch, config):
+    monkeypatch.setattr(cache_cli, "load_config", lambda path=None: config)
+    monkeypatch.setattr(cache_cli, "validate_config", lambda config: None)
+
+
+@pytest.mark.unit
+def test_cache_verify_command_reports_each_cache(monkeypatch, tmp_path, capsys):
+    config = _config(tmp_path)
+    _patch_config(monkeypatch, config)
+
+    nes = MetadataCache(gamelist_directory=tmp_path / "gamelists" / "nes")
+    nes.put("A", {"name": "A"}, rom_size=1)
+    nes.put("B", {"name": "B"}, rom_size=1)
+    nes.flush()
+    nes._writer().execute("UPDATE entries SET response = X'00' WHERE rom_hash = 'B'")
+    nes.close()
+    shared = MetadataCache(
+        gamelist_directory=tmp_path / "global", cache_dir=tmp_path / "global"
+    )
+    shared.put("1:C:1", {"name": "C"}, rom_size=1)
+    shared.close()
+    (tmp_path / "gamelists" / "snes").mkdir()
+
+    code = cli.main(["cache", "verify"])
+
+    out = capsys.readouterr().out
+    assert "nes: ok, 1 entries recovered, 1 dropped" in out
+    assert "global: ok, 1 entries recovered, 0 dropped" in out
+    assert "snes" not in out
+    assert code == 1
+
+
+@pytest.mark.unit
+def test_cache_compact_command_limits_to_systems(monkeypatch, tmp_path, capsys):
+    config = _config(tmp_path)
+    _patch_config(monkeypatch, config)
+
+    for name in ("nes", "snes"):
+        cache = MetadataCache(gamelist_directory=tmp_path / "gamelists" / name)
+        cache.put("A", {"name": "A"}, rom_size=1)
+        cache.close()
+
+    code = cache_cli.main(["compact", "--systems", "snes"])
+
+    out = capsys.readouterr().out
+    assert out.startswith("snes: 0 expired entries removed")
+    assert "nes:" not in out.replace("snes:", "")
+    assert code == 0
+
+
+@pytest.mark.unit
+def test_cache_export_import_round_trip(monkeypatch, tmp_path, capsys):
+    source = _config(tmp_path / "server")
+    nes = MetadataCache(gamelist_directory=tmp_path / "server" / "gamelists" / "nes")
+    nes.put("A", {"name": "A"}, rom_size=1, media_hashes={"screenshot": "H1"})
+    nes.put("B", {"name": "B"}, rom_size=2)
+    nes.close()
+    shared = MetadataCache(
+        gamelist_directory=tmp_path / "server" / "global",
+        cache_dir=tmp_path / "server" / "global",
+    )
+    shared.put("3:C:1", {"name": "C"}, rom_size=1)
+    shared.close()
+
+    bundle = tmp_path / "caches.jsonl.gz"
+    _patch_config(monkeypatch, source)
+    assert cache_cli.main(["export", str(bundle)]) == 0
+    assert "Wrote 3 entries" in capsys.readouterr().out
+
+    target = _config(tmp_path / "handheld")
+    _patch_config(monkeypatch, target)
+    assert cache_cli.main(["import", str(bundle)]) == 0
+    out = capsys.readouterr().out
+    assert "nes: 2 entries imported, 0 skipped" in out
+    assert "global: 1 entries imported, 0 skipped" in out
+
+    imported = MetadataCache(
+        gamelist_directory=tmp_path / "handheld" / "gamelists" / "nes"
+    )
+    entry = imported.get("A", rom_size=1)
+    assert entry["response"] == {"name": "A"}
+    # Media hashes stay with the install whose files they describe
+    assert imported.get_media_hash("A", "screenshot") is None
+    imported.close()
+
+    # Merging the same bundle again changes nothing
+    assert cache_cli.main(["import", str(bundle)]) == 0
+    assert "nes: 0 entries imported, 2 skipped" in capsys.readouterr().out
+
+
+@pytest.mark.unit
+def test_cache_export_without_caches_fails(monkeypatch, tmp_path, capsys):
+    _patch_config(monkeypatch, _config(tmp_path))
+    bundle = tmp_path / "caches.jsonl.gz"
+
+    assert cache_cli.main(["export", str(bundle)]) == 1
+    assert "Nothing to export" in capsys.readouterr().err
+    assert not bundle.exists()
+
+
+@pytest.mark.unit
+def test_cache_import_rejects_unknown_bundle(monkeypatch, tmp_path, capsys):
+    _patch_config(monkeypatch, _config(tmp_path))
+    bundle = tmp_path / "bundle.gz"
+    with gzip.open(bundle, "wt") as f:
+        f.write(json.dumps({"format": cache_cli.BUNDLE_FORMAT, "version": 99}))
+
+    assert cache_cli.main(["import", str(bundle)]) == 1
+    assert "bundle version 99" in capsys.readouterr().err
+
+    bundle.write_text("not gzip")
+    assert cache_cli.main(["import", str(bundle)]) == 1
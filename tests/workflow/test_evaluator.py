@@ -1,5 +1,6 @@
 import pytest
 
+from curateur.api.cache import MetadataCache
 from curateur.config.es_systems import SystemDefinition
 from curateur.gamelist.game_entry import GameEntry
 from curateur.scanner.rom_types import ROMInfo, ROMType
@@ -58,6 +59,25 @@ def test_evaluator_changed_mode_skips_when_hash_matches():
     assert decision.update_metadata is True
 
 
+@pytest.mark.unit
+def test_evaluator_changed_mode_skips_unchanged_fingerprinted_rom(tmp_path):
+    cache = MetadataCache(tmp_path)
+    cache.put("FP-0123", {"id": "1"}, rom_size=10)
+    evaluator = WorkflowEvaluator(_config(scrape_mode="changed"), cache=cache)
+    entry = GameEntry(path="./Alpha.nes", name="Alpha")
+
+    # Oversized ROM identified by its sampled fingerprint instead of a hash
+    decision = evaluator.evaluate_rom(
+        _rom(), entry, rom_hash="FP-0123", system=_system()
+    )
+    assert decision.fetch_metadata is False
+
+    decision = evaluator.evaluate_rom(
+        _rom(), entry, rom_hash="FP-4567", system=_system()
+    )
+    assert decision.fetch_metadata is True
+
+
 @pytest.mark.unit
 def test_evaluator_force_always_fetches():
     evaluator = WorkflowEvaluator(_config(scrape_mode="force"))
@@ -0,0 +1,107 @@
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+
+from curateur.workflow.import_schedule import ImportSchedule
+
+TODAY = date(2026, 10, 16)
+
+
+def _systems(*names):
+    return [SimpleNamespace(name=name) for name in names]
+
+
+@pytest.mark.unit
+def test_plan_round_trips_through_file(tmp_path):
+    schedule_file = tmp_path / "import_schedule.json"
+    schedule = ImportSchedule.load(schedule_file)
+    schedule.daily_budget = 500
+    schedule.record_system("nes", total=800, outstanding=300, today=TODAY)
+    schedule.record_pending("psx", total=1200, today=TODAY)
+    schedule.save(today=TODAY)
+
+    loaded = ImportSchedule.load(schedule_file)
+    assert loaded.daily_budget == 500
+    assert loaded.updated == "2026-10-16"
+    assert loaded.outstanding() == 1500
+    assert loaded.systems["psx"]["estimated"]
+    assert "estimated" not in loaded.systems["nes"]
+
+
+@pytest.mark.unit
+def test_unreadable_plan_starts_anew(tmp_path):
+    schedule_file = tmp_path / "import_schedule.json"
+    schedule_file.write_text("{not json")
+
+    schedule = ImportSchedule.load(schedule_file)
+
+    assert schedule.systems == {}
+    assert schedule.outstanding() == 0
+
+
+@pytest.mark.unit
+def test_unfinished_systems_come_first_in_plan_order(tmp_path):
+    schedule = ImportSchedule(tmp_path / "import_schedule.json")
+    schedule.record_system("nes", total=100, outstanding=0, today=TODAY)
+    schedule.record_pending("psx", total=900, today=TODAY)
+    schedule.record_system("snes", total=400, outstanding=150, today=TODAY)
+
+    ordered = schedule.order_systems(_systems("gb", "nes", "snes", "psx"))
+
+    assert [system.name for system in ordered] == ["psx", "snes", "gb", "nes"]
+
+
+@pytest.mark.unit
+def test_pending_system_keeps_earlier_outstanding_count(tmp_path):
+    schedule = ImportSchedule(tmp_path / "import_schedule.json")
+    schedule.record_system("snes", total=400, outstanding=150, today=TODAY)
+
+    schedule.record_pending("snes", total=410, today=TODAY)
+
+    assert schedule.systems["snes"]["outstanding"] == 150
+    assert schedule.systems["snes"]["total"] == 410
+
+
+@pytest.mark.unit
+def test_projection_spends_today_then_daily_budget(tmp_path):
+    schedule = ImportSchedule(tmp_path / "import_schedule.json")
+    schedule.daily_budget = 1000
+    schedule.record_system("nes", total=800, outstanding=300, today=TODAY)
+    schedule.record_system("gb", total=50, outstanding=0, today=TODAY)
+    schedule.record_pending("psx", total=2500, today=TODAY)
+
+    projection = schedule.projection(available_today=400, today=TODAY)
+
+    assert projection == [
+        ("nes", 300, date(2026, 10, 16)),
+        ("psx", 2500, date(2026, 10, 19)),
+    ]
+
+
+@pytest.mark.unit
+def test_projection_unknown_without_daily_budget(tmp_path):
+    schedule = ImportSchedule(tmp_path / "import_schedule.json")
+    schedule.record_pending("psx", total=2500, today=TODAY)
+
+    assert schedule.projection(today=TODAY) is None
+
+
+@pytest.mark.unit
+def test_projection_follows_run_order(tmp_path):
+    schedule = ImportSchedule(tmp_path / "import_schedule.json")
+    schedule.daily_budget = 1000
+    schedule.record_system("nes", total=800, outstanding=300, today=TODAY)
+    schedule.record_pending("psx", total=2500, today=TODAY)
+    schedule.record_pending("snes", total=200, today=TODAY)
+
+    projection = schedule.projection(
+        available_today=400, today=TODAY, order=["psx", "nes"]
+    )
+
+    # snes is not in this run's selection and comes last
+    assert projection == [
+        ("psx", 2500, date(2026, 10, 19)),
+        ("nes", 300, date(2026, 10, 19)),
+        ("snes", 200, date(2026, 10, 19)),
+    ]
@@ -2,8 +2,10 @@ from pathlib import Path
 
 import pytest
 
+from curateur.api.throttle import RateLimit, ThrottleManager
 from curateur.config.es_systems import SystemDefinition
-from curateur.workflow.orchestrator import WorkflowOrchestrator
+from curateur.workflow.orchestrator import ScrapingResult, WorkflowOrchestrator
+from curateur.workflow.quota_planner import QuotaPlanner
 
 
 class DummyAPIClient:
@@ -571,6 +573,49 @@ async def test_search_fallback_auto_select(monkeypatch, tmp_path):
     assert result["names"]["en"] == "Alpha"
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_search_fallback_skips_cached_empty_searches(monkeypatch, tmp_path):
+    from curateur.api.cache import MetadataCache
+
+    rom_info = type(
+        "R",
+        (),
+        {
+            "filename": "Homebrew.nes",
+            "path": tmp_path / "Homebrew.nes",
+            "file_size": 1,
+            "hash_value": "ABCD1234",
+            "system": "nes",
+        },
+    )
+
+    api_client = DummyAPIClient()
+    api_client.scrape_mode = "changed"
+    api_client.cache = MetadataCache(gamelist_directory=tmp_path)
+    orchestrator = WorkflowOrchestrator(
+        api_client=api_client,
+        rom_directory=tmp_path,
+        media_directory=tmp_path,
+        gamelist_directory=tmp_path,
+        work_queue=DummyWorkQueue(),
+        config={"runtime": {}, "scraping": {}, "paths": {}, "media": {}},
+        enable_search_fallback=True,
+    )
+
+    searches = []
+
+    async def fake_search(rom_info, shutdown_event=None, max_results=5):
+        searches.append(rom_info.filename)
+        return []
+
+    monkeypatch.setattr(orchestrator.api_client, "search_game", fake_search)
+
+    assert await orchestrator._search_fallback(rom_info, ["us"]) is None
+    assert await orchestrator._search_fallback(rom_info, ["us"]) is None
+    assert searches == ["Homebrew.nes"]
+
+
 @pytest.mark.unit
 def test_generate_gamelist_returns_none_when_no_scraped_games(tmp_path):
     orchestrator = WorkflowOrchestrator(
@@ -594,3 +639,401 @@ def test_generate_gamelist_returns_none_when_no_scraped_games(tmp_path):
         platform="nes",
     )
     assert orchestrator._generate_gamelist(system, []) is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scrape_system_skips_unchanged_system(monkeypatch, tmp_path):
+    rom_dir = tmp_path / "roms"
+    media_dir = tmp_path / "media"
+    gamelist_dir = tmp_path / "gamelists"
+    for d in (rom_dir, media_dir, gamelist_dir):
+        d.mkdir()
+    (rom_dir / "Alpha.nes").write_bytes(b"rom")
+
+    system = SystemDefinition(
+        name="nes",
+        fullname="NES",
+        path=str(rom_dir),
+        extensions=[".nes"],
+        platform="nes",
+    )
+
+    orchestrator = WorkflowOrchestrator(
+        api_client=DummyAPIClient(),
+        rom_directory=rom_dir,
+        media_directory=media_dir,
+        gamelist_directory=gamelist_dir,
+        work_queue=DummyWorkQueue(),
+        config={
+            "runtime": {"enable_cache": True},
+            "scraping": {},
+            "paths": {},
+            "media": {},
+        },
+        dry_run=False,
+    )
+
+    pipeline_runs = []
+
+    async def fake_scrape(system, rom_entries, *args, **kwargs):
+        pipeline_runs.append([rom.filename for rom in rom_entries])
+        return [], []
+
+    monkeypatch.setattr(orchestrator, "_scrape_roms_parallel", fake_scrape)
+    monkeypatch.setattr(
+        orchestrator, "_write_summary_log", lambda *args, **kwargs: None
+    )
+
+    await orchestrator.scrape_system(system)
+    assert pipeline_runs == [["Alpha.nes"]]
+
+    # Nothing changed: short-circuited before scanning
+    result = await orchestrator.scrape_system(system)
+    assert pipeline_runs == [["Alpha.nes"]]
+    assert result.total_roms == 1
+    assert result.skipped == 1
+
+    # A new ROM invalidates the snapshot
+    (rom_dir / "Beta.nes").write_bytes(b"rom2")
+    await orchestrator.scrape_system(system)
+    assert sorted(pipeline_runs[-1]) == ["Alpha.nes", "Beta.nes"]
+
+    # As does a settings change
+    orchestrator.config["media"] = {"media_types": ["covers"]}
+    await orchestrator.scrape_system(system)
+    assert len(pipeline_runs) == 3
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scrape_system_rescans_after_failed_media_download(monkeypatch, tmp_path):
+    rom_dir = tmp_path / "roms"
+    media_dir = tmp_path / "media"
+    gamelist_dir = tmp_path / "gamelists"
+    for d in (rom_dir, media_dir, gamelist_dir):
+        d.mkdir()
+    (rom_dir / "Alpha.nes").write_bytes(b"rom")
+
+    system = SystemDefinition(
+        name="nes",
+        fullname="NES",
+        path=str(rom_dir),
+        extensions=[".nes"],
+        platform="nes",
+    )
+
+    orchestrator = WorkflowOrchestrator(
+        api_client=DummyAPIClient(),
+        rom_directory=rom_dir,
+        media_directory=media_dir,
+        gamelist_directory=gamelist_dir,
+        work_queue=DummyWorkQueue(),
+        config={
+            "runtime": {"enable_cache": True},
+            "scraping": {},
+            "paths": {},
+            "media": {},
+        },
+        dry_run=False,
+    )
+
+    pipeline_runs = []
+    media_fails = [True, False]
+
+    async def fake_scrape(system, rom_entries, *args, **kwargs):
+        pipeline_runs.append([rom.filename for rom in rom_entries])
+        # The ROM itself succeeds; only its media download fails
+        if media_fails.pop(0):
+            orchestrator.session_stats["media_failed"] += 1
+        return [], []
+
+    monkeypatch.setattr(orchestrator, "_scrape_roms_parallel", fake_scrape)
+    monkeypatch.setattr(
+        orchestrator, "_write_summary_log", lambda *args, **kwargs: None
+    )
+
+    await orchestrator.scrape_system(system)
+    # Missing media is retried on the next pass instead of skipping the system
+    await orchestrator.scrape_system(system)
+    assert len(pipeline_runs) == 2
+
+    # Once media succeeds the system is recorded and skipped again
+    await orchestrator.scrape_system(system)
+    assert len(pipeline_runs) == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scrape_system_skips_unchanged_system_with_unmatched_rom(
+    monkeypatch, tmp_path
+):
+    rom_dir = tmp_path / "roms"
+    media_dir = tmp_path / "media"
+    gamelist_dir = tmp_path / "gamelists"
+    for d in (rom_dir, media_dir, gamelist_dir):
+        d.mkdir()
+    (rom_dir / "Alpha.nes").write_bytes(b"rom")
+    (rom_dir / "Homebrew.nes").write_bytes(b"unknown")
+
+    system = SystemDefinition(
+        name="nes",
+        fullname="NES",
+        path=str(rom_dir),
+        extensions=[".nes"],
+        platform="nes",
+    )
+
+    orchestrator = WorkflowOrchestrator(
+        api_client=DummyAPIClient(),
+        rom_directory=rom_dir,
+        media_directory=media_dir,
+        gamelist_directory=gamelist_dir,
+        work_queue=DummyWorkQueue(),
+        config={
+            "runtime": {"enable_cache": True},
+            "scraping": {},
+            "paths": {},
+            "media": {},
+        },
+        dry_run=False,
+    )
+
+    pipeline_runs = []
+    lookup_errors = [
+        ("Game not found", True),
+        ("API error: connection reset", False),
+        ("Game not found", True),
+    ]
+
+    async def fake_scrape(system, rom_entries, *args, **kwargs):
+        pipeline_runs.append([rom.filename for rom in rom_entries])
+        error, unmatched = lookup_errors.pop(0)
+        return [
+            ScrapingResult(
+                rom_path=rom_dir / "Homebrew.nes",
+                success=False,
+                error=error,
+                unmatched=unmatched,
+            )
+        ], []
+
+    monkeypatch.setattr(orchestrator, "_scrape_roms_parallel", fake_scrape)
+    monkeypatch.setattr(
+        orchestrator, "_write_summary_log", lambda *args, **kwargs: None
+    )
+
+    # The API does not know one ROM: the system is still recorded
+    result = await orchestrator.scrape_system(system)
+    assert result.failed == 1
+    await orchestrator.scrape_system(system)
+    assert len(pipeline_runs) == 1
+
+    # A failed lookup is not recorded and gets a full pass next time
+    (rom_dir / "Beta.nes").write_bytes(b"rom2")
+    await orchestrator.scrape_system(system)
+    await orchestrator.scrape_system(system)
+    assert len(pipeline_runs) == 3
+    await orchestrator.scrape_system(system)
+    assert len(pipeline_runs) == 3
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_watch_pass_resumes_after_daily_quota_reset(monkeypatch, tmp_path):
+    rom_dir = tmp_path / "roms"
+    media_dir = tmp_path / "media"
+    gamelist_dir = tmp_path / "gamelists"
+    for d in (rom_dir, media_dir, gamelist_dir):
+        d.mkdir()
+    (rom_dir / "Alpha.nes").write_bytes(b"rom")
+
+    system = SystemDefinition(
+        name="nes",
+        fullname="NES",
+        path=str(rom_dir),
+        extensions=[".nes"],
+        platform="nes",
+    )
+
+    throttle = ThrottleManager(RateLimit(calls=60, window_seconds=60))
+    await throttle.update_quota({"requeststoday": 100, "maxrequestsperday": 100})
+    planner = QuotaPlanner(throttle)
+    planner.mark_exhausted()
+
+    api_client = DummyAPIClient()
+
+    async def get_user_info():
+        # The quota reset at midnight while the process kept watching
+        return {"requeststoday": 0, "maxrequestsperday": 100}
+
+    api_client.get_user_info = get_user_info
+
+    orchestrator = WorkflowOrchestrator(
+        api_client=api_client,
+        rom_directory=rom_dir,
+        media_directory=media_dir,
+        gamelist_directory=gamelist_dir,
+        work_queue=DummyWorkQueue(),
+        config={
+            "runtime": {"enable_cache": True},
+            "scraping": {},
+            "paths": {},
+            "media": {},
+        },
+        dry_run=False,
+        quota_planner=planner,
+        retain_caches=True,
+    )
+
+    admitted = []
+
+    async def fake_scrape(system, rom_entries, *args, **kwargs):
+        admitted.append(planner.admit(1))
+        planner.settle(1)
+        return [], []
+
+    monkeypatch.setattr(orchestrator, "_scrape_roms_parallel", fake_scrape)
+    monkeypatch.setattr(
+        orchestrator, "_write_summary_log", lambda *args, **kwargs: None
+    )
+
+    await orchestrator.scrape_system(system)
+
+    assert admitted == [True]
+    assert not planner.exhausted
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scrape_system_retains_caches_between_passes(monkeypatch, tmp_path):
+    rom_dir = tmp_path / "roms"
+    media_dir = tmp_path / "media"
+    gamelist_dir = tmp_path / "gamelists"
+    for d in (rom_dir, media_dir, gamelist_dir):
+        d.mkdir()
+
+    system = SystemDefinition(
+        name="nes",
+        fullname="NES",
+        path=str(rom_dir),
+        extensions=[".nes"],
+        platform="nes",
+    )
+
+    api_client = DummyAPIClient()
+    orchestrator = WorkflowOrchestrator(
+        api_client=api_client,
+        rom_directory=rom_dir,
+        media_directory=media_dir,
+        gamelist_directory=gamelist_dir,
+        work_queue=DummyWorkQueue(),
+        config={
+            "runtime": {"enable_cache": True},
+            "scraping": {},
+            "paths": {},
+            "media": {},
+        },
+        dry_run=True,
+        retain_caches=True,
+    )
+    monkeypatch.setattr(
+        "curateur.workflow.orchestrator.scan_system", lambda *args, **kwargs: []
+    )
+
+    await orchestrator.scrape_system(system)
+    first_cache = api_client.cache
+    first_cache.put("ABCD1234", {"id": "1"})
+
+    # Watch-mode rescrape reuses the loaded cache instead of reading it again
+    await orchestrator.scrape_system(system)
+    assert api_client.cache is first_cache
+    assert api_client.cache.get("ABCD1234") is not None
+    # Cached entries don't mark gamelisted ROMs unchanged (their media is
+    # still checked and stale entries still reach the revalidator)
+    assert orchestrator.evaluator.cache is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scrape_system_layers_alias_systems_on_global_cache(
+    monkeypatch, tmp_path
+):
+    rom_dir = tmp_path / "roms"
+    media_dir = tmp_path / "media"
+    gamelist_dir = tmp_path / "gamelists"
+    for d in (rom_dir, media_dir, gamelist_dir):
+        d.mkdir()
+
+    api_client = DummyAPIClient()
+    orchestrator = WorkflowOrchestrator(
+        api_client=api_client,
+        rom_directory=rom_dir,
+        media_directory=media_dir,
+        gamelist_directory=gamelist_dir,
+        work_queue=DummyWorkQueue(),
+        config={
+            "runtime": {
+                "enable_cache": True,
+                "global_cache_dir": str(tmp_path / "global"),
+            },
+            "scraping": {},
+            "paths": {},
+            "media": {},
+        },
+        dry_run=True,
+    )
+    monkeypatch.setattr(
+        "curateur.workflow.orchestrator.scan_system", lambda *args, **kwargs: []
+    )
+
+    caches = {}
+    for name in ("genesis", "megadrive"):
+        system = SystemDefinition(
+            name=name,
+            fullname=name,
+            path=str(rom_dir),
+            extensions=[".md"],
+            platform=name,
+        )
+        await orchestrator.scrape_system(system)
+        caches[name] = api_client.cache
+
+    # Both alias systems map to the same systemeid in the shared cache
+    assert caches["genesis"].shared is not None
+    assert caches["genesis"].shared is caches["megadrive"].shared
+    assert caches["genesis"].shared_namespace == caches["megadrive"].shared_namespace
+
+    caches["genesis"].put("ABCD1234", {"id": "1"}, rom_size=512)
+    assert caches["megadrive"].get("ABCD1234", rom_size=512) is not None
+    orchestrator.flush_caches()
+    assert (tmp_path / "global" / "metadata_cache.db").exists()
+
+
+@pytest.mark.unit
+def test_cache_ttl_days_uses_per_system_override(tmp_path):
+    orchestrator = WorkflowOrchestrator(
+        api_client=DummyAPIClient(),
+        rom_directory=tmp_path,
+        media_directory=tmp_path,
+        gamelist_directory=tmp_path,
+        work_queue=DummyWorkQueue(),
+        config={
+            "runtime": {"cache_ttl_days": 14, "cache_ttl_overrides": {"arcade": 60}},
+            "scraping": {},
+            "paths": {},
+            "media": {},
+        },
+    )
+
+    def system(name):
+        return SystemDefinition(
+            name=name,
+            fullname=name,
+            path=str(tmp_path),
+            extensions=[".zip"],
+            platform=name,
+        )
+
+    assert orchestrator._cache_ttl_days(system("arcade")) == 60
+    assert orchestrator._cache_ttl_days(system("nes")) == 14
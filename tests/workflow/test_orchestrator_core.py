@@ -4,7 +4,7 @@ Comprehensive tests for WorkflowOrchestrator core functionality.
 These tests target previously uncovered code paths to increase coverage
 for the stable release. Focus areas:
 - _scrape_rom (individual ROM processing)
-- _batch_hash_roms (hash calculation)
+- _stream_hash_roms (hash calculation)
 - _scrape_roms_parallel (parallel coordination)
 - Error handling and edge cases
 - Media download integration
@@ -19,12 +19,15 @@ import pytest
 
 from curateur.config.es_systems import SystemDefinition
 from curateur.gamelist.game_entry import GameEntry
+from curateur.scanner.hash_index import HashIndex
 from curateur.scanner.rom_types import ROMInfo, ROMType
 from curateur.workflow.evaluator import WorkflowDecision
 from curateur.workflow.orchestrator import (
     ScrapingResult,
     WorkflowOrchestrator,
 )
+from curateur.workflow.thread_pool import ThreadPoolManager
+from curateur.workflow.work_queue import WorkQueueManager
 
 # ============================================================================
 # Test Fixtures
@@ -372,6 +375,108 @@ async def test_scrape_rom_api_error_404(orchestrator, test_system, tmp_path):
     # 404 should be marked as error
     assert result.error is not None
     assert "Game not found" in result.error
+    assert result.unmatched
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scrape_rom_defers_when_daily_quota_is_spent(
+    orchestrator, test_system, tmp_path
+):
+    """ROMs needing a lookup are deferred once the API reports 430."""
+    from curateur.api.error_handler import QuotaExceededError
+    from curateur.api.throttle import RateLimit, ThrottleManager
+    from curateur.workflow.quota_planner import DEFERRED_REASON, QuotaPlanner
+
+    orchestrator.quota_planner = QuotaPlanner(
+        ThrottleManager(RateLimit(calls=60, window_seconds=60))
+    )
+    orchestrator.evaluator.evaluate_rom = Mock(
+        return_value=WorkflowDecision(fetch_metadata=True, update_metadata=True)
+    )
+    orchestrator.api_client.query_game = AsyncMock(
+        side_effect=QuotaExceededError("Daily quota exceeded")
+    )
+
+    def rom(filename):
+        rom_file = tmp_path / filename
+        rom_file.write_bytes(b"TEST_ROM_DATA")
+        return ROMInfo(
+            path=rom_file,
+            filename=filename,
+            basename=rom_file.stem,
+            rom_type=ROMType.STANDARD,
+            system="nes",
+            query_filename=filename,
+            file_size=rom_file.stat().st_size,
+            hash_type="crc32",
+            hash_value=filename.upper(),
+        )
+
+    results = [
+        await orchestrator._scrape_rom(
+            system=test_system, rom_info=rom(name), media_types=[], preferred_regions=[]
+        )
+        for name in ("first.nes", "second.nes")
+    ]
+
+    # The 430 stops further lookups: the second ROM never reaches the API
+    assert orchestrator.api_client.query_game.await_count == 1
+    assert all(r.skipped and r.skip_reason == DEFERRED_REASON for r in results)
+    assert all(not r.success and r.error is None for r in results)
+    assert orchestrator.quota_planner.get_deferred("nes") == [
+        "first.nes",
+        "second.nes",
+    ]
+
+    orchestrator._write_deferred_roms("nes", ["second.nes", "first.nes"])
+    remainder = tmp_path / "gamelists" / "nes" / "deferred_roms.txt"
+    assert remainder.read_text().splitlines()[-2:] == ["first.nes", "second.nes"]
+
+    orchestrator._write_deferred_roms("nes", [])
+    assert not remainder.exists()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scrape_rom_settles_budget_when_cancelled_before_lookup(
+    orchestrator, test_system, tmp_path
+):
+    """A commitment is released even if the ROM is cancelled before its lookup."""
+    from curateur.api.throttle import RateLimit, ThrottleManager
+    from curateur.workflow.quota_planner import QuotaPlanner
+
+    throttle = ThrottleManager(RateLimit(calls=60, window_seconds=60))
+    await throttle.update_quota({"requeststoday": 10, "maxrequestsperday": 100})
+    orchestrator.quota_planner = QuotaPlanner(throttle)
+    orchestrator.evaluator.evaluate_rom = Mock(
+        return_value=WorkflowDecision(fetch_metadata=True, update_metadata=True)
+    )
+    orchestrator.event_bus = Mock()
+    orchestrator.event_bus.publish = AsyncMock(side_effect=asyncio.CancelledError)
+    orchestrator.api_client.query_game = AsyncMock()
+
+    rom_file = tmp_path / "game.nes"
+    rom_file.write_bytes(b"TEST_ROM_DATA")
+    rom_info = ROMInfo(
+        path=rom_file,
+        filename="game.nes",
+        basename="game",
+        rom_type=ROMType.STANDARD,
+        system="nes",
+        query_filename="game.nes",
+        file_size=rom_file.stat().st_size,
+        hash_type="crc32",
+        hash_value="ABCD1234",
+    )
+
+    result = await orchestrator._scrape_rom(
+        system=test_system, rom_info=rom_info, media_types=[], preferred_regions=[]
+    )
+
+    assert result.error == "Cancelled due to shutdown"
+    orchestrator.api_client.query_game.assert_not_awaited()
+    assert orchestrator.quota_planner.remaining() == 90
 
 
 @pytest.mark.unit
@@ -476,14 +581,14 @@ async def test_scrape_rom_with_shutdown_event(orchestrator, test_system, tmp_pat
 
 
 # ============================================================================
-# Tests for _batch_hash_roms - Batch Hashing
+# Tests for _stream_hash_roms - Streaming Hashing
 # ============================================================================
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_batch_hash_roms_single_batch(orchestrator, test_system, tmp_path):
-    """Test batch hashing with a single batch of ROMs."""
+async def test_stream_hash_roms_hashes_all(orchestrator, test_system, tmp_path):
+    """Test streaming hashing of a handful of ROMs."""
     # Create test ROM files
     rom_dir = tmp_path / "test_roms"
     rom_dir.mkdir(parents=True)
@@ -509,7 +614,7 @@ async def test_batch_hash_roms_single_batch(orchestrator, test_system, tmp_path)
         for rom_file in rom_files
     ]
 
-    await orchestrator._batch_hash_roms(roms, hash_algorithm="crc32", batch_size=10)
+    await orchestrator._stream_hash_roms(roms, hash_algorithm="crc32", max_in_flight=10)
 
     # All ROMs should now have hash values
     for rom in roms:
@@ -519,8 +624,8 @@ async def test_batch_hash_roms_single_batch(orchestrator, test_system, tmp_path)
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_batch_hash_roms_multiple_batches(orchestrator, test_system, tmp_path):
-    """Test batch hashing with multiple batches."""
+async def test_stream_hash_roms_small_window(orchestrator, test_system, tmp_path):
+    """Test streaming hashing with an in-flight window smaller than the ROM count."""
     # Create test ROM files
     rom_dir = tmp_path / "test_roms_multi"
     rom_dir.mkdir(parents=True)
@@ -546,8 +651,8 @@ async def test_batch_hash_roms_multiple_batches(orchestrator, test_system, tmp_p
         for rom_file in rom_files
     ]
 
-    # Small batch size to force multiple batches
-    await orchestrator._batch_hash_roms(roms, hash_algorithm="crc32", batch_size=5)
+    # Small window forces slots to be reused
+    await orchestrator._stream_hash_roms(roms, hash_algorithm="crc32", max_in_flight=5)
 
     # All ROMs should be hashed
     hashed_count = sum(1 for rom in roms if rom.hash_value is not None)
@@ -556,10 +661,10 @@ async def test_batch_hash_roms_multiple_batches(orchestrator, test_system, tmp_p
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_batch_hash_roms_with_missing_file(
+async def test_stream_hash_roms_with_missing_file(
     orchestrator, test_system, tmp_path, caplog
 ):
-    """Test batch hashing when a ROM file is missing."""
+    """Test streaming hashing when a ROM file is missing."""
     rom_dir = tmp_path / "test_roms_missing"
     rom_dir.mkdir(parents=True)
 
@@ -595,7 +700,9 @@ async def test_batch_hash_roms_with_missing_file(
 
     # Expect an error to be logged for missing file
     with caplog.at_level("ERROR"):
-        await orchestrator._batch_hash_roms(roms, hash_algorithm="crc32", batch_size=10)
+        await orchestrator._stream_hash_roms(
+            roms, hash_algorithm="crc32", max_in_flight=10
+        )
 
     # Real ROM should be hashed
     assert roms[0].hash_value is not None
@@ -604,19 +711,19 @@ async def test_batch_hash_roms_with_missing_file(
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_batch_hash_roms_empty_list(orchestrator, test_system):
-    """Test batch hashing with empty ROM list."""
+async def test_stream_hash_roms_empty_list(orchestrator, test_system):
+    """Test streaming hashing with empty ROM list."""
     roms = []
 
     # Should not raise error
-    await orchestrator._batch_hash_roms(roms, hash_algorithm="crc32", batch_size=10)
+    await orchestrator._stream_hash_roms(roms, hash_algorithm="crc32", max_in_flight=10)
 
     assert len(roms) == 0
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_batch_hash_roms_new_only_mode_skips_existing(
+async def test_stream_hash_roms_new_only_mode_skips_existing(
     orchestrator, test_system, tmp_path
 ):
     """Test that new_only mode skips hash calculation for existing ROMs."""
@@ -654,11 +761,11 @@ async def test_batch_hash_roms_new_only_mode_skips_existing(
         GameEntry(path=f"./{roms[2].filename}", name="Game 3"),
     ]
 
-    # Call _batch_hash_roms with new_only mode
-    await orchestrator._batch_hash_roms(
+    # Call _stream_hash_roms with new_only mode
+    await orchestrator._stream_hash_roms(
         roms,
         hash_algorithm="crc32",
-        batch_size=10,
+        max_in_flight=10,
         scrape_mode="new_only",
         existing_entries=existing_entries,
     )
@@ -681,7 +788,7 @@ async def test_batch_hash_roms_new_only_mode_skips_existing(
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_batch_hash_roms_changed_mode_hashes_all(
+async def test_stream_hash_roms_changed_mode_hashes_all(
     orchestrator, test_system, tmp_path
 ):
     """Test that changed mode hashes all ROMs regardless of gamelist."""
@@ -717,10 +824,10 @@ async def test_batch_hash_roms_changed_mode_hashes_all(
     ]
 
     # Call with changed mode (default)
-    await orchestrator._batch_hash_roms(
+    await orchestrator._stream_hash_roms(
         roms,
         hash_algorithm="crc32",
-        batch_size=10,
+        max_in_flight=10,
         scrape_mode="changed",
         existing_entries=existing_entries,
     )
@@ -730,6 +837,237 @@ async def test_batch_hash_roms_changed_mode_hashes_all(
         assert rom.hash_value is not None
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_stream_hash_roms_records_hashes_in_index(
+    orchestrator, test_system, tmp_path
+):
+    """Test that freshly calculated hashes are stored in the hash index."""
+    rom_file = tmp_path / "indexed.nes"
+    rom_file.write_bytes(b"INDEXED_ROM")
+
+    roms = [
+        ROMInfo(
+            path=rom_file,
+            filename=rom_file.name,
+            basename=rom_file.stem,
+            rom_type=ROMType.STANDARD,
+            system="nes",
+            query_filename=rom_file.name,
+            file_size=rom_file.stat().st_size,
+        )
+    ]
+
+    orchestrator.hash_index = HashIndex(tmp_path / ".cache")
+    await orchestrator._stream_hash_roms(roms, hash_algorithm="crc32", max_in_flight=10)
+
+    indexed = orchestrator.hash_index.lookup(rom_file)
+    assert indexed["crc32"] == roms[0].hash_value == roms[0].crc32
+    assert indexed["md5"] == roms[0].md5
+    assert indexed["sha1"] == roms[0].sha1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_stream_hash_roms_does_not_index_file_changed_while_hashing(
+    orchestrator, test_system, tmp_path
+):
+    """Test that hashes are indexed under the file's identity before hashing."""
+    rom_file = tmp_path / "copying.nes"
+    rom_file.write_bytes(b"PARTIAL")
+
+    rom = ROMInfo(
+        path=rom_file,
+        filename=rom_file.name,
+        basename=rom_file.stem,
+        rom_type=ROMType.STANDARD,
+        system="nes",
+        query_filename=rom_file.name,
+        file_size=rom_file.stat().st_size,
+        hash_stat=rom_file.stat(),
+    )
+
+    calculate_hashes = orchestrator.hash_backend.calculate_hashes
+
+    async def hash_then_finish_copy(path, **kwargs):
+        result = await calculate_hashes(path, **kwargs)
+        rom_file.write_bytes(b"PARTIAL-AND-THE-REST")
+        return result
+
+    orchestrator.hash_backend.calculate_hashes = hash_then_finish_copy
+    orchestrator.hash_index = HashIndex(tmp_path / ".cache")
+    await orchestrator._stream_hash_roms([rom], hash_algorithm="crc32")
+
+    # The partial content's digests must not match the finished file
+    assert orchestrator.hash_index.lookup(rom_file) is None
+
+
+@pytest.mark.unit
+def test_zip_member_crc_is_opt_in_and_needs_crc32_only(orchestrator):
+    """Test that the zip shortcut is off by default and with extra digests."""
+    runtime = orchestrator.config["runtime"]
+    assert not orchestrator._zip_member_crc_enabled()
+
+    runtime["zip_member_crc"] = True
+    # Default rom_digests include MD5 and SHA1, which the zip directory lacks
+    assert not orchestrator._zip_member_crc_enabled()
+
+    runtime["rom_digests"] = ["crc32"]
+    assert orchestrator._zip_member_crc_enabled()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_stream_hash_roms_hands_on_each_rom_when_ready(
+    orchestrator, test_system, tmp_path
+):
+    """Test that every ROM reaches on_ready, including ones needing no hash."""
+    roms = []
+    for name in ("a.nes", "b.nes", "c.nes"):
+        rom_file = tmp_path / name
+        rom_file.write_bytes(name.encode() * 100)
+        roms.append(
+            ROMInfo(
+                path=rom_file,
+                filename=name,
+                basename=rom_file.stem,
+                rom_type=ROMType.STANDARD,
+                system="nes",
+                query_filename=name,
+                file_size=rom_file.stat().st_size,
+            )
+        )
+    roms[1].hash_value = "PRESET01"
+
+    ready = []
+
+    async def on_ready(rom_info):
+        # Hash must already be populated when the ROM is handed on
+        ready.append((rom_info.filename, rom_info.hash_value))
+
+    await orchestrator._stream_hash_roms(
+        roms, hash_algorithm="crc32", max_in_flight=1, on_ready=on_ready
+    )
+
+    assert sorted(name for name, _ in ready) == ["a.nes", "b.nes", "c.nes"]
+    assert all(hash_value for _, hash_value in ready)
+    assert dict(ready)["b.nes"] == "PRESET01"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_stream_hash_roms_fingerprints_oversized_roms(
+    orchestrator, test_system, tmp_path
+):
+    """Test that ROMs over the size limit get a fingerprint instead of a hash."""
+    rom_file = tmp_path / "huge.iso"
+    rom_file.write_bytes(b"DISC" * 1000)
+    rom = ROMInfo(
+        path=rom_file,
+        filename="huge.iso",
+        basename="huge",
+        rom_type=ROMType.STANDARD,
+        system="nes",
+        query_filename="huge.iso",
+        file_size=rom_file.stat().st_size,
+        crc_size_limit=100,
+    )
+
+    [result] = await orchestrator._stream_hash_roms([rom], hash_algorithm="crc32")
+
+    assert result.hash_value is None
+    assert result.fingerprint and result.fingerprint.startswith("FP-")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_stream_hash_roms_respects_device_reader_limit(
+    orchestrator, test_system, tmp_path, monkeypatch
+):
+    """Test that a spinning disk is never read by more than its reader limit."""
+    roms = []
+    for i in range(1, 7):
+        rom_file = tmp_path / f"disc{i}.iso"
+        rom_file.write_bytes(b"DISC" * i)
+        roms.append(
+            ROMInfo(
+                path=rom_file,
+                filename=rom_file.name,
+                basename=rom_file.stem,
+                rom_type=ROMType.STANDARD,
+                system="nes",
+                query_filename=rom_file.name,
+                file_size=rom_file.stat().st_size,
+            )
+        )
+
+    active = 0
+    peak = 0
+
+    async def fake_hashes(file_path, algorithms, size_limit):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return {"crc32": "0000ABCD"}
+
+    monkeypatch.setattr(orchestrator.hash_backend, "calculate_hashes", fake_hashes)
+    monkeypatch.setattr(orchestrator.io_scheduler, "is_rotational", lambda dev: True)
+    orchestrator.io_scheduler.rotational_limit = 1
+
+    await orchestrator._stream_hash_roms(roms, hash_algorithm="crc32", max_in_flight=10)
+
+    assert peak == 1
+    assert all(rom.hash_value == "0000ABCD" for rom in roms)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scrape_roms_parallel_streams_hashed_roms_to_workers(
+    orchestrator, test_system, tmp_path, monkeypatch
+):
+    """Test that workers process ROMs queued by the streaming hash stage."""
+    roms = []
+    for i in range(1, 6):
+        rom_file = tmp_path / f"stream{i}.nes"
+        rom_file.write_bytes(b"STREAM" * i)
+        roms.append(
+            ROMInfo(
+                path=rom_file,
+                filename=rom_file.name,
+                basename=rom_file.stem,
+                rom_type=ROMType.STANDARD,
+                system="nes",
+                query_filename=rom_file.name,
+                file_size=rom_file.stat().st_size,
+            )
+        )
+
+    seen_hashes = []
+
+    async def fake_processor(rom_info, operation_callback, shutdown_event):
+        seen_hashes.append(rom_info.crc32)
+        return ScrapingResult(rom_path=rom_info.path, success=True)
+
+    monkeypatch.setattr(
+        orchestrator, "_create_rom_processor", lambda *args: fake_processor
+    )
+    orchestrator.work_queue = WorkQueueManager()
+    orchestrator.thread_manager = ThreadPoolManager({})
+    orchestrator.thread_manager.initialize_pools({"maxthreads": 2})
+
+    results, not_found = await asyncio.wait_for(
+        orchestrator._scrape_roms_parallel(test_system, roms, [], ["us"]),
+        timeout=10.0,
+    )
+
+    assert len(results) == 5
+    assert all(result.success for result in results)
+    assert all(seen_hashes) and len(seen_hashes) == 5
+    assert not_found == []
+
+
 # ============================================================================
 # Tests for _generate_gamelist
 # ============================================================================
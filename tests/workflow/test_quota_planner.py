@@ -0,0 +1,206 @@
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+
+from curateur.api.throttle import RateLimit, ThrottleManager
+from curateur.workflow.quota_planner import (
+    RANK_KNOWN_WITH_MEDIA,
+    RANK_KNOWN_WITHOUT_MEDIA,
+    RANK_NEW_WITH_MEDIA,
+    RANK_NEW_WITHOUT_MEDIA,
+    QuotaPlanner,
+)
+
+
+async def _throttle(used: int, limit: int) -> ThrottleManager:
+    throttle = ThrottleManager(RateLimit(calls=60, window_seconds=60))
+    await throttle.update_quota({"requeststoday": used, "maxrequestsperday": limit})
+    return throttle
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_admit_commits_budget_until_settled():
+    throttle = await _throttle(used=95, limit=100)
+    planner = QuotaPlanner(throttle, reserve=2)
+
+    assert planner.remaining() == 3
+    assert planner.is_scarce(4)
+    assert not planner.is_scarce(3)
+
+    assert [planner.admit(1) for _ in range(4)] == [True, True, True, False]
+    assert planner.exhausted
+    # Lookups the cache answers cost nothing and are still admitted
+    assert planner.admit(0)
+
+    stats = planner.get_stats()
+    assert stats["admitted"] == 3
+    assert stats["remaining"] == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_settle_hands_commitment_over_to_reported_usage():
+    throttle = await _throttle(used=98, limit=100)
+    planner = QuotaPlanner(throttle)
+
+    assert planner.admit(1)
+    assert planner.remaining() == 1
+
+    # The response reports the call, then the ROM settles its commitment
+    await throttle.update_quota({"requeststoday": 99})
+    planner.settle(1)
+
+    assert planner.remaining() == 1
+    assert planner.admit(1)
+    assert not planner.exhausted
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_unknown_limit_admits_everything_until_api_reports_430():
+    planner = QuotaPlanner(await _throttle(used=0, limit=0))
+
+    assert planner.remaining() is None
+    assert not planner.is_scarce(10_000)
+    assert planner.admit(1)
+
+    planner.mark_exhausted()
+    assert not planner.admit(1)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_daily_fraction_caps_usage_including_other_tools():
+    # 30 requests already made today (by any tool) count against the 50% share
+    planner = QuotaPlanner(
+        await _throttle(used=30, limit=100), reserve=5, daily_fraction=0.5
+    )
+
+    assert planner.daily_budget() == 45
+    assert planner.remaining() == 15
+
+    over_share = QuotaPlanner(await _throttle(used=60, limit=100), daily_fraction=0.5)
+    assert over_share.remaining() == 0
+    assert not over_share.admit(1)
+
+
+@pytest.mark.unit
+def test_rank_puts_new_roms_and_roms_without_media_first():
+    ranks = [
+        QuotaPlanner.rank(in_gamelist=True, has_media=True),
+        QuotaPlanner.rank(in_gamelist=False, has_media=True),
+        QuotaPlanner.rank(in_gamelist=True, has_media=False),
+        QuotaPlanner.rank(in_gamelist=False, has_media=False),
+    ]
+
+    assert ranks == [
+        RANK_KNOWN_WITH_MEDIA,
+        RANK_NEW_WITH_MEDIA,
+        RANK_KNOWN_WITHOUT_MEDIA,
+        RANK_NEW_WITHOUT_MEDIA,
+    ]
+    assert sorted(ranks) == [0, 1, 2, 3]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_order_systems_puts_priority_systems_first():
+    planner = QuotaPlanner(
+        await _throttle(used=0, limit=100), system_priority=["psx", "snes"]
+    )
+    systems = [SimpleNamespace(name=name) for name in ["nes", "snes", "gb", "psx"]]
+
+    ordered = [system.name for system in planner.order_systems(systems)]
+
+    assert ordered == ["psx", "snes", "nes", "gb"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_deferrals_are_tracked_per_system_pass():
+    planner = QuotaPlanner(await _throttle(used=0, limit=100))
+
+    planner.defer("nes", "b.nes")
+    planner.defer("nes", "a.nes")
+    assert planner.get_deferred("nes") == ["b.nes", "a.nes"]
+
+    planner.start_system("nes")
+    assert planner.get_deferred("nes") == []
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.day = date(2026, 10, 16)
+
+    def __call__(self):
+        return self.now
+
+    def today(self):
+        return self.day
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_check_reset_resumes_once_quota_usage_drops():
+    throttle = await _throttle(used=99, limit=100)
+    clock = FakeClock()
+    planner = QuotaPlanner(
+        throttle, recheck_interval=60, clock=clock, today=clock.today
+    )
+    usage = {"requeststoday": 100, "maxrequestsperday": 100}
+    fetches = []
+
+    async def fetch_user_info():
+        fetches.append(dict(usage))
+        return dict(usage)
+
+    assert planner.admit(1)
+    planner.settle(1)
+    await throttle.update_quota({"requeststoday": 100})
+    assert not planner.admit(1)
+    assert planner.exhausted
+
+    # Quota not reset yet: still spent, and not re-read again within the interval
+    assert not await planner.check_reset(fetch_user_info)
+    assert not await planner.check_reset(fetch_user_info)
+    assert len(fetches) == 1
+
+    # Past midnight the API reports fresh usage
+    usage["requeststoday"] = 3
+    clock.now += 61
+    assert await planner.check_reset(fetch_user_info)
+    assert not planner.exhausted
+    assert planner.remaining() == 97
+    assert planner.admit(1)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_check_reset_after_430_with_unknown_usage_waits_for_new_day():
+    throttle = ThrottleManager(RateLimit(calls=60, window_seconds=60))
+    clock = FakeClock()
+    planner = QuotaPlanner(throttle, recheck_interval=0, clock=clock, today=clock.today)
+
+    async def fetch_user_info():
+        return {}
+
+    planner.mark_exhausted()
+    assert not await planner.check_reset(fetch_user_info)
+
+    clock.day = date(2026, 10, 17)
+    assert await planner.check_reset(fetch_user_info)
+    assert not planner.exhausted
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_check_reset_is_a_no_op_while_budget_remains():
+    planner = QuotaPlanner(await _throttle(used=10, limit=100))
+
+    async def fetch_user_info():
+        raise AssertionError("must not re-read while budget remains")
+
+    assert not await planner.check_reset(fetch_user_info)
@@ -41,3 +41,20 @@ async def test_mark_processed_and_complete():
 
     stats = manager.get_stats()
     assert stats["processed"] == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_rank_orders_items_within_priority():
+    manager = WorkQueueManager()
+    manager.add_work({"filename": "known"}, action="full", rank=3)
+    manager.add_work({"filename": "new-a"}, action="full", rank=0)
+    manager.add_work({"filename": "partial"}, action="full", rank=1)
+    manager.add_work({"filename": "new-b"}, action="full", rank=0)
+    manager.add_work(
+        {"filename": "retry"}, action="full", priority=Priority.HIGH, rank=3
+    )
+
+    order = [(await manager.get_work_async()).rom_info["filename"] for _ in range(5)]
+
+    assert order == ["retry", "new-a", "new-b", "partial", "known"]